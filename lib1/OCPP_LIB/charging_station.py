@@ -1,82 +1,142 @@
 import asyncio
+import functools
 import inspect
 import logging
 import re
 import time
 import uuid
-from dataclasses import Field, asdict, is_dataclass
-from typing import Any, Dict, List, Union, get_args, get_origin
+from dataclasses import Field, asdict, fields, is_dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from OCPP_LIB.error_handling import NotImplementedError, NotSupportedError, OCPPError
+from OCPP_LIB.handler_executor import as_handler_executor
+from OCPP_LIB.journal import INBOUND, OUTBOUND
+from OCPP_LIB.key_tables import CAMEL_TO_SNAKE
+from OCPP_LIB.metrics import REGISTRY
 from OCPP_LIB.ocpp_messages import Call, MessageType, unpack, validate_payload
-from OCPP_LIB.ocpp_routing import create_route_map
+from OCPP_LIB.ocpp_routing import (
+    accepts_call_unique_id,
+    create_route_map,
+    get_routes,
+    handler_executor,
+)
+from OCPP_LIB.payload_decoder import PAYLOAD_DECODERS, LazyList, get_decoder
+from OCPP_LIB.send_queue import DEFAULT, RESPONSE, SendQueue, priority
 
 LOGGER = logging.getLogger("ocpp")
 
+# The names of the message types, as used for metrics.
+_MESSAGE_TYPES = {
+    MessageType.Call: "Call",
+    MessageType.CallResult: "CallResult",
+    MessageType.CallError: "CallError",
+}
 
-def camel_to_snake_case(data):
+# The error codes of CallErrors, as used for metrics. Other codes, which the
+# peer may choose freely, are counted as "unknown".
+_ERROR_CODES = frozenset(error.code for error in OCPPError.__subclasses__())
+
+
+def _error_code_label(error_code) -> str:
+    if isinstance(error_code, str) and error_code in _ERROR_CODES:
+        return error_code
+    return "unknown"
+
+
+# The fallback conversions below are only used for keys that aren't a property
+# in any of the schemas, like the keys of vendor specific `customData`. The
+# size of the caches is limited, because these keys are chosen by the peer.
+@functools.lru_cache(maxsize=4096)
+def _camel_to_snake_key(key: str) -> str:
     """
-    Convert all keys of all dictionaries inside the given argument from
-    camelCase to snake_case.
+    Convert a key from camelCase to snake_case.
 
     Inspired by: https://stackoverflow.com/a/1176023/1073222
 
     """
-    if isinstance(data, dict):
-        snake_case_dict = {}
-        for key, value in data.items():
-            key = key.replace("ocppCSMS", "ocpp_csms")
-            key = key.replace("V2X", "_v2x")
-            key = key.replace("V2X", "_v2x").replace("V2G", "_v2g")
-            s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", key)
-            key = re.sub("([a-z0-9])([A-Z])(?=\\S)", r"\1_\2", s1).lower()
+    key = key.replace("ocppCSMS", "ocpp_csms")
+    key = key.replace("V2X", "_v2x")
+    key = key.replace("V2X", "_v2x").replace("V2G", "_v2g")
+    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", key)
+    return re.sub("([a-z0-9])([A-Z])(?=\\S)", r"\1_\2", s1).lower()
 
-            snake_case_dict[key] = camel_to_snake_case(value)
 
-        return snake_case_dict
+@functools.lru_cache(maxsize=4096)
+def _snake_to_camel_key(key: str) -> str:
+    """
+    Convert a key from snake_case to camelCase.
+
+    Inspired by: https://stackoverflow.com/a/19053800/1073222
+    """
+    key = key.replace("soc", "SoC")
+    key = key.replace("_v2x", "V2X")
+    key = key.replace("ocpp_csms", "ocppCSMS")
+    key = key.replace("_url", "URL")
+    key = key.replace("soc", "SoC").replace("_SoCket", "Socket")
+    key = key.replace("_v2x", "V2X")
+    key = key.replace("soc_limit_reached", "SOCLimitReached")
+    key = key.replace("_v2x", "V2X").replace("_v2g", "V2G")
+    components = key.split("_")
+    return components[0] + "".join(x[:1].upper() + x[1:] for x in components[1:])
+
+
+_SNAKE_TO_CAMEL: Dict[str, Dict[str, str]] = {
+    ocpp_version: {snake: camel for camel, snake in table.items()}
+    for ocpp_version, table in CAMEL_TO_SNAKE.items()
+}
 
-    if isinstance(data, list):
-        snake_case_list = []
-        for value in data:
-            snake_case_list.append(camel_to_snake_case(value))
 
-        return snake_case_list
+def _convert_keys(data, table: Dict[str, str], fallback: Callable[[str], str]):
+    if isinstance(data, dict):
+        return {
+            (table[key] if key in table else fallback(key)): _convert_keys(
+                value, table, fallback
+            )
+            for key, value in data.items()
+        }
+
+    if isinstance(data, list):
+        return [_convert_keys(value, table, fallback) for value in data]
 
     return data
 
 
-def snake_to_camel_case(data):
+def camel_to_snake_case(data, ocpp_version: Optional[str] = None):
     """
-    Convert all keys of all dictionaries inside given argument from
-    snake_case to camelCase.
+    Convert all keys of all dictionaries inside the given argument from
+    camelCase to snake_case.
 
-    Inspired by: https://stackoverflow.com/a/19053800/1073222
+    When `ocpp_version` is given, the keys are looked up in the table that
+    `scripts/generate_key_tables.py` generated from the schemas of that
+    version. `snake_to_camel_case()` reverses the conversion of those keys
+    exactly. Other keys are converted using a set of rules.
     """
-    if isinstance(data, dict):
-        camel_case_dict = {}
-        for key, value in data.items():
-            key = key.replace("soc", "SoC")
-            key = key.replace("_v2x", "V2X")
-            key = key.replace("ocpp_csms", "ocppCSMS")
-            key = key.replace("_url", "URL")
-            key = key.replace("soc", "SoC").replace("_SoCket", "Socket")
-            key = key.replace("_v2x", "V2X")
-            key = key.replace("soc_limit_reached", "SOCLimitReached")
-            key = key.replace("_v2x", "V2X").replace("_v2g", "V2G")
-            components = key.split("_")
-            key = components[0] + "".join(x[:1].upper() + x[1:] for x in components[1:])
-            camel_case_dict[key] = snake_to_camel_case(value)
-
-        return camel_case_dict
+    return _convert_keys(
+        data, CAMEL_TO_SNAKE.get(ocpp_version, {}), _camel_to_snake_key
+    )
 
-    if isinstance(data, list):
-        camel_case_list = []
-        for value in data:
-            camel_case_list.append(snake_to_camel_case(value))
 
-        return camel_case_list
+def snake_to_camel_case(data, ocpp_version: Optional[str] = None):
+    """
+    Convert all keys of all dictionaries inside given argument from
+    snake_case to camelCase.
 
-    return data
+    See `camel_to_snake_case()` for the meaning of `ocpp_version`.
+    """
+    return _convert_keys(
+        data, _SNAKE_TO_CAMEL.get(ocpp_version, {}), _snake_to_camel_key
+    )
 
 
 def _is_dataclass_instance(input: Any) -> bool:
@@ -136,10 +196,11 @@ def serialize_as_dict(dataclass):
             serialized[field.name] = serialize_as_dict(value)
             continue
 
-        if isinstance(value, list):
-            for item in value:
-                if _is_dataclass_instance(item):
-                    serialized[field.name] = [serialize_as_dict(item)]
+        if isinstance(value, (list, LazyList)):
+            serialized[field.name] = [
+                serialize_as_dict(item) if _is_dataclass_instance(item) else item
+                for item in value
+            ]
 
     return serialized
 
@@ -154,6 +215,170 @@ def remove_nones(data: Union[List, Dict]) -> Union[List, Dict]:
     return data
 
 
+# Values of these types are copied into a payload as they are.
+_SCALAR_TYPES = frozenset([str, int, float, bool])
+
+# Serializers created by `_compile_serializer()`, by dataclass and OCPP version.
+_serializers: Dict[Tuple[type, Optional[str]], Callable[[Any], Dict]] = {}
+
+
+def _serialize_value(value, table: Dict[str, str], ocpp_version: Optional[str]):
+    """Serialize a value that isn't a `str`, `int`, `float` or `bool`."""
+    if _is_dataclass_instance(value):
+        return _get_serializer(value.__class__, ocpp_version)(value)
+
+    if isinstance(value, dict):
+        return {
+            (table.get(key) or _snake_to_camel_key(key)): (
+                item
+                if item.__class__ in _SCALAR_TYPES
+                else _serialize_value(item, table, ocpp_version)
+            )
+            for key, item in value.items()
+            if item is not None
+        }
+
+    if isinstance(value, (list, tuple, LazyList)):
+        return [
+            item
+            if item.__class__ in _SCALAR_TYPES
+            else _serialize_value(item, table, ocpp_version)
+            for item in value
+            if item is not None
+        ]
+
+    return value
+
+
+def _compile_serializer(cls: type, ocpp_version: Optional[str]) -> Callable:
+    """
+    Generate a function that serializes an instance of the dataclass `cls`
+    into the payload of an OCPP message. Fields are read one by one and their
+    camelCase keys are looked up only once, when the function is created.
+
+    For a dataclass
+
+        @dataclass
+        class StatusInfoType:
+            reason_code: str
+            additional_info: Optional[str] = None
+
+    the generated function looks like this:
+
+        def serialize(obj):
+            payload = {}
+            value = obj.reason_code
+            if value is not None:
+                payload['reasonCode'] = (
+                    value if value.__class__ in _SCALAR_TYPES
+                    else _serialize_value(value, _table, _ocpp_version)
+                )
+            value = obj.additional_info
+            ...
+            return payload
+    """
+    table = _SNAKE_TO_CAMEL.get(ocpp_version, {})
+
+    lines = ["def serialize(obj):", "    payload = {}"]
+    for field in fields(cls):
+        key = table.get(field.name) or _snake_to_camel_key(field.name)
+        lines += [
+            f"    value = obj.{field.name}",
+            "    if value is not None:",
+            f"        payload[{key!r}] = (",
+            "            value if value.__class__ in _SCALAR_TYPES",
+            "            else _serialize_value(value, _table, _ocpp_version)",
+            "        )",
+        ]
+    lines.append("    return payload")
+
+    namespace = {
+        "_SCALAR_TYPES": _SCALAR_TYPES,
+        "_serialize_value": _serialize_value,
+        "_table": table,
+        "_ocpp_version": ocpp_version,
+    }
+    exec(
+        compile("\n".join(lines), f"<serializer {cls.__qualname__}>", "exec"), namespace
+    )
+
+    return namespace["serialize"]
+
+
+def _get_serializer(cls: type, ocpp_version: Optional[str]) -> Callable:
+    try:
+        return _serializers[(cls, ocpp_version)]
+    except KeyError:
+        serializer = _compile_serializer(cls, ocpp_version)
+        _serializers[(cls, ocpp_version)] = serializer
+        return serializer
+
+
+def serialize_payload(payload, ocpp_version: Optional[str] = None) -> Dict:
+    """
+    Serialize a payload dataclass into the payload of an OCPP message.
+
+    The result is the same as that of
+
+        remove_nones(snake_to_camel_case(serialize_as_dict(payload), ocpp_version))
+
+    but it's created in a single pass. The serializer for a dataclass is
+    generated when an instance of it is serialized for the first time.
+    """
+    if _is_dataclass_instance(payload):
+        return _get_serializer(payload.__class__, ocpp_version)(payload)
+
+    return _serialize_value(
+        payload, _SNAKE_TO_CAMEL.get(ocpp_version, {}), ocpp_version
+    )
+
+
+def evse_or_transaction_key(msg: Call) -> Optional[Tuple[str, Any]]:
+    """
+    Return the key by which the handling of Call `msg` is ordered when a
+    `ChargePoint` handles Calls concurrently.
+
+    Calls about the same transaction, like the TransactionEvents of OCPP
+    2.0.1 with their increasing `seqNo`, are handled in the order they have
+    been received. So are Calls about the same EVSE or connector that don't
+    refer to a transaction. Other Calls, e.g. Heartbeats, aren't ordered.
+    """
+    payload = msg.payload
+    if not isinstance(payload, dict):
+        return None
+
+    transaction_id = payload.get("transactionId")
+    transaction_info = payload.get("transactionInfo")
+    if transaction_id is None and isinstance(transaction_info, dict):
+        transaction_id = transaction_info.get("transactionId")
+    if isinstance(transaction_id, (str, int)):
+        return ("transaction", transaction_id)
+
+    evse_id = payload.get("evseId")
+    evse = payload.get("evse")
+    if evse_id is None and isinstance(evse, dict):
+        evse_id = evse.get("id")
+    if evse_id is None:
+        evse_id = payload.get("connectorId")
+    if isinstance(evse_id, int):
+        return ("evse", evse_id)
+
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _known_actions(version: str) -> FrozenSet[str]:
+    """Return the actions of OCPP `version`."""
+    from OCPP_LIB.ver16.E_num import Action as v16_Action
+    from OCPP_LIB.ver201.E_num import Action as v201_Action
+
+    if version == "1.6":
+        return frozenset(v16_Action.__members__)
+    if version in ["2.0", "2.0.1"]:
+        return frozenset(v201_Action.__members__)
+    return frozenset()
+
+
 def _raise_key_error(action, version):
     """
     Checks whether a keyerror returned by _handle_call
@@ -193,7 +418,28 @@ class ChargePoint:
     initiated and received by the Central System
     """
 
-    def __init__(self, id, connection, response_timeout=30):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Collect the routes of the handlers once, when the class is defined.
+        # Every instance binds them in `create_route_map()`.
+        get_routes(cls)
+
+    def __init__(
+        self,
+        id,
+        connection,
+        response_timeout=30,
+        validation_engine=None,
+        codec=None,
+        payload_decoder=None,
+        max_pending_calls=1,
+        max_concurrent_handlers=None,
+        ordering_key=evse_or_transaction_key,
+        sync_handler_executor=None,
+        journal=None,
+        metrics_registry=None,
+        max_send_queue_size=1024 * 1024,
+    ):
         """
 
         Args:
@@ -202,6 +448,49 @@ class ChargePoint:
             connection: Connection to CP.
             response_timeout (int): When no response on a request is received
                 within this interval, a asyncio.TimeoutError is raised.
+            validation_engine (str): Engine used to validate payloads, either
+                "jsonschema" or "compiled". Defaults to the engine configured
+                with `OCPP_LIB.ocpp_messages.set_validation_engine()`.
+            codec (str or JSONCodec): Codec used to decode and encode
+                messages, e.g. "json" or "orjson". Defaults to the codec
+                configured with `OCPP_LIB.json_codec.set_default_codec()`.
+            payload_decoder (str): How nested objects of incoming payloads are
+                decoded. "dict" (the default) decodes them into dictionaries,
+                "typed" into the dataclasses of `data_type` and "lazy" does
+                the same, but decodes the items of arrays on first access.
+                See `OCPP_LIB.payload_decoder`.
+            max_pending_calls (int): The number of Calls that may await a
+                response at the same time. OCPP allows only one, use a higher
+                number only for peers that are known to handle more.
+            max_concurrent_handlers (int): By default a received Call is
+                handled before the next message is read. If set, Calls are
+                handled in tasks, so that responses to our own Calls are
+                routed while handlers run. At most this number of Calls are
+                handled, or wait for an earlier Call with the same ordering
+                key, at the same time; until one of them is done no further
+                messages are read.
+            ordering_key (callable): Only used when `max_concurrent_handlers`
+                is set. Returns for a Call a key, Calls with the same key are
+                handled one after another in the order they've been received.
+                Calls for which it returns `None` aren't ordered. Defaults to
+                `evse_or_transaction_key()`; pass `None` to not order Calls
+                at all.
+            sync_handler_executor (HandlerExecutor or Executor): If set,
+                synchronous handlers run in a thread of this executor instead
+                of blocking the event loop. Async handlers, and handlers with
+                an executor of their own passed to `on()`, aren't affected.
+                See `OCPP_LIB.handler_executor`.
+            journal (FrameJournal): If set, every frame that is sent or
+                received is recorded in this journal instead of being logged.
+                See `OCPP_LIB.journal`.
+            metrics_registry (MetricsRegistry): The registry the metrics of
+                this charge point, `self.metrics`, are aggregated in. Defaults
+                to `OCPP_LIB.metrics.REGISTRY`. See `OCPP_LIB.metrics`.
+            max_send_queue_size (int): The number of bytes of frames that may
+                wait to be sent. When the peer reads slowly and the queue is
+                full, sending waits until there's room. Responses are sent
+                before Calls, and Calls about transactions before bulk
+                reports. See `OCPP_LIB.send_queue`.
 
         """
         self.id = id
@@ -211,6 +500,19 @@ class ChargePoint:
         # exceeded.
         self._response_timeout = response_timeout
 
+        self._validation_engine = validation_engine
+
+        self._codec = codec
+
+        if payload_decoder is None:
+            payload_decoder = "dict"
+        if payload_decoder not in PAYLOAD_DECODERS:
+            raise ValueError(
+                f"Unknown payload decoder '{payload_decoder}', "
+                f"expected one of {PAYLOAD_DECODERS}"
+            )
+        self._payload_decoder = payload_decoder
+
         # A connection to the client. Currently this is an instance of gh
         self._connection = connection
 
@@ -219,11 +521,52 @@ class ChargePoint:
         # if exists.
         self.route_map = create_route_map(self)
 
-        self._call_lock = asyncio.Lock()
+        if max_pending_calls < 1:
+            raise ValueError("max_pending_calls must be at least 1")
+
+        # Limits the number of Calls awaiting a response. With the default of
+        # 1 it acts as a lock.
+        self._call_lock = asyncio.Semaphore(max_pending_calls)
+
+        # Futures of the Calls that await a response, by unique id.
+        # `route_message()` passes CallResults and CallErrors to them, other
+        # responses are dropped.
+        self._pending_calls: Dict[str, asyncio.Future] = {}
+
+        if max_concurrent_handlers is not None and max_concurrent_handlers < 1:
+            raise ValueError("max_concurrent_handlers must be at least 1")
 
-        # A queue used to pass CallResults and CallErrors from
-        # the self.serve() task to the self.call() task.
-        self._response_queue = asyncio.Queue()
+        # Limits the number of Calls that are handled at the same time, or
+        # `None` to handle Calls one by one in `route_message()`.
+        self._handler_semaphore = (
+            asyncio.Semaphore(max_concurrent_handlers)
+            if max_concurrent_handlers is not None
+            else None
+        )
+        self._ordering_key = ordering_key
+
+        # The tasks handling Calls, and per ordering key the last of them.
+        self._handler_tasks = set()
+        self._ordered_handler_tasks: Dict[Any, asyncio.Task] = {}
+
+        # Executor for synchronous handlers, or `None` to run them on the
+        # event loop.
+        self._sync_handler_executor = as_handler_executor(sync_handler_executor)
+
+        self._journal = journal
+
+        # Counters and histograms of the messages of this charge point.
+        if metrics_registry is None:
+            metrics_registry = REGISTRY
+        self.metrics = metrics_registry.register(self)
+
+        # Frames are written one at a time, by priority, see `_send()`.
+        self._send_queue = SendQueue(
+            self._write,
+            max_send_queue_size,
+            self.metrics,
+            on_error=self._fail_dropped_calls,
+        )
 
         # Function used to generate unique ids for CALLs. By default
         # uuid.uuid4() is used, but it can be changed. This is meant primarily
@@ -231,11 +574,56 @@ class ChargePoint:
         self._unique_id_generator = uuid.uuid4
 
     async def start(self):
-        while True:
-            message = await self._connection.recv()
-            LOGGER.info("%s: receive message %s", self.id, message)
+        self.metrics.connections = 1
+        try:
+            while True:
+                message = await self._connection.recv()
+                if self._journal is None:
+                    LOGGER.info("%s: receive message %s", self.id, message)
+
+                await self.route_message(message)
+        finally:
+            # The connection is closed, no responses will arrive anymore and
+            # queued frames can't be sent.
+            await self._cancel_handler_tasks()
+            self.cancel_pending_calls()
+            self._send_queue.close()
+            self.metrics.connections = 0
+
+    async def _cancel_handler_tasks(self):
+        """Cancel the tasks handling Calls and wait until they're done."""
+        tasks = list(self._handler_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._ordered_handler_tasks.clear()
+
+    def cancel_pending_calls(self):
+        """
+        Cancel all Calls that await a response. `call()` raises an
+        `asyncio.CancelledError` for them.
 
-            await self.route_message(message)
+        `start()` does this when the connection has been closed. Call it when
+        messages are received in another way.
+        """
+        for future in self._pending_calls.values():
+            future.cancel()
+        self._pending_calls.clear()
+        self.metrics.pending_calls = 0
+
+    def _fail_dropped_calls(self, error, frames):
+        """Raise `error` in the `call()`s of which the frames have been
+        dropped by the send queue, instead of letting them time out."""
+        for frame in frames:
+            try:
+                msg = unpack(frame, self._codec, lazy=True)
+            except OCPPError:
+                continue
+            if msg.message_type_id != MessageType.Call:
+                continue
+            future = self._pending_calls.get(msg.unique_id)
+            if future is not None and not future.done():
+                future.set_exception(error)
 
     async def route_message(self, raw_msg):
         """
@@ -243,10 +631,17 @@ class ChargePoint:
 
         If the message is a of type Call the corresponding hooks are executed.
         If the message is of type CallResult or CallError the message is passed
-        to the call() function via the response_queue.
+        to the call() that awaits the response with the same unique id.
+
+        Only the header of a CallResult or CallError is decoded here. Responses
+        that don't belong to a Call that call() is waiting for, like late or
+        duplicate responses, are dropped without decoding their payload.
         """
+        if self._journal is not None:
+            self._record(INBOUND, raw_msg)
+
         try:
-            msg = unpack(raw_msg)
+            msg = unpack(raw_msg, self._codec, lazy=True)
         except OCPPError as e:
             LOGGER.exception(
                 "Unable to parse message: '%s', it doesn't seem "
@@ -257,15 +652,120 @@ class ChargePoint:
             return
 
         if msg.message_type_id == MessageType.Call:
-            try:
-                await self._handle_call(msg)
-            except OCPPError as error:
-                LOGGER.exception("Error while handling request '%s'", msg)
-                response = msg.create_call_error(error).to_json()
-                await self._send(response)
+            self.metrics.message("in", self._action_label(msg.action), "Call")
+            if self._handler_semaphore is None:
+                await self._route_call(msg)
+            else:
+                # Wait for a free slot, so that `start()` stops reading while
+                # the handlers can't keep up.
+                await self._handler_semaphore.acquire()
+                self._schedule_call(msg)
 
         elif msg.message_type_id in [MessageType.CallResult, MessageType.CallError]:
-            self._response_queue.put_nowait(msg)
+            future = self._pending_calls.get(msg.unique_id)
+            if future is None or future.done():
+                # Responses to Calls are counted by `call()`.
+                self.metrics.message(
+                    "in", "unknown", _MESSAGE_TYPES[msg.message_type_id]
+                )
+                LOGGER.warning(
+                    "Ignoring response with unknown unique id: %s", msg.unique_id
+                )
+                return
+
+            future.set_result(msg)
+
+    async def _route_call(self, msg):
+        try:
+            await self._handle_call(msg)
+        except OCPPError as error:
+            LOGGER.exception("Error while handling request '%s'", msg)
+            await self._send_call_error(msg, error)
+
+    def _schedule_call(self, msg):
+        """Handle Call `msg` in a task, after the Call received before with
+        the same ordering key has been handled. The slot acquired from
+        `_handler_semaphore` is released when the task is done."""
+        key = self._ordering_key(msg) if self._ordering_key is not None else None
+        previous = self._ordered_handler_tasks.get(key) if key is not None else None
+
+        task = asyncio.ensure_future(self._run_call(msg, previous))
+        self._handler_tasks.add(task)
+        task.add_done_callback(self._handler_tasks.discard)
+        # Also released if the task is cancelled before it runs.
+        task.add_done_callback(lambda task: self._handler_semaphore.release())
+
+        if key is not None:
+            self._ordered_handler_tasks[key] = task
+
+            def forget(task):
+                if self._ordered_handler_tasks.get(key) is task:
+                    del self._ordered_handler_tasks[key]
+
+            task.add_done_callback(forget)
+
+    async def _run_call(self, msg, previous):
+        if previous is not None:
+            # Wait without raising the exception `previous` might have failed
+            # with.
+            await asyncio.wait([previous])
+
+        try:
+            await self._route_call(msg)
+        except Exception:
+            LOGGER.exception("Error while handling request '%s'", msg)
+
+    async def _send_call_error(self, msg, error):
+        """Send a CallError in response to Call `msg` that failed with
+        `error`."""
+        call_error = msg.create_call_error(error)
+        action = self._action_label(msg.action)
+        self.metrics.message("out", action, "CallError")
+        self.metrics.call_error("out", action, call_error.error_code)
+        await self._send(call_error.to_json(self._codec), RESPONSE)
+
+    def _action_label(self, action) -> str:
+        """Return the label of the metrics of a received Call with `action`.
+        Actions are chosen by the peer, so the ones this charge point has no
+        route for and that aren't actions of its OCPP version are counted as
+        "unknown", to keep the number of labels bounded."""
+        if isinstance(action, str) and (
+            action in self.route_map or action in _known_actions(self._ocpp_version)
+        ):
+            return action
+        return "unknown"
+
+    def _validate_payload(self, message, message_type):
+        """Validate the payload of `message` and measure how long it takes."""
+        start = time.perf_counter()
+        try:
+            validate_payload(message, self._ocpp_version, self._validation_engine)
+        finally:
+            self.metrics.observe(
+                "validation",
+                time.perf_counter() - start,
+                message.action,
+                message_type,
+            )
+
+    def _decode_payload(self, msg):
+        """Return the payload of `msg` with snake_case keys, decoded by the
+        payload decoder of this charge point."""
+        if self._payload_decoder == "dict":
+            return camel_to_snake_case(msg.payload, self._ocpp_version)
+
+        try:
+            decode = get_decoder(
+                msg.message_type_id,
+                msg.action,
+                self._ocpp_version,
+                lazy=self._payload_decoder == "lazy",
+            )
+        except OSError:
+            # No schema exists for this action.
+            return camel_to_snake_case(msg.payload, self._ocpp_version)
+
+        return decode(msg.payload)
 
     async def _handle_call(self, msg):
         """
@@ -286,67 +786,74 @@ class ChargePoint:
             return
 
         if not handlers.get("_skip_schema_validation", False):
-            validate_payload(msg, self._ocpp_version)
+            self._validate_payload(msg, "Call")
         # OCPP uses camelCase for the keys in the payload. It's more pythonic
         # to use snake_case for keyword arguments. Therefore the keys must be
         # 'translated'. Some examples:
         #
         # * chargePointVendor becomes charge_point_vendor
         # * firmwareVersion becomes firmwareVersion
-        snake_case_payload = camel_to_snake_case(msg.payload)
+        snake_case_payload = self._decode_payload(msg)
 
         try:
             handler = handlers["_on_action"]
         except KeyError:
             _raise_key_error(msg.action, self._ocpp_version)
-        handler_signature = inspect.signature(handler)
-        call_unique_id_required = "call_unique_id" in handler_signature.parameters
         try:
             # call_unique_id should be passed as kwarg only if is defined explicitly
             # in the handler signature
-            if call_unique_id_required:
-                response = handler(**snake_case_payload, call_unique_id=msg.unique_id)
-            else:
-                response = handler(**snake_case_payload)
-            if inspect.isawaitable(response):
-                response = await response
+            kwargs = snake_case_payload
+            if accepts_call_unique_id(handler):
+                kwargs = {**snake_case_payload, "call_unique_id": msg.unique_id}
+
+            executor = handler_executor(handler, self._sync_handler_executor)
+            start = time.perf_counter()
+            try:
+                if executor is not None:
+                    response = await executor.run(handler, **kwargs)
+                else:
+                    response = handler(**kwargs)
+                if inspect.isawaitable(response):
+                    response = await response
+            finally:
+                self.metrics.observe("handler", time.perf_counter() - start, msg.action)
         except Exception as e:
             LOGGER.exception("Error while handling request '%s'", msg)
-            response = msg.create_call_error(e).to_json()
-            await self._send(response)
+            await self._send_call_error(msg, e)
 
             return
 
-        temp_response_payload = serialize_as_dict(response)
-
-        # Remove nones ensures that we strip out optional arguments
-        # which were not set and have a default value of None
-        response_payload = remove_nones(temp_response_payload)
-
         # The response payload must be 'translated' from snake_case to
         # camelCase. So:
         #
         # * charge_point_vendor becomes chargePointVendor
         # * firmware_version becomes firmwareVersion
-        camel_case_payload = snake_to_camel_case(response_payload)
+        #
+        # Optional arguments which were not set and have a default value of
+        # None are stripped out.
+        camel_case_payload = serialize_payload(response, self._ocpp_version)
 
         response = msg.create_call_result(camel_case_payload)
 
         if not handlers.get("_skip_schema_validation", False):
-            validate_payload(response, self._ocpp_version)
+            self._validate_payload(response, "CallResult")
 
-        await self._send(response.to_json())
+        self.metrics.message("out", msg.action, "CallResult")
+        await self._send(response.to_json(self._codec), RESPONSE)
 
         try:
             handler = handlers["_after_action"]
-            handler_signature = inspect.signature(handler)
-            call_unique_id_required = "call_unique_id" in handler_signature.parameters
             # call_unique_id should be passed as kwarg only if is defined explicitly
             # in the handler signature
-            if call_unique_id_required:
-                response = handler(**snake_case_payload, call_unique_id=msg.unique_id)
+            kwargs = snake_case_payload
+            if accepts_call_unique_id(handler):
+                kwargs = {**snake_case_payload, "call_unique_id": msg.unique_id}
+
+            executor = handler_executor(handler, self._sync_handler_executor)
+            if executor is not None:
+                response = asyncio.ensure_future(executor.run(handler, **kwargs))
             else:
-                response = handler(**snake_case_payload)
+                response = handler(**kwargs)
             # Create task to avoid blocking when making a call inside the
             # after handler
             if inspect.isawaitable(response):
@@ -371,7 +878,14 @@ class ChargePoint:
 
         When waiting for a response no other Call message can be send. So this
         function will wait before response arrives or response timeout has
-        expired. This is in line the OCPP specification
+        expired. This is in line the OCPP specification. Unless the charge
+        point has been created with a `max_pending_calls` higher than 1, then
+        up to that number of Calls are sent without waiting.
+
+        An asyncio.CancelledError is raised if the pending calls are cancelled
+        because the connection has been closed, see `cancel_pending_calls()`.
+        If the Call was queued and writing a frame fails, the exception of
+        writing is raised right away.
 
         Suppress is used to maintain backwards compatibility. When set to True,
         if response is a CallError, then this call will be suppressed. When
@@ -379,7 +893,7 @@ class ChargePoint:
         CallError.
 
         """
-        camel_case_payload = snake_to_camel_case(serialize_as_dict(payload))
+        camel_case_payload = serialize_payload(payload, self._ocpp_version)
 
         unique_id = (
             unique_id if unique_id is not None else str(self._unique_id_generator())
@@ -393,35 +907,63 @@ class ChargePoint:
         call = Call(
             unique_id=unique_id,
             action=action_name,
-            payload=remove_nones(camel_case_payload),
+            payload=camel_case_payload,
         )
 
-        validate_payload(call, self._ocpp_version)
+        self._validate_payload(call, "Call")
 
         # Use a lock to prevent make sure that only 1 message can be send at a
-        # a time.
+        # a time, or `max_pending_calls` messages.
         async with self._call_lock:
-            await self._send(call.to_json())
+            if call.unique_id in self._pending_calls:
+                raise ValueError(
+                    f"A Call with unique id '{call.unique_id}' is already pending"
+                )
+
+            # Registered before sending, the response may arrive before
+            # `_get_specific_response()` is called.
+            self._pending_calls[
+                call.unique_id
+            ] = asyncio.get_running_loop().create_future()
+            self.metrics.pending_calls = len(self._pending_calls)
             try:
+                self.metrics.message("out", call.action, "Call")
+                start = time.perf_counter()
+                await self._send(
+                    call.to_json(self._codec), priority(MessageType.Call, call.action)
+                )
                 response = await self._get_specific_response(
                     call.unique_id, self._response_timeout
                 )
+                self.metrics.observe(
+                    "round_trip", time.perf_counter() - start, call.action
+                )
             except asyncio.TimeoutError:
+                self.metrics.timeout(call.action)
                 raise asyncio.TimeoutError(
                     f"Waited {self._response_timeout}s for response on "
-                    f"{call.to_json()}."
+                    f"{call.to_json(self._codec)}."
                 )
+            finally:
+                self._pending_calls.pop(call.unique_id, None)
+                self.metrics.pending_calls = len(self._pending_calls)
 
+        self.metrics.message(
+            "in", call.action, _MESSAGE_TYPES[response.message_type_id]
+        )
         if response.message_type_id == MessageType.CallError:
+            self.metrics.call_error(
+                "in", call.action, _error_code_label(response.error_code)
+            )
             LOGGER.warning("Received a CALLError: %s'", response)
             if suppress:
                 return
             raise response.to_exception()
         else:
             response.action = call.action
-            validate_payload(response, self._ocpp_version)
+            self._validate_payload(response, "CallResult")
 
-        snake_case_payload = camel_to_snake_case(response.payload)
+        snake_case_payload = self._decode_payload(response)
         # Create the correct Payload instance based on the received payload. If
         # this method is called with a call.BootNotificationPayload, then it
         # will create a call_result.BootNotificationPayload. If this method is
@@ -434,24 +976,27 @@ class ChargePoint:
         """
         Return response with given unique ID or raise an asyncio.TimeoutError.
         """
-        wait_until = time.time() + timeout
-        try:
-            # Wait for response of the Call message.
-            response = await asyncio.wait_for(self._response_queue.get(), timeout)
-        except asyncio.TimeoutError:
-            raise
-
-        if response.unique_id == unique_id:
-            return response
+        return await asyncio.wait_for(self._pending_calls[unique_id], timeout)
 
-        LOGGER.error("Ignoring response with unknown unique id: %s", response)
-        timeout_left = wait_until - time.time()
+    async def _send(self, message, priority=DEFAULT):
+        """Send `message` with priority class `priority`. Waits while the
+        send queue is full, see `OCPP_LIB.send_queue`."""
+        await self._send_queue.put(message, priority)
 
-        if timeout_left < 0:
-            raise asyncio.TimeoutError
-
-        return await self._get_specific_response(unique_id, timeout_left)
-
-    async def _send(self, message):
-        LOGGER.info("%s: send %s", self.id, message)
+    def _record(self, direction, frame):
+        """Record `frame` in the journal. A journal that fails, e.g. because
+        it has been closed, mustn't break the connection, so the frame is
+        logged instead."""
+        try:
+            self._journal.record(self.id, direction, frame)
+        except Exception:
+            LOGGER.exception("%s: Can't record %s in the journal", self.id, frame)
+
+    async def _write(self, message):
+        """Write `message` to the connection. Only the send queue calls it,
+        one message at a time."""
+        if self._journal is not None:
+            self._record(OUTBOUND, message)
+        else:
+            LOGGER.info("%s: send %s", self.id, message)
         await self._connection.send(message)
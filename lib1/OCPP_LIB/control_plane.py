@@ -0,0 +1,331 @@
+""" Module with an HTTP/JSON API to send commands to connected charge points.
+
+A `ControlPlane` calls the `send_*` methods of the charge points in a
+connection registry, see `OCPP_LIB.connection_registry`. A command names the
+charge point, the action and the arguments of the method:
+
+    {"charge_point_id": "CP_1", "action": "CancelReservation",
+     "arguments": {"reservation_id_value": 123}}
+
+calls `await CONNECTIONS["CP_1"].send_cancel_reservation(
+reservation_id_value=123)`. The action may also be given in snake_case,
+"cancel_reservation", and the arguments as a list. Instead of
+"charge_point_id" a command may have "charge_point_ids", a list of ids, or
+"select", a query of the registry like `{"vendor": "ACME"}`, to send it to
+several charge points. An optional "timeout" overrides the deadline of the
+control plane.
+
+`serve()` serves the API over TCP, or over a Unix socket if `path` is given:
+
+    >>> server = await ControlPlane().serve(port=8180)
+    $ curl -X POST http://127.0.0.1:8180/commands -d '[
+        {"charge_point_id": "CP_1", "action": "ClearCache"},
+        {"select": {"vendor": "ACME"}, "action": "TriggerMessage",
+         "arguments": {"requested_message_value": "Heartbeat"}}]'
+    $ curl -X POST 'http://127.0.0.1:8180/commands?async=true' -d '...'
+    {"job": "1"}
+    $ curl http://127.0.0.1:8180/jobs/1
+    $ curl 'http://127.0.0.1:8180/charge_points?vendor=ACME'
+
+POST /commands takes one command or a list of them, runs them concurrently
+and returns a result per charge point a command is sent to, with a status of
+`OCPP_LIB.fleet`. Every command is sent with a `FanOut`. With
+`?async=true` it returns a job id right away, and GET /jobs/<id> returns the
+results once the job is done.
+
+Everything runs on the event loop, without a thread per connection or a
+task per charge point.
+"""
+import asyncio
+import collections
+import dataclasses
+import itertools
+import json
+import urllib.parse
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from OCPP_LIB.connection_registry import CONNECTIONS, ConnectionRegistry
+from OCPP_LIB.fleet import ERROR, NOT_CONNECTED, SUCCESS, FanOut
+
+# The largest request body that is accepted, in bytes.
+MAX_BODY_SIZE = 10 * 1024 * 1024
+
+
+class _UnknownActionError(Exception):
+    """Raised for a command with an action the charge point has no `send_*`
+    method for."""
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: str, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _method(charge_point, action: str) -> Optional[Callable[..., Awaitable[Any]]]:
+    """Return the `send_*` method of `charge_point` for `action`, in
+    CamelCase or snake_case, or `None`."""
+    name = action.replace("_", "").lower()
+    for attribute in dir(charge_point):
+        if attribute.startswith("send_") and attribute[5:].replace("_", "") == name:
+            return getattr(charge_point, attribute)
+    return None
+
+
+def _to_json(value: Any) -> Any:
+    """Convert a response of a `send_*` method to something JSON can
+    encode."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    return value
+
+
+class ControlPlane:
+    """
+    Runs commands against the charge points in `registry`, `CONNECTIONS` by
+    default, at most `concurrency` at the same time, each with a deadline of
+    `timeout` seconds.
+
+    `on_result`, if given, is awaited with the charge point id, the action
+    and the response of every command that succeeded, e.g. to store the
+    response. The results of the last `max_jobs` asynchronous jobs are kept.
+    """
+
+    def __init__(
+        self,
+        registry: Optional[ConnectionRegistry] = None,
+        concurrency: int = 100,
+        timeout: float = 60,
+        on_result: Optional[Callable[[str, str, Any], Awaitable[None]]] = None,
+        max_jobs: int = 1000,
+    ):
+        self.registry = registry if registry is not None else CONNECTIONS
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.on_result = on_result
+        self.max_jobs = max_jobs
+
+        # Created on the event loop that runs the commands.
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._job_ids = itertools.count(1)
+        self._jobs: "collections.OrderedDict[str, Dict[str, Any]]" = (
+            collections.OrderedDict()
+        )
+        # Keep references to the tasks of running jobs.
+        self._tasks = set()
+
+    def _select(self, command: Dict[str, Any]) -> List[str]:
+        """Return the ids of the charge points the command is sent to."""
+        if "charge_point_id" in command:
+            ids = [command["charge_point_id"]]
+        elif "charge_point_ids" in command:
+            ids = list(command["charge_point_ids"])
+        elif "select" in command:
+            ids = sorted(self.registry.find(**command["select"]))
+        else:
+            raise ValueError(
+                "A command needs 'charge_point_id', 'charge_point_ids' or 'select'"
+            )
+        return [str(charge_point_id) for charge_point_id in ids]
+
+    def _fan_out(self, command: Dict[str, Any]) -> FanOut:
+        """Return a `FanOut` that calls the `send_*` method of the command on
+        the charge points it's sent to."""
+        action = str(command.get("action", ""))
+        timeout = command.get("timeout", self.timeout)
+
+        async def call(charge_point, arguments):
+            method = _method(charge_point, action) if action else None
+            if method is None:
+                raise _UnknownActionError(f"Unknown action '{action}'")
+
+            args, kwargs = (
+                (arguments, {}) if isinstance(arguments, list) else ((), arguments)
+            )
+            async with self._semaphore:
+                response = await asyncio.wait_for(method(*args, **kwargs), timeout)
+            if self.on_result is not None:
+                await self.on_result(charge_point.id, action, response)
+            return response
+
+        return FanOut(
+            self._select(command),
+            command.get("arguments") or {},
+            registry=self.registry,
+            concurrency=self.concurrency,
+            # `call` applies the deadline, after waiting for a free slot.
+            timeout=None,
+            call=call,
+        )
+
+    async def _results(
+        self, command: Dict[str, Any], fan_out: FanOut
+    ) -> List[Dict[str, Any]]:
+        """Return the results of `fan_out`, in the order of the charge point
+        ids."""
+        action = str(command.get("action", ""))
+        order = {}
+        for index, charge_point_id in enumerate(fan_out.charge_point_ids):
+            order.setdefault(charge_point_id, index)
+
+        results = []
+        for fan_out_result in sorted(
+            await fan_out.results(), key=lambda r: order[r.charge_point_id]
+        ):
+            status = fan_out_result.status
+            result = {
+                "charge_point_id": fan_out_result.charge_point_id,
+                "action": action,
+                "status": status,
+            }
+            if status == SUCCESS:
+                result["response"] = _to_json(fan_out_result.response)
+            elif status == ERROR:
+                error = fan_out_result.error
+                result["error"] = (
+                    str(error)
+                    if isinstance(error, _UnknownActionError)
+                    else f"{type(error).__name__}: {error}"
+                )
+            if status != NOT_CONNECTED:
+                result["elapsed"] = fan_out_result.elapsed
+            results.append(result)
+        return results
+
+    async def execute(self, commands: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run `commands` concurrently and return the results, one per charge
+        point a command is sent to, in the order of the commands."""
+        fan_outs = [self._fan_out(command) for command in commands]
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        results = await asyncio.gather(
+            *(self._results(*pair) for pair in zip(commands, fan_outs))
+        )
+        return [result for command_results in results for result in command_results]
+
+    def submit(self, commands: List[Dict[str, Any]]) -> str:
+        """Start running `commands` and return the id of the job."""
+        # Check the commands before the job starts.
+        for command in commands:
+            self._select(command)
+
+        job_id = str(next(self._job_ids))
+        job: Dict[str, Any] = {"job": job_id, "status": "running", "results": None}
+        self._jobs[job_id] = job
+        while len(self._jobs) > self.max_jobs:
+            self._jobs.popitem(last=False)
+
+        async def run():
+            job["results"] = await self.execute(commands)
+            job["status"] = "done"
+
+        task = asyncio.ensure_future(run())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job_id
+
+    def job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the status and, once it's done, the results of a job."""
+        return self._jobs.get(job_id)
+
+    async def handle(
+        self, method: str, target: str, body: bytes
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Handle an HTTP request and return the status and the JSON body of
+        the response."""
+        url = urllib.parse.urlsplit(target)
+        query = dict(urllib.parse.parse_qsl(url.query))
+        path = url.path.rstrip("/")
+
+        if path == "/commands":
+            if method != "POST":
+                raise _HTTPError("405 Method Not Allowed", "Use POST")
+            try:
+                commands = json.loads(body or b"null")
+            except ValueError as e:
+                raise _HTTPError("400 Bad Request", f"Invalid JSON: {e}")
+            if isinstance(commands, dict):
+                commands = [commands]
+            if not isinstance(commands, list) or not all(
+                isinstance(command, dict) for command in commands
+            ):
+                raise _HTTPError("400 Bad Request", "Expected commands")
+
+            try:
+                if query.get("async") in ("1", "true"):
+                    return "202 Accepted", {"job": self.submit(commands)}
+                return "200 OK", {"results": await self.execute(commands)}
+            except (ValueError, TypeError) as e:
+                raise _HTTPError("400 Bad Request", str(e))
+
+        if path.startswith("/jobs/") and method == "GET":
+            job = self.job(path.rsplit("/", 1)[1])
+            if job is None:
+                raise _HTTPError("404 Not Found", "Unknown job")
+            return "200 OK", job
+
+        if path == "/charge_points" and method == "GET":
+            try:
+                ids = sorted(self.registry.find(**query))
+            except (ValueError, TypeError) as e:
+                raise _HTTPError("400 Bad Request", str(e))
+            charge_points = []
+            for charge_point_id in ids:
+                try:
+                    attributes = self.registry.attributes(charge_point_id)
+                except KeyError:
+                    # Disconnected in the meantime.
+                    continue
+                charge_points.append({"id": charge_point_id, **attributes})
+            return "200 OK", {"charge_points": charge_points}
+
+        raise _HTTPError("404 Not Found", "Not Found")
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            try:
+                request_line = (await reader.readline()).decode("latin-1")
+                headers = {}
+                while True:
+                    line = (await reader.readline()).decode("latin-1").strip()
+                    if not line:
+                        break
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                parts = request_line.split()
+                if len(parts) < 2:
+                    raise _HTTPError("400 Bad Request", "Invalid request")
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY_SIZE:
+                    raise _HTTPError("413 Payload Too Large", "Body too large")
+                body = await reader.readexactly(length) if length else b""
+
+                status, response = await self.handle(parts[0], parts[1], body)
+            except _HTTPError as e:
+                status, response = e.status, {"error": str(e)}
+
+            data = json.dumps(response, default=str).encode()
+            writer.write(
+                (
+                    f"HTTP/1.1 {status}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    "Connection: close\r\n\r\n"
+                ).encode()
+                + data
+            )
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(
+        self, host: str = "127.0.0.1", port: int = 8180, path: Optional[str] = None
+    ) -> asyncio.AbstractServer:
+        """Serve the API at http://`host`:`port`, or on the Unix socket
+        `path` if it's given. Close it with `server.close()`."""
+        if path is not None:
+            return await asyncio.start_unix_server(self._handle_connection, path)
+        return await asyncio.start_server(self._handle_connection, host, port)
@@ -161,3 +161,17 @@ class UnknownCallErrorCodeError(Exception):
     """Raised when a CALLERROR is received with unknown error code."""
 
     pass
+
+
+class StorageFullError(Exception):
+    """Raised when a document can't be buffered by a `WriteBehindStore`
+    because its buffer stays full, i.e. storage is too slow."""
+
+    pass
+
+
+class ConnectionClosedError(Exception):
+    """Raised when a message is sent or received on a closed in-memory
+    connection, see `OCPP_LIB.loopback`."""
+
+    pass
@@ -0,0 +1,192 @@
+""" Module to send the same Call to many charge points at once.
+
+`FanOut` sends a payload to every selected charge point, with at most
+`concurrency` Calls at the same time and a deadline per Call, and yields the
+results as they complete:
+
+    >>> fan_out = FanOut(
+    ...     {"vendor": "ACME", "firmware_version": "1.2.3"},
+    ...     ocpp_request.UpdateFirmware(request_id=1, firmware=firmware),
+    ...     concurrency=200,
+    ...     timeout=30,
+    ... )
+    >>> async for result in fan_out:
+    ...     print(result.charge_point_id, result.status, result.response)
+    >>> fan_out.counts
+    {'success': 980, 'error': 12, 'timeout': 8, 'not_connected': 0}
+
+The charge points are selected by a list of ids or by a query of the
+connection registry, see `OCPP_LIB.connection_registry`. Instead of a payload
+a function can be passed that returns the payload for a charge point id, and
+instead of `ChargePoint.call()` another coroutine function can make the Call,
+like a `send_*` method of the charge point.
+"""
+import asyncio
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from OCPP_LIB.connection_registry import CONNECTIONS, ConnectionRegistry
+
+# The status of a result.
+SUCCESS = "success"
+ERROR = "error"
+TIMEOUT = "timeout"
+NOT_CONNECTED = "not_connected"
+STATUSES = (SUCCESS, ERROR, TIMEOUT, NOT_CONNECTED)
+
+
+class FanOutResult(NamedTuple):
+    """The result of the Call to one charge point."""
+
+    charge_point_id: str
+    # One of `STATUSES`.
+    status: str
+    # The CallResult payload, if the status is `SUCCESS`.
+    response: Any = None
+    # The exception, like an `OCPPError` for a CallError, if the status is
+    # `ERROR`.
+    error: Optional[BaseException] = None
+    # Seconds from sending the Call until the result.
+    elapsed: float = 0.0
+
+
+class FanOut:
+    """
+    Sends `payload` to the charge points selected by `selector`: a list of
+    charge point ids or a dictionary of attributes to `find()` in `registry`,
+    `CONNECTIONS` by default.
+
+    At most `concurrency` Calls are made at the same time. A Call that
+    hasn't been answered after `timeout` seconds, including the time it waits
+    for earlier Calls to the same charge point, has status `TIMEOUT`. With a
+    `timeout` of `None` there's no deadline.
+
+    If `call` is given, it's awaited with the charge point and the payload
+    instead of `charge_point.call(payload, suppress=False)`. Its result is
+    the response, and an `asyncio.TimeoutError` it raises is a `TIMEOUT`.
+
+    Iterate over it to start the Calls and get the results as they complete,
+    or await `results()` to get all of them. `counts` holds the number of
+    results per status so far.
+    """
+
+    def __init__(
+        self,
+        selector: Union[Iterable[str], Dict[str, Any]],
+        payload: Union[Any, Callable[[str], Any]],
+        registry: Optional[ConnectionRegistry] = None,
+        concurrency: int = 100,
+        timeout: Optional[float] = 30,
+        call: Optional[Callable[[Any, Any], Awaitable[Any]]] = None,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self.registry = registry if registry is not None else CONNECTIONS
+        if isinstance(selector, dict):
+            self.charge_point_ids: List[str] = sorted(self.registry.find(**selector))
+        else:
+            self.charge_point_ids = list(selector)
+
+        self.payload = payload
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.call = call
+        self.counts: Dict[str, int] = {status: 0 for status in STATUSES}
+        self._started = False
+
+    def __len__(self) -> int:
+        return len(self.charge_point_ids)
+
+    async def _call(self, charge_point_id: str) -> FanOutResult:
+        start = time.perf_counter()
+        try:
+            charge_point = self.registry.get(charge_point_id)
+            if charge_point is None:
+                return FanOutResult(charge_point_id, NOT_CONNECTED)
+
+            payload = (
+                self.payload(charge_point_id)
+                if callable(self.payload)
+                else self.payload
+            )
+            if self.call is not None:
+                call = self.call(charge_point, payload)
+            else:
+                call = charge_point.call(payload, suppress=False)
+            response = await asyncio.wait_for(call, self.timeout)
+        except asyncio.TimeoutError:
+            return FanOutResult(
+                charge_point_id, TIMEOUT, elapsed=time.perf_counter() - start
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            return FanOutResult(
+                charge_point_id, ERROR, error=e, elapsed=time.perf_counter() - start
+            )
+        return FanOutResult(
+            charge_point_id, SUCCESS, response, elapsed=time.perf_counter() - start
+        )
+
+    async def __aiter__(self) -> AsyncIterator[FanOutResult]:
+        if self._started:
+            raise RuntimeError("A FanOut can only be iterated once")
+        self._started = True
+
+        ids = iter(self.charge_point_ids)
+        results: asyncio.Queue = asyncio.Queue()
+
+        async def worker():
+            # The ids are taken one by one, so that at most `concurrency`
+            # Calls are made at the same time, without a task per Call.
+            for charge_point_id in ids:
+                await results.put(await self._call(charge_point_id))
+
+        workers = [
+            asyncio.ensure_future(worker())
+            for _ in range(min(self.concurrency, len(self.charge_point_ids)))
+        ]
+        running = set(workers)
+        get: Optional[asyncio.Future] = None
+        try:
+            for _ in range(len(self.charge_point_ids)):
+                get = asyncio.ensure_future(results.get())
+                while not get.done():
+                    # A worker that stops early doesn't put its results, so
+                    # don't wait for them.
+                    await asyncio.wait(
+                        running | {get}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in [task for task in running if task.done()]:
+                        running.discard(task)
+                        if not task.cancelled() and task.exception() is not None:
+                            raise task.exception()
+                    if not running and results.empty() and not get.done():
+                        return
+                result = get.result()
+                self.counts[result.status] += 1
+                yield result
+        finally:
+            if get is not None:
+                get.cancel()
+            # The caller may stop iterating early.
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def results(self) -> List[FanOutResult]:
+        """Make all Calls and return the results, in the order they've
+        completed."""
+        return [result async for result in self]
@@ -0,0 +1,154 @@
+""" Module to run synchronous handlers in a thread pool.
+
+A handler defined with `def` runs on the event loop. While it blocks, e.g.
+on a database write, no other connection of the process is served. Such
+handlers can be run in a `HandlerExecutor` instead, either per handler:
+
+    >>> executor = HandlerExecutor(max_workers=8)
+    >>> class MyChargePoint(ChargePoint):
+    ...     @on('Authorize', executor=executor)
+    ...     def on_authorize(self, id_token, **kwargs):
+    ...         ...
+
+or for all synchronous handlers of a charge point:
+
+    >>> cp = MyChargePoint(id, connection, sync_handler_executor=executor)
+
+Async handlers always run on the event loop.
+
+The executor keeps metrics to tell whether the pool is large enough: how many
+handlers run and wait for a thread, and how long they waited, see
+`HandlerExecutor.metrics()`.
+"""
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Union
+
+
+class HandlerExecutor:
+    """
+    Runs handlers in a thread pool of at most `max_workers` threads and
+    keeps metrics about it.
+
+    Instead of creating a thread pool, an existing `concurrent.futures`
+    executor can be passed as `executor`. `max_workers` must then be the
+    number of workers of that executor, it's used to compute the saturation.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        executor: Optional[Executor] = None,
+        name: str = "ocpp-handler",
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.name = name
+        self.max_workers = max_workers
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=name
+        )
+
+        # The metrics are updated from the event loop and the worker threads.
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._queued = 0
+        self._running = 0
+        self._max_queued = 0
+        self._queue_time_total = 0.0
+        self._queue_time_max = 0.0
+        self._run_time_total = 0.0
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run `func(*args, **kwargs)` in the thread pool and return its
+        result."""
+        with self._lock:
+            self._submitted += 1
+            self._queued += 1
+            self._max_queued = max(self._max_queued, self._queued)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(self._call, time.perf_counter(), func, args, kwargs),
+        )
+
+    def _call(self, submitted_at: float, func: Callable, args, kwargs) -> Any:
+        started_at = time.perf_counter()
+        queue_time = started_at - submitted_at
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            self._queue_time_total += queue_time
+            self._queue_time_max = max(self._queue_time_max, queue_time)
+
+        failed = True
+        try:
+            result = func(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+                self._failed += failed
+                self._run_time_total += time.perf_counter() - started_at
+
+    def metrics(self) -> Dict[str, Union[int, float]]:
+        """
+        Return a snapshot of the metrics:
+
+        * submitted, completed, failed: number of handlers.
+        * running: number of handlers running in a thread.
+        * queued, max_queued: number of handlers waiting for a thread, now
+          and at most.
+        * saturation: the fraction of threads that is busy, 1.0 means new
+          handlers have to wait.
+        * queue_time_avg, queue_time_max: time in seconds that handlers have
+          waited for a thread.
+        * run_time_avg: time in seconds that handlers have run.
+        """
+        with self._lock:
+            started = self._completed + self._running
+            return {
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "running": self._running,
+                "queued": self._queued,
+                "max_queued": self._max_queued,
+                "saturation": self._running / self.max_workers,
+                "queue_time_avg": self._queue_time_total / started if started else 0.0,
+                "queue_time_max": self._queue_time_max,
+                "run_time_avg": (
+                    self._run_time_total / self._completed if self._completed else 0.0
+                ),
+            }
+
+    def shutdown(self, wait: bool = True):
+        """Shut down the thread pool."""
+        self._executor.shutdown(wait=wait)
+
+    def __repr__(self):
+        return f"<HandlerExecutor - name={self.name}, max_workers={self.max_workers}>"
+
+
+def as_handler_executor(
+    executor: Union[HandlerExecutor, Executor, None]
+) -> Optional[HandlerExecutor]:
+    """Return `executor` as `HandlerExecutor`, wrapping a `concurrent.futures`
+    executor if needed."""
+    if executor is None or isinstance(executor, HandlerExecutor):
+        return executor
+
+    if isinstance(executor, Executor):
+        max_workers = getattr(executor, "_max_workers", 1)
+        return HandlerExecutor(max_workers=max_workers, executor=executor)
+
+    raise TypeError(f"Expected a HandlerExecutor or an Executor, got {executor!r}")
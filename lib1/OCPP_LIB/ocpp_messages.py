@@ -2,15 +2,16 @@
 also contain some helper functions for packing and unpacking messages.  """
 from __future__ import annotations
 
-import decimal
 import json
 import os
+import re
 from dataclasses import asdict, is_dataclass
-from typing import Callable, Dict, Union
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
-from jsonschema import Draft4Validator
+from jsonschema import Draft4Validator, validators
 from jsonschema.exceptions import ValidationError as SchemaValidationError
 
+from OCPP_LIB import schema_compiler
 from OCPP_LIB.error_handling import (
     FormatViolationError,
     NotImplementedError,
@@ -21,45 +22,50 @@ from OCPP_LIB.error_handling import (
     UnknownCallErrorCodeError,
     ValidationError,
 )
+from OCPP_LIB.json_codec import JSONCodec, _DecimalEncoder, get_codec  # noqa: F401
 
-_validators: Dict[str, Draft4Validator] = {}
 
+def _multiple_of(validator, divisor, instance, schema):
+    """
+    Replacement of the 'multipleOf' keyword of `Draft4Validator`.
+
+    A few OCPP 1.6 schemas define a precision of 1 decimal for floats, using
+    'multipleOf: 0.1'. A value of 21.4 is valid, whereas a value of 4.11 is
+    not. But Python's internal representation of 21.4 is
+    21.39999999999999857891452847979962825775146484375, which makes the check
+    of `Draft4Validator` fail although the payload is correct. This is a
+    known issue with jsonschemas, see:
+    https://github.com/Julian/jsonschema/issues/247
+
+    `schema_compiler.is_multiple_of()` compares numbers using the precision
+    they had in JSON. Neither the schema nor the payload have to be parsed
+    with `decimal.Decimal()`.
+    """
+    if not validator.is_type(instance, "number"):
+        return
 
-class _DecimalEncoder(json.JSONEncoder):
-    """Encode values of type `decimal.Decimal` using 1 decimal point.
+    if not schema_compiler.is_multiple_of(instance, divisor):
+        yield SchemaValidationError(f"{instance!r} is not a multiple of {divisor}")
 
-    A custom encoder is required because `json.dumps()` cannot encode a value
-    of type decimal.Decimal. This raises a TypeError:
 
-        >>> import decimal
-        >>> import json
-        >>> >>> json.dumps(decimal.Decimal(3))
-        Traceback (most recent call last):
-          File "<stdin>", line 1, in <module>
-          File "/home/developer/.pyenv/versions/3.7.0/lib/python3.7/json/__init__.py", line 231, in dumps  # noqa
-            return _default_encoder.encode(obj)
-          File "/home/developer/.pyenv/versions/3.7.0/lib/python3.7/json/encoder.py", line 199, in encode
-            chunks = self.iterencode(o, _one_shot=True)
-          File "/home/developer/.pyenv/versions/3.7.0/lib/python3.7/json/encoder.py", line 257, in iterencode
-            return _iterencode(o, 0)
-          File "/home/developer/.pyenv/versions/3.7.0/lib/python3.7/json/encoder.py", line 179, in default
-            raise TypeError(f'Object of type {o.__class__.__name__} '
-        TypeError: Object of type Decimal is not JSON serializable
+_Draft4Validator = validators.extend(Draft4Validator, {"multipleOf": _multiple_of})
 
-    This can be prevented by using a custom encoder.
+_validators: Dict[str, Draft4Validator] = {}
+_compiled_validators: Dict[str, schema_compiler.CompiledValidator] = {}
 
-    """
+#: Engines that can be used to validate payloads. "jsonschema" interprets the
+#: schemas using `jsonschema.Draft4Validator`. "compiled" uses validators
+#: generated by `OCPP_LIB.schema_compiler`.
+VALIDATION_ENGINES = ["jsonschema", "compiled"]
 
-    def default(self, obj):
-        if isinstance(obj, decimal.Decimal):
-            return float("%.1f" % obj)
-        try:
-            return json.JSONEncoder.default(self, obj)
-        except TypeError as e:
-            try:
-                return obj.to_json()
-            except AttributeError:
-                raise e
+_validation_engine = "jsonschema"
+
+# Directory containing the folders 'ver16' and 'ver201' with the schemas.
+_base_dir, _ = os.path.split(os.path.realpath(__file__))
+
+# Bundles of schemas created with `scripts/bundle_schemas.py`, keyed by OCPP
+# version. `None` is stored for versions without a bundle.
+_schema_bundles: Dict[str, Optional[Dict[str, Dict]]] = {}
 
 
 class MessageType:
@@ -75,12 +81,60 @@ class MessageType:
     CallError = 4
 
 
-def unpack(msg):
+# Match the start of a CallResult or CallError: the MessageTypeId and the
+# UniqueId. Unique ids containing escape sequences are not matched, those
+# messages are decoded completely.
+_HEADER_PATTERN = re.compile(r'\s*\[\s*([34])\s*,\s*"([^"\\]*)"\s*,')
+_HEADER_PATTERN_BYTES = re.compile(rb'\s*\[\s*([34])\s*,\s*"([^"\\]*)"\s*,')
+
+
+def _parse_header(msg: Union[str, bytes]) -> Optional[Tuple[int, str]]:
+    """Return the MessageTypeId and UniqueId of a CallResult or CallError
+    without decoding the rest of the message.
+
+    `None` is returned for other messages and for messages of which the header
+    can't be read this way.
+    """
+    if isinstance(msg, str):
+        match = _HEADER_PATTERN.match(msg)
+        if match is None:
+            return None
+        return int(match.group(1)), match.group(2)
+
+    if isinstance(msg, (bytes, bytearray)):
+        match = _HEADER_PATTERN_BYTES.match(msg)
+        if match is None:
+            return None
+        try:
+            return int(match.group(1)), match.group(2).decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+
+    return None
+
+
+def unpack(msg, codec: Union[str, JSONCodec, None] = None, lazy: bool = False):
     """
     Unpacks a message into either a Call, CallError or CallResult.
+
+    The `codec` argument selects the codec used to decode the message, see
+    `OCPP_LIB.json_codec.get_codec()`.
+
+    If `lazy` is `True`, only the MessageTypeId and the UniqueId of a
+    CallResult or CallError are decoded and a `LazyCallResult` or
+    `LazyCallError` is returned. The remainder of the message is decoded
+    when it's accessed for the first time.
     """
+    if lazy:
+        header = _parse_header(msg)
+        if header is not None:
+            message_type_id, unique_id = header
+            if message_type_id == MessageType.CallResult:
+                return LazyCallResult(unique_id, msg, codec)
+            return LazyCallError(unique_id, msg, codec)
+
     try:
-        msg = json.loads(msg)
+        msg = get_codec(codec).decode(msg)
     except json.JSONDecodeError:
         raise FormatViolationError(
             details={"cause": "Message is not valid JSON", "ocpp_message": msg}
@@ -113,32 +167,37 @@ def unpack(msg):
     )
 
 
-def pack(msg):
+def pack(msg, codec: Union[str, JSONCodec, None] = None):
     """
     Returns the JSON representation of a Call, CallError or CallResult.
 
     It just calls the 'to_json()' method of the message. But it is here mainly
     to complement the 'unpack' function of this module.
     """
-    return msg.to_json()
+    return msg.to_json(codec)
 
 
-def get_validator(
-    message_type_id: int, action: str, ocpp_version: str, parse_float: Callable = float
-) -> Draft4Validator:
+def set_validation_engine(engine: str) -> None:
+    """Set the engine that is used by `validate_payload()` when no engine is
+    passed explicitly. See `VALIDATION_ENGINES` for the available engines.
     """
-    Read schema from disk and return as `Draft4Validator`. Instances will be
-    cached for performance reasons.
+    global _validation_engine
 
-    The `parse_float` argument can be used to set the conversion method that
-    is used to parse floats. It must be a callable taking 1 argument. By
-    default it is `float()`, but certain schema's require `decimal.Decimal()`.
-    """
-    if ocpp_version not in ["1.6", "2.0", "2.0.1"]:
-        raise ValueError
+    if engine not in VALIDATION_ENGINES:
+        raise ValueError(
+            f"Unknown validation engine '{engine}', choose one of "
+            f"{VALIDATION_ENGINES}."
+        )
+
+    _validation_engine = engine
 
-    schemas_dir = "ver" + ocpp_version.replace(".", "")
 
+def get_validation_engine() -> str:
+    """Return the engine that is used by `validate_payload()` by default."""
+    return _validation_engine
+
+
+def _get_schema_name(message_type_id: int, action: str, ocpp_version: str) -> str:
     schema_name = action
     if message_type_id == MessageType.CallResult:
         schema_name += "Response"
@@ -149,13 +208,57 @@ def get_validator(
     if ocpp_version == "2.0":
         schema_name += "_v1p0"
 
-    cache_key = schema_name + "_" + ocpp_version
-    if cache_key in _validators:
-        return _validators[cache_key]
+    return schema_name
+
+
+def _parse_schema_name(schema_name: str, ocpp_version: str) -> Tuple[int, str]:
+    """Return the message type id and action for the name of a schema. This is
+    the reverse of `_get_schema_name()`."""
+    if ocpp_version == "2.0":
+        schema_name = schema_name[: -len("_v1p0")]
+
+    if schema_name.endswith("Response"):
+        return MessageType.CallResult, schema_name[: -len("Response")]
+
+    if ocpp_version in ["2.0", "2.0.1"] and schema_name.endswith("Request"):
+        return MessageType.Call, schema_name[: -len("Request")]
+
+    return MessageType.Call, schema_name
+
+
+def _get_schemas_dir(ocpp_version: str) -> str:
+    return os.path.join(_base_dir, "ver" + ocpp_version.replace(".", ""))
 
-    dir, _ = os.path.split(os.path.realpath(__file__))
-    relative_path = f"{schemas_dir}/schemas/{schema_name}.json"
-    path = os.path.join(dir, relative_path)
+
+def _get_schema_bundle(ocpp_version: str) -> Optional[Dict[str, Dict]]:
+    """Return the bundle with all schemas of the OCPP version, or `None` if no
+    bundle has been created. The bundle is read from disk only once.
+    """
+    if ocpp_version not in _schema_bundles:
+        path = os.path.join(_get_schemas_dir(ocpp_version), "schemas_bundle.json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                _schema_bundles[ocpp_version] = json.loads(f.read())
+        except OSError:
+            _schema_bundles[ocpp_version] = None
+
+    return _schema_bundles[ocpp_version]
+
+
+def _load_schema(schema_name: str, ocpp_version: str, parse_float: Callable) -> Dict:
+    bundle = _get_schema_bundle(ocpp_version)
+    if bundle is not None and schema_name in bundle:
+        schema = bundle[schema_name]
+        if parse_float is float:
+            return schema
+
+        # The bundle has been parsed using `float()`. Parse the schema again
+        # using the requested parser.
+        return json.loads(json.dumps(schema), parse_float=parse_float)
+
+    path = os.path.join(
+        _get_schemas_dir(ocpp_version), "schemas", f"{schema_name}.json"
+    )
 
     # The JSON schemas for OCPP 2.0 start with a byte order mark (BOM)
     # character. If no encoding is given, reading the schema would fail with:
@@ -163,15 +266,115 @@ def get_validator(
     #     Unexpected UTF-8 BOM (decode using utf-8-sig):
     with open(path, "r", encoding="utf-8-sig") as f:
         data = f.read()
-        validator = Draft4Validator(json.loads(data, parse_float=parse_float))
-        _validators[cache_key] = validator
+        return json.loads(data, parse_float=parse_float)
+
+
+def _list_schema_names(ocpp_version: str) -> List[str]:
+    bundle = _get_schema_bundle(ocpp_version)
+    if bundle is not None:
+        return list(bundle)
+
+    schemas_dir = os.path.join(_get_schemas_dir(ocpp_version), "schemas")
+    return sorted(
+        name[: -len(".json")]
+        for name in os.listdir(schemas_dir)
+        if name.endswith(".json")
+    )
+
+
+def preload(
+    versions: Iterable[str] = ("1.6", "2.0.1"), engine: Optional[str] = None
+) -> int:
+    """
+    Build and cache the validators for every schema of the given OCPP
+    versions and return the number of validators.
+
+    By default validators are created lazily, when the first message for an
+    action is validated. Call this function at startup, before connections
+    are accepted, to avoid reading and compiling schemas while messages are
+    being handled.
+
+    The `engine` argument selects the validation engine, see `get_validator()`.
+    """
+    count = 0
+    for ocpp_version in versions:
+        if ocpp_version not in ["1.6", "2.0", "2.0.1"]:
+            raise ValueError
+
+        for schema_name in _list_schema_names(ocpp_version):
+            message_type_id, action = _parse_schema_name(schema_name, ocpp_version)
+            get_validator(message_type_id, action, ocpp_version, engine=engine)
+            count += 1
+
+    return count
+
+
+def get_validator(
+    message_type_id: int,
+    action: str,
+    ocpp_version: str,
+    parse_float: Callable = float,
+    engine: Optional[str] = None,
+) -> Union[Draft4Validator, schema_compiler.CompiledValidator]:
+    """
+    Read schema from disk and return as `Draft4Validator`. Instances will be
+    cached for performance reasons. The schema is taken from the bundle
+    created by `scripts/bundle_schemas.py`, if the bundle exists.
+
+    The `parse_float` argument can be used to set the conversion method that
+    is used to parse floats. It must be a callable taking 1 argument. By
+    default it is `float()`. Since 'multipleOf' is checked with the precision
+    of the payload, see `_multiple_of()`, no schema requires
+    `decimal.Decimal()` anymore.
+
+    The `engine` argument selects the type of validator. With "compiled" a
+    `CompiledValidator` is returned instead of a `Draft4Validator`. Schemas
+    that can't be compiled silently fall back to a `Draft4Validator`. If no
+    engine is given, the engine configured with `set_validation_engine()` is
+    used.
+    """
+    if ocpp_version not in ["1.6", "2.0", "2.0.1"]:
+        raise ValueError
+
+    if engine is None:
+        engine = _validation_engine
+    elif engine not in VALIDATION_ENGINES:
+        raise ValueError(
+            f"Unknown validation engine '{engine}', choose one of "
+            f"{VALIDATION_ENGINES}."
+        )
+
+    schema_name = _get_schema_name(message_type_id, action, ocpp_version)
+
+    cache_key = schema_name + "_" + ocpp_version
+    if engine == "compiled":
+        if cache_key not in _compiled_validators:
+            schema = _load_schema(schema_name, ocpp_version, parse_float)
+            try:
+                validator = schema_compiler.CompiledValidator(schema)
+            except schema_compiler.UnsupportedSchemaError:
+                validator = _Draft4Validator(schema)
+            _compiled_validators[cache_key] = validator
+
+        return _compiled_validators[cache_key]
+
+    if cache_key in _validators:
+        return _validators[cache_key]
+
+    validator = _Draft4Validator(_load_schema(schema_name, ocpp_version, parse_float))
+    _validators[cache_key] = validator
 
     return _validators[cache_key]
 
 
-def validate_payload(message: Union[Call, CallResult], ocpp_version: str) -> None:
-    """Validate the payload of the message using JSON schemas."""
-    if type(message) not in [Call, CallResult]:
+def validate_payload(
+    message: Union[Call, CallResult], ocpp_version: str, engine: Optional[str] = None
+) -> None:
+    """Validate the payload of the message using JSON schemas.
+
+    The `engine` argument selects the validation engine, see `get_validator()`.
+    """
+    if not isinstance(message, (Call, CallResult)):
         raise ValidationError(
             "Payload can't be validated because message "
             f"type. It's '{type(message)}', but it should "
@@ -179,44 +382,9 @@ def validate_payload(message: Union[Call, CallResult], ocpp_version: str) -> Non
         )
 
     try:
-        # 3 OCPP 1.6 schedules have fields of type floats. The JSON schema
-        # defines a certain precision for these fields of 1 decimal. A value of
-        # 21.4 is valid, whereas a value if 4.11 is not.
-        #
-        # The problem is that Python's internal representation of 21.4 might
-        # have more than 1 decimal. It might be 21.399999999999995. This would
-        # make the validation fail, although the payload is correct. This is a
-        # known issue with jsonschemas, see:
-        # https://github.com/Julian/jsonschema/issues/247
-        #
-        # This issue can be fixed by using a different parser for floats than
-        # the default one that is used.
-        #
-        # Both the schema and the payload must be parsed using the different
-        # parser for floats.
-        if ocpp_version == "1.6" and (
-            (
-                type(message) == Call
-                and message.action in ["SetChargingProfile", "RemoteStartTransaction"]
-            )  # noqa
-            or (
-                type(message) == CallResult and message.action == "GetCompositeSchedule"
-            )
-        ):
-            validator = get_validator(
-                message.message_type_id,
-                message.action,
-                ocpp_version,
-                parse_float=decimal.Decimal,
-            )
-
-            message.payload = json.loads(
-                json.dumps(message.payload), parse_float=decimal.Decimal
-            )
-        else:
-            validator = get_validator(
-                message.message_type_id, message.action, ocpp_version
-            )
+        validator = get_validator(
+            message.message_type_id, message.action, ocpp_version, engine=engine
+        )
     except (OSError, json.JSONDecodeError):
         raise NotImplementedError(
             details={"cause": f"Failed to validate action: {message.action}"}
@@ -277,6 +445,8 @@ class Call:
             ]
     """
 
+    __slots__ = ("unique_id", "action", "payload")
+
     message_type_id = 2
 
     def __init__(self, unique_id, action, payload):
@@ -287,19 +457,19 @@ class Call:
         if is_dataclass(payload):
             self.payload = asdict(payload)
 
-    def to_json(self):
-        """Return a valid JSON representation of the instance."""
-        return json.dumps(
+    def to_json(self, codec: Union[str, JSONCodec, None] = None):
+        """Return a valid JSON representation of the instance.
+
+        The `codec` argument selects the codec used to encode the message, see
+        `OCPP_LIB.json_codec.get_codec()`.
+        """
+        return get_codec(codec).encode(
             [
                 self.message_type_id,
                 self.unique_id,
                 self.action,
                 self.payload,
-            ],
-            # By default json.dumps() adds a white space after every separator.
-            # By setting the separator manually that can be avoided.
-            separators=(",", ":"),
-            cls=_DecimalEncoder,
+            ]
         )
 
     def create_call_result(self, payload):
@@ -359,6 +529,8 @@ class CallResult:
 
     """
 
+    __slots__ = ("unique_id", "payload", "action")
+
     message_type_id = 3
 
     def __init__(self, unique_id, payload, action=None):
@@ -369,17 +541,13 @@ class CallResult:
         # to validate the message it is needed.
         self.action = action
 
-    def to_json(self):
-        return json.dumps(
+    def to_json(self, codec: Union[str, JSONCodec, None] = None):
+        return get_codec(codec).encode(
             [
                 self.message_type_id,
                 self.unique_id,
                 self.payload,
-            ],
-            # By default json.dumps() adds a white space after every separator.
-            # By setting the separator manually that can be avoided.
-            separators=(",", ":"),
-            cls=_DecimalEncoder,
+            ]
         )
 
     def __repr__(self):
@@ -405,6 +573,8 @@ class CallError:
             [<MessageTypeId>, "<UniqueId>", "<errorCode>", "<errorDescription>", {<errorDetails>}] # noqa
     """
 
+    __slots__ = ("unique_id", "error_code", "error_description", "error_details")
+
     message_type_id = 4
 
     def __init__(self, unique_id, error_code, error_description, error_details=None):
@@ -413,19 +583,15 @@ class CallError:
         self.error_description = error_description
         self.error_details = error_details
 
-    def to_json(self):
-        return json.dumps(
+    def to_json(self, codec: Union[str, JSONCodec, None] = None):
+        return get_codec(codec).encode(
             [
                 self.message_type_id,
                 self.unique_id,
                 self.error_code,
                 self.error_description,
                 self.error_details,
-            ],
-            # By default json.dumps() adds a white space after every separator.
-            # By setting the separator manually that can be avoided.
-            separators=(",", ":"),
-            cls=_DecimalEncoder,
+            ]
         )
 
     def to_exception(self):
@@ -448,3 +614,92 @@ class CallError:
             f"error_description={self.error_description}, "
             f"error_details={self.error_details}>"
         )
+
+
+def _lazy_attribute(name: str) -> property:
+    """Return a property that decodes the message before `name` is read or
+    written."""
+    private_name = "_" + name
+
+    def getter(self):
+        if self._raw is not None:
+            self._load()
+        return getattr(self, private_name)
+
+    def setter(self, value):
+        if self._raw is not None:
+            self._load()
+        setattr(self, private_name, value)
+
+    return property(getter, setter)
+
+
+class _LazyMessage:
+    """
+    Mixin for messages of which only the header has been decoded. The
+    remainder of the raw message is decoded when one of the attributes in
+    `_lazy_attributes` is accessed for the first time.
+
+    Decoding can fail, because the raw message isn't checked beyond its header.
+    In that case the same exceptions as raised by `unpack()` are raised when
+    the attribute is accessed.
+    """
+
+    # The slots '_raw', '_codec' and one per lazy attribute are defined by
+    # the subclasses. A mixin with slots can't be combined with the slots of
+    # the message classes.
+    __slots__ = ()
+
+    _lazy_attributes: Tuple[str, ...] = ()
+
+    def _init_lazy(self, unique_id, raw, codec):
+        self.unique_id = unique_id
+        self._raw = raw
+        self._codec = codec
+
+    @property
+    def is_loaded(self) -> bool:
+        """Return `True` if the complete message has been decoded."""
+        return self._raw is None
+
+    def _load(self):
+        msg = unpack(self._raw, self._codec)
+        for name in self._lazy_attributes:
+            setattr(self, "_" + name, getattr(msg, name))
+        self._raw = None
+
+
+class LazyCallResult(_LazyMessage, CallResult):
+    """A CallResult of which the payload is decoded on first access."""
+
+    __slots__ = ("_raw", "_codec", "_payload")
+
+    _lazy_attributes = ("payload",)
+
+    payload = _lazy_attribute("payload")
+
+    def __init__(self, unique_id, raw, codec=None, action=None):
+        self._init_lazy(unique_id, raw, codec)
+        self.action = action
+
+
+class LazyCallError(_LazyMessage, CallError):
+    """A CallError of which the error code, description and details are
+    decoded on first access."""
+
+    __slots__ = (
+        "_raw",
+        "_codec",
+        "_error_code",
+        "_error_description",
+        "_error_details",
+    )
+
+    _lazy_attributes = ("error_code", "error_description", "error_details")
+
+    error_code = _lazy_attribute("error_code")
+    error_description = _lazy_attribute("error_description")
+    error_details = _lazy_attribute("error_details")
+
+    def __init__(self, unique_id, raw, codec=None):
+        self._init_lazy(unique_id, raw, codec)
@@ -0,0 +1,382 @@
+""" Module with a write-behind store to persist documents, like the requests
+and responses of a central system, without blocking the event loop.
+
+Documents written to a `WriteBehindStore` are buffered in memory. A
+background thread takes them from the buffer and inserts them in batches of
+up to `batch_size` documents, at the latest `flush_interval` seconds after
+they've been written:
+
+    >>> store = WriteBehindStore(MongoBackend(client.ocpp_database))
+    >>> await store.write_async("ocpp_log", to_document(request))
+    >>> ...
+    >>> store.close()
+
+The buffer holds at most `max_buffered` documents. When storage is slower
+than documents are written, writers wait until there's room again, or raise
+`StorageFullError` after `timeout` seconds.
+
+The backends are `MemoryBackend` and `SQLiteBackend` for local testing, and
+`MongoBackend`.
+"""
+import asyncio
+import collections
+import dataclasses
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from OCPP_LIB.error_handling import StorageFullError
+
+LOGGER = logging.getLogger("ocpp")
+
+
+def _document(pairs: List[Tuple[str, Any]]) -> Dict:
+    """`dict_factory` for `dataclasses.asdict()`. Lists that have been
+    decoded lazily are copied as lists of dataclasses, see
+    `OCPP_LIB.payload_decoder.LazyList`; they become lists of dictionaries
+    too."""
+    return {key: _document_value(value) for key, value in pairs}
+
+
+def _document_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_document_value(item) for item in value]
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value, dict_factory=_document)
+    return value
+
+
+def to_document(payload: Any, **fields) -> Dict:
+    """
+    Return a new dictionary with the fields of `payload`, a dataclass or a
+    dictionary, updated with `fields`. `payload` itself isn't changed.
+
+        >>> to_document(ocpp_request.ClearCache(), API_REQUEST="ClearCache")
+        {'custom_data': None, 'API_REQUEST': 'ClearCache'}
+    """
+    if dataclasses.is_dataclass(payload):
+        document = dataclasses.asdict(payload, dict_factory=_document)
+    else:
+        document = dict(payload)
+
+    document.update(fields)
+    return document
+
+
+class MemoryBackend:
+    """Backend that keeps the documents in memory, per collection."""
+
+    def __init__(self):
+        self.collections: Dict[str, List[Dict]] = collections.defaultdict(list)
+        self._lock = threading.Lock()
+
+    def insert_many(self, collection: str, documents: List[Dict]):
+        with self._lock:
+            self.collections[collection].extend(documents)
+
+    def find(self, collection: str) -> List[Dict]:
+        with self._lock:
+            return list(self.collections.get(collection, []))
+
+    def close(self):
+        pass
+
+
+class SQLiteBackend:
+    """
+    Backend that stores the documents as JSON in a SQLite database, by
+    default in memory. All collections share one table.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        # The connection is used by the thread of the store and by `find()`.
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                "id INTEGER PRIMARY KEY, collection TEXT NOT NULL, "
+                "document TEXT NOT NULL)"
+            )
+
+    def insert_many(self, collection: str, documents: List[Dict]):
+        rows = [
+            (collection, json.dumps(document, default=str)) for document in documents
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO documents (collection, document) VALUES (?, ?)", rows
+            )
+
+    def find(self, collection: str) -> List[Dict]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT document FROM documents WHERE collection = ? ORDER BY id",
+                (collection,),
+            ).fetchall()
+        return [json.loads(document) for document, in rows]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+class MongoBackend:
+    """Backend that inserts the documents in a MongoDB database, e.g.
+    `MongoClient(uri).ocpp_database`."""
+
+    def __init__(self, database):
+        self._database = database
+
+    def insert_many(self, collection: str, documents: List[Dict]):
+        # Unordered, so that one rejected document doesn't stop the rest.
+        self._database[collection].insert_many(documents, ordered=False)
+
+    def close(self):
+        self._database.client.close()
+
+
+def _set_done(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+class WriteBehindStore:
+    """
+    Buffers documents and writes them to `backend` in batches, in a
+    background thread.
+
+    Args:
+
+        backend: An object with the methods `insert_many(collection,
+            documents)` and `close()`, like `MongoBackend`.
+        batch_size (int): The maximum number of documents inserted at once.
+            A batch is written as soon as that many documents are buffered.
+        flush_interval (float): The maximum time in seconds a document stays
+            in the buffer.
+        max_buffered (int): The maximum number of documents in the buffer.
+        timeout (float): The maximum time in seconds a writer waits for room
+            in the buffer before `StorageFullError` is raised, or `None` to
+            wait forever.
+    """
+
+    def __init__(
+        self,
+        backend,
+        batch_size: int = 500,
+        flush_interval: float = 0.5,
+        max_buffered: int = 10000,
+        timeout: Optional[float] = None,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if max_buffered < batch_size:
+            raise ValueError("max_buffered must be at least batch_size")
+
+        self.backend = backend
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self.timeout = timeout
+
+        self._buffer: Deque[Tuple[str, Dict]] = collections.deque()
+        # Documents taken from the buffer, but not yet written.
+        self._writing = 0
+        self._closed = False
+        # Number of `flush()` calls waiting for the buffer to be written.
+        self._flushing = 0
+        self._condition = threading.Condition()
+        # Futures of `write_async()` calls waiting for room, with their loop.
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+        self._written = 0
+        self._failed = 0
+        self._batches = 0
+        self._max_buffered_seen = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name="ocpp-storage", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, collection: str, document: Dict):
+        """
+        Buffer `document` to be inserted in `collection`.
+
+        Blocks while the buffer is full. Use `write_async()` in coroutines.
+        """
+        with self._condition:
+            if not self._condition.wait_for(self._has_room, self.timeout):
+                raise StorageFullError(
+                    f"{self.max_buffered} documents are waiting to be written"
+                )
+            self._append(collection, document)
+
+    async def write_async(self, collection: str, document: Dict):
+        """
+        Buffer `document` to be inserted in `collection`.
+
+        While the buffer is full it waits on the event loop, without a thread,
+        until the background thread signals that there's room. Cancelling it
+        while it waits means the document isn't written.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if self.timeout is None else loop.time() + self.timeout
+        while True:
+            with self._condition:
+                if self._has_room():
+                    self._append(collection, document)
+                    return
+                room = loop.create_future()
+                self._async_waiters.append((loop, room))
+
+            try:
+                if deadline is None:
+                    await room
+                else:
+                    await asyncio.wait_for(room, deadline - loop.time())
+            except asyncio.TimeoutError:
+                raise StorageFullError(
+                    f"{self.max_buffered} documents are waiting to be written"
+                )
+
+    def _has_room(self) -> bool:
+        if self._closed:
+            raise RuntimeError("Store is closed")
+        return len(self._buffer) < self.max_buffered
+
+    def _append(self, collection: str, document: Dict):
+        self._buffer.append((collection, document))
+        self._max_buffered_seen = max(self._max_buffered_seen, len(self._buffer))
+        # Wake up the thread to start the flush interval, or to write a full
+        # batch.
+        if len(self._buffer) == 1 or len(self._buffer) >= self.batch_size:
+            self._condition.notify_all()
+
+    def _take_batch(self) -> List[Tuple[str, Dict]]:
+        """Wait until a batch is due and take it from the buffer. Returns an
+        empty list when the store is closed and the buffer is empty."""
+        with self._condition:
+            deadline = None
+            while True:
+                if self._buffer and (
+                    self._closed
+                    or self._flushing
+                    or len(self._buffer) >= self.batch_size
+                ):
+                    break
+                if self._closed:
+                    return []
+                if self._buffer:
+                    if deadline is None:
+                        deadline = time.monotonic() + self.flush_interval
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                else:
+                    deadline = None
+                    self._condition.wait()
+
+            count = min(len(self._buffer), self.batch_size)
+            batch = [self._buffer.popleft() for _ in range(count)]
+            self._writing = count
+            # Wake up writers waiting for room.
+            self._condition.notify_all()
+            self._notify_async_waiters()
+            return batch
+
+    def _notify_async_waiters(self):
+        """Wake up the `write_async()` calls waiting for room. Must be called
+        with the lock held."""
+        waiters, self._async_waiters = self._async_waiters, []
+        for loop, room in waiters:
+            try:
+                loop.call_soon_threadsafe(_set_done, room)
+            except RuntimeError:
+                # The loop has been closed.
+                pass
+
+    def _run(self):
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return
+
+            documents: Dict[str, List[Dict]] = collections.defaultdict(list)
+            for collection, document in batch:
+                documents[collection].append(document)
+
+            written = failed = 0
+            for collection, items in documents.items():
+                try:
+                    self.backend.insert_many(collection, items)
+                    written += len(items)
+                except Exception:
+                    LOGGER.exception(
+                        "Failed to write %d documents to '%s'", len(items), collection
+                    )
+                    failed += len(items)
+
+            with self._condition:
+                self._writing = 0
+                self._written += written
+                self._failed += failed
+                self._batches += 1
+                self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Write all buffered documents now and wait until that's done.
+        Returns `False` if that took longer than `timeout` seconds."""
+        with self._condition:
+            self._flushing += 1
+            self._condition.notify_all()
+            try:
+                return self._condition.wait_for(
+                    lambda: not self._buffer and not self._writing, timeout
+                )
+            finally:
+                self._flushing -= 1
+
+    def close(self, timeout: Optional[float] = None):
+        """Write all buffered documents, stop the background thread and
+        close the backend. If the thread is still writing after `timeout`
+        seconds, the backend is left open."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            self._notify_async_waiters()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            LOGGER.warning(
+                "The store is still writing after %s seconds, not closing %r",
+                timeout,
+                self.backend,
+            )
+            return
+        self.backend.close()
+
+    def metrics(self) -> Dict[str, int]:
+        """
+        Return a snapshot of the metrics:
+
+        * buffered, max_buffered: number of documents in the buffer, now and
+          at most.
+        * written, failed: number of documents that have been written or
+          rejected by the backend.
+        * batches: number of batches.
+        """
+        with self._condition:
+            return {
+                "buffered": len(self._buffer) + self._writing,
+                "max_buffered": self._max_buffered_seen,
+                "written": self._written,
+                "failed": self._failed,
+                "batches": self._batches,
+            }
+
+    def __repr__(self):
+        return f"<WriteBehindStore - backend={self.backend!r}>"
@@ -1,7 +1,8 @@
 import warnings
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import Dict, List, Optional
 
+from OCPP_LIB.dataclass_slots import slotted_dataclass
 from OCPP_LIB.ver16.E_num import (
     AvailabilityType,
     CertificateUse,
@@ -37,34 +38,34 @@ from OCPP_LIB.ver16.E_num import (
 # from Central System to Charge Point.
 
 
-@dataclass
+@slotted_dataclass
 class CancelReservation:
     reservation_id: int
 
 
-@dataclass
+@slotted_dataclass
 class CertificateSigned:
     certificate_chain: str
 
 
-@dataclass
+@slotted_dataclass
 class ChangeAvailability:
     connector_id: int
     type: AvailabilityType
 
 
-@dataclass
+@slotted_dataclass
 class ChangeConfiguration:
     key: str
     value: str
 
 
-@dataclass
+@slotted_dataclass
 class ClearCache:
     pass
 
 
-@dataclass
+@slotted_dataclass
 class ClearChargingProfile:
     id: Optional[int] = None
     connector_id: Optional[int] = None
@@ -72,30 +73,30 @@ class ClearChargingProfile:
     stack_level: Optional[int] = None
 
 
-@dataclass
+@slotted_dataclass
 class DeleteCertificate:
     certificate_hash_data: Dict
 
 
-@dataclass
+@slotted_dataclass
 class ExtendedTriggerMessage:
     requested_message: MessageTrigger
     connector_id: Optional[int] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetCompositeSchedule:
     connector_id: int
     duration: int
     charging_rate_unit: Optional[ChargingRateUnitType] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetConfiguration:
     key: Optional[List] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetDiagnostics:
     location: str
     retries: Optional[int] = None
@@ -104,17 +105,17 @@ class GetDiagnostics:
     stop_time: Optional[str] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetInstalledCertificateIds:
     certificate_type: CertificateUse
 
 
-@dataclass
+@slotted_dataclass
 class GetLocalListVersion:
     pass
 
 
-@dataclass
+@slotted_dataclass
 class GetLog:
     log: Dict
     log_type: Log
@@ -123,25 +124,25 @@ class GetLog:
     retry_interval: Optional[int] = None
 
 
-@dataclass
+@slotted_dataclass
 class InstallCertificate:
     certificate_type: CertificateUse
     certificate: str
 
 
-@dataclass
+@slotted_dataclass
 class RemoteStartTransaction:
     id_tag: str
     connector_id: Optional[int] = None
     charging_profile: Optional[Dict] = None
 
 
-@dataclass
+@slotted_dataclass
 class RemoteStopTransaction:
     transaction_id: int
 
 
-@dataclass
+@slotted_dataclass
 class ReserveNow:
     connector_id: int
     expiry_date: str
@@ -150,25 +151,25 @@ class ReserveNow:
     parent_id_tag: Optional[str] = None
 
 
-@dataclass
+@slotted_dataclass
 class Reset:
     type: ResetType
 
 
-@dataclass
+@slotted_dataclass
 class SendLocalList:
     list_version: int
     update_type: UpdateType
     local_authorization_list: List = field(default_factory=list)
 
 
-@dataclass
+@slotted_dataclass
 class SetChargingProfile:
     connector_id: int
     cs_charging_profiles: Dict
 
 
-@dataclass
+@slotted_dataclass
 class SignedUpdateFirmware:
     request_id: int
     firmware: Dict
@@ -176,18 +177,18 @@ class SignedUpdateFirmware:
     retry_interval: Optional[int] = None
 
 
-@dataclass
+@slotted_dataclass
 class TriggerMessage:
     requested_message: MessageTrigger
     connector_id: Optional[int] = None
 
 
-@dataclass
+@slotted_dataclass
 class UnlockConnector:
     connector_id: int
 
 
-@dataclass
+@slotted_dataclass
 class UpdateFirmware:
     location: str
     retrieve_date: str
@@ -199,12 +200,12 @@ class UpdateFirmware:
 # in the bottom part of this module.
 
 
-@dataclass
+@slotted_dataclass
 class Authorize:
     id_tag: str
 
 
-@dataclass
+@slotted_dataclass
 class BootNotification:
     charge_point_model: str
     charge_point_vendor: str
@@ -217,53 +218,53 @@ class BootNotification:
     meter_type: Optional[str] = None
 
 
-@dataclass
+@slotted_dataclass
 class DiagnosticsStatusNotification:
     status: DiagnosticsStatus
 
 
-@dataclass
+@slotted_dataclass
 class FirmwareStatusNotification:
     status: FirmwareStatus
 
 
-@dataclass
+@slotted_dataclass
 class Heartbeat:
     pass
 
 
-@dataclass
+@slotted_dataclass
 class LogStatusNotification:
     status: UploadLogStatus
     request_id: int
 
 
-@dataclass
+@slotted_dataclass
 class MeterValues:
     connector_id: int
     meter_value: List = field(default_factory=list)
     transaction_id: Optional[int] = None
 
 
-@dataclass
+@slotted_dataclass
 class SecurityEventNotification:
     type: str
     timestamp: str
     tech_info: Optional[str]
 
 
-@dataclass
+@slotted_dataclass
 class SignCertificate:
     csr: str
 
 
-@dataclass
+@slotted_dataclass
 class SignedFirmwareStatusNotification:
     status: FirmwareStatus
     request_id: int
 
 
-@dataclass
+@slotted_dataclass
 class StartTransaction:
     connector_id: int
     id_tag: str
@@ -272,7 +273,7 @@ class StartTransaction:
     reservation_id: Optional[int] = None
 
 
-@dataclass
+@slotted_dataclass
 class StopTransaction:
     meter_stop: int
     timestamp: str
@@ -282,7 +283,7 @@ class StopTransaction:
     transaction_data: Optional[List] = None
 
 
-@dataclass
+@slotted_dataclass
 class StatusNotification:
     connector_id: int
     error_code: ChargePointErrorCode
@@ -297,7 +298,7 @@ class StatusNotification:
 # Charge Point.
 
 
-@dataclass
+@slotted_dataclass
 class DataTransfer:
     vendor_id: str
     message_id: Optional[str] = None
@@ -305,7 +306,7 @@ class DataTransfer:
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class CancelReservationPayload(CancelReservation):
     def __post_init__(self):
         warnings.warn(
@@ -318,7 +319,7 @@ class CancelReservationPayload(CancelReservation):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class CertificateSignedPayload(CertificateSigned):
     def __post_init__(self):
         warnings.warn(
@@ -331,7 +332,7 @@ class CertificateSignedPayload(CertificateSigned):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ChangeAvailabilityPayload(ChangeAvailability):
     def __post_init__(self):
         warnings.warn(
@@ -344,7 +345,7 @@ class ChangeAvailabilityPayload(ChangeAvailability):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ChangeConfigurationPayload(ChangeConfiguration):
     def __post_init__(self):
         warnings.warn(
@@ -357,7 +358,7 @@ class ChangeConfigurationPayload(ChangeConfiguration):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ClearCachePayload(ClearCache):
     def __post_init__(self):
         warnings.warn(
@@ -370,7 +371,7 @@ class ClearCachePayload(ClearCache):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ClearChargingProfilePayload(ClearChargingProfile):
     def __post_init__(self):
         warnings.warn(
@@ -383,7 +384,7 @@ class ClearChargingProfilePayload(ClearChargingProfile):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class DeleteCertificatePayload(DeleteCertificate):
     def __post_init__(self):
         warnings.warn(
@@ -396,7 +397,7 @@ class DeleteCertificatePayload(DeleteCertificate):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ExtendedTriggerMessagePayload(ExtendedTriggerMessage):
     def __post_init__(self):
         warnings.warn(
@@ -409,7 +410,7 @@ class ExtendedTriggerMessagePayload(ExtendedTriggerMessage):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetCompositeSchedulePayload(GetCompositeSchedule):
     def __post_init__(self):
         warnings.warn(
@@ -422,7 +423,7 @@ class GetCompositeSchedulePayload(GetCompositeSchedule):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetConfigurationPayload(GetConfiguration):
     def __post_init__(self):
         warnings.warn(
@@ -435,7 +436,7 @@ class GetConfigurationPayload(GetConfiguration):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetDiagnosticsPayload(GetDiagnostics):
     def __post_init__(self):
         warnings.warn(
@@ -448,7 +449,7 @@ class GetDiagnosticsPayload(GetDiagnostics):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetInstalledCertificateIdsPayload(GetInstalledCertificateIds):
     def __post_init__(self):
         warnings.warn(
@@ -461,7 +462,7 @@ class GetInstalledCertificateIdsPayload(GetInstalledCertificateIds):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetLocalListVersionPayload(GetLocalListVersion):
     def __post_init__(self):
         warnings.warn(
@@ -474,7 +475,7 @@ class GetLocalListVersionPayload(GetLocalListVersion):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetLogPayload(GetLog):
     def __post_init__(self):
         warnings.warn(
@@ -487,7 +488,7 @@ class GetLogPayload(GetLog):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class InstallCertificatePayload(InstallCertificate):
     def __post_init__(self):
         warnings.warn(
@@ -500,7 +501,7 @@ class InstallCertificatePayload(InstallCertificate):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class RemoteStartTransactionPayload(RemoteStartTransaction):
     def __post_init__(self):
         warnings.warn(
@@ -513,7 +514,7 @@ class RemoteStartTransactionPayload(RemoteStartTransaction):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class RemoteStopTransactionPayload(RemoteStopTransaction):
     def __post_init__(self):
         warnings.warn(
@@ -526,7 +527,7 @@ class RemoteStopTransactionPayload(RemoteStopTransaction):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ReserveNowPayload(ReserveNow):
     def __post_init__(self):
         warnings.warn(
@@ -539,7 +540,7 @@ class ReserveNowPayload(ReserveNow):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ResetPayload(Reset):
     def __post_init__(self):
         warnings.warn(
@@ -552,7 +553,7 @@ class ResetPayload(Reset):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SendLocalListPayload(SendLocalList):
     def __post_init__(self):
         warnings.warn(
@@ -565,7 +566,7 @@ class SendLocalListPayload(SendLocalList):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SetChargingProfilePayload(SetChargingProfile):
     def __post_init__(self):
         warnings.warn(
@@ -578,7 +579,7 @@ class SetChargingProfilePayload(SetChargingProfile):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SignedUpdateFirmwarePayload(SignedUpdateFirmware):
     def __post_init__(self):
         warnings.warn(
@@ -591,7 +592,7 @@ class SignedUpdateFirmwarePayload(SignedUpdateFirmware):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class TriggerMessagePayload(TriggerMessage):
     def __post_init__(self):
         warnings.warn(
@@ -604,7 +605,7 @@ class TriggerMessagePayload(TriggerMessage):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class UnlockConnectorPayload(UnlockConnector):
     def __post_init__(self):
         warnings.warn(
@@ -617,7 +618,7 @@ class UnlockConnectorPayload(UnlockConnector):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class UpdateFirmwarePayload(UpdateFirmware):
     def __post_init__(self):
         warnings.warn(
@@ -634,7 +635,7 @@ class UpdateFirmwarePayload(UpdateFirmware):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class AuthorizePayload(Authorize):
     def __post_init__(self):
         warnings.warn(
@@ -647,7 +648,7 @@ class AuthorizePayload(Authorize):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class BootNotificationPayload(BootNotification):
     def __post_init__(self):
         warnings.warn(
@@ -660,7 +661,7 @@ class BootNotificationPayload(BootNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class DiagnosticsStatusNotificationPayload(DiagnosticsStatusNotification):
     def __post_init__(self):
         warnings.warn(
@@ -673,7 +674,7 @@ class DiagnosticsStatusNotificationPayload(DiagnosticsStatusNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class FirmwareStatusNotificationPayload(FirmwareStatusNotification):
     def __post_init__(self):
         warnings.warn(
@@ -686,7 +687,7 @@ class FirmwareStatusNotificationPayload(FirmwareStatusNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class HeartbeatPayload(Heartbeat):
     def __post_init__(self):
         warnings.warn(
@@ -699,7 +700,7 @@ class HeartbeatPayload(Heartbeat):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class LogStatusNotificationPayload(LogStatusNotification):
     def __post_init__(self):
         warnings.warn(
@@ -712,7 +713,7 @@ class LogStatusNotificationPayload(LogStatusNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class MeterValuesPayload(MeterValues):
     def __post_init__(self):
         warnings.warn(
@@ -725,7 +726,7 @@ class MeterValuesPayload(MeterValues):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SecurityEventNotificationPayload(SecurityEventNotification):
     def __post_init__(self):
         warnings.warn(
@@ -738,7 +739,7 @@ class SecurityEventNotificationPayload(SecurityEventNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SignCertificatePayload(SignCertificate):
     def __post_init__(self):
         warnings.warn(
@@ -751,7 +752,7 @@ class SignCertificatePayload(SignCertificate):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SignedFirmwareStatusNotificationPayload(SignedFirmwareStatusNotification):
     def __post_init__(self):
         warnings.warn(
@@ -764,7 +765,7 @@ class SignedFirmwareStatusNotificationPayload(SignedFirmwareStatusNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class StartTransactionPayload(StartTransaction):
     def __post_init__(self):
         warnings.warn(
@@ -777,7 +778,7 @@ class StartTransactionPayload(StartTransaction):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class StopTransactionPayload(StopTransaction):
     def __post_init__(self):
         warnings.warn(
@@ -790,7 +791,7 @@ class StopTransactionPayload(StopTransaction):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class StatusNotificationPayload(StatusNotification):
     def __post_init__(self):
         warnings.warn(
@@ -807,7 +808,7 @@ class StatusNotificationPayload(StatusNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class DataTransferPayload(DataTransfer):
     def __post_init__(self):
         warnings.warn(
@@ -1,7 +1,7 @@
 import warnings
-from dataclasses import dataclass
 from typing import Dict, List, Optional
 
+from OCPP_LIB.dataclass_slots import slotted_dataclass
 from OCPP_LIB.ver16.data_type import IdTagInfo
 from OCPP_LIB.ver16.E_num import (
     AvailabilityStatus,
@@ -46,65 +46,65 @@ from OCPP_LIB.ver16.E_num import (
 # from Central System to Charge Point.
 
 
-@dataclass
+@slotted_dataclass
 class Authorize:
     id_tag_info: IdTagInfo
 
 
-@dataclass
+@slotted_dataclass
 class BootNotification:
     current_time: str
     interval: int
     status: RegistrationStatus
 
 
-@dataclass
+@slotted_dataclass
 class DiagnosticsStatusNotification:
     pass
 
 
-@dataclass
+@slotted_dataclass
 class FirmwareStatusNotification:
     pass
 
 
-@dataclass
+@slotted_dataclass
 class Heartbeat:
     current_time: str
 
 
-@dataclass
+@slotted_dataclass
 class LogStatusNotification:
     pass
 
 
-@dataclass
+@slotted_dataclass
 class SecurityEventNotification:
     pass
 
 
-@dataclass
+@slotted_dataclass
 class SignCertificate:
     status: GenericStatus
 
 
-@dataclass
+@slotted_dataclass
 class MeterValues:
     pass
 
 
-@dataclass
+@slotted_dataclass
 class StartTransaction:
     transaction_id: int
     id_tag_info: IdTagInfo
 
 
-@dataclass
+@slotted_dataclass
 class StatusNotification:
     pass
 
 
-@dataclass
+@slotted_dataclass
 class StopTransaction:
     id_tag_info: Optional[IdTagInfo] = None
 
@@ -113,53 +113,53 @@ class StopTransaction:
 # listed in the bottom part of this module.
 
 
-@dataclass
+@slotted_dataclass
 class CancelReservation:
     status: CancelReservationStatus
 
 
-@dataclass
+@slotted_dataclass
 class CertificateSigned:
     status: CertificateSignedStatus
 
 
-@dataclass
+@slotted_dataclass
 class ChangeAvailability:
     status: AvailabilityStatus
 
 
-@dataclass
+@slotted_dataclass
 class ChangeConfiguration:
     status: ConfigurationStatus
 
 
-@dataclass
+@slotted_dataclass
 class ClearCache:
     status: ClearCacheStatus
 
 
-@dataclass
+@slotted_dataclass
 class ClearChargingProfile:
     status: ClearChargingProfileStatus
 
 
-@dataclass
+@slotted_dataclass
 class DeleteCertificate:
     status: DeleteCertificateStatus
 
 
-@dataclass
+@slotted_dataclass
 class ExtendedTriggerMessage:
     status: TriggerMessageStatus
 
 
-@dataclass
+@slotted_dataclass
 class GetInstalledCertificateIds:
     status: GetInstalledCertificateStatus
     certificate_hash_data: Optional[List] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetCompositeSchedule:
     status: GetCompositeScheduleStatus
     connector_id: Optional[int] = None
@@ -167,84 +167,84 @@ class GetCompositeSchedule:
     charging_schedule: Optional[Dict] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetConfiguration:
     configuration_key: Optional[List] = None
     unknown_key: Optional[List] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetDiagnostics:
     file_name: Optional[str] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetLocalListVersion:
     list_version: int
 
 
-@dataclass
+@slotted_dataclass
 class GetLog:
     status: LogStatus
     filename: Optional[str] = None
 
 
-@dataclass
+@slotted_dataclass
 class InstallCertificate:
     status: CertificateStatus
 
 
-@dataclass
+@slotted_dataclass
 class RemoteStartTransaction:
     status: RemoteStartStopStatus
 
 
-@dataclass
+@slotted_dataclass
 class RemoteStopTransaction:
     status: RemoteStartStopStatus
 
 
-@dataclass
+@slotted_dataclass
 class ReserveNow:
     status: ReservationStatus
 
 
-@dataclass
+@slotted_dataclass
 class Reset:
     status: ResetStatus
 
 
-@dataclass
+@slotted_dataclass
 class SendLocalList:
     status: UpdateStatus
 
 
-@dataclass
+@slotted_dataclass
 class SetChargingProfile:
     status: ChargingProfileStatus
 
 
-@dataclass
+@slotted_dataclass
 class SignedFirmwareStatusNotification:
     pass
 
 
-@dataclass
+@slotted_dataclass
 class SignedUpdateFirmware:
     status: UpdateFirmwareStatus
 
 
-@dataclass
+@slotted_dataclass
 class TriggerMessage:
     status: TriggerMessageStatus
 
 
-@dataclass
+@slotted_dataclass
 class UnlockConnector:
     status: UnlockStatus
 
 
-@dataclass
+@slotted_dataclass
 class UpdateFirmware:
     pass
 
@@ -253,14 +253,14 @@ class UpdateFirmware:
 # from a Charge Point.
 
 
-@dataclass
+@slotted_dataclass
 class DataTransfer:
     status: DataTransferStatus
     data: Optional[str] = None
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class AuthorizePayload(Authorize):
     def __post_init__(self):
         warnings.warn(
@@ -273,7 +273,7 @@ class AuthorizePayload(Authorize):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class BootNotificationPayload(BootNotification):
     def __post_init__(self):
         warnings.warn(
@@ -286,7 +286,7 @@ class BootNotificationPayload(BootNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class DiagnosticsStatusNotificationPayload(DiagnosticsStatusNotification):
     def __post_init__(self):
         warnings.warn(
@@ -299,7 +299,7 @@ class DiagnosticsStatusNotificationPayload(DiagnosticsStatusNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class FirmwareStatusNotificationPayload(FirmwareStatusNotification):
     def __post_init__(self):
         warnings.warn(
@@ -312,7 +312,7 @@ class FirmwareStatusNotificationPayload(FirmwareStatusNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class HeartbeatPayload(Heartbeat):
     def __post_init__(self):
         warnings.warn(
@@ -325,7 +325,7 @@ class HeartbeatPayload(Heartbeat):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class LogStatusNotificationPayload(LogStatusNotification):
     def __post_init__(self):
         warnings.warn(
@@ -338,7 +338,7 @@ class LogStatusNotificationPayload(LogStatusNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SecurityEventNotificationPayload(SecurityEventNotification):
     def __post_init__(self):
         warnings.warn(
@@ -351,7 +351,7 @@ class SecurityEventNotificationPayload(SecurityEventNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SignCertificatePayload(SignCertificate):
     def __post_init__(self):
         warnings.warn(
@@ -364,7 +364,7 @@ class SignCertificatePayload(SignCertificate):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class MeterValuesPayload(MeterValues):
     def __post_init__(self):
         warnings.warn(
@@ -377,7 +377,7 @@ class MeterValuesPayload(MeterValues):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class StartTransactionPayload(StartTransaction):
     def __post_init__(self):
         warnings.warn(
@@ -390,7 +390,7 @@ class StartTransactionPayload(StartTransaction):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class StatusNotificationPayload(StatusNotification):
     def __post_init__(self):
         warnings.warn(
@@ -403,7 +403,7 @@ class StatusNotificationPayload(StatusNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class StopTransactionPayload(StopTransaction):
     def __post_init__(self):
         warnings.warn(
@@ -420,7 +420,7 @@ class StopTransactionPayload(StopTransaction):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class CancelReservationPayload(CancelReservation):
     def __post_init__(self):
         warnings.warn(
@@ -433,7 +433,7 @@ class CancelReservationPayload(CancelReservation):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class CertificateSignedPayload(CertificateSigned):
     def __post_init__(self):
         warnings.warn(
@@ -446,7 +446,7 @@ class CertificateSignedPayload(CertificateSigned):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ChangeAvailabilityPayload(ChangeAvailability):
     def __post_init__(self):
         warnings.warn(
@@ -459,7 +459,7 @@ class ChangeAvailabilityPayload(ChangeAvailability):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ChangeConfigurationPayload(ChangeConfiguration):
     def __post_init__(self):
         warnings.warn(
@@ -472,7 +472,7 @@ class ChangeConfigurationPayload(ChangeConfiguration):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ClearCachePayload(ClearCache):
     def __post_init__(self):
         warnings.warn(
@@ -485,7 +485,7 @@ class ClearCachePayload(ClearCache):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ClearChargingProfilePayload(ClearChargingProfile):
     def __post_init__(self):
         warnings.warn(
@@ -498,7 +498,7 @@ class ClearChargingProfilePayload(ClearChargingProfile):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class DeleteCertificatePayload(DeleteCertificate):
     def __post_init__(self):
         warnings.warn(
@@ -511,7 +511,7 @@ class DeleteCertificatePayload(DeleteCertificate):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ExtendedTriggerMessagePayload(ExtendedTriggerMessage):
     def __post_init__(self):
         warnings.warn(
@@ -524,7 +524,7 @@ class ExtendedTriggerMessagePayload(ExtendedTriggerMessage):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetInstalledCertificateIdsPayload(GetInstalledCertificateIds):
     def __post_init__(self):
         warnings.warn(
@@ -537,7 +537,7 @@ class GetInstalledCertificateIdsPayload(GetInstalledCertificateIds):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetCompositeSchedulePayload(GetCompositeSchedule):
     def __post_init__(self):
         warnings.warn(
@@ -550,7 +550,7 @@ class GetCompositeSchedulePayload(GetCompositeSchedule):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetConfigurationPayload(GetConfiguration):
     def __post_init__(self):
         warnings.warn(
@@ -563,7 +563,7 @@ class GetConfigurationPayload(GetConfiguration):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetDiagnosticsPayload(GetDiagnostics):
     def __post_init__(self):
         warnings.warn(
@@ -576,7 +576,7 @@ class GetDiagnosticsPayload(GetDiagnostics):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetLocalListVersionPayload(GetLocalListVersion):
     def __post_init__(self):
         warnings.warn(
@@ -589,7 +589,7 @@ class GetLocalListVersionPayload(GetLocalListVersion):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetLogPayload(GetLog):
     def __post_init__(self):
         warnings.warn(
@@ -602,7 +602,7 @@ class GetLogPayload(GetLog):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class InstallCertificatePayload(InstallCertificate):
     def __post_init__(self):
         warnings.warn(
@@ -615,7 +615,7 @@ class InstallCertificatePayload(InstallCertificate):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class RemoteStartTransactionPayload(RemoteStartTransaction):
     def __post_init__(self):
         warnings.warn(
@@ -628,7 +628,7 @@ class RemoteStartTransactionPayload(RemoteStartTransaction):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class RemoteStopTransactionPayload(RemoteStopTransaction):
     def __post_init__(self):
         warnings.warn(
@@ -641,7 +641,7 @@ class RemoteStopTransactionPayload(RemoteStopTransaction):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ReserveNowPayload(ReserveNow):
     def __post_init__(self):
         warnings.warn(
@@ -654,7 +654,7 @@ class ReserveNowPayload(ReserveNow):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ResetPayload(Reset):
     def __post_init__(self):
         warnings.warn(
@@ -667,7 +667,7 @@ class ResetPayload(Reset):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SendLocalListPayload(SendLocalList):
     def __post_init__(self):
         warnings.warn(
@@ -680,7 +680,7 @@ class SendLocalListPayload(SendLocalList):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SetChargingProfilePayload(SetChargingProfile):
     def __post_init__(self):
         warnings.warn(
@@ -693,7 +693,7 @@ class SetChargingProfilePayload(SetChargingProfile):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SignedFirmwareStatusNotificationPayload(SignedFirmwareStatusNotification):
     def __post_init__(self):
         warnings.warn(
@@ -706,7 +706,7 @@ class SignedFirmwareStatusNotificationPayload(SignedFirmwareStatusNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SignedUpdateFirmwarePayload(SignedUpdateFirmware):
     def __post_init__(self):
         warnings.warn(
@@ -719,7 +719,7 @@ class SignedUpdateFirmwarePayload(SignedUpdateFirmware):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class TriggerMessagePayload(TriggerMessage):
     def __post_init__(self):
         warnings.warn(
@@ -732,7 +732,7 @@ class TriggerMessagePayload(TriggerMessage):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class UnlockConnectorPayload(UnlockConnector):
     def __post_init__(self):
         warnings.warn(
@@ -745,7 +745,7 @@ class UnlockConnectorPayload(UnlockConnector):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class UpdateFirmwarePayload(UpdateFirmware):
     def __post_init__(self):
         warnings.warn(
@@ -762,7 +762,7 @@ class UpdateFirmwarePayload(UpdateFirmware):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class DataTransferPayload(DataTransfer):
     def __post_init__(self):
         warnings.warn(
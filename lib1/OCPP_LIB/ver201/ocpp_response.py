@@ -1,16 +1,17 @@
 import warnings
-from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+from OCPP_LIB.dataclass_slots import slotted_dataclass
 
-@dataclass
+
+@slotted_dataclass
 class Authorize:
     id_token_info: Dict
     certificate_status: Optional[str] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class BootNotification:
     current_time: str
     interval: int
@@ -19,72 +20,72 @@ class BootNotification:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class CancelReservation:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class CertificateSigned:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ChangeAvailability:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ClearCache:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ClearChargingProfile:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ClearDisplayMessage:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ClearVariableMonitoring:
     clear_monitoring_result: List
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ClearedChargingLimit:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class CostUpdated:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class CustomerInformation:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class DataTransfer:
     status: str
     status_info: Optional[Dict] = None
@@ -92,19 +93,19 @@ class DataTransfer:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class DeleteCertificate:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class FirmwareStatusNotification:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class Get15118EVCertificate:
     status: str
     exi_response: str
@@ -112,14 +113,14 @@ class Get15118EVCertificate:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetBaseReport:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetCertificateStatus:
     status: str
     status_info: Optional[Dict] = None
@@ -127,14 +128,14 @@ class GetCertificateStatus:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetChargingProfiles:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetCompositeSchedule:
     status: str
     status_info: Optional[Dict] = None
@@ -142,14 +143,14 @@ class GetCompositeSchedule:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetDisplayMessages:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetInstalledCertificateIds:
     status: str
     status_info: Optional[Dict] = None
@@ -157,13 +158,13 @@ class GetInstalledCertificateIds:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetLocalListVersion:
     version_number: int
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetLog:
     status: str
     status_info: Optional[Dict] = None
@@ -171,118 +172,118 @@ class GetLog:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetMonitoringReport:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetReport:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetTransactionStatus:
     messages_in_queue: bool
     ongoing_indicator: Optional[bool] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetVariables:
     get_variable_result: List
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class Heartbeat:
     current_time: str
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class InstallCertificate:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class LogStatusNotification:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class MeterValues:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class NotifyChargingLimit:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class NotifyCustomerInformation:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class NotifyDisplayMessages:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class NotifyEVChargingNeeds:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class NotifyEVChargingSchedule:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class NotifyEvent:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class NotifyMonitoringReport:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class NotifyReport:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class PublishFirmware:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class PublishFirmwareStatusNotification:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ReportChargingProfiles:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class RequestStartTransaction:
     status: str
     status_info: Optional[Dict] = None
@@ -290,104 +291,104 @@ class RequestStartTransaction:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class RequestStopTransaction:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ReservationStatusUpdate:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ReserveNow:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class Reset:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SecurityEventNotification:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SendLocalList:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SetChargingProfile:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SetDisplayMessage:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SetMonitoringBase:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SetMonitoringLevel:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SetNetworkProfile:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SetVariableMonitoring:
     set_monitoring_result: List
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SetVariables:
     set_variable_result: List
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SignCertificate:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class StatusNotification:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class TransactionEvent:
     total_cost: Optional[int] = None
     charging_priority: Optional[int] = None
@@ -396,27 +397,27 @@ class TransactionEvent:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class TriggerMessage:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class UnlockConnector:
     status: str
     status_info: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class UnpublishFirmware:
     status: str
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class UpdateFirmware:
     status: str
     status_info: Optional[Dict] = None
@@ -424,7 +425,7 @@ class UpdateFirmware:
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class AuthorizePayload(Authorize):
     def __post_init__(self):
         warnings.warn(
@@ -437,7 +438,7 @@ class AuthorizePayload(Authorize):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class BootNotificationPayload(BootNotification):
     def __post_init__(self):
         warnings.warn(
@@ -450,7 +451,7 @@ class BootNotificationPayload(BootNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class CancelReservationPayload(CancelReservation):
     def __post_init__(self):
         warnings.warn(
@@ -463,7 +464,7 @@ class CancelReservationPayload(CancelReservation):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class CertificateSignedPayload(CertificateSigned):
     def __post_init__(self):
         warnings.warn(
@@ -476,7 +477,7 @@ class CertificateSignedPayload(CertificateSigned):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ChangeAvailabilityPayload(ChangeAvailability):
     def __post_init__(self):
         warnings.warn(
@@ -489,7 +490,7 @@ class ChangeAvailabilityPayload(ChangeAvailability):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ClearCachePayload(ClearCache):
     def __post_init__(self):
         warnings.warn(
@@ -502,7 +503,7 @@ class ClearCachePayload(ClearCache):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ClearChargingProfilePayload(ClearChargingProfile):
     def __post_init__(self):
         warnings.warn(
@@ -515,7 +516,7 @@ class ClearChargingProfilePayload(ClearChargingProfile):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ClearDisplayMessagePayload(ClearDisplayMessage):
     def __post_init__(self):
         warnings.warn(
@@ -528,7 +529,7 @@ class ClearDisplayMessagePayload(ClearDisplayMessage):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ClearVariableMonitoringPayload(ClearVariableMonitoring):
     def __post_init__(self):
         warnings.warn(
@@ -541,7 +542,7 @@ class ClearVariableMonitoringPayload(ClearVariableMonitoring):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ClearedChargingLimitPayload(ClearedChargingLimit):
     def __post_init__(self):
         warnings.warn(
@@ -554,7 +555,7 @@ class ClearedChargingLimitPayload(ClearedChargingLimit):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class CostUpdatedPayload(CostUpdated):
     def __post_init__(self):
         warnings.warn(
@@ -567,7 +568,7 @@ class CostUpdatedPayload(CostUpdated):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class CustomerInformationPayload(CustomerInformation):
     def __post_init__(self):
         warnings.warn(
@@ -580,7 +581,7 @@ class CustomerInformationPayload(CustomerInformation):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class DataTransferPayload(DataTransfer):
     def __post_init__(self):
         warnings.warn(
@@ -593,7 +594,7 @@ class DataTransferPayload(DataTransfer):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class DeleteCertificatePayload(DeleteCertificate):
     def __post_init__(self):
         warnings.warn(
@@ -606,7 +607,7 @@ class DeleteCertificatePayload(DeleteCertificate):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class FirmwareStatusNotificationPayload(FirmwareStatusNotification):
     def __post_init__(self):
         warnings.warn(
@@ -619,7 +620,7 @@ class FirmwareStatusNotificationPayload(FirmwareStatusNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class Get15118EVCertificatePayload(Get15118EVCertificate):
     def __post_init__(self):
         warnings.warn(
@@ -632,7 +633,7 @@ class Get15118EVCertificatePayload(Get15118EVCertificate):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetBaseReportPayload(GetBaseReport):
     def __post_init__(self):
         warnings.warn(
@@ -645,7 +646,7 @@ class GetBaseReportPayload(GetBaseReport):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetCertificateStatusPayload(GetCertificateStatus):
     def __post_init__(self):
         warnings.warn(
@@ -658,7 +659,7 @@ class GetCertificateStatusPayload(GetCertificateStatus):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetChargingProfilesPayload(GetChargingProfiles):
     def __post_init__(self):
         warnings.warn(
@@ -671,7 +672,7 @@ class GetChargingProfilesPayload(GetChargingProfiles):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetCompositeSchedulePayload(GetCompositeSchedule):
     def __post_init__(self):
         warnings.warn(
@@ -684,7 +685,7 @@ class GetCompositeSchedulePayload(GetCompositeSchedule):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetDisplayMessagesPayload(GetDisplayMessages):
     def __post_init__(self):
         warnings.warn(
@@ -697,7 +698,7 @@ class GetDisplayMessagesPayload(GetDisplayMessages):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetInstalledCertificateIdsPayload(GetInstalledCertificateIds):
     def __post_init__(self):
         warnings.warn(
@@ -710,7 +711,7 @@ class GetInstalledCertificateIdsPayload(GetInstalledCertificateIds):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetLocalListVersionPayload(GetLocalListVersion):
     def __post_init__(self):
         warnings.warn(
@@ -723,7 +724,7 @@ class GetLocalListVersionPayload(GetLocalListVersion):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetLogPayload(GetLog):
     def __post_init__(self):
         warnings.warn(
@@ -736,7 +737,7 @@ class GetLogPayload(GetLog):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetMonitoringReportPayload(GetMonitoringReport):
     def __post_init__(self):
         warnings.warn(
@@ -749,7 +750,7 @@ class GetMonitoringReportPayload(GetMonitoringReport):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetReportPayload(GetReport):
     def __post_init__(self):
         warnings.warn(
@@ -762,7 +763,7 @@ class GetReportPayload(GetReport):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetTransactionStatusPayload(GetTransactionStatus):
     def __post_init__(self):
         warnings.warn(
@@ -775,7 +776,7 @@ class GetTransactionStatusPayload(GetTransactionStatus):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetVariablesPayload(GetVariables):
     def __post_init__(self):
         warnings.warn(
@@ -788,7 +789,7 @@ class GetVariablesPayload(GetVariables):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class HeartbeatPayload(Heartbeat):
     def __post_init__(self):
         warnings.warn(
@@ -801,7 +802,7 @@ class HeartbeatPayload(Heartbeat):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class InstallCertificatePayload(InstallCertificate):
     def __post_init__(self):
         warnings.warn(
@@ -814,7 +815,7 @@ class InstallCertificatePayload(InstallCertificate):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class LogStatusNotificationPayload(LogStatusNotification):
     def __post_init__(self):
         warnings.warn(
@@ -827,7 +828,7 @@ class LogStatusNotificationPayload(LogStatusNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class MeterValuesPayload(MeterValues):
     def __post_init__(self):
         warnings.warn(
@@ -840,7 +841,7 @@ class MeterValuesPayload(MeterValues):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class NotifyChargingLimitPayload(NotifyChargingLimit):
     def __post_init__(self):
         warnings.warn(
@@ -853,7 +854,7 @@ class NotifyChargingLimitPayload(NotifyChargingLimit):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class NotifyCustomerInformationPayload(NotifyCustomerInformation):
     def __post_init__(self):
         warnings.warn(
@@ -866,7 +867,7 @@ class NotifyCustomerInformationPayload(NotifyCustomerInformation):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class NotifyDisplayMessagesPayload(NotifyDisplayMessages):
     def __post_init__(self):
         warnings.warn(
@@ -879,7 +880,7 @@ class NotifyDisplayMessagesPayload(NotifyDisplayMessages):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class NotifyEVChargingNeedsPayload(NotifyEVChargingNeeds):
     def __post_init__(self):
         warnings.warn(
@@ -892,7 +893,7 @@ class NotifyEVChargingNeedsPayload(NotifyEVChargingNeeds):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class NotifyEVChargingSchedulePayload(NotifyEVChargingSchedule):
     def __post_init__(self):
         warnings.warn(
@@ -905,7 +906,7 @@ class NotifyEVChargingSchedulePayload(NotifyEVChargingSchedule):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class NotifyEventPayload(NotifyEvent):
     def __post_init__(self):
         warnings.warn(
@@ -918,7 +919,7 @@ class NotifyEventPayload(NotifyEvent):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class NotifyMonitoringReportPayload(NotifyMonitoringReport):
     def __post_init__(self):
         warnings.warn(
@@ -931,7 +932,7 @@ class NotifyMonitoringReportPayload(NotifyMonitoringReport):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class NotifyReportPayload(NotifyReport):
     def __post_init__(self):
         warnings.warn(
@@ -944,7 +945,7 @@ class NotifyReportPayload(NotifyReport):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class PublishFirmwarePayload(PublishFirmware):
     def __post_init__(self):
         warnings.warn(
@@ -957,7 +958,7 @@ class PublishFirmwarePayload(PublishFirmware):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class PublishFirmwareStatusNotificationPayload(PublishFirmwareStatusNotification):
     def __post_init__(self):
         warnings.warn(
@@ -970,7 +971,7 @@ class PublishFirmwareStatusNotificationPayload(PublishFirmwareStatusNotification
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ReportChargingProfilesPayload(ReportChargingProfiles):
     def __post_init__(self):
         warnings.warn(
@@ -983,7 +984,7 @@ class ReportChargingProfilesPayload(ReportChargingProfiles):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class RequestStartTransactionPayload(RequestStartTransaction):
     def __post_init__(self):
         warnings.warn(
@@ -996,7 +997,7 @@ class RequestStartTransactionPayload(RequestStartTransaction):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class RequestStopTransactionPayload(RequestStopTransaction):
     def __post_init__(self):
         warnings.warn(
@@ -1009,7 +1010,7 @@ class RequestStopTransactionPayload(RequestStopTransaction):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ReservationStatusUpdatePayload(ReservationStatusUpdate):
     def __post_init__(self):
         warnings.warn(
@@ -1022,7 +1023,7 @@ class ReservationStatusUpdatePayload(ReservationStatusUpdate):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ReserveNowPayload(ReserveNow):
     def __post_init__(self):
         warnings.warn(
@@ -1035,7 +1036,7 @@ class ReserveNowPayload(ReserveNow):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ResetPayload(Reset):
     def __post_init__(self):
         warnings.warn(
@@ -1048,7 +1049,7 @@ class ResetPayload(Reset):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SecurityEventNotificationPayload(SecurityEventNotification):
     def __post_init__(self):
         warnings.warn(
@@ -1061,7 +1062,7 @@ class SecurityEventNotificationPayload(SecurityEventNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SendLocalListPayload(SendLocalList):
     def __post_init__(self):
         warnings.warn(
@@ -1074,7 +1075,7 @@ class SendLocalListPayload(SendLocalList):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SetChargingProfilePayload(SetChargingProfile):
     def __post_init__(self):
         warnings.warn(
@@ -1087,7 +1088,7 @@ class SetChargingProfilePayload(SetChargingProfile):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SetDisplayMessagePayload(SetDisplayMessage):
     def __post_init__(self):
         warnings.warn(
@@ -1100,7 +1101,7 @@ class SetDisplayMessagePayload(SetDisplayMessage):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SetMonitoringBasePayload(SetMonitoringBase):
     def __post_init__(self):
         warnings.warn(
@@ -1113,7 +1114,7 @@ class SetMonitoringBasePayload(SetMonitoringBase):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SetMonitoringLevelPayload(SetMonitoringLevel):
     def __post_init__(self):
         warnings.warn(
@@ -1126,7 +1127,7 @@ class SetMonitoringLevelPayload(SetMonitoringLevel):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SetNetworkProfilePayload(SetNetworkProfile):
     def __post_init__(self):
         warnings.warn(
@@ -1139,7 +1140,7 @@ class SetNetworkProfilePayload(SetNetworkProfile):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SetVariableMonitoringPayload(SetVariableMonitoring):
     def __post_init__(self):
         warnings.warn(
@@ -1152,7 +1153,7 @@ class SetVariableMonitoringPayload(SetVariableMonitoring):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SetVariablesPayload(SetVariables):
     def __post_init__(self):
         warnings.warn(
@@ -1165,7 +1166,7 @@ class SetVariablesPayload(SetVariables):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SignCertificatePayload(SignCertificate):
     def __post_init__(self):
         warnings.warn(
@@ -1178,7 +1179,7 @@ class SignCertificatePayload(SignCertificate):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class StatusNotificationPayload(StatusNotification):
     def __post_init__(self):
         warnings.warn(
@@ -1191,7 +1192,7 @@ class StatusNotificationPayload(StatusNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class TransactionEventPayload(TransactionEvent):
     def __post_init__(self):
         warnings.warn(
@@ -1204,7 +1205,7 @@ class TransactionEventPayload(TransactionEvent):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class TriggerMessagePayload(TriggerMessage):
     def __post_init__(self):
         warnings.warn(
@@ -1217,7 +1218,7 @@ class TriggerMessagePayload(TriggerMessage):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class UnlockConnectorPayload(UnlockConnector):
     def __post_init__(self):
         warnings.warn(
@@ -1230,7 +1231,7 @@ class UnlockConnectorPayload(UnlockConnector):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class UnpublishFirmwarePayload(UnpublishFirmware):
     def __post_init__(self):
         warnings.warn(
@@ -1243,7 +1244,7 @@ class UnpublishFirmwarePayload(UnpublishFirmware):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class UpdateFirmwarePayload(UpdateFirmware):
     def __post_init__(self):
         warnings.warn(
@@ -0,0 +1,212 @@
+""" Measure encode and decode throughput of the JSON codecs.
+
+Run it from the root of the repository:
+
+    $ python -m benchmarks.bench_codec
+    $ python -m benchmarks.bench_codec --codec json --number 5000
+
+For a set of realistic messages the time it takes to encode a message with
+`to_json()` and to decode it with `unpack()` is measured for every codec that
+is installed. Install orjson to include the "orjson" codec.
+"""
+import argparse
+import decimal
+import timeit
+
+from OCPP_LIB.json_codec import available_codecs, get_codec
+from OCPP_LIB.ocpp_messages import Call, CallError, CallResult, unpack
+
+
+def _sampled_values(count):
+    measurands = [
+        ("Energy.Active.Import.Register", "Wh"),
+        ("Power.Active.Import", "W"),
+        ("Current.Import", "A"),
+        ("Voltage", "V"),
+    ]
+    return [
+        {
+            "value": 230.4 + i,
+            "context": "Sample.Periodic",
+            "measurand": measurands[i % len(measurands)][0],
+            "phase": ["L1", "L2", "L3"][i % 3],
+            "location": "Outlet",
+            "unitOfMeasure": {"unit": measurands[i % len(measurands)][1]},
+        }
+        for i in range(count)
+    ]
+
+
+def _report_data(count):
+    return [
+        {
+            "component": {
+                "name": "EVSE",
+                "instance": f"instance-{i}",
+                "evse": {"id": 1 + i % 2, "connectorId": 1},
+            },
+            "variable": {"name": "AvailabilityState"},
+            "variableAttribute": [
+                {
+                    "type": "Actual",
+                    "value": "Available",
+                    "mutability": "ReadOnly",
+                    "persistent": True,
+                    "constant": False,
+                }
+            ],
+            "variableCharacteristics": {
+                "dataType": "OptionList",
+                "valuesList": "Available,Occupied,Reserved,Unavailable,Faulted",
+                "supportsMonitoring": True,
+            },
+        }
+        for i in range(count)
+    ]
+
+
+def messages():
+    """Return a list of tuples (name, message)."""
+    return [
+        ("Heartbeat Call", Call("1", "Heartbeat", {})),
+        (
+            "Heartbeat CallResult",
+            CallResult(
+                "1", {"currentTime": "2024-04-05T12:00:00Z"}, action="Heartbeat"
+            ),
+        ),
+        (
+            "BootNotification Call",
+            Call(
+                "1",
+                "BootNotification",
+                {
+                    "reason": "PowerUp",
+                    "chargingStation": {
+                        "model": "SingleSocketCharger",
+                        "vendorName": "VendorX",
+                        "serialNumber": "0123456789",
+                        "firmwareVersion": "1.2.3",
+                        "modem": {"iccid": "8931000000000000000", "imsi": "204"},
+                    },
+                },
+            ),
+        ),
+        (
+            "MeterValues Call (8 sampled values)",
+            Call(
+                "1",
+                "MeterValues",
+                {
+                    "evseId": 1,
+                    "meterValue": [
+                        {
+                            "timestamp": "2024-04-05T12:00:00Z",
+                            "sampledValue": _sampled_values(8),
+                        }
+                    ],
+                },
+            ),
+        ),
+        (
+            "MeterValues Call (4x24 sampled values)",
+            Call(
+                "1",
+                "MeterValues",
+                {
+                    "evseId": 1,
+                    "meterValue": [
+                        {
+                            "timestamp": f"2024-04-05T12:0{i}:00Z",
+                            "sampledValue": _sampled_values(24),
+                        }
+                        for i in range(4)
+                    ],
+                },
+            ),
+        ),
+        (
+            "NotifyReport Call (100 report data)",
+            Call(
+                "1",
+                "NotifyReport",
+                {
+                    "requestId": 1,
+                    "generatedAt": "2024-04-05T12:00:00Z",
+                    "tbc": False,
+                    "seqNo": 0,
+                    "reportData": _report_data(100),
+                },
+            ),
+        ),
+        (
+            "GetCompositeSchedule CallResult (decimals)",
+            CallResult(
+                "1",
+                {
+                    "status": "Accepted",
+                    "connectorId": 1,
+                    "chargingSchedule": {
+                        "chargingRateUnit": "A",
+                        "chargingSchedulePeriod": [
+                            {"startPeriod": i * 900, "limit": decimal.Decimal("16.0")}
+                            for i in range(24)
+                        ],
+                    },
+                },
+                action="GetCompositeSchedule",
+            ),
+        ),
+        (
+            "CallError",
+            CallError(
+                "1",
+                "FormationViolation",
+                "Payload for Action is syntactically incorrect",
+                {"cause": "'idTag' is a required property"},
+            ),
+        ),
+    ]
+
+
+def run(codecs, number, repeat):
+    print(
+        f"{'message':<44} {'codec':<7} {'size (B)':>9} "
+        f"{'encode (us)':>12} {'decode (us)':>12} {'encode (MB/s)':>14}"
+    )
+
+    for name, message in messages():
+        for codec_name in codecs:
+            codec = get_codec(codec_name)
+            data = message.to_json(codec)
+
+            encode = min(
+                timeit.repeat(
+                    lambda: message.to_json(codec), number=number, repeat=repeat
+                )
+            )
+            decode = min(
+                timeit.repeat(lambda: unpack(data, codec), number=number, repeat=repeat)
+            )
+
+            print(
+                f"{name:<44} {codec_name:<7} {len(data):>9} "
+                f"{encode / number * 1e6:>12.2f} {decode / number * 1e6:>12.2f} "
+                f"{len(data) * number / encode / 1e6:>14.1f}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--codec", choices=available_codecs(), action="append", dest="codecs"
+    )
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run(args.codecs or available_codecs(), args.number, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
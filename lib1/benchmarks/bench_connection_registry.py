@@ -0,0 +1,89 @@
+""" Measure the connection registry with many connected charge points.
+
+Run it from the root of the repository:
+
+    $ python -m benchmarks.bench_connection_registry
+    $ python -m benchmarks.bench_connection_registry --sessions 1000000
+
+`--sessions` charge points with 20 vendors, 100 models and 50 firmware
+versions are added to a `ConnectionRegistry`, see
+`OCPP_LIB.connection_registry`. Then the time per operation is measured for
+a connect (add and BootNotification), a disconnect, a lookup by id and
+queries by one and by two attributes. These should take about the same time
+for any number of sessions, except for queries, which take time proportional
+to the number of matching charge points.
+"""
+import argparse
+import time
+
+from OCPP_LIB.connection_registry import ConnectionRegistry
+
+
+class _ChargePoint:
+    def __init__(self, id):
+        self.id = id
+
+
+def _boot_notification(i):
+    return {
+        "vendor_name": f"Vendor {i % 20}",
+        "model": f"Model {i % 100}",
+        "firmware_version": f"1.{i % 50}",
+    }
+
+
+def _measure(name, function, number):
+    start = time.perf_counter()
+    for i in range(number):
+        function(i)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<40} {elapsed / number * 1e6:>10.2f} us")
+
+
+def run(sessions, number):
+    registry = ConnectionRegistry()
+    charge_points = [_ChargePoint(f"CP_{i}") for i in range(sessions)]
+
+    start = time.perf_counter()
+    for i, charge_point in enumerate(charge_points):
+        registry.add(charge_point)
+        registry.boot_notification(charge_point.id, _boot_notification(i))
+    print(f"{sessions} sessions added in {time.perf_counter() - start:.2f} s")
+
+    extra = [_ChargePoint(f"EXTRA_{i}") for i in range(number)]
+
+    def connect(i):
+        registry.add(extra[i])
+        registry.boot_notification(extra[i].id, _boot_notification(i))
+
+    _measure("connect and BootNotification", connect, number)
+    _measure("disconnect", lambda i: registry.remove(extra[i]), number)
+    _measure("lookup by id", lambda i: registry.get(f"CP_{i}"), number)
+    _measure(
+        "find(firmware_version=...)",
+        lambda i: registry.find(firmware_version=f"1.{i % 50}"),
+        min(number, 1000),
+    )
+    _measure(
+        "find(vendor=..., model=...)",
+        lambda i: registry.find(vendor=f"Vendor {i % 20}", model=f"Model {i % 100}"),
+        min(number, 1000),
+    )
+    _measure(
+        "counts('firmware_version')",
+        lambda i: registry.counts("firmware_version"),
+        100,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sessions", type=int, default=100000)
+    parser.add_argument("--number", type=int, default=10000)
+    args = parser.parse_args()
+
+    run(args.sessions, args.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+""" Compare the payload decoders of `OCPP_LIB.payload_decoder`.
+
+Run it from the root of the repository:
+
+    $ python -m benchmarks.bench_decode
+    $ python -m benchmarks.bench_decode --number 5000
+
+Before a payload is passed to a handler, or returned by `ChargePoint.call()`,
+its keys are converted to snake_case. By default nested objects remain
+dictionaries ("dict"). The "typed" decoder turns them into the dataclasses of
+`data_type` and the enums of `E_num`, the "lazy" decoder does the same but
+decodes the items of arrays only when they are accessed. The last two columns
+show the time to decode a payload and then walk through every value of it.
+"""
+import argparse
+import timeit
+
+from benchmarks.bench_codec import _report_data, _sampled_values
+from OCPP_LIB.charging_station import camel_to_snake_case
+from OCPP_LIB.ocpp_messages import MessageType
+from OCPP_LIB.payload_decoder import LazyList, get_decoder
+
+
+def _meter_values_v16(count):
+    return {
+        "connectorId": 1,
+        "transactionId": 1234,
+        "meterValue": [
+            {
+                "timestamp": f"2024-04-05T12:0{i}:00Z",
+                "sampledValue": [
+                    {
+                        "value": str(value["value"]),
+                        "context": value["context"],
+                        "measurand": value["measurand"],
+                        "phase": value["phase"],
+                        "location": value["location"],
+                        "unit": value["unitOfMeasure"]["unit"],
+                    }
+                    for value in _sampled_values(count)
+                ],
+            }
+            for i in range(4)
+        ],
+    }
+
+
+def _set_charging_profile_v201(count):
+    return {
+        "evseId": 1,
+        "chargingProfile": {
+            "id": 1,
+            "stackLevel": 0,
+            "chargingProfilePurpose": "TxDefaultProfile",
+            "chargingProfileKind": "Absolute",
+            "chargingSchedule": [
+                {
+                    "id": 1,
+                    "chargingRateUnit": "A",
+                    "startSchedule": "2024-04-05T12:00:00Z",
+                    "chargingSchedulePeriod": [
+                        {"startPeriod": i * 900, "limit": 16.0, "numberPhases": 3}
+                        for i in range(count)
+                    ],
+                }
+            ],
+        },
+    }
+
+
+def payloads():
+    """Return a list of tuples (name, OCPP version, action, payload)."""
+    return [
+        (
+            "1.6 BootNotification",
+            "1.6",
+            "BootNotification",
+            {
+                "chargePointModel": "SingleSocketCharger",
+                "chargePointVendor": "VendorX",
+                "firmwareVersion": "1.2.3",
+            },
+        ),
+        (
+            "1.6 MeterValues (4x24 sampled values)",
+            "1.6",
+            "MeterValues",
+            _meter_values_v16(24),
+        ),
+        (
+            "2.0.1 SetChargingProfile (96 periods)",
+            "2.0.1",
+            "SetChargingProfile",
+            _set_charging_profile_v201(96),
+        ),
+        (
+            "2.0.1 NotifyReport (100 report data)",
+            "2.0.1",
+            "NotifyReport",
+            {
+                "requestId": 1,
+                "generatedAt": "2024-04-05T12:00:00Z",
+                "tbc": False,
+                "seqNo": 0,
+                "reportData": _report_data(100),
+            },
+        ),
+    ]
+
+
+def _touch(value):
+    """Access every value nested in `value`, including the items of a
+    `LazyList`."""
+    if isinstance(value, (list, LazyList)):
+        for item in value:
+            _touch(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _touch(item)
+    elif hasattr(value, "__dataclass_fields__"):
+        for name in value.__dataclass_fields__:
+            _touch(getattr(value, name))
+
+
+def run(number, repeat):
+    print(
+        f"{'payload':<40} {'dict (us)':>10} {'typed (us)':>11} "
+        f"{'lazy (us)':>10} {'typed+walk (us)':>16} {'lazy+walk (us)':>15}"
+    )
+
+    for name, ocpp_version, action, payload in payloads():
+        typed = get_decoder(MessageType.Call, action, ocpp_version)
+        lazy = get_decoder(MessageType.Call, action, ocpp_version, lazy=True)
+
+        functions = [
+            lambda: camel_to_snake_case(payload, ocpp_version),
+            lambda: typed(payload),
+            lambda: lazy(payload),
+            lambda: _touch(typed(payload)),
+            lambda: _touch(lazy(payload)),
+        ]
+
+        results = []
+        for function in functions:
+            timings = timeit.repeat(function, number=number, repeat=repeat)
+            results.append(min(timings) / number * 1e6)
+
+        print(
+            f"{name:<40} {results[0]:>10.2f} {results[1]:>11.2f} "
+            f"{results[2]:>10.2f} {results[3]:>16.2f} {results[4]:>15.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run(args.number, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
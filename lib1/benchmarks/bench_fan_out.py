@@ -0,0 +1,95 @@
+""" Measure how long it takes to send a Call to a fleet of charge points.
+
+Run it from the root of the repository:
+
+    $ python -m benchmarks.bench_fan_out
+    $ python -m benchmarks.bench_fan_out --stations 10000 --latency 0.05 \\
+        --concurrency 100 --concurrency 1000
+
+`--stations` charging stations are connected to the CSMS by in-memory
+connections with `--latency` seconds delay per frame, see
+`OCPP_LIB.loopback`. For every `--concurrency` a `FanOut` sends a
+TriggerMessage to all of them, see `OCPP_LIB.fleet`. With a network latency
+the time it takes is dominated by waiting, so it shrinks with the
+concurrency until the CSMS is busy all the time.
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.replay import PERCENTILES, percentile
+from OCPP_LIB.connection_registry import ConnectionRegistry
+from OCPP_LIB.fleet import FanOut
+from OCPP_LIB.loopback import connection_pair
+from OCPP_LIB.ocpp_routing import on
+from OCPP_LIB.ver201 import ChargePoint, ocpp_request, ocpp_response
+
+
+class Station(ChargePoint):
+    @on("TriggerMessage")
+    def on_trigger_message(self, **kwargs):
+        return ocpp_response.TriggerMessage(status="Accepted")
+
+
+async def run(stations, latency, concurrencies, timeout):
+    registry = ConnectionRegistry()
+    tasks = []
+    for i in range(stations):
+        csms_connection, station_connection = connection_pair(latency, seed=i)
+        csms = ChargePoint(f"CP_{i}", csms_connection)
+        registry.add(csms)
+        tasks += [
+            asyncio.ensure_future(csms.start()),
+            asyncio.ensure_future(Station(f"CP_{i}", station_connection).start()),
+        ]
+
+    columns = "".join(f"{f'p{q} (ms)':>10}" for q in PERCENTILES)
+    print(f"{'concurrency':>11} {'elapsed (s)':>12} {'calls/s':>9} {'ok':>7}{columns}")
+    for concurrency in concurrencies:
+        fan_out = FanOut(
+            list(registry),
+            ocpp_request.TriggerMessage(requested_message="Heartbeat"),
+            registry=registry,
+            concurrency=concurrency,
+            timeout=timeout,
+        )
+        start = time.perf_counter()
+        results = await fan_out.results()
+        elapsed = time.perf_counter() - start
+
+        latencies = sorted(result.elapsed for result in results)
+        columns = "".join(
+            f"{percentile(latencies, q) * 1e3:>10.2f}" for q in PERCENTILES
+        )
+        print(
+            f"{concurrency:>11} {elapsed:>12.2f} {len(results) / elapsed:>9.0f} "
+            f"{fan_out.counts['success']:>7}{columns}"
+        )
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--stations", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument(
+        "--concurrency", type=int, action="append", dest="concurrencies"
+    )
+    parser.add_argument("--timeout", type=float, default=30)
+    args = parser.parse_args()
+
+    asyncio.run(
+        run(
+            args.stations,
+            args.latency,
+            args.concurrencies or [10, 100, 1000],
+            args.timeout,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+""" Measure the cost of recording a frame in the journal.
+
+Run it from the root of the repository:
+
+    $ python -m benchmarks.bench_journal
+    $ python -m benchmarks.bench_journal --number 20000
+
+For a set of realistic messages the time it takes to record the frame with
+`FrameJournal.record()` is compared to logging it with `LOGGER.info()` to a
+file, the way `ChargePoint` did without a journal. Both write to a temporary
+directory that is removed afterwards.
+"""
+import argparse
+import logging
+import os
+import tempfile
+import timeit
+
+from benchmarks.bench_codec import messages
+from OCPP_LIB.journal import OUTBOUND, FrameJournal
+
+
+def run(number, repeat):
+    print(
+        f"{'message':<44} {'size (B)':>9} {'logging (us)':>13} "
+        f"{'journal (us)':>13} {'journal (MB/s)':>15}"
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        logger = logging.getLogger("bench_journal")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        handler = logging.FileHandler(os.path.join(directory, "ocpp.log"))
+        logger.addHandler(handler)
+
+        journal = FrameJournal(os.path.join(directory, "journal"))
+
+        for name, message in messages():
+            frame = message.to_json()
+
+            log = min(
+                timeit.repeat(
+                    lambda: logger.info("%s: send %s", "CP_1", frame),
+                    number=number,
+                    repeat=repeat,
+                )
+            )
+            record = min(
+                timeit.repeat(
+                    lambda: journal.record("CP_1", OUTBOUND, frame),
+                    number=number,
+                    repeat=repeat,
+                )
+            )
+
+            print(
+                f"{name:<44} {len(frame):>9} {log / number * 1e6:>13.2f} "
+                f"{record / number * 1e6:>13.2f} "
+                f"{len(frame) * number / record / 1e6:>15.1f}"
+            )
+
+        journal.close()
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--number", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run(args.number, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
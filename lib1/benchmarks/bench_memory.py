@@ -0,0 +1,167 @@
+""" Measure the memory footprint of messages, payloads and idle connections.
+
+Run it from the root of the repository:
+
+    $ python -m benchmarks.bench_memory
+    $ python -m benchmarks.bench_memory --number 5000
+
+The payload dataclasses and the message classes are slotted, see
+`OCPP_LIB/dataclass_slots.py`. To show the effect every object is also
+measured as an instance of an equivalent class with a per-instance `__dict__`,
+the way these classes were defined before.
+
+The footprint of an object is measured by creating `--number` instances with
+`tracemalloc` enabled and dividing the growth of the traced memory by that
+number. Objects that are shared between instances, like interned strings,
+aren't counted.
+
+An idle connection is a `ChargePoint` that hasn't exchanged any messages.
+"""
+import argparse
+import dataclasses
+import gc
+import tracemalloc
+from unittest.mock import AsyncMock
+
+from benchmarks.bench_codec import messages
+from benchmarks.bench_serialize import payloads
+from OCPP_LIB.ocpp_messages import Call, CallError, CallResult
+from OCPP_LIB.ver16 import ChargePoint as ChargePointV16
+from OCPP_LIB.ver201 import ChargePoint as ChargePointV201
+
+_unslotted_classes = {}
+
+
+def _unslotted_class(cls):
+    """Return a copy of `cls` without `__slots__`."""
+    try:
+        return _unslotted_classes[cls]
+    except KeyError:
+        pass
+
+    if dataclasses.is_dataclass(cls):
+        unslotted = dataclasses.make_dataclass(
+            cls.__name__,
+            [
+                (
+                    field.name,
+                    field.type,
+                    dataclasses.field(
+                        default=field.default, default_factory=field.default_factory
+                    ),
+                )
+                for field in dataclasses.fields(cls)
+            ],
+        )
+    else:
+        # The message classes only set their attributes in `__init__()`.
+        unslotted = type(cls.__name__, (), {"__init__": cls.__init__})
+
+    _unslotted_classes[cls] = unslotted
+    return unslotted
+
+
+def _copy(value, unslotted):
+    """Return a deep copy of `value`. If `unslotted` is `True` dataclasses
+    are copied into instances of `_unslotted_class()`."""
+    if isinstance(value, list):
+        return [_copy(item, unslotted) for item in value]
+    if isinstance(value, dict):
+        return {key: _copy(item, unslotted) for key, item in value.items()}
+    if dataclasses.is_dataclass(value):
+        cls = _unslotted_class(type(value)) if unslotted else type(value)
+        return cls(
+            **{
+                field.name: _copy(getattr(value, field.name), unslotted)
+                for field in dataclasses.fields(value)
+            }
+        )
+
+    return value
+
+
+def _copy_message(message, unslotted):
+    cls = _unslotted_class(type(message)) if unslotted else type(message)
+    if isinstance(message, Call):
+        return cls(message.unique_id, message.action, _copy(message.payload, False))
+    if isinstance(message, CallResult):
+        return cls(message.unique_id, _copy(message.payload, False), message.action)
+    if isinstance(message, CallError):
+        return cls(
+            message.unique_id,
+            message.error_code,
+            message.error_description,
+            _copy(message.error_details, False),
+        )
+
+    raise TypeError(f"Unexpected message {message!r}")
+
+
+def measure(create, number):
+    """Return the average number of bytes allocated by `create()`."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        objects = [create() for _ in range(number)]
+        end = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    # The list holding the objects is measured as well.
+    size = end - start - objects.__sizeof__()
+    del objects
+
+    return size / number
+
+
+def _print_header(name):
+    print(f"{name:<44} {'__dict__ (B)':>13} {'slots (B)':>12} {'saved':>8}")
+
+
+def _print_row(name, before, after):
+    print(
+        f"{name:<44} {before:>13.0f} {after:>12.0f} "
+        f"{(before - after) / before * 100:>7.1f}%"
+    )
+
+
+def run(number):
+    _print_header("message (incl. payload)")
+    for name, message in messages():
+        _print_row(
+            name,
+            measure(lambda: _copy_message(message, True), number),
+            measure(lambda: _copy_message(message, False), number),
+        )
+
+    print()
+    _print_header("payload dataclass")
+    for name, _, payload in payloads():
+        _print_row(
+            name,
+            measure(lambda: _copy(payload, True), number),
+            measure(lambda: _copy(payload, False), number),
+        )
+
+    print()
+    print(f"{'idle connection':<44} {'size (B)':>13}")
+    connection = AsyncMock()
+    for name, cls in [
+        ("1.6 ChargePoint", ChargePointV16),
+        ("2.0.1 ChargePoint", ChargePointV201),
+    ]:
+        size = measure(lambda: cls("CP_1", connection), max(number // 10, 1))
+        print(f"{name:<44} {size:>13.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--number", type=int, default=1000)
+    args = parser.parse_args()
+
+    run(args.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+""" Measure every stage of the message pipeline for every action.
+
+Run it from the root of the repository:
+
+    $ python -m benchmarks.bench_pipeline run --output results.json
+    $ python -m benchmarks.bench_pipeline run --version 2.0.1 --action Heartbeat
+    $ python -m benchmarks.bench_pipeline run --percentile 100 --seed 1
+    $ python -m benchmarks.bench_pipeline compare baseline.json results.json
+
+For every schema of OCPP 1.6 and 2.0.1 a payload is generated that contains
+all optional properties, see `benchmarks/payloads.py`. With `--percentile`
+the payloads are generated by `PayloadGenerator` at that size instead, for
+example `--percentile 100` for the largest ones. A received message
+passes these stages:
+
+* unpack: `unpack()` of the frame;
+* validate: `validate_payload()`;
+* camel_to_snake: `camel_to_snake_case()` of the payload;
+* dispatch: looking up the handler in the route map and calling it, Calls
+  only.
+
+A message that is sent passes these:
+
+* serialize_payload: `serialize_payload()` of the payload dataclass, the
+  single pass that `ChargePoint` uses;
+* serialize_as_dict, snake_to_camel, remove_nones: the three passes that
+  `serialize_payload()` replaces;
+* to_json: `to_json()` of the message.
+
+`run` prints the time per stage in microseconds and with `--output` saves the
+results as JSON. `compare` compares two of these files and lists every stage
+that has become slower by more than `--threshold` (10% by default) and by
+more than `--min-delta` microseconds. It exits with status 1 if there's any
+such regression, so it can be used in CI against a stored baseline.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+
+from benchmarks.payloads import (
+    OCPP_VERSIONS,
+    PayloadGenerator,
+    generate_payload,
+    iter_schemas,
+)
+from OCPP_LIB.charging_station import (
+    camel_to_snake_case,
+    remove_nones,
+    serialize_as_dict,
+    serialize_payload,
+    snake_to_camel_case,
+)
+from OCPP_LIB.ocpp_messages import (
+    Call,
+    CallResult,
+    MessageType,
+    unpack,
+    validate_payload,
+)
+from OCPP_LIB.ocpp_routing import create_route_map, on
+from OCPP_LIB.payload_decoder import get_decoder
+from OCPP_LIB.ver16 import ocpp_request as v16_request
+from OCPP_LIB.ver16 import ocpp_response as v16_response
+from OCPP_LIB.ver201 import ocpp_request as v201_request
+from OCPP_LIB.ver201 import ocpp_response as v201_response
+
+STAGES = [
+    "unpack",
+    "validate",
+    "camel_to_snake",
+    "dispatch",
+    "serialize_payload",
+    "serialize_as_dict",
+    "snake_to_camel",
+    "remove_nones",
+    "to_json",
+]
+
+_PAYLOAD_MODULES = {
+    ("1.6", MessageType.Call): v16_request,
+    ("1.6", MessageType.CallResult): v16_response,
+    ("2.0.1", MessageType.Call): v201_request,
+    ("2.0.1", MessageType.CallResult): v201_response,
+}
+
+
+class _Handlers:
+    """Has a handler for every action that does nothing."""
+
+    def __init__(self, actions):
+        for action in actions:
+            setattr(self, f"on_{action}", on(action)(lambda **kwargs: None))
+        self.route_map = create_route_map(self)
+
+
+def _dispatch(route_map, action, kwargs):
+    """Do what `ChargePoint._handle_call()` does to call a handler."""
+    handler = route_map[action]["_on_action"]
+    return handler(**kwargs)
+
+
+def _payload_dataclass(ocpp_version, message_type_id, action, payload):
+    """Return `payload` as instance of its dataclass, or `None` if there's no
+    dataclass for it."""
+    module = _PAYLOAD_MODULES[(ocpp_version, message_type_id)]
+    cls = getattr(module, action, None)
+    if cls is None:
+        return None
+
+    try:
+        return cls(**get_decoder(message_type_id, action, ocpp_version)(payload))
+    except (OSError, TypeError):
+        return None
+
+
+def _stages(ocpp_version, action, message_type_id, payload, handlers):
+    """Return a dictionary with a function to measure per stage."""
+    if message_type_id == MessageType.Call:
+        message = Call(unique_id="1", action=action, payload=payload)
+    else:
+        message = CallResult(unique_id="1", action=action, payload=payload)
+    frame = message.to_json()
+    snake_case_payload = camel_to_snake_case(payload, ocpp_version)
+
+    stages = {
+        "unpack": lambda: unpack(frame),
+        "validate": lambda: validate_payload(message, ocpp_version),
+        "camel_to_snake": lambda: camel_to_snake_case(payload, ocpp_version),
+        "to_json": message.to_json,
+    }
+
+    if message_type_id == MessageType.Call:
+        route_map = handlers.route_map
+        stages["dispatch"] = lambda: _dispatch(route_map, action, snake_case_payload)
+
+    dataclass = _payload_dataclass(ocpp_version, message_type_id, action, payload)
+    if dataclass is not None:
+        as_dict = serialize_as_dict(dataclass)
+        camel_case = snake_to_camel_case(as_dict, ocpp_version)
+        stages.update(
+            {
+                "serialize_payload": lambda: serialize_payload(dataclass, ocpp_version),
+                "serialize_as_dict": lambda: serialize_as_dict(dataclass),
+                "snake_to_camel": lambda: snake_to_camel_case(as_dict, ocpp_version),
+                "remove_nones": lambda: remove_nones(camel_case),
+            }
+        )
+
+    return stages
+
+
+def run(ocpp_versions, actions, number, repeat, percentile=None, seed="0"):
+    """Measure the stages and return the results as a dictionary."""
+    generator = PayloadGenerator(percentile, seed) if percentile is not None else None
+    results = {}
+    width = 12
+    print(
+        f"{'version':<8} {'message':<44}"
+        + "".join(f"{stage[:width - 1]:>{width}}" for stage in STAGES)
+    )
+
+    for ocpp_version in ocpp_versions:
+        schemas = [
+            schema
+            for schema in iter_schemas(ocpp_version)
+            if not actions or schema[0] in actions
+        ]
+        handlers = _Handlers({action for action, _, _ in schemas})
+
+        for action, message_type_id, schema in schemas:
+            kind = "Call" if message_type_id == MessageType.Call else "CallResult"
+            if generator is None:
+                payload = generate_payload(schema)
+            else:
+                payload = generator.generate(schema, f"{action}/{message_type_id}")
+            name = f"{ocpp_version}/{action}/{kind}"
+
+            timings = {}
+            stages = _stages(ocpp_version, action, message_type_id, payload, handlers)
+            for stage, function in stages.items():
+                # Warm up caches, like those of validators and serializers.
+                function()
+                timings[stage] = (
+                    min(timeit.repeat(function, number=number, repeat=repeat))
+                    / number
+                    * 1e6
+                )
+            results[name] = timings
+
+            columns = "".join(
+                f"{timings[stage]:>{width}.2f}"
+                if stage in timings
+                else f"{'-':>{width}}"
+                for stage in STAGES
+            )
+            print(f"{ocpp_version:<8} {action + ' ' + kind:<44}{columns}")
+
+    return {
+        "metadata": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "number": number,
+            "repeat": repeat,
+            "percentile": percentile,
+            "seed": seed,
+            "unit": "us",
+        },
+        "results": results,
+    }
+
+
+def compare(baseline, current, threshold, min_delta):
+    """Print the stages that became slower or faster, and return the number
+    of regressions."""
+    regressions = improvements = 0
+    for name, timings in sorted(current["results"].items()):
+        for stage, value in timings.items():
+            before = baseline["results"].get(name, {}).get(stage)
+            if before is None:
+                continue
+
+            delta = value - before
+            if abs(delta) < min_delta or abs(delta) < before * threshold:
+                continue
+
+            label = "REGRESSION " if delta > 0 else "improvement"
+            print(
+                f"{label} {name:<56} {stage:<18} {before:>10.2f} -> "
+                f"{value:>10.2f} us ({delta / before * 100:+.0f}%)"
+            )
+            if delta > 0:
+                regressions += 1
+            else:
+                improvements += 1
+
+    print(f"{regressions} regressions, {improvements} improvements")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="measure the stages")
+    run_parser.add_argument(
+        "--version", choices=OCPP_VERSIONS, action="append", dest="versions"
+    )
+    run_parser.add_argument("--action", action="append", dest="actions")
+    run_parser.add_argument("--number", type=int, default=200)
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--percentile", type=float)
+    run_parser.add_argument("--seed", default="0")
+    run_parser.add_argument("--output", help="file to save the results to")
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="compare results to a baseline"
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    compare_parser.add_argument("--min-delta", type=float, default=0.5)
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        results = run(
+            args.versions or OCPP_VERSIONS,
+            args.actions,
+            args.number,
+            args.repeat,
+            args.percentile,
+            args.seed,
+        )
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(results, f, indent=2, sort_keys=True)
+    else:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+        if compare(baseline, current, args.threshold, args.min_delta):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
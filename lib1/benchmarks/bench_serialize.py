@@ -0,0 +1,158 @@
+""" Compare the serialization of outbound payloads.
+
+Run it from the root of the repository:
+
+    $ python -m benchmarks.bench_serialize
+    $ python -m benchmarks.bench_serialize --number 5000
+
+Before a payload dataclass is sent, it's turned into a dictionary with
+camelCase keys and without None values. This used to be done in three passes:
+`serialize_as_dict()`, `snake_to_camel_case()` and `remove_nones()`.
+`serialize_payload()` does the same in a single pass with a serializer that is
+generated per dataclass. Both are measured for a set of realistic payloads.
+"""
+import argparse
+import timeit
+
+from OCPP_LIB.charging_station import (
+    remove_nones,
+    serialize_as_dict,
+    serialize_payload,
+    snake_to_camel_case,
+)
+from OCPP_LIB.ver16 import data_type as v16_data_type
+from OCPP_LIB.ver16 import ocpp_request as v16_request
+from OCPP_LIB.ver201 import data_type as v201_data_type
+from OCPP_LIB.ver201 import ocpp_request as v201_request
+from OCPP_LIB.ver201 import ocpp_response as v201_response
+
+
+def _meter_values_v16(count):
+    return v16_request.MeterValues(
+        connector_id=1,
+        transaction_id=1234,
+        meter_value=[
+            v16_data_type.MeterValue(
+                timestamp="2024-04-05T12:00:00Z",
+                sampled_value=[
+                    v16_data_type.SampledValue(
+                        value=str(230 + i),
+                        context="Sample.Periodic",
+                        measurand="Voltage",
+                        phase=["L1", "L2", "L3"][i % 3],
+                        location="Outlet",
+                        unit="V",
+                    )
+                    for i in range(count)
+                ],
+            )
+        ],
+    )
+
+
+def _set_charging_profile_v201(count):
+    return v201_request.SetChargingProfile(
+        evse_id=1,
+        charging_profile=v201_data_type.ChargingProfileType(
+            id=1,
+            stack_level=0,
+            charging_profile_purpose="TxDefaultProfile",
+            charging_profile_kind="Absolute",
+            charging_schedule=[
+                v201_data_type.ChargingScheduleType(
+                    id=1,
+                    charging_rate_unit="A",
+                    start_schedule="2024-04-05T12:00:00Z",
+                    charging_schedule_period=[
+                        v201_data_type.ChargingSchedulePeriodType(
+                            start_period=i * 900, limit=16.0, number_phases=3
+                        )
+                        for i in range(count)
+                    ],
+                )
+            ],
+        ),
+    )
+
+
+def _get_variables_v201(count):
+    return v201_request.GetVariables(
+        get_variable_data=[
+            v201_data_type.GetVariableDataType(
+                component=v201_data_type.ComponentType(
+                    name="EVSE", evse=v201_data_type.EVSEType(id=1 + i % 2)
+                ),
+                variable=v201_data_type.VariableType(name="AvailabilityState"),
+                attribute_type="Actual",
+            )
+            for i in range(count)
+        ]
+    )
+
+
+def payloads():
+    """Return a list of tuples (name, OCPP version, payload)."""
+    return [
+        (
+            "1.6 BootNotification",
+            "1.6",
+            v16_request.BootNotification(
+                charge_point_model="SingleSocketCharger",
+                charge_point_vendor="VendorX",
+                firmware_version="1.2.3",
+            ),
+        ),
+        (
+            "2.0.1 Heartbeat response",
+            "2.0.1",
+            v201_response.Heartbeat(current_time="2024-04-05T12:00:00Z"),
+        ),
+        ("1.6 MeterValues (24 sampled values)", "1.6", _meter_values_v16(24)),
+        (
+            "2.0.1 SetChargingProfile (96 periods)",
+            "2.0.1",
+            _set_charging_profile_v201(96),
+        ),
+        ("2.0.1 GetVariables (50 variables)", "2.0.1", _get_variables_v201(50)),
+    ]
+
+
+def _three_passes(payload, ocpp_version):
+    return remove_nones(snake_to_camel_case(serialize_as_dict(payload), ocpp_version))
+
+
+def run(number, repeat):
+    print(
+        f"{'payload':<40} {'3 passes (us)':>14} {'serializer (us)':>16} "
+        f"{'speedup':>8}"
+    )
+
+    for name, ocpp_version, payload in payloads():
+        assert serialize_payload(payload, ocpp_version) == _three_passes(
+            payload, ocpp_version
+        )
+
+        results = []
+        for function in [_three_passes, serialize_payload]:
+            timings = timeit.repeat(
+                lambda: function(payload, ocpp_version), number=number, repeat=repeat
+            )
+            results.append(min(timings) / number * 1e6)
+
+        print(
+            f"{name:<40} {results[0]:>14.2f} {results[1]:>16.2f} "
+            f"{results[0] / results[1]:>7.1f}x"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run(args.number, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+""" Build valid payloads for every action from the JSON schemas that ship with
+`OCPP_LIB`. The payloads are used as input for the benchmarks.
+
+`generate_payload()` builds one small payload with all optional properties.
+`PayloadGenerator` builds payloads of a chosen size, reproducibly, to create
+corpora for load tests. Run it from the root of the repository to write such
+a corpus as JSON lines, or as a journal that `benchmarks/replay.py` replays:
+
+    $ python -m benchmarks.payloads --version 2.0.1 --percentile 50 \\
+        --percentile 100 --output corpus.jsonl
+    $ python -m benchmarks.payloads --version 2.0.1 --action NotifyReport \\
+        --action MeterValues --count 100 --journal /tmp/journal
+    $ python -m benchmarks.payloads --version 1.6 --action SendLocalList \\
+        --percentile 100 --max-items 5000 --output send_local_list.jsonl
+    $ python -m benchmarks.payloads --version 2.0.1 --action MeterValues \\
+        --items meterValue=4 --output meter_values.jsonl
+
+With `--journal` only Calls are generated, distributed over
+`--charge-points` charge points and `--interval` seconds apart.
+"""
+import argparse
+import datetime
+import json
+import random
+import string
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+from OCPP_LIB.journal import INBOUND, FrameJournal
+from OCPP_LIB.ocpp_messages import Call, MessageType
+
+SCHEMAS_DIR = Path(__file__).resolve().parent.parent / "OCPP_LIB"
+
+OCPP_VERSIONS = ["1.6", "2.0.1"]
+
+
+def iter_schemas(ocpp_version: str) -> Iterator[Tuple[str, int, Dict]]:
+    """Yield a tuple (action, message type id, schema) for every schema of the
+    given OCPP version."""
+    schemas_dir = SCHEMAS_DIR / ("ver" + ocpp_version.replace(".", "")) / "schemas"
+
+    for path in sorted(schemas_dir.glob("*.json")):
+        name = path.stem
+        if name.endswith("Response"):
+            action, message_type_id = name[: -len("Response")], MessageType.CallResult
+        elif name.endswith("Request"):
+            action, message_type_id = name[: -len("Request")], MessageType.Call
+        else:
+            action, message_type_id = name, MessageType.Call
+
+        with open(path, "r", encoding="utf-8-sig") as f:
+            yield action, message_type_id, json.load(f)
+
+
+def generate_payload(schema: Dict, optional: bool = True) -> Any:
+    """Return an instance that is valid according to `schema`.
+
+    When `optional` is `True` all optional properties are included as well.
+    """
+    return _generate(schema, schema, optional)
+
+
+def _generate(schema: Dict, root: Dict, optional: bool) -> Any:
+    if "$ref" in schema:
+        schema = root["definitions"][schema["$ref"].split("/")[-1]]
+
+    if "enum" in schema:
+        return schema["enum"][0]
+
+    type = schema.get("type", "object")
+    if type == "object":
+        required = schema.get("required", [])
+        return {
+            name: _generate(subschema, root, optional)
+            for name, subschema in schema.get("properties", {}).items()
+            if optional or name in required
+        }
+
+    if type == "array":
+        count = max(schema.get("minItems", 1), 1)
+        return [_generate(schema["items"], root, optional) for _ in range(count)]
+
+    if type == "string":
+        if schema.get("format") == "date-time":
+            return "2024-04-05T12:00:00Z"
+        if schema.get("format") == "uri":
+            return "https://example.com"
+        return "x" * min(schema.get("maxLength", 8), 8)
+
+    if type == "integer":
+        return max(schema.get("minimum", 1), 1)
+
+    if type == "number":
+        return float(max(schema.get("minimum", 16), 16))
+
+    if type == "boolean":
+        return True
+
+    return None
+
+
+_CHARACTERS = string.ascii_letters + string.digits
+_EPOCH = datetime.datetime(2024, 1, 1)
+
+
+class PayloadGenerator:
+    """
+    Generates random payloads that are valid according to a schema, with a
+    size given as `percentile` between 0 and 100:
+
+    * 0 is the smallest payload: only required properties, arrays with
+      their minimum number of items and strings of the minimum length.
+    * 100 is the largest payload: all optional properties, arrays with their
+      maximum number of items and strings of the maximum length.
+
+    In between, optional properties are included with a probability of
+    `percentile` / 100, and the number of items and the length of strings
+    grow linearly.
+
+    Because arrays are nested, like `sampledValue` in `meterValue` of
+    MeterValues, a payload has at most `max_items` items in total: an array
+    has at most `max_items` divided by the number of items of the arrays it
+    is nested in. `items` overrides the maximum number of items of arrays by
+    property name, within their `minItems` and `maxItems`. For example
+    `{"meterValue": 4}` gives MeterValues a few meter values with many
+    sampled values each. Strings have at most `max_length` characters.
+
+    The same `seed` always generates the same payloads.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 50,
+        seed: Any = 0,
+        max_items: int = 1000,
+        max_length: int = 512,
+        items: Optional[Dict[str, int]] = None,
+    ):
+        if not 0 <= percentile <= 100:
+            raise ValueError("percentile must be between 0 and 100")
+
+        self.percentile = percentile
+        self.seed = seed
+        self.max_items = max_items
+        self.max_length = max_length
+        self.items = items or {}
+
+    def generate(self, schema: Dict, key: str = "") -> Any:
+        """Return a payload for `schema`. Pass different keys to get different
+        payloads for the same schema."""
+        self._random = random.Random(f"{self.seed}/{self.percentile}/{key}")
+        return self._generate(schema, schema, "", 1)
+
+    def _scale(self, low: int, high: int) -> int:
+        return low + round((high - low) * self.percentile / 100)
+
+    def _generate(self, schema: Dict, root: Dict, name: str, outer: int) -> Any:
+        """`outer` is the number of items of the arrays the value is nested
+        in."""
+        if "$ref" in schema:
+            schema = root["definitions"][schema["$ref"].split("/")[-1]]
+
+        if "enum" in schema:
+            return self._random.choice(schema["enum"])
+
+        type = schema.get("type", "object")
+        if type == "object":
+            required = schema.get("required", [])
+            return {
+                key: self._generate(subschema, root, key, outer)
+                for key, subschema in schema.get("properties", {}).items()
+                if key in required or self._random.random() * 100 < self.percentile
+            }
+
+        if type == "array":
+            low = schema.get("minItems", 0)
+            high = self.items.get(name, max(self.max_items // outer, 1))
+            high = max(min(high, schema.get("maxItems", high)), low)
+            count = self._scale(low, high)
+            return [
+                self._generate(schema["items"], root, name, outer * max(count, 1))
+                for _ in range(count)
+            ]
+
+        if type == "string":
+            if schema.get("format") == "date-time":
+                seconds = self._random.randrange(366 * 24 * 3600)
+                timestamp = _EPOCH + datetime.timedelta(seconds=seconds)
+                return timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+            low = schema.get("minLength", 1)
+            high = max(min(schema.get("maxLength", 36), self.max_length), low)
+            characters = "".join(
+                self._random.choices(_CHARACTERS, k=self._scale(low, high))
+            )
+            if schema.get("format") == "uri":
+                return "https://example.com/" + characters
+            return characters
+
+        if type == "integer":
+            return self._random.randint(
+                int(schema.get("minimum", 0)), int(schema.get("maximum", 1000))
+            )
+
+        if type == "number":
+            return round(
+                self._random.uniform(
+                    schema.get("minimum", 0.0), schema.get("maximum", 1000.0)
+                ),
+                1,
+            )
+
+        if type == "boolean":
+            return self._random.random() < 0.5
+
+        return None
+
+
+def generate_corpus(
+    ocpp_version: str,
+    actions: Optional[Sequence[str]] = None,
+    percentiles: Sequence[float] = (0, 50, 100),
+    count: int = 1,
+    seed: Any = 0,
+    message_type_ids: Sequence[int] = (MessageType.Call, MessageType.CallResult),
+    **kwargs,
+) -> Iterator[Tuple[str, int, float, Dict]]:
+    """Yield tuples (action, message type id, percentile, payload), `count`
+    payloads per schema and percentile. Other keyword arguments are passed to
+    `PayloadGenerator`."""
+    for action, message_type_id, schema in iter_schemas(ocpp_version):
+        if actions and action not in actions:
+            continue
+        if message_type_id not in message_type_ids:
+            continue
+
+        for percentile in percentiles:
+            generator = PayloadGenerator(percentile, seed, **kwargs)
+            for index in range(count):
+                key = f"{action}/{message_type_id}/{index}"
+                yield action, message_type_id, percentile, generator.generate(
+                    schema, key
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--version", choices=OCPP_VERSIONS, default="2.0.1")
+    parser.add_argument("--action", action="append", dest="actions")
+    parser.add_argument("--percentile", type=float, action="append", dest="percentiles")
+    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument("--seed", default="0")
+    parser.add_argument(
+        "--max-items",
+        type=int,
+        default=1000,
+        help="maximum number of array items in a payload",
+    )
+    parser.add_argument(
+        "--items",
+        action="append",
+        default=[],
+        metavar="NAME=COUNT",
+        help="maximum number of items of the arrays with this property name",
+    )
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument("--output", help="file to write the payloads to")
+    output.add_argument(
+        "--journal", help="directory of a journal to record the Calls in"
+    )
+    parser.add_argument(
+        "--charge-points",
+        type=int,
+        default=10,
+        help="number of charge points the Calls are distributed over",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.1,
+        help="seconds between two Calls of the journal",
+    )
+    args = parser.parse_args()
+
+    corpus = generate_corpus(
+        args.version,
+        args.actions,
+        args.percentiles or [0, 50, 100],
+        args.count,
+        args.seed,
+        [MessageType.Call]
+        if args.journal
+        else [MessageType.Call, MessageType.CallResult],
+        max_items=args.max_items,
+        items={
+            name: int(count) for name, count in (item.split("=") for item in args.items)
+        },
+    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            for action, message_type_id, percentile, payload in corpus:
+                line = {
+                    "version": args.version,
+                    "action": action,
+                    "messageTypeId": message_type_id,
+                    "percentile": percentile,
+                    "payload": payload,
+                }
+                f.write(json.dumps(line) + "\n")
+        return
+
+    journal = FrameJournal(args.journal)
+    for i, (action, _, _, payload) in enumerate(corpus):
+        journal.record(
+            f"CP_{i % args.charge_points}",
+            INBOUND,
+            Call(str(i), action, payload).to_json(),
+            timestamp=int(i * args.interval * 1e9),
+        )
+    journal.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+""" Replay recorded traffic against a `ChargePoint` subclass.
+
+Run it from the root of the repository, for example against the central
+system in `implementation/ver201`:
+
+    $ OCPP_STORAGE=memory python -m benchmarks.replay /var/lib/ocpp/journal \\
+        central_system_1:ChargePoint --path implementation/ver201
+    $ python -m benchmarks.replay /var/lib/ocpp/journal \\
+        central_system_1:ChargePoint --path implementation/ver201 \\
+        --speed 10 --processes 4
+
+The journal is recorded by a central system, see `OCPP_LIB.journal`. For
+every charge point in the journal an instance of the given class is created
+and connected to a simulated charging station by an in-memory connection,
+see `OCPP_LIB.loopback`. The station sends the Calls the charge point has
+received, one at a time, and waits for the response:
+
+* with `--speed 1` (the default) at the times they've been recorded;
+* with `--speed N` N times faster;
+* with `--speed 0` as fast as possible.
+
+Calls the charge point sends itself are answered with the response recorded
+for the same action, or with a CallError if there's none.
+
+The charge points are distributed over `--processes` processes. The
+throughput and the latency percentiles from sending a Call until receiving
+the response are reported per action.
+"""
+import argparse
+import asyncio
+import collections
+import importlib
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Sequence
+
+from OCPP_LIB.error_handling import ConnectionClosedError
+from OCPP_LIB.journal import INBOUND, OUTBOUND, read_journal
+from OCPP_LIB.loopback import connection_pair
+from OCPP_LIB.ocpp_messages import Call, CallError, CallResult, MessageType
+
+PERCENTILES = [50, 90, 99]
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Return the `q`-th percentile of the sorted `values`, using the
+    nearest-rank method."""
+    if not values:
+        return 0.0
+    rank = max(int(len(values) * q / 100 + 0.5), 1)
+    return values[min(rank, len(values)) - 1]
+
+
+def load_class(name: str, paths: Sequence[str] = ()):
+    """Import a class given as "module:attribute"."""
+    for path in paths:
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+    module_name, _, attribute = name.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+class _Station:
+    """Sends the recorded Calls of one charge point and measures the time it
+    takes to receive the responses."""
+
+    def __init__(self, connection, records):
+        self.connection = connection
+        # The Calls received by the charge point.
+        self.calls = [
+            record
+            for record in records
+            if record.direction == INBOUND
+            and record.message_type_id == MessageType.Call
+        ]
+
+        # The payloads of the responses to the Calls the charge point has
+        # sent, by action.
+        actions = {
+            record.unique_id: record.action
+            for record in records
+            if record.direction == OUTBOUND
+            and record.message_type_id == MessageType.Call
+        }
+        self.responses = {}
+        for record in records:
+            if (
+                record.direction == INBOUND
+                and record.message_type_id == MessageType.CallResult
+                and record.unique_id in actions
+            ):
+                payload = json.loads(record.frame)[2]
+                self.responses.setdefault(actions[record.unique_id], payload)
+
+        self.pending: Dict[str, asyncio.Future] = {}
+        self.latencies: Dict[str, List[float]] = collections.defaultdict(list)
+
+    async def receive(self):
+        try:
+            while True:
+                message = json.loads(await self.connection.recv())
+                if message[0] == MessageType.Call:
+                    await self._answer(Call(*message[1:]))
+                else:
+                    future = self.pending.pop(message[1], None)
+                    if future is not None and not future.done():
+                        future.set_result(message)
+        except ConnectionClosedError:
+            pass
+
+    async def _answer(self, call):
+        try:
+            response = CallResult(call.unique_id, self.responses[call.action])
+        except KeyError:
+            response = CallError(
+                call.unique_id,
+                "NotImplemented",
+                f"No response recorded for {call.action}",
+                {},
+            )
+        await self.connection.send(response.to_json())
+
+    async def send_calls(self, speed: float, timeout: float, first: int):
+        """Send the Calls, timed relative to the timestamp `first` of the
+        first Call in the journal."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for record in self.calls:
+            if speed > 0:
+                delay = start + (record.timestamp - first) / 1e9 / speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            future = loop.create_future()
+            self.pending[record.unique_id] = future
+            sent_at = time.perf_counter()
+            await self.connection.send(record.frame)
+            try:
+                await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                self.pending.pop(record.unique_id, None)
+                self.latencies[record.action + " (timeout)"].append(timeout)
+                continue
+            self.latencies[record.action].append(time.perf_counter() - sent_at)
+
+
+async def _replay(records_by_id, charge_point_class, speed, timeout, first):
+    latencies: Dict[str, List[float]] = collections.defaultdict(list)
+    tasks = []
+
+    async def run(charge_point_id, records):
+        csms_connection, station_connection = connection_pair()
+        charge_point = charge_point_class(charge_point_id, csms_connection)
+        station = _Station(station_connection, records)
+
+        charge_point_task = asyncio.ensure_future(charge_point.start())
+        receive_task = asyncio.ensure_future(station.receive())
+        try:
+            await station.send_calls(speed, timeout, first)
+        finally:
+            await csms_connection.close()
+            await asyncio.gather(
+                charge_point_task, receive_task, return_exceptions=True
+            )
+
+        for action, values in station.latencies.items():
+            latencies[action].extend(values)
+
+    for charge_point_id, records in records_by_id.items():
+        tasks.append(run(charge_point_id, records))
+
+    await asyncio.gather(*tasks)
+    return dict(latencies)
+
+
+def _worker(directory, charge_point_ids, class_name, paths, speed, timeout, first):
+    charge_point_class = load_class(class_name, paths)
+    charge_point_ids = set(charge_point_ids)
+
+    records_by_id = collections.defaultdict(list)
+    for record in read_journal(directory):
+        if record.charge_point_id in charge_point_ids:
+            records_by_id[record.charge_point_id].append(record)
+
+    return asyncio.run(
+        _replay(records_by_id, charge_point_class, speed, timeout, first)
+    )
+
+
+def replay(
+    directory: str,
+    class_name: str,
+    paths: Sequence[str] = (),
+    speed: float = 1.0,
+    processes: int = 1,
+    timeout: float = 30,
+):
+    """
+    Replay the journal in `directory` against the class `class_name`, given
+    as "module:attribute", and return a tuple of the elapsed time and the
+    latencies in seconds per action.
+    """
+    charge_point_ids = set()
+    first = None
+    for record in read_journal(directory):
+        charge_point_ids.add(record.charge_point_id)
+        if first is None or record.timestamp < first:
+            first = record.timestamp
+    charge_point_ids = sorted(charge_point_ids)
+
+    groups = [charge_point_ids[i::processes] for i in range(processes)]
+    groups = [group for group in groups if group]
+
+    latencies: Dict[str, List[float]] = collections.defaultdict(list)
+    start = time.perf_counter()
+    arguments = (class_name, paths, speed, timeout, first)
+    if len(groups) <= 1:
+        results = [_worker(directory, charge_point_ids, *arguments)]
+    else:
+        with ProcessPoolExecutor(max_workers=len(groups)) as executor:
+            futures = [
+                executor.submit(_worker, directory, group, *arguments)
+                for group in groups
+            ]
+            results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        for action, values in result.items():
+            latencies[action].extend(values)
+
+    return elapsed, dict(latencies)
+
+
+def report(elapsed: float, latencies: Dict[str, List[float]]):
+    columns = "".join(f"{f'p{q} (ms)':>10}" for q in PERCENTILES)
+    print(f"{'action':<36} {'calls':>7} {'calls/s':>9}{columns} {'max (ms)':>10}")
+
+    total = 0
+    for action, values in sorted(latencies.items()):
+        values = sorted(values)
+        total += len(values)
+        columns = "".join(f"{percentile(values, q) * 1e3:>10.2f}" for q in PERCENTILES)
+        print(
+            f"{action:<36} {len(values):>7} {len(values) / elapsed:>9.1f}"
+            f"{columns} {values[-1] * 1e3:>10.2f}"
+        )
+
+    print(f"{'total':<36} {total:>7} {total / elapsed:>9.1f}")
+    print(f"elapsed: {elapsed:.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("journal", help="directory of the journal")
+    parser.add_argument(
+        "charge_point_class",
+        help='class to replay the journal against, as "module:attribute"',
+    )
+    parser.add_argument(
+        "--path",
+        action="append",
+        default=[],
+        help="directory to add to sys.path to import the class",
+    )
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=30)
+    args = parser.parse_args()
+
+    elapsed, latencies = replay(
+        args.journal,
+        args.charge_point_class,
+        args.path,
+        args.speed,
+        args.processes,
+        args.timeout,
+    )
+    report(elapsed, latencies)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+@brief The store shared by the central system modules to persist messages.
+
+Requests and responses are written to a write-behind store, which inserts
+them in batches from a background thread, so that handlers and the event loop
+don't wait for MongoDB.
+
+@details
+The backend is chosen with the environment variable OCPP_STORAGE:
+
+- "mongo" (default): the MongoDB database 'ocpp_database', at the URI in
+  the environment variable OCPP_MONGO_URI, by default a local server.
+- "sqlite:<path>": a SQLite database, for local testing.
+- "memory": keep the documents in memory, for local testing.
+
+Example usage:
+@code
+from ocpp_store import store, to_document
+store.write("Heartbeat", {"current_time": current_time})
+await store.write_async("ocpp_log", to_document(request, API_REQUEST="Reset"))
+@endcode
+"""
+import atexit
+import os
+
+from OCPP_LIB.storage import (
+    MemoryBackend,
+    MongoBackend,
+    SQLiteBackend,
+    WriteBehindStore,
+    to_document,
+)
+
+__all__ = ["store", "to_document"]
+
+
+def create_backend(storage):
+    if storage == "memory":
+        return MemoryBackend()
+    if storage.startswith("sqlite:"):
+        return SQLiteBackend(storage[len("sqlite:"):])
+
+    from pymongo.mongo_client import MongoClient
+    from pymongo.server_api import ServerApi
+
+    # The URI holds the credentials, so it isn't part of the code.
+    uri = os.environ.get("OCPP_MONGO_URI", "mongodb://localhost:27017/")
+    client = MongoClient(uri, server_api=ServerApi('1'), tlsAllowInvalidCertificates=True)
+    return MongoBackend(client.ocpp_database)
+
+
+store = WriteBehindStore(create_backend(os.environ.get("OCPP_STORAGE", "mongo")))
+
+# Write what's still buffered when the central system stops.
+atexit.register(store.close)
@@ -0,0 +1,126 @@
+import asyncio
+import dataclasses
+import importlib
+import os
+import warnings
+from typing import List, Optional
+
+import pytest
+
+from OCPP_LIB import dataclass_slots
+from OCPP_LIB.dataclass_slots import slotted_dataclass
+from OCPP_LIB.loopback import connection_pair
+from OCPP_LIB.ocpp_routing import on
+from OCPP_LIB.ver16 import data_type as v16_data_type
+from OCPP_LIB.ver16 import ocpp_request as v16_request
+from OCPP_LIB.ver16 import ocpp_response as v16_response
+from OCPP_LIB.ver201 import ChargePoint as v201_ChargePoint
+from OCPP_LIB.ver201 import data_type as v201_data_type
+from OCPP_LIB.ver201 import ocpp_request as v201_request
+from OCPP_LIB.ver201 import ocpp_response as v201_response
+
+
+@pytest.fixture(params=[True, False], ids=["dataclass", "fallback"])
+def slots_supported(request, monkeypatch):
+    if request.param and not dataclass_slots._SLOTS_SUPPORTED:
+        pytest.skip("dataclass(slots=True) requires Python 3.10")
+
+    monkeypatch.setattr(dataclass_slots, "_SLOTS_SUPPORTED", request.param)
+
+
+def test_slotted_dataclass(slots_supported):
+    @slotted_dataclass
+    class Payload:
+        id: int
+        status: Optional[str] = None
+        values: List = dataclasses.field(default_factory=list)
+
+    @slotted_dataclass
+    class DeprecatedPayload(Payload):
+        def __post_init__(self):
+            warnings.warn(__class__.__name__ + " is deprecated")
+
+    payload = Payload(id=1)
+    assert payload == Payload(1, None, [])
+    assert dataclasses.asdict(payload) == {"id": 1, "status": None, "values": []}
+    assert not hasattr(payload, "__dict__")
+
+    with pytest.raises(AttributeError):
+        payload.unknown = 1
+
+    with pytest.warns(UserWarning):
+        deprecated = DeprecatedPayload(id=2, status="Accepted")
+
+    assert deprecated.status == "Accepted"
+    assert DeprecatedPayload.__slots__ == ()
+    assert not hasattr(deprecated, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        v16_data_type,
+        v16_request,
+        v16_response,
+        v201_data_type,
+        v201_request,
+        v201_response,
+    ],
+)
+def test_payload_classes_are_slotted(module):
+    for cls in vars(module).values():
+        if dataclasses.is_dataclass(cls):
+            assert "__dict__" not in dir(cls), cls
+
+
+# The example implementation of this copy of the library.
+IMPLEMENTATION = os.path.join(
+    os.path.dirname(__file__), os.pardir, "implementation", "ver201"
+)
+
+
+class Peer(v201_ChargePoint):
+    @on("CancelReservation")
+    def on_cancel_reservation(self, reservation_id, **kwargs):
+        return v201_response.CancelReservation(status="Accepted")
+
+    @on("Authorize")
+    def on_authorize(self, id_token, **kwargs):
+        return v201_response.Authorize(id_token_info={"status": "Accepted"})
+
+
+@pytest.mark.asyncio
+async def test_implementation_send_method(monkeypatch):
+    """The send_* methods of the example implementation work with slotted
+    payloads, which have no `__dict__`."""
+    monkeypatch.setenv("OCPP_STORAGE", "memory")
+    monkeypatch.syspath_prepend(IMPLEMENTATION)
+    if os.path.exists(os.path.join(IMPLEMENTATION, "central_system_1.py")):
+        module = importlib.import_module("central_system_1")
+        send = "send_cancel_reservation", (123,)
+    else:
+        module = importlib.import_module("charge_point_1")
+        send = "send_authorize", ({"id_token": "123456", "type": "Central"},)
+
+    connection, peer_connection = connection_pair()
+    charge_point = module.ChargePoint("CP_1", connection)
+    tasks = [
+        asyncio.ensure_future(cp.start())
+        for cp in (charge_point, Peer("CP_1", peer_connection))
+    ]
+    try:
+        name, args = send
+        await getattr(charge_point, name)(*args)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    if name == "send_cancel_reservation":
+        store = importlib.import_module("ocpp_store").store
+        store.flush()
+        documents = store.backend.find("ocpp_log")
+        assert {"reservation_id": 123, "API_REQUEST": "CancelReservation"} in [
+            {key: document.get(key) for key in ("reservation_id", "API_REQUEST")}
+            for document in documents
+        ]
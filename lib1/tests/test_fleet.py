@@ -0,0 +1,152 @@
+import asyncio
+import contextlib
+
+import pytest
+
+from OCPP_LIB.connection_registry import ConnectionRegistry
+from OCPP_LIB.error_handling import InternalError
+from OCPP_LIB.fleet import ERROR, NOT_CONNECTED, SUCCESS, TIMEOUT, FanOut
+from OCPP_LIB.loopback import connection_pair
+from OCPP_LIB.ocpp_routing import on
+from OCPP_LIB.ver201 import ChargePoint, ocpp_request, ocpp_response
+
+
+class Station(ChargePoint):
+    @on("TriggerMessage")
+    async def on_trigger_message(self, requested_message, **kwargs):
+        if self.id == "CP_1":
+            raise InternalError()
+        if self.id == "CP_2":
+            await asyncio.sleep(1)
+        return ocpp_response.TriggerMessage(status="Accepted")
+
+
+@contextlib.asynccontextmanager
+async def connect_fleet():
+    """Connect 10 stations and add the CSMS side of them to a registry."""
+    registry = ConnectionRegistry()
+    tasks = []
+    for i in range(10):
+        csms_connection, station_connection = connection_pair()
+        csms = ChargePoint(f"CP_{i}", csms_connection)
+        station = Station(f"CP_{i}", station_connection)
+        registry.add(csms, vendor="ACME" if i < 5 else "Other")
+        tasks += [asyncio.ensure_future(cp.start()) for cp in (csms, station)]
+
+    try:
+        yield registry
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_fan_out():
+    async with connect_fleet() as fleet:
+        fan_out = FanOut(
+            [f"CP_{i}" for i in range(10)] + ["CP_99"],
+            ocpp_request.TriggerMessage(requested_message="Heartbeat"),
+            registry=fleet,
+            concurrency=3,
+            timeout=0.2,
+        )
+        results = {result.charge_point_id: result async for result in fan_out}
+
+        assert len(results) == 11
+        assert fan_out.counts == {
+            SUCCESS: 8,
+            ERROR: 1,
+            TIMEOUT: 1,
+            NOT_CONNECTED: 1,
+        }
+        assert results["CP_0"].response.status == "Accepted"
+        assert isinstance(results["CP_1"].error, InternalError)
+        assert results["CP_2"].status == TIMEOUT
+        assert results["CP_99"].status == NOT_CONNECTED
+
+
+@pytest.mark.asyncio
+async def test_fan_out_to_registry_query():
+    async with connect_fleet() as fleet:
+        requested = []
+
+        def payload(charge_point_id):
+            requested.append(charge_point_id)
+            return ocpp_request.TriggerMessage(requested_message="StatusNotification")
+
+        fan_out = FanOut({"vendor": "Other"}, payload, registry=fleet)
+        results = await fan_out.results()
+
+        assert sorted(requested) == [f"CP_{i}" for i in range(5, 10)]
+        assert {result.status for result in results} == {SUCCESS}
+        with pytest.raises(RuntimeError):
+            await fan_out.results()
+
+
+@pytest.mark.asyncio
+async def test_stop_early():
+    async with connect_fleet() as fleet:
+        fan_out = FanOut(
+            [f"CP_{i}" for i in range(3, 10)],
+            ocpp_request.TriggerMessage(requested_message="Heartbeat"),
+            registry=fleet,
+            concurrency=2,
+        )
+        async for result in fan_out:
+            break
+
+        assert sum(fan_out.counts.values()) == 1
+
+
+@pytest.mark.asyncio
+async def test_fan_out_with_call():
+    async with connect_fleet() as fleet:
+        calls = []
+
+        async def call(charge_point, payload):
+            calls.append(charge_point.id)
+            return await asyncio.wait_for(charge_point.call(payload), 0.2)
+
+        fan_out = FanOut(
+            ["CP_0", "CP_2"],
+            ocpp_request.TriggerMessage(requested_message="Heartbeat"),
+            registry=fleet,
+            timeout=None,
+            call=call,
+        )
+        results = {result.charge_point_id: result async for result in fan_out}
+
+        assert sorted(calls) == ["CP_0", "CP_2"]
+        assert results["CP_0"].response.status == "Accepted"
+        assert results["CP_2"].status == TIMEOUT
+
+
+@pytest.mark.asyncio
+async def test_payload_factory_errors():
+    async with connect_fleet() as fleet:
+
+        def payload(charge_point_id):
+            if charge_point_id == "CP_3":
+                raise ValueError("No payload")
+            return ocpp_request.TriggerMessage(requested_message="StatusNotification")
+
+        fan_out = FanOut(["CP_3", "CP_4"], payload, registry=fleet, concurrency=1)
+        results = {
+            result.charge_point_id: result
+            for result in await asyncio.wait_for(fan_out.results(), 5)
+        }
+
+        assert isinstance(results["CP_3"].error, ValueError)
+        assert results["CP_3"].status == ERROR
+        assert results["CP_4"].status == SUCCESS
+
+        # A worker that fails doesn't leave the iteration waiting.
+        fan_out = FanOut(["CP_3", "CP_4"], payload, registry=fleet)
+
+        async def call(charge_point_id):
+            raise RuntimeError("Bug")
+
+        fan_out._call = call
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(fan_out.results(), 5)
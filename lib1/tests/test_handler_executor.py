@@ -0,0 +1,153 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from OCPP_LIB.handler_executor import HandlerExecutor, as_handler_executor
+from OCPP_LIB.ocpp_messages import Call
+from OCPP_LIB.ocpp_routing import after, on
+from OCPP_LIB.ver201 import ChargePoint, ocpp_response
+
+
+def _heartbeat():
+    return Call(unique_id="1", action="Heartbeat", payload={}).to_json()
+
+
+def _heartbeat_response():
+    return ocpp_response.Heartbeat(current_time="2024-04-05T12:00:00Z")
+
+
+@pytest.fixture
+def executor():
+    executor = HandlerExecutor(max_workers=2)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_sync_handler_runs_in_executor(connection, executor):
+    threads = []
+
+    class MyChargePoint(ChargePoint):
+        @on("Heartbeat")
+        def on_heartbeat(self, **kwargs):
+            threads.append(threading.get_ident())
+            return _heartbeat_response()
+
+        @after("Heartbeat")
+        def after_heartbeat(self, **kwargs):
+            threads.append(threading.get_ident())
+
+    cp = MyChargePoint("CP_1", connection, sync_handler_executor=executor)
+    await cp.route_message(_heartbeat())
+    connection.send.assert_awaited_once()
+
+    # The after handler runs in the background.
+    while executor.metrics()["completed"] < 2:
+        await asyncio.sleep(0.01)
+
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
+
+
+@pytest.mark.asyncio
+async def test_async_handler_runs_on_event_loop(connection, executor):
+    threads = []
+
+    class MyChargePoint(ChargePoint):
+        @on("Heartbeat")
+        async def on_heartbeat(self, **kwargs):
+            threads.append(threading.get_ident())
+            return _heartbeat_response()
+
+    cp = MyChargePoint("CP_1", connection, sync_handler_executor=executor)
+    await cp.route_message(_heartbeat())
+
+    assert threads == [threading.get_ident()]
+    assert executor.metrics()["submitted"] == 0
+
+
+@pytest.mark.asyncio
+async def test_executor_per_handler(connection, executor):
+    threads = []
+
+    class MyChargePoint(ChargePoint):
+        @on("Heartbeat", executor=executor)
+        def on_heartbeat(self, call_unique_id, **kwargs):
+            threads.append((threading.get_ident(), call_unique_id))
+            return _heartbeat_response()
+
+    cp = MyChargePoint("CP_1", connection)
+    await cp.route_message(_heartbeat())
+
+    [(thread, call_unique_id)] = threads
+    assert thread != threading.get_ident()
+    assert call_unique_id == "1"
+    assert executor.metrics()["completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_handler_error_is_sent_as_call_error(connection, executor):
+    class MyChargePoint(ChargePoint):
+        @on("Heartbeat")
+        def on_heartbeat(self, **kwargs):
+            raise ValueError("Database not available")
+
+    cp = MyChargePoint("CP_1", connection, sync_handler_executor=executor)
+    await cp.route_message(_heartbeat())
+
+    assert "InternalError" in connection.send.call_args[0][0]
+    assert executor.metrics()["failed"] == 1
+
+
+def test_on_rejects_executor_for_async_handler(executor):
+    with pytest.raises(TypeError):
+
+        @on("Heartbeat", executor=executor)
+        async def on_heartbeat(**kwargs):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_metrics(executor):
+    release = threading.Event()
+
+    tasks = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(3)]
+    while executor.metrics()["running"] < 2:
+        await asyncio.sleep(0.01)
+
+    metrics = executor.metrics()
+    assert metrics["submitted"] == 3
+    assert metrics["queued"] == 1
+    assert metrics["saturation"] == 1.0
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    metrics = executor.metrics()
+    assert metrics["completed"] == 3
+    assert metrics["failed"] == 0
+    assert metrics["running"] == metrics["queued"] == 0
+    assert metrics["max_queued"] >= 1
+    assert metrics["saturation"] == 0.0
+    assert metrics["queue_time_max"] >= metrics["queue_time_avg"] > 0
+
+
+def test_as_handler_executor():
+    assert as_handler_executor(None) is None
+
+    executor = HandlerExecutor(max_workers=1)
+    assert as_handler_executor(executor) is executor
+    executor.shutdown()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        wrapped = as_handler_executor(pool)
+        assert isinstance(wrapped, HandlerExecutor)
+        assert wrapped.max_workers == 4
+
+    with pytest.raises(TypeError):
+        as_handler_executor(4)
+
+    with pytest.raises(ValueError):
+        HandlerExecutor(max_workers=0)
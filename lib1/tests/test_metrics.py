@@ -0,0 +1,182 @@
+import asyncio
+import gc
+
+import pytest
+
+from OCPP_LIB.error_handling import UnknownCallErrorCodeError
+from OCPP_LIB.loopback import connection_pair
+from OCPP_LIB.metrics import Histogram, MetricsRegistry, serve_metrics
+from OCPP_LIB.ocpp_messages import Call
+from OCPP_LIB.ocpp_routing import on
+from OCPP_LIB.ver201 import ChargePoint, ocpp_request, ocpp_response
+
+
+def test_histogram_percentiles():
+    histogram = Histogram()
+    for i in range(1, 10001):
+        histogram.record(i / 1e6)
+
+    assert histogram.count == 10000
+    assert histogram.max == 0.01
+    assert histogram.sum == pytest.approx(50.005)
+    for q in (50, 90, 99, 99.9):
+        assert histogram.percentile(q) == pytest.approx(q / 1e4, rel=0.01)
+    assert histogram.percentile(100) == 0.01
+
+    other = Histogram()
+    other.record(1.0)
+    histogram.merge(other)
+    assert histogram.count == 10001
+    assert histogram.percentile(100) == 1.0
+    assert Histogram().percentile(50) == 0.0
+
+
+def test_registry_aggregates_and_keeps_totals():
+    class Owner:
+        pass
+
+    registry = MetricsRegistry()
+    owners = [Owner(), Owner()]
+    metrics = [registry.register(owner) for owner in owners]
+    for m in metrics:
+        m.message("in", "Heartbeat", "Call")
+        m.observe("handler", 0.001, "Heartbeat")
+        m.pending_calls = 1
+        m.connections = 1
+    assert len(registry) == 2
+
+    snapshot = registry.snapshot()
+    assert snapshot.counters["messages"][("in", "Heartbeat", "Call")] == 2
+    assert snapshot.histograms["handler"][("Heartbeat",)].count == 2
+    assert snapshot.pending_calls == 2
+
+    del owners[0], metrics[0]
+    gc.collect()
+    assert len(registry) == 1
+
+    snapshot = registry.snapshot()
+    assert snapshot.counters["messages"][("in", "Heartbeat", "Call")] == 2
+    assert snapshot.pending_calls == 1
+
+
+class CentralSystem(ChargePoint):
+    @on("Heartbeat")
+    def on_heartbeat(self, **kwargs):
+        return ocpp_response.Heartbeat(current_time="2024-04-05T12:00:00Z")
+
+    @on("StatusNotification")
+    def on_status_notification(self, **kwargs):
+        raise ValueError("Oops")
+
+
+class Station(ChargePoint):
+    @on("Heartbeat")
+    async def on_heartbeat(self, **kwargs):
+        await asyncio.sleep(0.3)
+        return ocpp_response.Heartbeat(current_time="2024-04-05T12:00:00Z")
+
+
+@pytest.mark.asyncio
+async def test_charge_point_metrics():
+    registry = MetricsRegistry()
+    csms_connection, station_connection = connection_pair()
+    csms = CentralSystem(
+        "CP_1", csms_connection, response_timeout=0.1, metrics_registry=registry
+    )
+    station = Station("CP_1", station_connection, metrics_registry=registry)
+    tasks = [asyncio.ensure_future(cp.start()) for cp in (csms, station)]
+
+    await station.call(ocpp_request.Heartbeat())
+    await station.call(
+        ocpp_request.StatusNotification(
+            timestamp="2024-04-05T12:00:00Z",
+            connector_status="Available",
+            evse_id=1,
+            connector_id=1,
+        )
+    )
+    # The CSMS has no handler for it, but answers with a CallError.
+    await station.call(
+        ocpp_request.Authorize(id_token={"idToken": "1", "type": "ISO14443"})
+    )
+    # The station answers too late.
+    with pytest.raises(asyncio.TimeoutError):
+        await csms.call(ocpp_request.Heartbeat())
+
+    messages = station.metrics.counters["messages"]
+    assert messages[("out", "Heartbeat", "Call")] == 1
+    assert messages[("in", "Heartbeat", "CallResult")] == 1
+    assert messages[("in", "StatusNotification", "CallError")] == 1
+    assert station.metrics.counters["call_errors"] == {
+        ("in", "StatusNotification", "InternalError"): 1,
+        ("in", "Authorize", "NotImplemented"): 1,
+    }
+    assert station.metrics.histograms["round_trip"][("Heartbeat",)].count == 1
+    assert csms.metrics.histograms["handler"][("Heartbeat",)].count == 1
+    assert csms.metrics.histograms["validation"][("Heartbeat", "CallResult")].count == 1
+    assert csms.metrics.counters["timeouts"] == {("Heartbeat",): 1}
+    assert csms.metrics.pending_calls == 0
+
+    snapshot = registry.snapshot()
+    assert snapshot.counters["messages"][("in", "Heartbeat", "Call")] == 2
+
+    text = registry.to_prometheus()
+    assert (
+        'ocpp_messages_total{direction="out",action="Heartbeat",'
+        'message_type="Call"} 2' in text
+    )
+    assert 'ocpp_round_trip_seconds{action="Heartbeat",quantile="0.99"}' in text
+    assert 'ocpp_round_trip_seconds_count{action="Heartbeat"} 1' in text
+    assert "ocpp_connections 2" in text
+
+    # Actions the peer makes up are counted as "unknown".
+    await csms.route_message(Call("1", "NoSuchAction", {}).to_json())
+    await csms.route_message(Call("2", "Authorize", {}).to_json())
+    messages = csms.metrics.counters["messages"]
+    assert messages[("in", "unknown", "Call")] == 1
+    assert messages[("in", "Authorize", "Call")] == 2
+    assert csms.metrics.counters["call_errors"][("out", "unknown", "NotSupported")] == 1
+    assert "NoSuchAction" not in registry.to_prometheus()
+
+    await csms_connection.close()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    # The charge points are closed, but haven't been garbage collected.
+    assert len(registry) == 0
+    assert "ocpp_connections 0" in registry.to_prometheus()
+
+
+@pytest.mark.asyncio
+async def test_serve_metrics():
+    registry = MetricsRegistry()
+    registry.register(test_serve_metrics).timeout("Heartbeat")
+    server = await serve_metrics(registry, port=0)
+    port = server.sockets[0].getsockname()[1]
+
+    async def get(path):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        response = await reader.read()
+        writer.close()
+        return response.decode()
+
+    response = await get("/metrics")
+    assert response.startswith("HTTP/1.1 200 OK")
+    assert 'ocpp_timeouts_total{action="Heartbeat"} 1' in response
+    assert (await get("/")).startswith("HTTP/1.1 404")
+
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_unknown_error_codes_are_counted_as_unknown(connection):
+    cp = ChargePoint("CP_1", connection, metrics_registry=MetricsRegistry())
+    cp._unique_id_generator = lambda: "1"
+    call = asyncio.ensure_future(cp.call(ocpp_request.Heartbeat(), suppress=False))
+    await asyncio.sleep(0)
+    await cp.route_message('[4,"1","MadeUpErrorCode42","Oops",{}]')
+
+    with pytest.raises(UnknownCallErrorCodeError):
+        await call
+    assert cp.metrics.counters["call_errors"] == {("in", "Heartbeat", "unknown"): 1}
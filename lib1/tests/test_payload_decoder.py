@@ -0,0 +1,226 @@
+import json
+
+import pytest
+
+from OCPP_LIB.charging_station import serialize_as_dict, serialize_payload
+from OCPP_LIB.error_handling import TypeConstraintViolationError
+from OCPP_LIB.ocpp_messages import Call, MessageType
+from OCPP_LIB.ocpp_routing import create_route_map, on
+from OCPP_LIB.payload_decoder import LazyList, get_decoder
+from OCPP_LIB.storage import to_document
+from OCPP_LIB.ver16 import data_type as v16_data_type
+from OCPP_LIB.ver16.E_num import Measurand, ReadingContext
+from OCPP_LIB.ver201 import ChargePoint
+from OCPP_LIB.ver201 import data_type as v201_data_type
+from OCPP_LIB.ver201 import ocpp_request, ocpp_response
+from OCPP_LIB.ver201.E_num import (
+    AttributeType,
+    ChargingProfileKindType,
+    ChargingProfilePurposeType,
+)
+
+METER_VALUES = {
+    "connectorId": 1,
+    "meterValue": [
+        {
+            "timestamp": "2024-04-05T12:00:00Z",
+            "sampledValue": [
+                {"value": "230", "context": "Sample.Periodic", "measurand": "Voltage"}
+            ],
+        }
+    ],
+}
+
+SET_CHARGING_PROFILE = {
+    "evseId": 1,
+    "chargingProfile": {
+        "id": 1,
+        "stackLevel": 0,
+        "chargingProfilePurpose": "TxDefaultProfile",
+        "chargingProfileKind": "Absolute",
+        "chargingSchedule": [
+            {
+                "id": 1,
+                "chargingRateUnit": "A",
+                "chargingSchedulePeriod": [{"startPeriod": 0, "limit": 16.0}],
+            }
+        ],
+    },
+}
+
+
+def test_decode_v16_meter_values():
+    payload = get_decoder(MessageType.Call, "MeterValues", "1.6")(METER_VALUES)
+
+    assert payload["connector_id"] == 1
+    meter_value = payload["meter_value"][0]
+    assert isinstance(meter_value, v16_data_type.MeterValue)
+    assert meter_value.timestamp == "2024-04-05T12:00:00Z"
+
+    sampled_value = meter_value.sampled_value[0]
+    assert isinstance(sampled_value, v16_data_type.SampledValue)
+    assert sampled_value.value == "230"
+    assert sampled_value.context is ReadingContext.sample_periodic
+    assert sampled_value.measurand is Measurand.voltage
+
+
+def test_decode_v201_set_charging_profile():
+    payload = get_decoder(MessageType.Call, "SetChargingProfile", "2.0.1")(
+        SET_CHARGING_PROFILE
+    )
+
+    profile = payload["charging_profile"]
+    assert isinstance(profile, v201_data_type.ChargingProfileType)
+    assert profile.stack_level == 0
+    assert profile.charging_profile_purpose is (
+        ChargingProfilePurposeType.tx_default_profile
+    )
+    assert profile.charging_profile_kind is ChargingProfileKindType.absolute
+
+    period = profile.charging_schedule[0].charging_schedule_period[0]
+    assert period == v201_data_type.ChargingSchedulePeriodType(
+        start_period=0, limit=16.0
+    )
+
+
+def test_decoded_enums_equal_their_values():
+    payload = get_decoder(MessageType.Call, "SetChargingProfile", "2.0.1")(
+        SET_CHARGING_PROFILE
+    )
+
+    profile = payload["charging_profile"]
+    assert profile.charging_profile_purpose == "TxDefaultProfile"
+    assert profile.charging_schedule[0].charging_rate_unit == "A"
+
+
+def test_decode_custom_data():
+    payload = get_decoder(MessageType.Call, "Heartbeat", "2.0.1")(
+        {"customData": {"vendorId": "com.example", "someValue": 1}}
+    )
+
+    assert payload == {"custom_data": {"vendor_id": "com.example", "some_value": 1}}
+
+    payload = get_decoder(MessageType.Call, "SetChargingProfile", "2.0.1")(
+        {
+            "evseId": 1,
+            "chargingProfile": {
+                **SET_CHARGING_PROFILE["chargingProfile"],
+                "customData": {"vendorId": "com.example"},
+            },
+        }
+    )
+
+    profile = payload["charging_profile"]
+    assert isinstance(profile, v201_data_type.ChargingProfileType)
+    assert profile.custom_data == {"vendor_id": "com.example"}
+    assert isinstance(profile.charging_schedule[0], v201_data_type.ChargingScheduleType)
+
+
+def test_decode_invalid_object():
+    decode = get_decoder(MessageType.Call, "SetChargingProfile", "2.0.1")
+    profile = dict(SET_CHARGING_PROFILE["chargingProfile"])
+    del profile["id"]
+
+    with pytest.raises(TypeConstraintViolationError):
+        decode({"evseId": 1, "chargingProfile": profile})
+
+
+def test_lazy_decoder_decodes_items_on_access():
+    decoded = []
+
+    def decode(item):
+        decoded.append(item)
+        return item * 2
+
+    items = LazyList([1, 2, 3], decode)
+    assert len(items) == 3
+    assert decoded == []
+
+    assert items[1] == 4
+    assert items[1] == 4
+    assert decoded == [2]
+
+    assert items[-1] == 6
+    assert items[:2] == [2, 4]
+    assert items == [2, 4, 6]
+    assert decoded == [2, 3, 1]
+
+
+def test_lazy_decoder():
+    payload = get_decoder(MessageType.Call, "NotifyReport", "2.0.1", lazy=True)(
+        {
+            "requestId": 1,
+            "generatedAt": "2024-04-05T12:00:00Z",
+            "seqNo": 0,
+            "reportData": [
+                {
+                    "component": {"name": "EVSE"},
+                    "variable": {"name": "AvailabilityState"},
+                    "variableAttribute": [{"type": "Actual", "value": "Available"}],
+                }
+            ],
+        }
+    )
+
+    assert isinstance(payload["report_data"], LazyList)
+    report_data = payload["report_data"][0]
+    assert isinstance(report_data, v201_data_type.ReportDataType)
+    assert report_data.variable_attribute[0].type is AttributeType.actual
+
+
+def test_lazy_decoder_round_trip():
+    payload = {
+        "requestId": 1,
+        "generatedAt": "2024-04-05T12:00:00Z",
+        "seqNo": 0,
+        "reportData": [
+            {
+                "component": {"name": "EVSE"},
+                "variable": {"name": "AvailabilityState"},
+                "variableAttribute": [{"type": "Actual", "value": "Available"}],
+            }
+        ],
+    }
+    decode = get_decoder(MessageType.Call, "NotifyReport", "2.0.1", lazy=True)
+    request = ocpp_request.NotifyReport(**decode(payload))
+
+    # Sent on as a new Call, and stored.
+    call = Call("1", "NotifyReport", serialize_payload(request, "2.0.1"))
+    assert json.loads(call.to_json())[3] == payload
+    report_data = to_document(request)["report_data"]
+    assert report_data[0]["variable_attribute"][0]["value"] == "Available"
+    assert serialize_as_dict(request)["report_data"][0]["component"]["name"] == "EVSE"
+
+
+def test_get_decoder_is_cached():
+    assert get_decoder(MessageType.Call, "MeterValues", "1.6") is get_decoder(
+        MessageType.Call, "MeterValues", "1.6"
+    )
+
+
+def test_charge_point_rejects_unknown_payload_decoder(connection):
+    with pytest.raises(ValueError):
+        ChargePoint("1", connection, payload_decoder="fast")
+
+
+@pytest.mark.asyncio
+async def test_handler_receives_typed_payload(connection):
+    charge_point = ChargePoint("1", connection, payload_decoder="typed")
+
+    received = {}
+
+    @on("SetChargingProfile")
+    def on_set_charging_profile(evse_id, charging_profile):
+        received.update(evse_id=evse_id, charging_profile=charging_profile)
+        return ocpp_response.SetChargingProfile(status="Accepted")
+
+    charge_point.on_set_charging_profile = on_set_charging_profile
+    charge_point.route_map = create_route_map(charge_point)
+
+    await charge_point.route_message(
+        Call("1", "SetChargingProfile", SET_CHARGING_PROFILE).to_json()
+    )
+
+    assert received["evse_id"] == 1
+    assert isinstance(received["charging_profile"], v201_data_type.ChargingProfileType)
+    connection.send.assert_called_once()
@@ -0,0 +1,207 @@
+from decimal import Decimal
+
+import pytest
+from jsonschema import Draft4Validator
+from jsonschema.exceptions import ValidationError as SchemaValidationError
+
+from OCPP_LIB.error_handling import (
+    FormatViolationError,
+    ProtocolError,
+    TypeConstraintViolationError,
+)
+from OCPP_LIB.ocpp_messages import (
+    Call,
+    CallResult,
+    MessageType,
+    _compiled_validators,
+    get_validation_engine,
+    get_validator,
+    set_validation_engine,
+    validate_payload,
+)
+from OCPP_LIB.schema_compiler import (
+    CompiledValidator,
+    UnsupportedSchemaError,
+    compile_schema,
+    is_multiple_of,
+)
+
+schema = {
+    "$schema": "http://json-schema.org/draft-04/schema#",
+    "definitions": {
+        "CustomDataType": {
+            "type": "object",
+            "properties": {"vendorId": {"type": "string", "maxLength": 255}},
+            "required": ["vendorId"],
+        },
+        "SampledValueType": {
+            "type": "object",
+            "additionalProperties": False,
+            "properties": {
+                "value": {"type": "number", "minimum": 0, "multipleOf": 0.5},
+                "unit": {"type": "string", "enum": ["W", "Wh"]},
+            },
+            "required": ["value"],
+        },
+    },
+    "type": "object",
+    "additionalProperties": False,
+    "properties": {
+        "customData": {"$ref": "#/definitions/CustomDataType"},
+        "evseId": {"type": "integer", "maximum": 10},
+        "idTag": {"type": "string", "maxLength": 5},
+        "sampledValue": {
+            "type": "array",
+            "minItems": 1,
+            "items": {"$ref": "#/definitions/SampledValueType"},
+        },
+    },
+    "required": ["evseId", "sampledValue"],
+}
+
+
+def _error(validate, instance):
+    try:
+        validate(instance)
+    except SchemaValidationError as e:
+        return e.validator, e.message
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        {"evseId": 1, "sampledValue": [{"value": 1.5, "unit": "W"}]},
+        {"evseId": 1, "sampledValue": [{"value": 1.5}], "customData": {"a": 1}},
+        [],
+        {"sampledValue": [{"value": 1}]},
+        {"evseId": True, "sampledValue": [{"value": 1}]},
+        {"evseId": 11, "sampledValue": [{"value": 1}]},
+        {"evseId": 1, "sampledValue": []},
+        {"evseId": 1, "sampledValue": [{"value": 1.2}]},
+        {"evseId": 1, "sampledValue": [{"value": -1}]},
+        {"evseId": 1, "sampledValue": [{"value": 1, "unit": "kW"}]},
+        {"evseId": 1, "sampledValue": [{"value": 1, "phase": "L1"}]},
+        {"evseId": 1, "sampledValue": [{"value": 1}], "idTag": "too long"},
+        {"evseId": 1, "sampledValue": [{"value": 1}], "customData": {}},
+        {"evseId": "1", "sampledValue": "1", "foo": 1, "bar": 2},
+    ],
+)
+def test_compiled_schema_matches_draft4_validator(instance):
+    """
+    Test that the compiled validator detects the same error as the
+    Draft4Validator does.
+    """
+    expected = _error(Draft4Validator(schema).validate, instance)
+
+    assert _error(compile_schema(schema), instance) == expected
+
+
+def test_compiled_schema_accepts_str_enums():
+    """Members of the enums in `E_num` are subclasses of `str`."""
+    from OCPP_LIB.ver16.E_num import RegistrationStatus
+
+    validate = compile_schema({"type": "string", "enum": ["Accepted", "Rejected"]})
+
+    validate(RegistrationStatus.accepted)
+
+
+@pytest.mark.parametrize(
+    "instance,divisor,expected",
+    [
+        (21.4, 0.1, True),
+        (15.2, 0.1, True),
+        (4.11, 0.1, False),
+        (10, 2, True),
+        (10, 3, False),
+        (10, 0.5, True),
+        (Decimal("21.4"), 0.1, True),
+        (10**400, 0.1, True),
+        (float("inf"), 0.1, False),
+    ],
+)
+def test_is_multiple_of(instance, divisor, expected):
+    assert is_multiple_of(instance, divisor) is expected
+
+
+def test_compile_schema_with_unsupported_keyword():
+    with pytest.raises(UnsupportedSchemaError):
+        compile_schema({"type": "string", "pattern": "^a"})
+
+
+@pytest.mark.parametrize("ocpp_version", ["1.6", "2.0.1"])
+def test_get_validator_with_compiled_engine(ocpp_version):
+    validator = get_validator(
+        MessageType.Call, "Heartbeat", ocpp_version, engine="compiled"
+    )
+
+    assert isinstance(validator, CompiledValidator)
+    assert (
+        get_validator(MessageType.Call, "Heartbeat", ocpp_version, engine="compiled")
+        is validator
+    )
+    assert validator in _compiled_validators.values()
+
+
+def test_get_validator_with_invalid_engine():
+    with pytest.raises(ValueError):
+        get_validator(MessageType.Call, "Heartbeat", "1.6", engine="magic")
+
+
+def test_set_validation_engine():
+    assert get_validation_engine() == "jsonschema"
+
+    set_validation_engine("compiled")
+    try:
+        assert get_validation_engine() == "compiled"
+    finally:
+        set_validation_engine("jsonschema")
+
+    with pytest.raises(ValueError):
+        set_validation_engine("magic")
+
+
+@pytest.mark.parametrize(
+    "payload,exception",
+    [
+        ({"meterStart": "invalid_type"}, TypeConstraintViolationError),
+        ({"meterStart": None}, ProtocolError),
+        ({"idTag": "012345678901234567890"}, TypeConstraintViolationError),
+        ({"foo": 1}, FormatViolationError),
+    ],
+)
+def test_validate_payload_with_compiled_engine(payload, exception):
+    """
+    Test that the compiled engine raises the same exceptions as the default
+    engine does.
+    """
+    payload = {
+        "connectorId": 1,
+        "idTag": "okTag",
+        "meterStart": 0,
+        "timestamp": "2022-01-25T19:18:30.018Z",
+        **payload,
+    }
+    payload = {key: value for key, value in payload.items() if value is not None}
+    message = Call(unique_id="1234", action="StartTransaction", payload=payload)
+
+    with pytest.raises(exception):
+        validate_payload(message, ocpp_version="1.6")
+
+    with pytest.raises(exception):
+        validate_payload(message, ocpp_version="1.6", engine="compiled")
+
+
+def test_validate_payload_with_compiled_engine_and_decimals():
+    message = CallResult(
+        unique_id="1234",
+        action="GetCompositeSchedule",
+        payload={
+            "status": "Accepted",
+            "chargingSchedule": {
+                "chargingRateUnit": "A",
+                "chargingSchedulePeriod": [{"startPeriod": 0, "limit": 15.2}],
+            },
+        },
+    )
+
+    validate_payload(message, ocpp_version="1.6", engine="compiled")
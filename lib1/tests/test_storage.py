@@ -0,0 +1,187 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from OCPP_LIB.error_handling import StorageFullError
+from OCPP_LIB.storage import (
+    MemoryBackend,
+    SQLiteBackend,
+    WriteBehindStore,
+    to_document,
+)
+from OCPP_LIB.ver201 import ocpp_request
+
+
+class BlockingBackend(MemoryBackend):
+    """Backend that doesn't write until `release` is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+        self.batches = []
+
+    def insert_many(self, collection, documents):
+        self.release.wait()
+        self.batches.append(len(documents))
+        super().insert_many(collection, documents)
+
+
+@pytest.fixture
+def backend():
+    return BlockingBackend()
+
+
+def test_to_document():
+    request = ocpp_request.Reset(type="Immediate")
+    document = to_document(request, API_REQUEST="Reset")
+
+    assert document == {
+        "type": "Immediate",
+        "evse_id": None,
+        "custom_data": None,
+        "API_REQUEST": "Reset",
+    }
+    assert to_document(document) is not document
+    assert not hasattr(request, "API_REQUEST")
+
+
+def test_writes_in_batches(backend):
+    store = WriteBehindStore(backend, batch_size=10, flush_interval=60)
+    for i in range(25):
+        store.write("ocpp_log", {"i": i})
+
+    backend.release.set()
+    assert store.flush(timeout=5)
+
+    assert [document["i"] for document in backend.find("ocpp_log")] == list(range(25))
+    assert backend.batches == [10, 10, 5]
+    assert store.metrics()["written"] == 25
+    store.close()
+
+
+def test_flush_interval():
+    backend = MemoryBackend()
+    store = WriteBehindStore(backend, batch_size=10, flush_interval=0.05)
+    store.write("Heartbeat", {})
+
+    deadline = time.monotonic() + 5
+    while not backend.find("Heartbeat") and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert backend.find("Heartbeat") == [{}]
+    store.close()
+
+
+def test_backpressure(backend):
+    store = WriteBehindStore(backend, batch_size=2, max_buffered=2, timeout=5)
+    for i in range(4):
+        store.write("ocpp_log", {"i": i})
+
+    # Two documents are being written, two are buffered.
+    store.timeout = 0.05
+    with pytest.raises(StorageFullError):
+        store.write("ocpp_log", {"i": 4})
+    assert store.metrics()["buffered"] == 4
+
+    backend.release.set()
+    store.write("ocpp_log", {"i": 4})
+    store.close()
+
+    assert len(backend.find("ocpp_log")) == 5
+
+
+@pytest.mark.asyncio
+async def test_write_async_waits_for_room(backend):
+    store = WriteBehindStore(backend, batch_size=1, max_buffered=1)
+    await store.write_async("ocpp_log", {"i": 0})
+    await store.write_async("ocpp_log", {"i": 1})
+
+    write = asyncio.ensure_future(store.write_async("ocpp_log", {"i": 2}))
+    await asyncio.sleep(0.05)
+    assert not write.done()
+
+    backend.release.set()
+    await asyncio.wait_for(write, 5)
+    store.close()
+
+    assert len(backend.find("ocpp_log")) == 3
+
+
+@pytest.mark.asyncio
+async def test_write_async_waits_without_threads(backend):
+    store = WriteBehindStore(backend, batch_size=1, max_buffered=1, timeout=5)
+    await store.write_async("ocpp_log", {"i": 0})
+    await store.write_async("ocpp_log", {"i": 1})
+    threads = threading.active_count()
+
+    writes = [
+        asyncio.ensure_future(store.write_async("ocpp_log", {"i": i}))
+        for i in range(2, 12)
+    ]
+    await asyncio.sleep(0.05)
+    assert threading.active_count() == threads
+
+    # A cancelled write isn't written later.
+    writes[0].cancel()
+    store.timeout = 0.05
+    with pytest.raises(StorageFullError):
+        await store.write_async("ocpp_log", {"i": 12})
+
+    backend.release.set()
+    await asyncio.wait_for(asyncio.gather(*writes[1:]), 5)
+    store.close()
+
+    assert sorted(document["i"] for document in backend.find("ocpp_log")) == [
+        i for i in range(12) if i != 2
+    ]
+
+
+def test_close_leaves_backend_open_while_writing(backend):
+    closed = []
+    backend.close = lambda: closed.append(True)
+    store = WriteBehindStore(backend, batch_size=1)
+    store.write("ocpp_log", {})
+
+    store.close(timeout=0.05)
+    assert closed == []
+
+    backend.release.set()
+    store.close(timeout=5)
+    assert closed == [True]
+    assert backend.find("ocpp_log") == [{}]
+
+
+def test_failed_writes_are_counted():
+    class FailingBackend(MemoryBackend):
+        def insert_many(self, collection, documents):
+            if collection == "broken":
+                raise ConnectionError
+            super().insert_many(collection, documents)
+
+    backend = FailingBackend()
+    store = WriteBehindStore(backend)
+    store.write("broken", {})
+    store.write("ocpp_log", {})
+    store.close()
+
+    assert backend.find("ocpp_log") == [{}]
+    assert store.metrics()["failed"] == 1
+    assert store.metrics()["written"] == 1
+
+    with pytest.raises(RuntimeError):
+        store.write("ocpp_log", {})
+
+
+def test_sqlite_backend(tmp_path):
+    path = str(tmp_path / "ocpp.db")
+    store = WriteBehindStore(SQLiteBackend(path))
+    store.write("ocpp_log", {"status": "Accepted", "API_RESPONSE": "Reset"})
+    store.write("Heartbeat", {})
+    store.close()
+
+    backend = SQLiteBackend(path)
+    assert backend.find("ocpp_log") == [{"status": "Accepted", "API_RESPONSE": "Reset"}]
+    assert backend.find("Heartbeat") == [{}]
+    backend.close()
@@ -1,9 +1,12 @@
+import asyncio
 import json
 
 import pytest
 
+from OCPP_LIB.charging_station import evse_or_transaction_key
+from OCPP_LIB.ocpp_messages import Call
 from OCPP_LIB.ocpp_routing import after, create_route_map, on
-from OCPP_LIB.ver201 import ocpp_response
+from OCPP_LIB.ver201 import ChargePoint, ocpp_request, ocpp_response
 
 
 @pytest.mark.asyncio
@@ -118,3 +121,144 @@ async def test_call_without_unique_id_should_return_a_random_value(
     ) = mock_base_central_system._get_specific_response.call_args_list[0][0]
     # Check the actual unique id is equals to the one internally generated
     assert actual_unique_id == expected_unique_id
+
+
+def _transaction_event(unique_id, transaction_id, seq_no):
+    return Call(
+        unique_id,
+        "TransactionEvent",
+        {
+            "eventType": "Updated",
+            "timestamp": "2024-04-05T12:00:00Z",
+            "triggerReason": "MeterValuePeriodic",
+            "seqNo": seq_no,
+            "transactionInfo": {"transactionId": transaction_id},
+        },
+    ).to_json()
+
+
+class ConcurrentChargePoint(ChargePoint):
+    """Handles TransactionEvents only when `release()` is called."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.handled = []
+        self.active = 0
+        self.max_active = 0
+        self.released = asyncio.Event()
+
+    @on("TransactionEvent")
+    async def on_transaction_event(self, transaction_info, seq_no, **kwargs):
+        self.active += 1
+        self.max_active = max(self.active, self.max_active)
+        await self.released.wait()
+        self.active -= 1
+
+        self.handled.append((transaction_info["transaction_id"], seq_no))
+        return ocpp_response.TransactionEvent()
+
+
+async def _settle():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_handlers_do_not_block_responses(connection):
+    cs = ConcurrentChargePoint(1234, connection, max_concurrent_handlers=2)
+    cs._unique_id_generator = lambda: 1337
+
+    await cs.route_message(_transaction_event("1", "tx-1", 0))
+    await _settle()
+    assert cs.active == 1
+
+    call = asyncio.ensure_future(cs.call(ocpp_request.Heartbeat()))
+    await _settle()
+    await cs.route_message('[3,"1337",{"currentTime":"2024-04-05T12:00:00Z"}]')
+
+    # The response is routed while the handler is still running.
+    assert await call == ocpp_response.Heartbeat(current_time="2024-04-05T12:00:00Z")
+    assert cs.active == 1
+
+    cs.released.set()
+    await _settle()
+    assert cs.handled == [("tx-1", 0)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_handlers_are_limited_and_ordered(connection):
+    cs = ConcurrentChargePoint(1234, connection, max_concurrent_handlers=2)
+
+    await cs.route_message(_transaction_event("1", "tx-1", 0))
+    await cs.route_message(_transaction_event("2", "tx-1", 1))
+    routing = [
+        asyncio.ensure_future(cs.route_message(_transaction_event(*event)))
+        for event in [("3", "tx-2", 0), ("4", "tx-3", 0)]
+    ]
+    await _settle()
+
+    # The second event of tx-1 waits for the first one and takes the second
+    # slot, so no further Calls are read.
+    assert cs.active == 1
+    assert not any(task.done() for task in routing)
+
+    cs.released.set()
+    await asyncio.gather(*routing)
+    await _settle()
+
+    assert cs.max_active <= 2
+    assert cs.handled.index(("tx-1", 0)) < cs.handled.index(("tx-1", 1))
+    assert sorted(cs.handled) == [
+        ("tx-1", 0),
+        ("tx-1", 1),
+        ("tx-2", 0),
+        ("tx-3", 0),
+    ]
+    assert cs._ordered_handler_tasks == {}
+
+    # The responses of tx-1 have been sent in the order of the Calls.
+    unique_ids = [json.loads(c.args[0])[1] for c in connection.send.call_args_list]
+    assert unique_ids.index("1") < unique_ids.index("2")
+
+
+@pytest.mark.asyncio
+async def test_closing_cancels_handlers(connection):
+    cs = ConcurrentChargePoint(1234, connection, max_concurrent_handlers=2)
+    messages = [_transaction_event("1", "tx-1", 0)]
+
+    async def recv():
+        if messages:
+            return messages.pop()
+        # The connection closes while the handler runs.
+        await _settle()
+        raise ConnectionError
+
+    connection.recv = recv
+
+    with pytest.raises(ConnectionError):
+        await cs.start()
+
+    assert cs.active == 1 and cs.handled == []
+    assert cs._handler_tasks == set() and cs._ordered_handler_tasks == {}
+    # The slot of the cancelled handler is free again.
+    assert not cs._handler_semaphore.locked()
+    connection.send.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "payload,expected",
+    [
+        (
+            {"transactionInfo": {"transactionId": "tx-1"}, "evse": {"id": 1}},
+            ("transaction", "tx-1"),
+        ),
+        ({"transactionId": 12}, ("transaction", 12)),
+        ({"evseId": 1, "connectorId": 2}, ("evse", 1)),
+        ({"evse": {"id": 2}}, ("evse", 2)),
+        ({"connectorId": 3}, ("evse", 3)),
+        ({}, None),
+        ({"transactionInfo": "invalid"}, None),
+    ],
+)
+def test_evse_or_transaction_key(payload, expected):
+    assert evse_or_transaction_key(Call("1", "Action", payload)) == expected
@@ -0,0 +1,223 @@
+""" Module with a registry of the charge points that are connected.
+
+A central system adds every `ChargePoint` when it connects, and removes it
+when the connection is closed. Anywhere else in the process a charge point
+can then be looked up by its id:
+
+    >>> CONNECTIONS.add(charge_point)
+    >>> try:
+    ...     await charge_point.start()
+    ... finally:
+    ...     CONNECTIONS.remove(charge_point)
+    ...
+    >>> await CONNECTIONS["CP_1"].call(ocpp_request.Reset(type="Immediate"))
+
+Besides the id, charge points are indexed by the attributes in `INDEXES`:
+the vendor, model and firmware version of the BootNotification, see
+`ConnectionRegistry.boot_notification()`, and the state of the connection.
+`find()` returns the ids of the charge points with the given values:
+
+    >>> CONNECTIONS.find(vendor="ACME", firmware_version="1.2.3")
+    {'CP_1', 'CP_7'}
+
+Adding, updating and removing a charge point take constant time, and
+`find()` takes time proportional to the smallest of the matching index
+entries, however many charge points are connected. A lock makes the registry
+safe to use from handlers that run in threads, see
+`OCPP_LIB.handler_executor`.
+"""
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+# The attributes charge points are indexed by.
+INDEXES = ("vendor", "model", "firmware_version", "state")
+
+# The state of a charge point that has connected, and of one whose
+# BootNotification has been received.
+CONNECTED = "connected"
+BOOTED = "booted"
+
+
+def _get(data: Any, key: str) -> Any:
+    """Return `key` of a dictionary or an attribute of a dataclass."""
+    if isinstance(data, dict):
+        return data.get(key)
+    return getattr(data, key, None)
+
+
+class ConnectionRegistry:
+    """
+    The charge points that are connected, by id, with per charge point its
+    attributes: the ones in `INDEXES` and `connected_at`, the time it was
+    added as returned by `time.time()`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._charge_points: Dict[str, Any] = {}
+        self._attributes: Dict[str, Dict[str, Any]] = {}
+        # Per index the ids of the charge points by value.
+        self._indexes: Dict[str, Dict[Any, Set[str]]] = {name: {} for name in INDEXES}
+
+    def add(self, charge_point, state: str = CONNECTED, **attributes) -> Optional[Any]:
+        """
+        Add `charge_point`, with `state` and other attributes. A charge point
+        with the same id, e.g. after a reconnect, is replaced and returned.
+        """
+        charge_point_id = charge_point.id
+        with self._lock:
+            previous = self._charge_points.get(charge_point_id)
+            if previous is not None:
+                self._unindex(charge_point_id)
+
+            self._charge_points[charge_point_id] = charge_point
+            self._attributes[charge_point_id] = {
+                **{name: None for name in INDEXES},
+                "connected_at": time.time(),
+            }
+            self._update(charge_point_id, {"state": state, **attributes})
+            return previous
+
+    def remove(self, charge_point) -> bool:
+        """
+        Remove `charge_point`. Nothing is removed if another charge point has
+        been added with the same id since, e.g. after a reconnect. Return
+        whether it has been removed.
+        """
+        charge_point_id = charge_point.id
+        with self._lock:
+            if self._charge_points.get(charge_point_id) is not charge_point:
+                return False
+            self._unindex(charge_point_id)
+            del self._charge_points[charge_point_id]
+            del self._attributes[charge_point_id]
+            return True
+
+    def update(self, charge_point_id: str, **attributes) -> bool:
+        """Set attributes of a charge point, e.g. `state`. Return `False` if
+        it isn't connected."""
+        with self._lock:
+            if charge_point_id not in self._charge_points:
+                return False
+            self._update(charge_point_id, attributes)
+            return True
+
+    def boot_notification(
+        self,
+        charge_point_id: str,
+        charging_station: Any = None,
+        charge_point_vendor: Optional[str] = None,
+        charge_point_model: Optional[str] = None,
+        firmware_version: Optional[str] = None,
+        **kwargs,
+    ) -> bool:
+        """
+        Set the vendor, model and firmware version of a charge point from the
+        keyword arguments of a BootNotification handler, of OCPP 1.6 or 2.0.1,
+        and set its state to `BOOTED`:
+
+            >>> @on("BootNotification")
+            ... def on_boot_notification(self, **kwargs):
+            ...     CONNECTIONS.boot_notification(self.id, **kwargs)
+        """
+        if charging_station is not None:
+            charge_point_vendor = _get(charging_station, "vendor_name")
+            charge_point_model = _get(charging_station, "model")
+            firmware_version = _get(charging_station, "firmware_version")
+
+        return self.update(
+            charge_point_id,
+            vendor=charge_point_vendor,
+            model=charge_point_model,
+            firmware_version=firmware_version,
+            state=BOOTED,
+        )
+
+    def _update(self, charge_point_id: str, attributes: Dict[str, Any]):
+        current = self._attributes[charge_point_id]
+        for name, value in attributes.items():
+            index = self._indexes.get(name)
+            if index is not None:
+                old = current.get(name)
+                if old is not None and old != value:
+                    self._discard(index, old, charge_point_id)
+                if value is not None:
+                    index.setdefault(value, set()).add(charge_point_id)
+            current[name] = value
+
+    def _unindex(self, charge_point_id: str):
+        attributes = self._attributes[charge_point_id]
+        for name, index in self._indexes.items():
+            value = attributes.get(name)
+            if value is not None:
+                self._discard(index, value, charge_point_id)
+
+    @staticmethod
+    def _discard(index: Dict[Any, Set[str]], value: Any, charge_point_id: str):
+        ids = index.get(value)
+        if ids is not None:
+            ids.discard(charge_point_id)
+            if not ids:
+                del index[value]
+
+    def get(self, charge_point_id: str) -> Optional[Any]:
+        """Return the charge point with id `charge_point_id`, or `None`."""
+        return self._charge_points.get(charge_point_id)
+
+    def __getitem__(self, charge_point_id: str):
+        return self._charge_points[charge_point_id]
+
+    def __contains__(self, charge_point_id: object) -> bool:
+        return charge_point_id in self._charge_points
+
+    def __len__(self) -> int:
+        return len(self._charge_points)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over a copy of the ids."""
+        with self._lock:
+            return iter(list(self._charge_points))
+
+    def attributes(self, charge_point_id: str) -> Dict[str, Any]:
+        """Return a copy of the attributes of a charge point."""
+        with self._lock:
+            return dict(self._attributes[charge_point_id])
+
+    def find(self, **criteria) -> Set[str]:
+        """
+        Return the ids of the charge points whose attributes have the given
+        values, e.g. `find(vendor="ACME", state=BOOTED)`. Without criteria
+        all ids are returned. Only the attributes in `INDEXES` can be used.
+        """
+        for name in criteria:
+            if name not in self._indexes:
+                raise ValueError(f"'{name}' isn't indexed, use one of {INDEXES}")
+
+        with self._lock:
+            if not criteria:
+                return set(self._charge_points)
+
+            candidates: List[Set[str]] = []
+            for name, value in criteria.items():
+                ids = self._indexes[name].get(value)
+                if not ids:
+                    return set()
+                candidates.append(ids)
+
+            candidates.sort(key=len)
+            return candidates[0].intersection(*candidates[1:])
+
+    def count(self, **criteria) -> int:
+        """Return the number of charge points that `find()` would return."""
+        return len(self.find(**criteria))
+
+    def counts(self, name: str) -> Dict[Any, int]:
+        """Return per value of attribute `name` the number of charge points,
+        e.g. `counts("firmware_version")`."""
+        with self._lock:
+            return {value: len(ids) for value, ids in self._indexes[name].items()}
+
+
+# The registry of the process.
+CONNECTIONS = ConnectionRegistry()
@@ -0,0 +1,55 @@
+""" Module providing `slotted_dataclass()`, a replacement of
+`dataclasses.dataclass()` that creates classes with `__slots__`.
+
+Instances of a class with `__slots__` store their attributes in a fixed
+layout instead of a per-instance `__dict__`, which roughly halves the memory
+footprint of a payload. Since Python 3.10 this is supported by
+`dataclass(slots=True)`. For older versions the class is recreated with
+`__slots__` the same way.
+
+The classes in `data_type.py`, `ocpp_request.py` and `ocpp_response.py` are
+created with this decorator. As a consequence, attributes that aren't fields
+can't be set on payloads.
+"""
+import dataclasses
+import sys
+
+_SLOTS_SUPPORTED = sys.version_info >= (3, 10)
+
+
+def _add_slots(cls: type) -> type:
+    field_names = tuple(field.name for field in dataclasses.fields(cls))
+    inherited_slots = set()
+    for base in cls.__mro__[1:-1]:
+        inherited_slots.update(getattr(base, "__slots__", ()))
+
+    namespace = dict(cls.__dict__)
+    namespace["__slots__"] = tuple(
+        name for name in field_names if name not in inherited_slots
+    )
+    for name in field_names:
+        # Remove the default values, they would conflict with the slots.
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+
+    return slotted
+
+
+def slotted_dataclass(cls=None, **kwargs):
+    """Decorator that works like `dataclasses.dataclass()`, but creates a
+    class with `__slots__`."""
+
+    def wrap(cls):
+        if _SLOTS_SUPPORTED:
+            return dataclasses.dataclass(cls, slots=True, **kwargs)
+
+        return _add_slots(dataclasses.dataclass(cls, **kwargs))
+
+    if cls is None:
+        return wrap
+
+    return wrap(cls)
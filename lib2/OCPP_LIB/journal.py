@@ -0,0 +1,380 @@
+""" Module with an append-only journal of the frames a charge point sends and
+receives.
+
+A `FrameJournal` passed to a `ChargePoint` records every frame, together with
+the id of the charge point, the direction, the message type, the action, the
+unique id and a monotonic timestamp:
+
+    >>> journal = FrameJournal("/var/lib/ocpp/journal")
+    >>> cp = ChargePoint(charge_point_id, websocket, journal=journal)
+    >>> ...
+    >>> journal.close()
+    >>> for record in read_journal("/var/lib/ocpp/journal"):
+    ...     print(record.charge_point_id, record.action, record.frame)
+
+Records are collected in a buffer and copied in batches into segment files,
+which are preallocated and memory-mapped. Recording a frame therefore costs a
+few microseconds and no system call. A batch is copied once it holds
+`batch_size` bytes, or after at most `flush_interval` seconds, one by
+default. Records in the segment survive a crash of the process, so at most
+the records of the last `flush_interval` seconds are lost. The operating
+system writes the pages to disk; call `flush()` to do that right away.
+
+Segments are created, and full ones written and closed, on a background
+thread: the next segment is opened before it's needed, so that a full
+segment doesn't stall the event loop.
+
+Segments are numbered, and a journal takes the next free number whenever it
+needs a segment. So several journals, e.g. one per worker process, can share
+a directory.
+
+A segment starts with a header holding the wall-clock and the monotonic time
+at which it was created, followed by the records:
+
+    header: magic (8 bytes), wall-clock time (int64, ns),
+            monotonic time (int64, ns)
+    record: size of the record (uint32), monotonic time (int64, ns),
+            direction (uint8), message type id (uint8), length of the charge
+            point id, of the unique id and of the action (uint16 each), length
+            of the frame (uint32), followed by these four UTF-8 strings.
+
+A record with size 0 marks the end of a segment.
+"""
+import glob
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import BinaryIO, Iterator, NamedTuple, Optional, Tuple, Union
+
+INBOUND = 0
+OUTBOUND = 1
+
+_MAGIC = b"OCPPJRN1"
+_SEGMENT_HEADER = struct.Struct("<8sqq")
+_RECORD_HEADER = struct.Struct("<IqBBHHHI")
+_RECORD_SIZE = struct.Struct("<I")
+
+# Matches the message type id, the unique id and, for Calls, the action at
+# the start of a frame, without decoding the payload.
+_FRAME_HEADER = re.compile(
+    r'\[\s*(\d)\s*,\s*"((?:[^"\\]|\\.)*)"\s*(?:,\s*"((?:[^"\\]|\\.)*)")?'
+)
+
+
+class JournalRecord(NamedTuple):
+    charge_point_id: str
+    direction: int
+    message_type_id: int
+    unique_id: str
+    action: str
+    # Monotonic time in nanoseconds.
+    timestamp: int
+    # Wall-clock time in nanoseconds since the epoch.
+    wall_clock: int
+    frame: str
+
+
+def _frame_header(frame: str):
+    """Return the message type id, unique id and action of `frame`. The
+    action is empty for CallResults, CallErrors and invalid frames."""
+    match = _FRAME_HEADER.match(frame, 0, 512)
+    if match is None:
+        return 0, "", ""
+
+    message_type_id = int(match.group(1))
+    action = match.group(3) if message_type_id == 2 else None
+    return message_type_id, match.group(2), action or ""
+
+
+class FrameJournal:
+    """
+    Records frames in memory-mapped segment files in `directory`.
+
+    Args:
+
+        directory (str): The directory of the segment files. It's created if
+            it doesn't exist. New segments are added after existing ones,
+            also while other journals write to the directory.
+        segment_size (int): The size in bytes of a segment file. A frame
+            that doesn't fit into a segment gets a segment of its own.
+        batch_size (int): Records are copied into the segment once this
+            many bytes are buffered.
+        flush_interval (float): Buffered records are copied into the
+            segment at least every this many seconds, by a background
+            thread. `None` copies them only when the batch is full, or on
+            `flush()` and `close()`.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_size: int = 64 * 1024 * 1024,
+        batch_size: int = 64 * 1024,
+        flush_interval: Optional[float] = 1.0,
+    ):
+        self.directory = directory
+        self.segment_size = segment_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        os.makedirs(directory, exist_ok=True)
+        existing = _segment_paths(directory)
+        self._segment_index = (
+            int(os.path.basename(existing[-1])[8:14]) + 1 if existing else 0
+        )
+
+        self._lock = threading.Lock()
+        self._batch = bytearray()
+        self._file: Optional[BinaryIO] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._records = 0
+        self._closed = False
+
+        # Creates the next segment and closes full ones.
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ocpp-journal"
+        )
+        self._next_segment: Future = self._executor.submit(self._create_segment)
+
+        self._stopping = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if flush_interval is not None:
+            self._flusher = threading.Thread(
+                target=self._flush_periodically, name="ocpp-journal", daemon=True
+            )
+            self._flusher.start()
+
+    def _flush_periodically(self):
+        """Copy the buffered records into the segment every
+        `flush_interval` seconds."""
+        while not self._stopping.wait(self.flush_interval):
+            with self._lock:
+                if self._batch and not self._closed:
+                    self._write_batch()
+
+    def record(
+        self,
+        charge_point_id: str,
+        direction: int,
+        frame: Union[str, bytes],
+        timestamp: Optional[int] = None,
+    ) -> None:
+        """Record `frame`, received (`INBOUND`) or sent (`OUTBOUND`) by the
+        charge point with id `charge_point_id`. `timestamp` defaults to the
+        current monotonic time in nanoseconds, pass it to create synthetic
+        journals."""
+        if timestamp is None:
+            timestamp = time.monotonic_ns()
+        if isinstance(frame, bytes):
+            frame = frame.decode("utf-8", "replace")
+
+        message_type_id, unique_id, action = _frame_header(frame)
+        charge_point_id = str(charge_point_id).encode()
+        unique_id = unique_id.encode()
+        action = action.encode()
+        frame = frame.encode()
+
+        size = (
+            _RECORD_HEADER.size
+            + len(charge_point_id)
+            + len(unique_id)
+            + len(action)
+            + len(frame)
+        )
+        header = _RECORD_HEADER.pack(
+            size,
+            timestamp,
+            direction,
+            message_type_id,
+            len(charge_point_id),
+            len(unique_id),
+            len(action),
+            len(frame),
+        )
+
+        with self._lock:
+            if self._closed:
+                raise ValueError("Journal is closed")
+
+            batch = self._batch
+            batch += header
+            batch += charge_point_id
+            batch += unique_id
+            batch += action
+            batch += frame
+            self._records += 1
+
+            if len(batch) >= self.batch_size:
+                self._write_batch()
+
+    def _write_batch(self):
+        batch = self._batch
+        start = end = 0
+        while end < len(batch):
+            (size,) = _RECORD_SIZE.unpack_from(batch, end)
+            if end + size - start > self._room():
+                # Continue in a new segment.
+                self._copy(batch, start, end)
+                self._open_segment(size)
+                start = end
+            end += size
+
+        self._copy(batch, start, end)
+        self._batch = bytearray()
+
+    def _copy(self, batch: bytearray, start: int, end: int):
+        if end > start:
+            with memoryview(batch) as view:
+                self._mmap.write(view[start:end])
+
+    def _room(self) -> int:
+        if self._mmap is None:
+            return 0
+        # Keep room for the end marker.
+        return len(self._mmap) - self._mmap.tell() - _RECORD_SIZE.size
+
+    def _create_segment(self) -> Tuple[BinaryIO, mmap.mmap]:
+        """Create the segment file with the next free number and map it.
+        Runs on the background thread."""
+        while True:
+            path = os.path.join(
+                self.directory, f"journal-{self._segment_index:06d}.ocj"
+            )
+            self._segment_index += 1
+            try:
+                # Fails if another journal has taken the number.
+                file = open(path, "x+b")
+                break
+            except FileExistsError:
+                continue
+
+        file.truncate(self.segment_size)
+        segment = mmap.mmap(file.fileno(), self.segment_size)
+        _SEGMENT_HEADER.pack_into(
+            segment, 0, _MAGIC, time.time_ns(), time.monotonic_ns()
+        )
+        segment.seek(_SEGMENT_HEADER.size)
+        return file, segment
+
+    def _open_segment(self, size: int):
+        """Continue in the segment created in the background, with room for
+        a record of `size` bytes, and start creating the one after it."""
+        if self._mmap is not None:
+            self._executor.submit(_close_segment, self._file, self._mmap)
+
+        self._file, self._mmap = self._next_segment.result()
+        self._next_segment = self._executor.submit(self._create_segment)
+
+        length = _SEGMENT_HEADER.size + size + _RECORD_SIZE.size
+        if length > len(self._mmap):
+            # A frame larger than a segment gets a larger segment.
+            self._mmap.close()
+            self._file.truncate(length)
+            self._mmap = mmap.mmap(self._file.fileno(), length)
+            self._mmap.seek(_SEGMENT_HEADER.size)
+
+    def flush(self):
+        """Copy buffered records into the segment and write it to disk."""
+        with self._lock:
+            if self._batch:
+                self._write_batch()
+            if self._mmap is not None:
+                self._mmap.flush()
+
+    def close(self):
+        """Write all records and close the segment file."""
+        with self._lock:
+            if self._closed:
+                return
+            if self._batch:
+                self._write_batch()
+            if self._mmap is not None:
+                self._executor.submit(_close_segment, self._file, self._mmap)
+                self._mmap = None
+            self._closed = True
+
+        self._stopping.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        # The segment created in advance isn't needed.
+        file, segment = self._next_segment.result()
+        segment.close()
+        file.close()
+        os.remove(file.name)
+        self._executor.shutdown()
+
+    def __len__(self):
+        return self._records
+
+    def __repr__(self):
+        return f"<FrameJournal - directory={self.directory}>"
+
+
+def _close_segment(file: BinaryIO, segment: mmap.mmap):
+    """Write `segment` to disk and close it."""
+    size = segment.tell()
+    segment.flush()
+    segment.close()
+    # Drop the unused, preallocated part of the segment.
+    file.truncate(size)
+    file.close()
+
+
+def _segment_paths(directory: str):
+    return sorted(glob.glob(os.path.join(directory, "journal-[0-9]*.ocj")))
+
+
+def read_journal(
+    directory: str, charge_point_id: Optional[str] = None
+) -> Iterator[JournalRecord]:
+    """Iterate over the records in `directory`, in the order they've been
+    recorded, optionally only those of the charge point `charge_point_id`."""
+    for path in _segment_paths(directory):
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _SEGMENT_HEADER.size:
+            continue
+
+        magic, wall_clock, monotonic = _SEGMENT_HEADER.unpack_from(data, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} isn't a journal segment")
+
+        offset = _SEGMENT_HEADER.size
+        while offset + _RECORD_HEADER.size <= len(data):
+            (
+                size,
+                timestamp,
+                direction,
+                message_type_id,
+                id_length,
+                unique_id_length,
+                action_length,
+                frame_length,
+            ) = _RECORD_HEADER.unpack_from(data, offset)
+            if size == 0:
+                break
+
+            position = offset + _RECORD_HEADER.size
+            fields = []
+            for length in (id_length, unique_id_length, action_length, frame_length):
+                start, position = position, position + length
+                fields.append(data[start:position].decode())
+            offset += size
+
+            if charge_point_id is not None and fields[0] != charge_point_id:
+                continue
+
+            yield JournalRecord(
+                charge_point_id=fields[0],
+                direction=direction,
+                message_type_id=message_type_id,
+                unique_id=fields[1],
+                action=fields[2],
+                timestamp=timestamp,
+                wall_clock=wall_clock + timestamp - monotonic,
+                frame=fields[3],
+            )
@@ -0,0 +1,195 @@
+""" Module containing the codecs that encode OCPP messages to JSON and decode
+them from JSON.
+
+The codec used by `unpack()` and the `to_json()` methods of `Call`,
+`CallResult` and `CallError` can be selected globally with
+`set_default_codec()` or per `ChargePoint` using its `codec` argument.
+
+Two codecs are available:
+
+* "json" uses the `json` module of the standard library. It's the default.
+* "orjson" uses orjson_, which is considerably faster. It requires the
+  optional dependency `orjson`.
+
+The name "auto" selects "orjson" if it's installed and "json" otherwise.
+
+Both codecs produce compact JSON, without white space after separators, and
+encode values of type `decimal.Decimal` using 1 decimal point.
+
+.. _orjson: https://pypi.org/project/orjson/
+"""
+import decimal
+import json
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class _DecimalEncoder(json.JSONEncoder):
+    """Encode values of type `decimal.Decimal` using 1 decimal point.
+
+    A custom encoder is required because `json.dumps()` cannot encode a value
+    of type decimal.Decimal. This raises a TypeError:
+
+        >>> import decimal
+        >>> import json
+        >>> >>> json.dumps(decimal.Decimal(3))
+        Traceback (most recent call last):
+          File "<stdin>", line 1, in <module>
+          File "/home/developer/.pyenv/versions/3.7.0/lib/python3.7/json/__init__.py", line 231, in dumps  # noqa
+            return _default_encoder.encode(obj)
+          File "/home/developer/.pyenv/versions/3.7.0/lib/python3.7/json/encoder.py", line 199, in encode
+            chunks = self.iterencode(o, _one_shot=True)
+          File "/home/developer/.pyenv/versions/3.7.0/lib/python3.7/json/encoder.py", line 257, in iterencode
+            return _iterencode(o, 0)
+          File "/home/developer/.pyenv/versions/3.7.0/lib/python3.7/json/encoder.py", line 179, in default
+            raise TypeError(f'Object of type {o.__class__.__name__} '
+        TypeError: Object of type Decimal is not JSON serializable
+
+    This can be prevented by using a custom encoder.
+
+    """
+
+    def default(self, obj):
+        if isinstance(obj, decimal.Decimal):
+            return float("%.1f" % obj)
+        try:
+            return json.JSONEncoder.default(self, obj)
+        except TypeError as e:
+            try:
+                return obj.to_json()
+            except AttributeError:
+                raise e
+
+
+class JSONCodec:
+    """Base class for codecs. A codec encodes Python objects into a `str`
+    containing JSON and decodes JSON into Python objects.
+    """
+
+    name = ""
+
+    def encode(self, obj: Any) -> str:
+        raise NotImplementedError
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        """Decode `data`. A `json.JSONDecodeError` is raised if `data` isn't
+        valid JSON."""
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} - name={self.name}>"
+
+
+class StdlibJSONCodec(JSONCodec):
+    """Codec using the `json` module of the standard library."""
+
+    name = "json"
+
+    def __init__(self):
+        # `json.dumps(..., cls=_DecimalEncoder)` creates a new encoder for
+        # every call. A single instance is reused instead.
+        #
+        # By default json.dumps() adds a white space after every separator.
+        # By setting the separator manually that can be avoided.
+        self._encoder = _DecimalEncoder(separators=(",", ":"))
+        self._decoder = json.JSONDecoder()
+
+    def encode(self, obj: Any) -> str:
+        return self._encoder.encode(obj)
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode("utf-8")
+        return self._decoder.decode(data)
+
+
+def _orjson_default(obj):
+    # orjson calls this function for all types it doesn't support natively.
+    # It mirrors `_DecimalEncoder.default()`.
+    if isinstance(obj, decimal.Decimal):
+        return float("%.1f" % obj)
+    try:
+        return obj.to_json()
+    except AttributeError:
+        raise TypeError(
+            f"Object of type {obj.__class__.__name__} is not JSON serializable"
+        )
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec using the optional dependency orjson."""
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise RuntimeError(
+                "The codec 'orjson' requires the package 'orjson'. Install it "
+                "by running: pip install orjson"
+            )
+
+    def encode(self, obj: Any) -> str:
+        # Like the `json` module, orjson raises a `TypeError` for objects it
+        # can't encode.
+        return orjson.dumps(
+            obj, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        # `orjson.JSONDecodeError` is a subclass of `json.JSONDecodeError`.
+        return orjson.loads(data)
+
+
+_codec_classes = {
+    StdlibJSONCodec.name: StdlibJSONCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+_codecs: Dict[str, JSONCodec] = {}
+
+_default_codec: Optional[JSONCodec] = None
+
+
+def available_codecs():
+    """Return the names of the codecs which dependencies are installed."""
+    return [name for name in _codec_classes if name != "orjson" or orjson is not None]
+
+
+def get_codec(codec: Union[str, JSONCodec, None] = None) -> JSONCodec:
+    """Return a codec.
+
+    `codec` can be the name of a codec, "auto" or an instance of `JSONCodec`.
+    If it is `None` the default codec is returned, see `set_default_codec()`.
+    """
+    if codec is None:
+        return _default_codec
+
+    if isinstance(codec, JSONCodec):
+        return codec
+
+    if codec == "auto":
+        codec = "orjson" if orjson is not None else "json"
+
+    if codec not in _codecs:
+        try:
+            _codecs[codec] = _codec_classes[codec]()
+        except KeyError:
+            raise ValueError(
+                f"Unknown codec '{codec}', choose one of {list(_codec_classes)}."
+            )
+
+    return _codecs[codec]
+
+
+def set_default_codec(codec: Union[str, JSONCodec]) -> None:
+    """Set the codec used when no codec is given explicitly."""
+    global _default_codec
+
+    _default_codec = get_codec(codec)
+
+
+set_default_codec("json")
@@ -0,0 +1,352 @@
+""" Tables that map the camelCase keys of OCPP payloads to snake_case.
+
+This file is generated by `scripts/generate_key_tables.py`. Don't edit it by
+hand.
+"""
+
+CAMEL_TO_SNAKE = {
+    "1.6": {
+        "certificate": "certificate",
+        "certificateChain": "certificate_chain",
+        "certificateHashData": "certificate_hash_data",
+        "certificateType": "certificate_type",
+        "chargeBoxSerialNumber": "charge_box_serial_number",
+        "chargePointModel": "charge_point_model",
+        "chargePointSerialNumber": "charge_point_serial_number",
+        "chargePointVendor": "charge_point_vendor",
+        "chargingProfile": "charging_profile",
+        "chargingProfileId": "charging_profile_id",
+        "chargingProfileKind": "charging_profile_kind",
+        "chargingProfilePurpose": "charging_profile_purpose",
+        "chargingRateUnit": "charging_rate_unit",
+        "chargingSchedule": "charging_schedule",
+        "chargingSchedulePeriod": "charging_schedule_period",
+        "configurationKey": "configuration_key",
+        "connectorId": "connector_id",
+        "context": "context",
+        "csChargingProfiles": "cs_charging_profiles",
+        "csr": "csr",
+        "currentTime": "current_time",
+        "data": "data",
+        "duration": "duration",
+        "errorCode": "error_code",
+        "expiryDate": "expiry_date",
+        "fileName": "file_name",
+        "filename": "filename",
+        "firmware": "firmware",
+        "firmwareVersion": "firmware_version",
+        "format": "format",
+        "hashAlgorithm": "hash_algorithm",
+        "iccid": "iccid",
+        "id": "id",
+        "idTag": "id_tag",
+        "idTagInfo": "id_tag_info",
+        "imsi": "imsi",
+        "info": "info",
+        "installDateTime": "install_date_time",
+        "interval": "interval",
+        "issuerKeyHash": "issuer_key_hash",
+        "issuerNameHash": "issuer_name_hash",
+        "key": "key",
+        "latestTimestamp": "latest_timestamp",
+        "limit": "limit",
+        "listVersion": "list_version",
+        "localAuthorizationList": "local_authorization_list",
+        "location": "location",
+        "log": "log",
+        "logType": "log_type",
+        "measurand": "measurand",
+        "messageId": "message_id",
+        "meterSerialNumber": "meter_serial_number",
+        "meterStart": "meter_start",
+        "meterStop": "meter_stop",
+        "meterType": "meter_type",
+        "meterValue": "meter_value",
+        "minChargingRate": "min_charging_rate",
+        "numberPhases": "number_phases",
+        "oldestTimestamp": "oldest_timestamp",
+        "parentIdTag": "parent_id_tag",
+        "phase": "phase",
+        "readonly": "readonly",
+        "reason": "reason",
+        "recurrencyKind": "recurrency_kind",
+        "remoteLocation": "remote_location",
+        "requestId": "request_id",
+        "requestedMessage": "requested_message",
+        "reservationId": "reservation_id",
+        "retries": "retries",
+        "retrieveDate": "retrieve_date",
+        "retrieveDateTime": "retrieve_date_time",
+        "retryInterval": "retry_interval",
+        "sampledValue": "sampled_value",
+        "scheduleStart": "schedule_start",
+        "serialNumber": "serial_number",
+        "signature": "signature",
+        "signingCertificate": "signing_certificate",
+        "stackLevel": "stack_level",
+        "startPeriod": "start_period",
+        "startSchedule": "start_schedule",
+        "startTime": "start_time",
+        "status": "status",
+        "stopTime": "stop_time",
+        "techInfo": "tech_info",
+        "timestamp": "timestamp",
+        "transactionData": "transaction_data",
+        "transactionId": "transaction_id",
+        "type": "type",
+        "unit": "unit",
+        "unknownKey": "unknown_key",
+        "updateType": "update_type",
+        "validFrom": "valid_from",
+        "validTo": "valid_to",
+        "value": "value",
+        "vendorErrorCode": "vendor_error_code",
+        "vendorId": "vendor_id",
+    },
+    "2.0.1": {
+        "acChargingParameters": "ac_charging_parameters",
+        "action": "action",
+        "actualValue": "actual_value",
+        "additionalIdToken": "additional_id_token",
+        "additionalInfo": "additional_info",
+        "amount": "amount",
+        "amountMultiplier": "amount_multiplier",
+        "apn": "apn",
+        "apnAuthentication": "apn_authentication",
+        "apnPassword": "apn_password",
+        "apnUserName": "apn_user_name",
+        "attributeStatus": "attribute_status",
+        "attributeStatusInfo": "attribute_status_info",
+        "attributeType": "attribute_type",
+        "attributeValue": "attribute_value",
+        "bulkSoC": "bulk_soc",
+        "cableMaxCurrent": "cable_max_current",
+        "cacheExpiryDateTime": "cache_expiry_date_time",
+        "cause": "cause",
+        "certificate": "certificate",
+        "certificateChain": "certificate_chain",
+        "certificateHashData": "certificate_hash_data",
+        "certificateHashDataChain": "certificate_hash_data_chain",
+        "certificateStatus": "certificate_status",
+        "certificateType": "certificate_type",
+        "chargingLimit": "charging_limit",
+        "chargingLimitSource": "charging_limit_source",
+        "chargingNeeds": "charging_needs",
+        "chargingPriority": "charging_priority",
+        "chargingProfile": "charging_profile",
+        "chargingProfileCriteria": "charging_profile_criteria",
+        "chargingProfileId": "charging_profile_id",
+        "chargingProfileKind": "charging_profile_kind",
+        "chargingProfilePurpose": "charging_profile_purpose",
+        "chargingRateUnit": "charging_rate_unit",
+        "chargingSchedule": "charging_schedule",
+        "chargingSchedulePeriod": "charging_schedule_period",
+        "chargingState": "charging_state",
+        "chargingStation": "charging_station",
+        "checksum": "checksum",
+        "childCertificateHashData": "child_certificate_hash_data",
+        "clear": "clear",
+        "clearMonitoringResult": "clear_monitoring_result",
+        "cleared": "cleared",
+        "component": "component",
+        "componentCriteria": "component_criteria",
+        "componentVariable": "component_variable",
+        "configurationSlot": "configuration_slot",
+        "connectionData": "connection_data",
+        "connectorId": "connector_id",
+        "connectorStatus": "connector_status",
+        "connectorType": "connector_type",
+        "constant": "constant",
+        "consumptionCost": "consumption_cost",
+        "content": "content",
+        "context": "context",
+        "cost": "cost",
+        "costKind": "cost_kind",
+        "csr": "csr",
+        "currentTime": "current_time",
+        "customData": "custom_data",
+        "customerCertificate": "customer_certificate",
+        "customerIdentifier": "customer_identifier",
+        "data": "data",
+        "dataType": "data_type",
+        "dcChargingParameters": "dc_charging_parameters",
+        "departureTime": "departure_time",
+        "display": "display",
+        "duration": "duration",
+        "ePriceLevel": "e_price_level",
+        "encodingMethod": "encoding_method",
+        "endDateTime": "end_date_time",
+        "energyAmount": "energy_amount",
+        "evEnergyCapacity": "ev_energy_capacity",
+        "evMaxCurrent": "ev_max_current",
+        "evMaxPower": "ev_max_power",
+        "evMaxVoltage": "ev_max_voltage",
+        "evMinCurrent": "ev_min_current",
+        "eventData": "event_data",
+        "eventId": "event_id",
+        "eventNotificationType": "event_notification_type",
+        "eventType": "event_type",
+        "evse": "evse",
+        "evseId": "evse_id",
+        "exiRequest": "exi_request",
+        "exiResponse": "exi_response",
+        "expiryDateTime": "expiry_date_time",
+        "filename": "filename",
+        "firmware": "firmware",
+        "firmwareVersion": "firmware_version",
+        "format": "format",
+        "fullSoC": "full_soc",
+        "generatedAt": "generated_at",
+        "getVariableData": "get_variable_data",
+        "getVariableResult": "get_variable_result",
+        "group": "group",
+        "groupIdToken": "group_id_token",
+        "hashAlgorithm": "hash_algorithm",
+        "iccid": "iccid",
+        "id": "id",
+        "idToken": "id_token",
+        "idTokenInfo": "id_token_info",
+        "imsi": "imsi",
+        "installDateTime": "install_date_time",
+        "instance": "instance",
+        "interval": "interval",
+        "isGridCritical": "is_grid_critical",
+        "iso15118CertificateHashData": "iso15118_certificate_hash_data",
+        "iso15118SchemaVersion": "iso15118_schema_version",
+        "issuerKeyHash": "issuer_key_hash",
+        "issuerNameHash": "issuer_name_hash",
+        "key": "key",
+        "language": "language",
+        "language1": "language_1",
+        "language2": "language_2",
+        "latestTimestamp": "latest_timestamp",
+        "limit": "limit",
+        "localAuthorizationList": "local_authorization_list",
+        "location": "location",
+        "log": "log",
+        "logType": "log_type",
+        "maxLimit": "max_limit",
+        "maxScheduleTuples": "max_schedule_tuples",
+        "measurand": "measurand",
+        "message": "message",
+        "messageId": "message_id",
+        "messageInfo": "message_info",
+        "messageTimeout": "message_timeout",
+        "messagesInQueue": "messages_in_queue",
+        "meterValue": "meter_value",
+        "minChargingRate": "min_charging_rate",
+        "minLimit": "min_limit",
+        "model": "model",
+        "modem": "modem",
+        "monitor": "monitor",
+        "monitoringBase": "monitoring_base",
+        "monitoringCriteria": "monitoring_criteria",
+        "multiplier": "multiplier",
+        "mutability": "mutability",
+        "name": "name",
+        "numEPriceLevels": "num_e_price_levels",
+        "numberOfPhasesUsed": "number_of_phases_used",
+        "numberPhases": "number_phases",
+        "ocppCsmsUrl": "ocpp_csms_url",
+        "ocppInterface": "ocpp_interface",
+        "ocppTransport": "ocpp_transport",
+        "ocppVersion": "ocpp_version",
+        "ocspRequestData": "ocsp_request_data",
+        "ocspResult": "ocsp_result",
+        "offline": "offline",
+        "oldestTimestamp": "oldest_timestamp",
+        "ongoingIndicator": "ongoing_indicator",
+        "operationalStatus": "operational_status",
+        "password": "password",
+        "persistent": "persistent",
+        "personalMessage": "personal_message",
+        "phase": "phase",
+        "phaseToUse": "phase_to_use",
+        "preferredNetwork": "preferred_network",
+        "priority": "priority",
+        "publicKey": "public_key",
+        "reason": "reason",
+        "reasonCode": "reason_code",
+        "recurrencyKind": "recurrency_kind",
+        "relativeTimeInterval": "relative_time_interval",
+        "remoteLocation": "remote_location",
+        "remoteStartId": "remote_start_id",
+        "report": "report",
+        "reportBase": "report_base",
+        "reportData": "report_data",
+        "requestId": "request_id",
+        "requestedEnergyTransfer": "requested_energy_transfer",
+        "requestedMessage": "requested_message",
+        "reservationId": "reservation_id",
+        "reservationUpdateStatus": "reservation_update_status",
+        "responderURL": "responder_url",
+        "retries": "retries",
+        "retrieveDateTime": "retrieve_date_time",
+        "retryInterval": "retry_interval",
+        "salesTariff": "sales_tariff",
+        "salesTariffDescription": "sales_tariff_description",
+        "salesTariffEntry": "sales_tariff_entry",
+        "sampledValue": "sampled_value",
+        "schedule": "schedule",
+        "scheduleStart": "schedule_start",
+        "securityProfile": "security_profile",
+        "seqNo": "seq_no",
+        "serialNumber": "serial_number",
+        "server": "server",
+        "setMonitoringData": "set_monitoring_data",
+        "setMonitoringResult": "set_monitoring_result",
+        "setVariableData": "set_variable_data",
+        "setVariableResult": "set_variable_result",
+        "severity": "severity",
+        "signature": "signature",
+        "signedMeterData": "signed_meter_data",
+        "signedMeterValue": "signed_meter_value",
+        "signingCertificate": "signing_certificate",
+        "signingMethod": "signing_method",
+        "simPin": "sim_pin",
+        "stackLevel": "stack_level",
+        "start": "start",
+        "startDateTime": "start_date_time",
+        "startPeriod": "start_period",
+        "startSchedule": "start_schedule",
+        "startValue": "start_value",
+        "state": "state",
+        "stateOfCharge": "state_of_charge",
+        "status": "status",
+        "statusInfo": "status_info",
+        "stoppedReason": "stopped_reason",
+        "supportsMonitoring": "supports_monitoring",
+        "tbc": "tbc",
+        "techCode": "tech_code",
+        "techInfo": "tech_info",
+        "timeBase": "time_base",
+        "timeSpentCharging": "time_spent_charging",
+        "timestamp": "timestamp",
+        "totalCost": "total_cost",
+        "transaction": "transaction",
+        "transactionId": "transaction_id",
+        "transactionInfo": "transaction_info",
+        "trigger": "trigger",
+        "triggerReason": "trigger_reason",
+        "type": "type",
+        "unit": "unit",
+        "unitOfMeasure": "unit_of_measure",
+        "updateType": "update_type",
+        "updatedPersonalMessage": "updated_personal_message",
+        "useOnlyPreferredNetwork": "use_only_preferred_network",
+        "user": "user",
+        "validFrom": "valid_from",
+        "validTo": "valid_to",
+        "value": "value",
+        "valuesList": "values_list",
+        "variable": "variable",
+        "variableAttribute": "variable_attribute",
+        "variableCharacteristics": "variable_characteristics",
+        "variableMonitoring": "variable_monitoring",
+        "variableMonitoringId": "variable_monitoring_id",
+        "vendorId": "vendor_id",
+        "vendorName": "vendor_name",
+        "versionNumber": "version_number",
+        "vpn": "vpn",
+    },
+}
@@ -0,0 +1,118 @@
+""" Module with an in-memory connection to connect two charge points in one
+process, without a network.
+
+`connection_pair()` returns the two ends of a duplex connection. A message
+sent on one end is received on the other. Both ends implement the interface
+that `ChargePoint` uses, `recv()` and `send()`:
+
+    >>> csms_connection, station_connection = connection_pair()
+    >>> csms = CentralSystem("CP_1", csms_connection)
+    >>> station = Station("CP_1", station_connection)
+    >>> asyncio.ensure_future(csms.start())
+    >>> asyncio.ensure_future(station.start())
+    >>> await station.send_heartbeat()
+
+To simulate a network, messages can be delayed by `latency` seconds, plus or
+minus a random `jitter`, and dropped with probability `loss`. Messages are
+still received in the order they've been sent, like on a WebSocket.
+"""
+import asyncio
+import collections
+import random
+from typing import Optional, Tuple, Union
+
+from OCPP_LIB.error_handling import ConnectionClosedError
+
+_CLOSED = object()
+
+
+class LoopbackConnection:
+    """One end of an in-memory connection."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        loss: float = 0.0,
+        random_generator: Optional[random.Random] = None,
+    ):
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._peer: "LoopbackConnection" = None
+        self.closed = False
+
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self._random = random_generator or random.Random()
+        # Delayed messages, and the time at which the last one is delivered.
+        self._in_flight = collections.deque()
+        self._last_delivery = 0.0
+
+        self.sent = 0
+        self.dropped = 0
+
+    async def send(self, message: Union[str, bytes]):
+        if self.closed:
+            raise ConnectionClosedError("Connection is closed")
+
+        self.sent += 1
+        if self.loss and self._random.random() < self.loss:
+            self.dropped += 1
+            return
+
+        if not self.latency and not self.jitter:
+            self._peer._queue.put_nowait(message)
+            return
+
+        loop = asyncio.get_running_loop()
+        delay = max(self.latency + self._random.uniform(-self.jitter, self.jitter), 0)
+        # Don't overtake messages sent before.
+        delivery = max(loop.time() + delay, self._last_delivery)
+        self._last_delivery = delivery
+        self._in_flight.append(message)
+        loop.call_at(delivery, self._deliver)
+
+    def _deliver(self):
+        # Callbacks scheduled for the same time may run in any order, so
+        # always deliver the oldest message.
+        message = self._in_flight.popleft()
+        if not self._peer.closed:
+            self._peer._queue.put_nowait(message)
+
+    async def recv(self) -> Union[str, bytes]:
+        message = await self._queue.get()
+        if message is _CLOSED:
+            # Let other receivers of this end see the close too.
+            self._queue.put_nowait(_CLOSED)
+            raise ConnectionClosedError("Connection is closed")
+        return message
+
+    async def close(self):
+        """Close both ends of the connection. Pending and future calls of
+        `recv()` raise `ConnectionClosedError`. Delayed messages that haven't
+        been delivered yet are dropped."""
+        for end in (self, self._peer):
+            if not end.closed:
+                end.closed = True
+                end._queue.put_nowait(_CLOSED)
+
+
+def connection_pair(
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    loss: float = 0.0,
+    seed: Optional[int] = None,
+) -> Tuple[LoopbackConnection, LoopbackConnection]:
+    """
+    Return the two ends of a new in-memory connection.
+
+    Messages in both directions are delayed by `latency` seconds plus a
+    random value between `-jitter` and `jitter`, and dropped with probability
+    `loss`. Pass `seed` to make the delays and losses reproducible.
+    """
+    random_generator = random.Random(seed)
+    a, b = (
+        LoopbackConnection(latency, jitter, loss, random_generator) for _ in range(2)
+    )
+    a._peer, b._peer = b, a
+    return a, b
@@ -0,0 +1,323 @@
+""" Module with metrics about the messages a charge point sends and receives.
+
+Every `ChargePoint` has a `Metrics` instance, `ChargePoint.metrics`, that
+counts:
+
+* the messages received and sent, per action and message type;
+* the time spent validating payloads, running handlers and waiting for the
+  response to a Call, in histograms;
+* the Calls that timed out and the CallErrors, per error code;
+* the number of Calls awaiting a response and of frames waiting to be sent;
+* whether the charge point is connected, i.e. `ChargePoint.start()` runs.
+
+The metrics of all charge points are aggregated by a `MetricsRegistry`, by
+default `REGISTRY`. Its snapshot is exported in the Prometheus text format,
+and `serve_metrics()` serves it over HTTP:
+
+    >>> server = await serve_metrics(port=9100)
+    $ curl http://127.0.0.1:9100/metrics
+
+Collecting metrics must not slow down the charge point: counters are plain
+dictionaries, a histogram stores a value by incrementing one bucket, and
+nothing is locked, because a charge point only updates its metrics from the
+event loop. Aggregating and formatting happens only when a snapshot is taken.
+
+The histograms are log-linear, like HdrHistogram: each power of two is split
+into `SUB_BUCKETS` buckets of equal width, so a percentile is reported with
+a relative error of at most 1 / `SUB_BUCKETS`, for any range of values.
+"""
+import asyncio
+import collections
+import math
+import weakref
+from typing import Dict, Iterable, Optional, Tuple
+
+# The number of buckets per power of two.
+SUB_BUCKETS = 128
+
+# Values below this, in seconds, are counted as this value.
+_MIN_VALUE = 1e-9
+
+# The quantiles that are exported of a histogram.
+QUANTILES = [0.5, 0.9, 0.99, 0.999]
+
+
+class Histogram:
+    """A histogram of positive values, like durations in seconds."""
+
+    __slots__ = ("buckets", "count", "sum", "max")
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, value: float):
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+        # `value` is `mantissa * 2 ** exponent` with 0.5 <= `mantissa` < 1.
+        mantissa, exponent = math.frexp(max(value, _MIN_VALUE))
+        index = exponent * SUB_BUCKETS + int((mantissa - 0.5) * 2 * SUB_BUCKETS)
+        buckets = self.buckets
+        buckets[index] = buckets.get(index, 0) + 1
+
+    def merge(self, other: "Histogram"):
+        """Add the values of `other` to this histogram."""
+        self.count += other.count
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def percentile(self, q: float) -> float:
+        """Return the `q`-th percentile, `q` between 0 and 100. It's the upper
+        bound of the bucket holding the value, but at most the maximum."""
+        if not self.count:
+            return 0.0
+
+        rank = max(math.ceil(self.count * q / 100), 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                exponent, sub_bucket = divmod(index, SUB_BUCKETS)
+                upper = math.ldexp(0.5 + (sub_bucket + 1) / (2 * SUB_BUCKETS), exponent)
+                return min(upper, self.max)
+        return self.max
+
+
+class Metrics:
+    """
+    The metrics of one charge point, or aggregated over several. Counters and
+    histograms are keyed by a tuple of the values of their labels, see
+    `LABELS`.
+    """
+
+    def __init__(self):
+        self.counters: Dict[str, Dict[Tuple, int]] = {
+            name: collections.defaultdict(int) for name in COUNTERS
+        }
+        self.histograms: Dict[str, Dict[Tuple, Histogram]] = {
+            name: {} for name in HISTOGRAMS
+        }
+        # Calls awaiting a response, frames waiting to be sent, and
+        # connected charge points.
+        self.pending_calls = 0
+        self.send_queue_depth = 0
+        self.connections = 0
+
+    def message(self, direction: str, action: str, message_type: str):
+        """Count a message received ("in") or sent ("out")."""
+        self.counters["messages"][(direction, action, message_type)] += 1
+
+    def call_error(self, direction: str, action: str, error_code: str):
+        """Count a CallError received ("in") or sent ("out")."""
+        self.counters["call_errors"][(direction, action, error_code)] += 1
+
+    def timeout(self, action: str):
+        """Count a Call that hasn't been answered in time."""
+        self.counters["timeouts"][(action,)] += 1
+
+    def observe(self, name: str, seconds: float, *labels: str):
+        """Record a duration in the histogram `name`."""
+        histograms = self.histograms[name]
+        histogram = histograms.get(labels)
+        if histogram is None:
+            histogram = histograms[labels] = Histogram()
+        histogram.record(seconds)
+
+    def merge(self, other: "Metrics"):
+        """Add the metrics of `other` to these."""
+        for name, counters in other.counters.items():
+            for labels, value in counters.items():
+                self.counters[name][labels] += value
+        for name, histograms in other.histograms.items():
+            for labels, histogram in histograms.items():
+                if labels not in self.histograms[name]:
+                    self.histograms[name][labels] = Histogram()
+                self.histograms[name][labels].merge(histogram)
+        self.pending_calls += other.pending_calls
+        self.send_queue_depth += other.send_queue_depth
+        self.connections += other.connections
+
+    def to_prometheus(self) -> str:
+        """Return the metrics in the Prometheus text format."""
+        lines = []
+        for name, (help, labels) in COUNTERS.items():
+            metric = f"ocpp_{name}_total"
+            lines += [f"# HELP {metric} {help}", f"# TYPE {metric} counter"]
+            for values, value in sorted(self.counters[name].items()):
+                lines.append(f"{metric}{_labels(labels, values)} {value}")
+
+        for name, (help, labels) in HISTOGRAMS.items():
+            metric = f"ocpp_{name}_seconds"
+            lines += [f"# HELP {metric} {help}", f"# TYPE {metric} summary"]
+            for values, histogram in sorted(self.histograms[name].items()):
+                for quantile in QUANTILES:
+                    label_set = _labels(
+                        labels + ("quantile",), values + (str(quantile),)
+                    )
+                    value = histogram.percentile(quantile * 100)
+                    lines.append(f"{metric}{label_set} {value:.9g}")
+                label_set = _labels(labels, values)
+                lines.append(f"{metric}_sum{label_set} {histogram.sum:.9g}")
+                lines.append(f"{metric}_count{label_set} {histogram.count}")
+
+        for name, help in GAUGES.items():
+            metric = f"ocpp_{name}"
+            lines += [
+                f"# HELP {metric} {help}",
+                f"# TYPE {metric} gauge",
+                f"{metric} {getattr(self, name)}",
+            ]
+
+        return "\n".join(lines) + "\n"
+
+
+# Per metric its description and the names of its labels.
+COUNTERS = {
+    "messages": (
+        "Messages received and sent.",
+        ("direction", "action", "message_type"),
+    ),
+    "call_errors": (
+        "CallErrors received and sent, by error code.",
+        ("direction", "action", "error_code"),
+    ),
+    "timeouts": ("Calls that haven't been answered in time.", ("action",)),
+}
+
+HISTOGRAMS = {
+    "validation": (
+        "Time spent validating payloads.",
+        ("action", "message_type"),
+    ),
+    "handler": ("Time spent running handlers.", ("action",)),
+    "round_trip": (
+        "Time from sending a Call until its response has been received.",
+        ("action",),
+    ),
+}
+
+GAUGES = {
+    "pending_calls": "Calls awaiting a response.",
+    "send_queue_depth": "Frames waiting to be sent.",
+    "connections": "Charge points that are connected.",
+}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values))
+    return "{" + pairs + "}" if pairs else ""
+
+
+class MetricsRegistry:
+    """
+    Aggregates the metrics of many charge points.
+
+    The metrics of a charge point that has been garbage collected are kept
+    in the totals, so counters never decrease.
+    """
+
+    def __init__(self):
+        self._metrics: "weakref.WeakSet[Metrics]" = weakref.WeakSet()
+        # Metrics of charge points that have been garbage collected, added to
+        # `_retired` by `_retire()`. Finalizers may run at any time, so
+        # they only append to this deque.
+        self._retiring: collections.deque = collections.deque()
+        self._retired = Metrics()
+
+    def register(self, owner: object) -> Metrics:
+        """Return new metrics for `owner`, like a charge point, that are
+        aggregated until `owner` is garbage collected."""
+        metrics = Metrics()
+        self._metrics.add(metrics)
+        weakref.finalize(owner, self._retiring.append, metrics)
+        return metrics
+
+    def __len__(self) -> int:
+        """Return the number of connected charge points. Charge points that
+        have been closed but not garbage collected yet aren't counted."""
+        self._retire()
+        return sum(metrics.connections for metrics in list(self._metrics))
+
+    def _retire(self):
+        """Add the metrics of charge points that are gone to the totals."""
+        while self._retiring:
+            metrics = self._retiring.popleft()
+            self._metrics.discard(metrics)
+            # The gauges of charge points that are gone are 0.
+            metrics.pending_calls = metrics.send_queue_depth = 0
+            metrics.connections = 0
+            self._retired.merge(metrics)
+
+    def snapshot(self) -> Metrics:
+        """Return the metrics of all charge points, summed up."""
+        self._retire()
+        snapshot = Metrics()
+        snapshot.merge(self._retired)
+        for metrics in list(self._metrics):
+            snapshot.merge(metrics)
+        return snapshot
+
+    def to_prometheus(self) -> str:
+        """Return a snapshot in the Prometheus text format."""
+        return self.snapshot().to_prometheus()
+
+
+# The registry charge points register at by default.
+REGISTRY = MetricsRegistry()
+
+
+async def serve_metrics(
+    registry: Optional[MetricsRegistry] = None,
+    host: str = "127.0.0.1",
+    port: int = 9100,
+) -> asyncio.AbstractServer:
+    """
+    Serve the metrics of `registry`, `REGISTRY` by default, in the Prometheus
+    text format at http://`host`:`port`/metrics. `registry` may be anything
+    with a `to_prometheus()` method, like a `Supervisor`. The server runs on
+    the event loop; close it with `server.close()`.
+    """
+    registry = registry if registry is not None else REGISTRY
+
+    async def handle(reader, writer):
+        try:
+            request_line = await reader.readline()
+            # Skip the headers.
+            while (await reader.readline()).strip():
+                pass
+
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1] == "/metrics":
+                status = "200 OK"
+                body = registry.to_prometheus().encode()
+            else:
+                status = "404 Not Found"
+                body = b"Not Found\n"
+
+            writer.write(
+                (
+                    f"HTTP/1.1 {status}\r\n"
+                    "Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    "Connection: close\r\n\r\n"
+                ).encode()
+                + body
+            )
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
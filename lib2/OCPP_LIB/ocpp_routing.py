@@ -1,9 +1,61 @@
 import functools
+import inspect
+from types import FunctionType, MethodType
+from typing import Any, Callable, Dict, Optional
 
-routables = []
+from OCPP_LIB.handler_executor import HandlerExecutor, as_handler_executor
 
+#: Options a route can have. The first two are the names of attributes the
+#: decorators `on()` and `after()` set on a handler.
+_HANDLER_OPTIONS = ("_on_action", "_after_action")
 
-def on(action, *, skip_schema_validation=False):
+
+def _accepts_call_unique_id(func: Callable) -> bool:
+    """Return `True` if `func` has a parameter named 'call_unique_id'."""
+    return "call_unique_id" in inspect.signature(func).parameters
+
+
+def accepts_call_unique_id(handler: Callable) -> bool:
+    """
+    Return `True` if the unique id of a Call must be passed to `handler` as
+    keyword argument 'call_unique_id'.
+
+    For handlers decorated with `on()` or `after()` this has been determined
+    when the handler was decorated. Other handlers are inspected.
+    """
+    try:
+        return handler._call_unique_id
+    except AttributeError:
+        return _accepts_call_unique_id(handler)
+
+
+def _is_async(func: Callable) -> bool:
+    return inspect.iscoroutinefunction(func)
+
+
+def handler_executor(
+    handler: Callable, default: Optional[HandlerExecutor] = None
+) -> Optional[HandlerExecutor]:
+    """
+    Return the executor `handler` must be run in, or `None` if it must be run
+    on the event loop.
+
+    That's the executor passed to `on()` or, if `handler` is synchronous,
+    `default`. Async handlers always run on the event loop.
+    """
+    executor = getattr(handler, "_executor", None)
+    if executor is not None or default is None:
+        return executor
+
+    try:
+        is_async = handler._is_async
+    except AttributeError:
+        is_async = _is_async(handler)
+
+    return None if is_async else default
+
+
+def on(action, *, skip_schema_validation=False, executor=None):
     """
     Function decorator to mark function as handler for specific action. The
     wrapped function may be async or sync.
@@ -40,17 +92,29 @@ def on(action, *, skip_schema_validation=False):
     defaults to False. Setting this argument to `True` will disable schema
     validation of the request and the response of the specific route.
 
+    A synchronous handler blocks the event loop while it runs. With the
+    optional argument `executor`, a `HandlerExecutor` or an executor of
+    `concurrent.futures`, it's run in a thread of that executor instead.
+    See `OCPP_LIB.handler_executor`.
+
     """
+    executor = as_handler_executor(executor)
 
     def decorator(func):
+        if executor is not None and _is_async(func):
+            raise TypeError(
+                f"Async handler '{func.__name__}' can't be run in an executor"
+            )
+
         @functools.wraps(func)
         def inner(*args, **kwargs):
             return func(*args, **kwargs)
 
         inner._on_action = action
         inner._skip_schema_validation = skip_schema_validation
-        if func.__name__ not in routables:
-            routables.append(func.__name__)
+        inner._call_unique_id = _accepts_call_unique_id(func)
+        inner._is_async = _is_async(func)
+        inner._executor = executor
         return inner
 
     return decorator
@@ -76,19 +140,77 @@ def after(action):
             return func(*args, **kwargs)
 
         inner._after_action = action
-        if func.__name__ not in routables:
-            routables.append(func.__name__)
+        inner._call_unique_id = _accepts_call_unique_id(func)
+        inner._is_async = _is_async(func)
         return inner
 
     return decorator
 
 
+def _add_route(routes: Dict, attr: Any):
+    """Add `attr` to `routes` if it's decorated with `on()` or `after()`."""
+    # Handlers can be wrapped in `staticmethod` or `classmethod`.
+    func = getattr(attr, "__func__", attr)
+    if not isinstance(func, FunctionType):
+        return
+
+    for option in _HANDLER_OPTIONS:
+        action = getattr(func, option, None)
+        if action is None:
+            continue
+
+        route = routes.setdefault(action, {})
+        route[option] = attr
+
+        # Routes decorated with the `@on()` decorator can be configured
+        # to skip validation of the input and output. For more info see
+        # the docstring of `on()`.
+        if option == "_on_action":
+            route["_skip_schema_validation"] = getattr(
+                func, "_skip_schema_validation", False
+            )
+
+
+def get_routes(cls: type) -> Dict[Any, Dict[str, Any]]:
+    """
+    Return the routes of the handlers defined on `cls` and its base classes.
+
+    The routes have the same structure as the ones returned by
+    `create_route_map()`, but contain the unbound handlers. They are
+    collected once per class and cached on the class.
+
+    Only the namespaces of the classes are looked at, so that no properties
+    are evaluated. A handler that's overridden by an undecorated attribute
+    isn't routed.
+    """
+    try:
+        return cls.__dict__["_ocpp_routes"]
+    except KeyError:
+        pass
+
+    attributes = {}
+    for klass in reversed(cls.__mro__):
+        attributes.update(vars(klass))
+
+    routes = {}
+    for attr in attributes.values():
+        _add_route(routes, attr)
+
+    # Stored on the class itself, subclasses have their own routes.
+    type.__setattr__(cls, "_ocpp_routes", routes)
+    return routes
+
+
 def create_route_map(obj):
     """
     Iterates of all attributes of the class looking for attributes which
     have been decorated by the @on() decorator It returns a dictionary where
     the action name are the keys and the decorated functions are the values.
 
+    The routes of the class are collected only once, see `get_routes()`.
+    Here they are bound to `obj`. Handlers assigned to attributes of `obj`
+    itself are included as well.
+
     To illustrate this with an example, consider the following function:
 
         class ChargePoint:
@@ -113,27 +235,19 @@ def create_route_map(obj):
         }
 
     """
-    routes = {}
-    for attr_name in routables:
-        for option in ["_on_action", "_after_action"]:
-            try:
-                attr = getattr(obj, attr_name)
-                action = getattr(attr, option)
-
-                if action not in routes:
-                    routes[action] = {}
-
-                # Routes decorated with the `@on()` decorator can be configured
-                # to skip validation of the input and output. For more info see
-                # the docstring of `on()`.
-                if option == "_on_action":
-                    routes[action]["_skip_schema_validation"] = getattr(
-                        attr, "_skip_schema_validation", False
-                    )
+    cls = type(obj)
 
-                routes[action][option] = attr
+    route_map = {
+        action: {
+            option: value.__get__(obj, cls) if option in _HANDLER_OPTIONS else value
+            for option, value in route.items()
+        }
+        for action, route in get_routes(cls).items()
+    }
 
-            except AttributeError:
-                continue
+    # Handlers that have been assigned to an instance aren't bound.
+    for attr in getattr(obj, "__dict__", {}).values():
+        if isinstance(attr, (FunctionType, MethodType)):
+            _add_route(route_map, attr)
 
-    return routes
+    return route_map
@@ -0,0 +1,291 @@
+""" Module that decodes payloads into the dataclasses of `data_type` and the
+enums of `E_num`.
+
+By default handlers receive, and `ChargePoint.call()` returns, payloads of
+which nested objects are plain dictionaries with snake_case keys. With the
+"typed" decoder nested objects become instances of the dataclasses in
+`data_type`, e.g. `ChargingProfileType` or `SampledValue`, and strings that
+are restricted to a set of values become members of the enums in `E_num`:
+
+    >>> decode = get_decoder(MessageType.Call, "MeterValues", "1.6")
+    >>> decode({"connectorId": 1, "meterValue": [...]})
+    {'connector_id': 1, 'meter_value': [MeterValue(timestamp=..., ...)]}
+
+A decoder is generated once for every schema. It knows for every property the
+snake_case key, and whether the value must be decoded into a dataclass or an
+enum, so that values of other properties are copied without further checks.
+
+With the "lazy" decoder, the items of arrays of objects are decoded only when
+they are accessed, see `LazyList`.
+
+An object is decoded into a dataclass if a dataclass can be found for it: by
+the name of its definition in the schema, by the name of the property or by
+its set of properties. Objects for which that fails remain dictionaries, for
+every payload of the schema. An object that matches the schema but can't be
+passed to its dataclass, which is only possible if validation is skipped,
+raises a `TypeConstraintViolationError`.
+"""
+import copy
+import dataclasses
+import importlib
+from collections.abc import Sequence
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from OCPP_LIB.error_handling import TypeConstraintViolationError
+from OCPP_LIB.key_tables import CAMEL_TO_SNAKE
+from OCPP_LIB.ocpp_messages import _get_schema_name, _load_schema
+
+#: Decoders that can be used by a `ChargePoint`. "dict" is the default and
+#: decodes nested objects into dictionaries.
+PAYLOAD_DECODERS = ["dict", "typed", "lazy"]
+
+_packages = {"1.6": "ver16", "2.0": "ver201", "2.0.1": "ver201"}
+
+_decoders: Dict[Tuple[int, str, str, bool], Callable[[Dict], Dict]] = {}
+
+
+class LazyList(Sequence):
+    """
+    Read-only list of which the items are decoded when they are accessed for
+    the first time.
+
+    It isn't a `list`: payloads that hold one are serialized like lists by
+    `ChargePoint`, but `isinstance(value, list)` is `False`. A copy made by
+    `copy.deepcopy()`, e.g. by `dataclasses.asdict()`, is a `list`.
+    """
+
+    __slots__ = ("_items", "_decode", "_decoded")
+
+    _not_decoded = object()
+
+    def __init__(self, items: List, decode: Callable[[Any], Any]):
+        self._items = items
+        self._decode = decode
+        self._decoded = [self._not_decoded] * len(items)
+
+    def _get(self, index: int) -> Any:
+        item = self._decoded[index]
+        if item is self._not_decoded:
+            item = self._decoded[index] = self._decode(self._items[index])
+        return item
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self)))]
+
+        return self._get(index)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, LazyList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LazyList({list(self)!r})"
+
+    def __deepcopy__(self, memo) -> List:
+        return copy.deepcopy(list(self), memo)
+
+
+class _Context:
+    """The modules and schema a decoder is generated from."""
+
+    def __init__(self, schema: Dict, ocpp_version: str, lazy: bool):
+        # Imported here, because `OCPP_LIB.charging_station` imports this
+        # module.
+        from OCPP_LIB.charging_station import _camel_to_snake_key, camel_to_snake_case
+
+        package = _packages[ocpp_version]
+        self.data_types = importlib.import_module(f"OCPP_LIB.{package}.data_type")
+        self.enums = importlib.import_module(f"OCPP_LIB.{package}.E_num")
+        self.root = schema
+        self.ocpp_version = ocpp_version
+        self.lazy = lazy
+        self.keys = CAMEL_TO_SNAKE.get(ocpp_version, {})
+        self.camel_to_snake_key = _camel_to_snake_key
+        self.camel_to_snake_case = camel_to_snake_case
+
+    def snake_case(self, key: str) -> str:
+        return self.keys.get(key) or self.camel_to_snake_key(key)
+
+    def resolve(self, schema: Dict) -> Tuple[Dict, Optional[str]]:
+        """Return the schema a '$ref' points to and the name of its
+        definition."""
+        if "$ref" in schema:
+            name = schema["$ref"].split("/")[-1]
+            return self.root["definitions"][name], name
+        return schema, None
+
+    def find_dataclass(self, schema: Dict, names: List[str]) -> Optional[type]:
+        fields = {self.snake_case(key) for key in schema.get("properties", {})} - {
+            "custom_data"
+        }
+
+        for name in names:
+            cls = getattr(self.data_types, name, None)
+            if dataclasses.is_dataclass(cls) and fields <= _field_names(cls):
+                return cls
+
+        # Fall back to a dataclass with the same fields.
+        for cls in vars(self.data_types).values():
+            if dataclasses.is_dataclass(cls) and fields == _field_names(cls) - {
+                "custom_data"
+            }:
+                return cls
+
+        return None
+
+    def find_enum(self, values: List, names: List[str]) -> Optional[type]:
+        values = set(values)
+        candidates = [
+            cls
+            for cls in vars(self.enums).values()
+            if isinstance(cls, type)
+            and issubclass(cls, Enum)
+            and cls is not Enum
+            and values <= set(cls._value2member_map_)
+        ]
+        for name in names:
+            for cls in candidates:
+                if cls.__name__ == name:
+                    return cls
+
+        exact = [cls for cls in candidates if set(cls._value2member_map_) == values]
+        return exact[0] if exact else None
+
+
+def _field_names(cls: type) -> set:
+    return {field.name for field in dataclasses.fields(cls)}
+
+
+def _class_names(definition: Optional[str], key: Optional[str]) -> List[str]:
+    names = []
+    if definition is not None:
+        names += [
+            definition,
+            definition.replace("EnumType", "Type"),
+            definition.replace("EnumType", ""),
+        ]
+    if key:
+        names.append(key[0].upper() + key[1:])
+    return names
+
+
+def _build(
+    context: _Context, schema: Dict, key: Optional[str], top_level: bool = False
+) -> Optional[Callable[[Any], Any]]:
+    """Return a function that decodes a value matching `schema`, or `None` if
+    the value can be used as it is."""
+    schema, definition = context.resolve(schema)
+    names = _class_names(definition, key)
+
+    if "enum" in schema:
+        enum = context.find_enum(schema["enum"], names)
+        if enum is None:
+            return None
+
+        members = enum._value2member_map_
+
+        def decode_enum(value):
+            return members.get(value, value) if isinstance(value, str) else value
+
+        return decode_enum
+
+    type_ = schema.get("type")
+    if type_ == "array" and isinstance(schema.get("items"), dict):
+        decode_item = _build(context, schema["items"], key)
+        if decode_item is None:
+            return None
+
+        items, _ = context.resolve(schema["items"])
+        lazy = context.lazy and items.get("type") == "object"
+
+        def decode_array(value):
+            if not isinstance(value, list):
+                return value
+            if lazy:
+                return LazyList(value, decode_item)
+            return [decode_item(item) for item in value]
+
+        return decode_array
+
+    if type_ == "object" or "properties" in schema:
+        return _build_object(context, schema, names, top_level)
+
+    return None
+
+
+def _build_object(
+    context: _Context, schema: Dict, names: List[str], top_level: bool
+) -> Callable[[Dict], Any]:
+    properties = {}
+    for key, subschema in schema.get("properties", {}).items():
+        properties[key] = (context.snake_case(key), _build(context, subschema, key))
+
+    # The payload itself is passed as keyword arguments, it's never decoded
+    # into a dataclass of `data_type`.
+    cls = None if top_level else context.find_dataclass(schema, names)
+    camel_to_snake_case = context.camel_to_snake_case
+    camel_to_snake_key = context.camel_to_snake_key
+    ocpp_version = context.ocpp_version
+
+    def decode(value):
+        if not isinstance(value, dict):
+            return value
+
+        kwargs = {}
+        for key, item in value.items():
+            try:
+                snake_case_key, decode_item = properties[key]
+            except KeyError:
+                # A key that is not in the schema, e.g. inside 'customData'.
+                kwargs[camel_to_snake_key(key)] = camel_to_snake_case(
+                    item, ocpp_version
+                )
+                continue
+
+            kwargs[snake_case_key] = item if decode_item is None else decode_item(item)
+
+        if cls is None:
+            return kwargs
+
+        try:
+            return cls(**kwargs)
+        except TypeError as e:
+            # A missing or unknown key; valid payloads always fit.
+            raise TypeConstraintViolationError(
+                details={"cause": f"Can't decode {value!r} into {cls.__name__}: {e}"}
+            ) from e
+
+    return decode
+
+
+def get_decoder(
+    message_type_id: int, action: str, ocpp_version: str, lazy: bool = False
+) -> Callable[[Dict], Dict]:
+    """
+    Return a function that decodes the camelCase payload of a message into a
+    dictionary with snake_case keys. The values are dataclasses of `data_type`
+    and enums of `E_num` where possible.
+
+    Decoders are created once and cached. An `OSError` is raised if no schema
+    exists for the message.
+    """
+    cache_key = (message_type_id, action, ocpp_version, lazy)
+    try:
+        return _decoders[cache_key]
+    except KeyError:
+        pass
+
+    schema_name = _get_schema_name(message_type_id, action, ocpp_version)
+    schema = _load_schema(schema_name, ocpp_version, float)
+    context = _Context(schema, ocpp_version, lazy)
+
+    decoder = _build(context, schema, None, top_level=True)
+    _decoders[cache_key] = decoder
+
+    return decoder
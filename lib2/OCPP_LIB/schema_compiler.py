@@ -0,0 +1,446 @@
+""" Module that compiles the OCPP JSON schemas into specialised Python
+functions.
+
+`jsonschema.Draft4Validator` interprets the schema tree every time a payload is
+validated. The functions generated here perform exactly the same checks, but
+the schema is walked only once: when the validator is compiled. The result is
+plain Python code that consists of `isinstance()` checks, dictionary lookups
+and comparisons against constants.
+
+The generated code raises a `jsonschema.exceptions.ValidationError` for the
+first violation it encounters. The keyword (e.g. 'type' or 'required') and the
+message of that error, as well as the order in which violations are detected,
+are the same as the ones of `Draft4Validator.validate()`. That allows
+`OCPP_LIB.ocpp_messages.validate_payload()` to translate errors into the same
+`OCPPError` subclasses, regardless of the validation engine in use.
+
+The only deliberate difference is 'multipleOf', which is evaluated by
+`is_multiple_of()`. `OCPP_LIB.ocpp_messages` uses the same function for its
+`Draft4Validator`.
+"""
+import numbers
+from fractions import Fraction
+from typing import Any, Callable, Dict, List
+
+from jsonschema import Draft4Validator
+from jsonschema.exceptions import ValidationError as SchemaValidationError
+
+# Keywords that are evaluated by the generated code. Every other keyword known
+# to `Draft4Validator` can't be compiled and makes `compile_schema()` raise an
+# `UnsupportedSchemaError`.
+_SUPPORTED_KEYWORDS = {
+    "additionalItems",
+    "additionalProperties",
+    "enum",
+    # Like `Draft4Validator`, 'format' is not asserted when no format checker
+    # is configured.
+    "format",
+    "items",
+    "maxItems",
+    "maxLength",
+    "maximum",
+    "minItems",
+    "minLength",
+    "minimum",
+    "multipleOf",
+    "properties",
+    "required",
+    "type",
+}
+
+_TYPE_CHECKS = {
+    "array": "isinstance({0}, list)",
+    "boolean": "isinstance({0}, bool)",
+    "integer": "(isinstance({0}, int) and not isinstance({0}, bool))",
+    "null": "{0} is None",
+    "number": (
+        "({0}.__class__ is int or {0}.__class__ is float "
+        "or (isinstance({0}, _Number) and not isinstance({0}, bool)))"
+    ),
+    "object": "isinstance({0}, dict)",
+    "string": "isinstance({0}, str)",
+}
+
+
+class UnsupportedSchemaError(Exception):
+    """Raised when a schema uses a keyword that can't be compiled."""
+
+    pass
+
+
+class CompiledValidator:
+    """Validator that checks instances using a function generated from a JSON
+    schema.
+
+    It mimics the part of the interface of `jsonschema.Draft4Validator` that
+    is used by this package: the `schema` attribute and the `validate()`
+    method.
+    """
+
+    def __init__(self, schema: Dict):
+        self.schema = schema
+        self.validate = compile_schema(schema)
+
+    def __repr__(self):
+        return f"<CompiledValidator - schema={self.schema.get('title')}>"
+
+
+def _fail(keyword: str, message: str):
+    raise SchemaValidationError(message, validator=keyword)
+
+
+def _extras_message(extras: List) -> str:
+    verb = "was" if len(extras) == 1 else "were"
+    return ", ".join(repr(extra) for extra in extras) + f" {verb}"
+
+
+def _to_fraction(number: Any) -> Fraction:
+    if isinstance(number, float):
+        # The shortest representation of a float is the way it was written in
+        # JSON, e.g. '21.4' instead of 21.39999999999999857891452847979962825.
+        return Fraction(repr(number))
+    return Fraction(number)
+
+
+def is_multiple_of(instance: Any, divisor: Any) -> bool:
+    """Return `True` if the number `instance` is a multiple of `divisor`.
+
+    `Draft4Validator` divides floats, which makes 21.4 fail 'multipleOf: 0.1',
+    because `21.4 / 0.1` is 213.99999999999997. This function compares floats
+    by their shortest decimal representation instead. The exact comparison is
+    only done when the division of floats doesn't give a whole number.
+    """
+    if isinstance(instance, int) and isinstance(divisor, int):
+        return instance % divisor == 0
+
+    if isinstance(instance, (int, float)) and isinstance(divisor, (int, float)):
+        try:
+            if (instance / divisor).is_integer():
+                return True
+        except OverflowError:
+            pass
+
+    try:
+        return (_to_fraction(instance) / _to_fraction(divisor)).denominator == 1
+    except (ValueError, OverflowError):
+        # Infinity or NaN.
+        return False
+
+
+class _CodeGenerator:
+    """Translate a schema into the source code of a Python module."""
+
+    def __init__(self, schema: Dict):
+        self.root = schema
+        self.constants: Dict[str, Any] = {}
+        self.functions: Dict[str, str] = {}
+        self.pending: List[str] = []
+        self._counter = 0
+
+    def _name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"_{prefix}{self._counter}"
+
+    def _constant(self, value: Any) -> str:
+        name = self._name("c")
+        self.constants[name] = value
+        return name
+
+    def generate(self) -> str:
+        body: List[str] = []
+        self._schema(self.root, "instance", 1, body)
+        functions = ["def validate(instance):", *body, "    return None"]
+
+        # Definitions are compiled into their own function. This happens
+        # lazily, only for definitions that are actually referenced, and
+        # supports recursive references.
+        while self.pending:
+            ref = self.pending.pop()
+            function_body: List[str] = []
+            self._schema(self._resolve(ref), "instance", 1, function_body)
+            functions += [
+                "",
+                f"def {self.functions[ref]}(instance):",
+                *function_body,
+                "    return None",
+            ]
+
+        return "\n".join(functions) + "\n"
+
+    def _resolve(self, ref: str) -> Dict:
+        if not ref.startswith("#/"):
+            raise UnsupportedSchemaError(f"Can't resolve remote reference {ref!r}.")
+
+        schema = self.root
+        for part in ref[2:].split("/"):
+            schema = schema[part.replace("~1", "/").replace("~0", "~")]
+        return schema
+
+    def _ref(self, ref: str) -> str:
+        if ref not in self.functions:
+            self.functions[ref] = self._name("ref")
+            self.pending.append(ref)
+        return self.functions[ref]
+
+    def _schema(self, schema: Dict, var: str, depth: int, out: List[str]) -> None:
+        indent = "    " * depth
+        if not isinstance(schema, dict):
+            raise UnsupportedSchemaError(f"Schema {schema!r} is not an object.")
+
+        # In draft 4 all keywords next to a '$ref' are ignored.
+        if "$ref" in schema:
+            out.append(f"{indent}{self._ref(schema['$ref'])}({var})")
+            return
+
+        # The type of `var` once the 'type' keyword has been evaluated. It
+        # allows to omit type guards for the keywords that follow.
+        known_type = None
+        for keyword, value in schema.items():
+            if keyword not in Draft4Validator.VALIDATORS:
+                continue
+            if keyword not in _SUPPORTED_KEYWORDS:
+                raise UnsupportedSchemaError(f"Keyword {keyword!r} isn't supported.")
+
+            if keyword == "type":
+                known_type = self._type(value, var, indent, out)
+            else:
+                getattr(self, "_" + keyword)(value, schema, var, depth, out, known_type)
+
+    def _guard(self, type_name, known_type, var, depth, out):
+        """Emit an `if` that checks the type of `var`, unless that type is
+        already known. Returns the indentation depth of the guarded code, or
+        `None` if the guarded code can never run."""
+        if known_type == type_name or (known_type, type_name) == ("integer", "number"):
+            return depth
+        if known_type is not None:
+            return None
+        out.append("    " * depth + "if " + _TYPE_CHECKS[type_name].format(var) + ":")
+        return depth + 1
+
+    def _type(self, types, var, indent, out):
+        names = [types] if isinstance(types, str) else list(types)
+        for name in names:
+            if name not in _TYPE_CHECKS:
+                raise UnsupportedSchemaError(f"Type {name!r} isn't supported.")
+
+        condition = " or ".join(_TYPE_CHECKS[name].format(var) for name in names)
+        expected = ", ".join(repr(name) for name in names)
+        out.append(f"{indent}if not ({condition}):")
+        out.append(
+            f"{indent}    _fail('type', f'{{{var}!r}} is not of type ' {expected!r})"
+        )
+        return names[0] if len(names) == 1 else None
+
+    def _properties(self, properties, schema, var, depth, out, known_type):
+        inner: List[str] = []
+        for name, subschema in properties.items():
+            item = self._name("v")
+            key = self._constant(name)
+            body: List[str] = []
+            self._schema(subschema, item, depth + 2, body)
+            if not body:
+                continue
+            inner.append("    " * (depth + 1) + f"if {key} in {var}:")
+            inner.append("    " * (depth + 2) + f"{item} = {var}[{key}]")
+            inner.extend(body)
+
+        if inner:
+            guarded = self._guard("object", known_type, var, depth, out)
+            if guarded is None:
+                return
+            # The body has been generated assuming a guard; dedent if it wasn't
+            # needed.
+            if guarded == depth:
+                inner = [line[4:] for line in inner]
+            out.extend(inner)
+
+    def _additionalProperties(self, allowed, schema, var, depth, out, known_type):
+        if allowed is True or (isinstance(allowed, dict) and not allowed):
+            return
+        if isinstance(allowed, dict) or "patternProperties" in schema:
+            raise UnsupportedSchemaError(
+                "Only boolean 'additionalProperties' are supported."
+            )
+
+        names = self._constant(frozenset(schema.get("properties", {})))
+        depth = self._guard("object", known_type, var, depth, out)
+        if depth is None:
+            return
+        indent = "    " * depth
+        out.append(f"{indent}if not {names}.issuperset({var}):")
+        out.append(
+            f"{indent}    _fail('additionalProperties', "
+            "'Additional properties are not allowed (%s unexpected)' % "
+            f"_extras_message(sorted({var}.keys() - {names}, key=str)))"
+        )
+
+    def _required(self, required, schema, var, depth, out, known_type):
+        if not required:
+            return
+        depth = self._guard("object", known_type, var, depth, out)
+        if depth is None:
+            return
+        indent = "    " * depth
+        for name in required:
+            key = self._constant(name)
+            out.append(f"{indent}if {key} not in {var}:")
+            out.append(
+                f"{indent}    _fail('required', {f'{name!r} is a required property'!r})"
+            )
+
+    def _enum(self, enums, schema, var, depth, out, known_type):
+        if not all(isinstance(value, str) for value in enums):
+            raise UnsupportedSchemaError("Only enums of strings are supported.")
+
+        # A set lookup is the fast path. It can't be used for subclasses of
+        # `str`, like the members of the enums in `E_num`: their hash differs
+        # from the hash of their value.
+        fast = self._constant(frozenset(enums))
+        slow = self._constant(tuple(enums))
+        indent = "    " * depth
+        out.append(
+            f"{indent}if not ({var} in {fast} if {var}.__class__ is str "
+            f"else {var} in {slow}):"
+        )
+        out.append(
+            f"{indent}    _fail('enum', f'{{{var}!r}} is not one of ' {repr(enums)!r})"
+        )
+
+    def _length(self, keyword, type_name, var, depth, out, known_type, op, limit, msg):
+        depth = self._guard(type_name, known_type, var, depth, out)
+        if depth is None:
+            return
+        indent = "    " * depth
+        out.append(f"{indent}if len({var}) {op} {limit!r}:")
+        out.append(f"{indent}    _fail({keyword!r}, f'{{{var}!r}} ' {msg!r})")
+
+    def _maxLength(self, limit, schema, var, depth, out, known_type):
+        message = "is expected to be empty" if limit == 0 else "is too long"
+        self._length(
+            "maxLength", "string", var, depth, out, known_type, ">", limit, message
+        )
+
+    def _minLength(self, limit, schema, var, depth, out, known_type):
+        message = "should be non-empty" if limit == 1 else "is too short"
+        self._length(
+            "minLength", "string", var, depth, out, known_type, "<", limit, message
+        )
+
+    def _maxItems(self, limit, schema, var, depth, out, known_type):
+        message = "is expected to be empty" if limit == 0 else "is too long"
+        self._length(
+            "maxItems", "array", var, depth, out, known_type, ">", limit, message
+        )
+
+    def _minItems(self, limit, schema, var, depth, out, known_type):
+        message = "should be non-empty" if limit == 1 else "is too short"
+        self._length(
+            "minItems", "array", var, depth, out, known_type, "<", limit, message
+        )
+
+    def _items(self, items, schema, var, depth, out, known_type):
+        if not isinstance(items, dict):
+            raise UnsupportedSchemaError("Only a single schema for 'items' is allowed.")
+
+        item = self._name("i")
+        body: List[str] = []
+        self._schema(items, item, depth + 2, body)
+        if not body:
+            return
+
+        guarded = self._guard("array", known_type, var, depth, out)
+        if guarded is None:
+            return
+        if guarded == depth:
+            body = [line[4:] for line in body]
+        out.append("    " * guarded + f"for {item} in {var}:")
+        out.extend(body)
+
+    def _additionalItems(self, additional, schema, var, depth, out, known_type):
+        # Only relevant when 'items' is a list of schemas, which `_items()`
+        # rejects.
+        pass
+
+    def _format(self, format, schema, var, depth, out, known_type):
+        pass
+
+    def _bound(self, keyword, limit, exclusive, var, depth, out, known_type):
+        # The operator tests for a violation of the bound.
+        if keyword == "minimum":
+            op, comparison = (
+                ("<=", "less than or equal to")
+                if exclusive
+                else (
+                    "<",
+                    "less than",
+                )
+            )
+        else:
+            op, comparison = (
+                (">=", "greater than or equal to")
+                if exclusive
+                else (
+                    ">",
+                    "greater than",
+                )
+            )
+
+        bound = self._constant(limit)
+        depth = self._guard("number", known_type, var, depth, out)
+        if depth is None:
+            return
+        indent = "    " * depth
+        message = f" the {keyword} of {limit!r}"
+        out.append(f"{indent}if {var} {op} {bound}:")
+        out.append(
+            f"{indent}    _fail({keyword!r}, f'{{{var}!r}} is {comparison}' "
+            f"{message!r})"
+        )
+
+    def _minimum(self, limit, schema, var, depth, out, known_type):
+        exclusive = schema.get("exclusiveMinimum", False)
+        self._bound("minimum", limit, exclusive, var, depth, out, known_type)
+
+    def _maximum(self, limit, schema, var, depth, out, known_type):
+        exclusive = schema.get("exclusiveMaximum", False)
+        self._bound("maximum", limit, exclusive, var, depth, out, known_type)
+
+    def _multipleOf(self, divisor, schema, var, depth, out, known_type):
+        constant = self._constant(divisor)
+        depth = self._guard("number", known_type, var, depth, out)
+        if depth is None:
+            return
+        indent = "    " * depth
+        out.append(f"{indent}if not _is_multiple_of({var}, {constant}):")
+        out.append(
+            f"{indent}    _fail('multipleOf', f'{{{var}!r}} is not a multiple of "
+            f"{{{constant}}}')"
+        )
+
+
+def generate_source(schema: Dict) -> str:
+    """Return the source code of the validator function for `schema`."""
+    return _CodeGenerator(schema).generate()
+
+
+def compile_schema(schema: Dict) -> Callable[[Any], None]:
+    """Compile the `schema` into a function that takes an instance and raises a
+    `jsonschema.exceptions.ValidationError` if the instance is invalid.
+
+    An `UnsupportedSchemaError` is raised when the schema uses features that
+    can't be compiled.
+    """
+    generator = _CodeGenerator(schema)
+    source = generator.generate()
+
+    namespace: Dict[str, Any] = {
+        "_fail": _fail,
+        "_extras_message": _extras_message,
+        "_is_multiple_of": is_multiple_of,
+        "_Number": numbers.Number,
+        **generator.constants,
+    }
+    title = schema.get("title") or schema.get("$id") or "schema"
+    exec(compile(source, f"<compiled schema {title}>", "exec"), namespace)
+
+    return namespace["validate"]
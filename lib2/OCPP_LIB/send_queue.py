@@ -0,0 +1,291 @@
+""" Module with the queue of the frames a charge point sends.
+
+Every `ChargePoint` sends its frames through a `SendQueue`. Frames are
+written one at a time, in the order of their priority class:
+
+    1. `RESPONSE`: CallResults and CallErrors, the peer waits for them.
+    2. `TRANSACTION`: Calls about transactions, like TransactionEvent and
+       MeterValues, see `TRANSACTION_ACTIONS`.
+    3. `DEFAULT`: all other Calls.
+    4. `BULK`: Calls that report a lot of data, like NotifyReport, see
+       `BULK_ACTIONS`.
+
+and in the order they've been queued within a class.
+
+When nothing is queued, a frame is written right away by the coroutine that
+sends it. Frames sent while a frame is being written are queued, and a
+single writer task writes them. When the peer reads slowly, writing takes
+longer and frames queue up. The queue holds at most `max_size` bytes, after
+that senders wait until there's room, the ones with the highest priority
+first. So a slow or stalled peer can't make the queue grow without limit,
+and responses are written before reports that have been queued earlier.
+
+If writing a frame fails, e.g. because the connection has been closed, the
+queued frames are dropped and every sender that waits for room, and every
+later one, gets the exception. `on_error` is called with the exception and
+the frames that haven't been written, so that e.g. the Calls among them can
+be failed too. Senders that wait for room when the queue is closed get a
+`ConnectionError`.
+"""
+import asyncio
+import collections
+import heapq
+import itertools
+import logging
+from typing import Awaitable, Callable, Deque, List, Optional, Sequence, Tuple, Union
+
+from OCPP_LIB.ocpp_messages import MessageType
+
+LOGGER = logging.getLogger("ocpp")
+
+# The priority classes, from highest to lowest priority.
+RESPONSE = 0
+TRANSACTION = 1
+DEFAULT = 2
+BULK = 3
+PRIORITIES = (RESPONSE, TRANSACTION, DEFAULT, BULK)
+
+# The actions of Calls with priority `TRANSACTION`, of OCPP 1.6 and 2.0.1.
+TRANSACTION_ACTIONS = frozenset(
+    ["TransactionEvent", "StartTransaction", "StopTransaction", "MeterValues"]
+)
+
+# The actions of Calls with priority `BULK`, of OCPP 1.6 and 2.0.1.
+BULK_ACTIONS = frozenset(
+    [
+        "NotifyReport",
+        "NotifyMonitoringReport",
+        "NotifyCustomerInformation",
+        "NotifyDisplayMessages",
+        "ReportChargingProfiles",
+        "SendLocalList",
+    ]
+)
+
+Frame = Union[str, bytes]
+
+
+def _frame_size(frame: Frame) -> int:
+    """Return the number of bytes of `frame` once it's encoded as UTF-8."""
+    if isinstance(frame, bytes) or frame.isascii():
+        return len(frame)
+    return len(frame.encode())
+
+
+def priority(message_type_id: int, action: Optional[str] = None) -> int:
+    """Return the priority class of a message of type `message_type_id`
+    with `action`."""
+    if message_type_id != MessageType.Call:
+        return RESPONSE
+    if action in TRANSACTION_ACTIONS:
+        return TRANSACTION
+    if action in BULK_ACTIONS:
+        return BULK
+    return DEFAULT
+
+
+class SendQueue:
+    """
+    Writes frames with `write`, e.g. the `send()` method of a connection,
+    one at a time and by priority, see the module documentation.
+
+    At most `max_size` bytes of frames are queued; a larger frame is only
+    queued when the queue is empty. If `metrics` is given, its
+    `send_queue_depth` is kept at the number of frames that are queued or
+    being written. `on_error`, if given, is called with the exception and the
+    frames that have been dropped when writing fails.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[Frame], Awaitable[None]],
+        max_size: int = 1024 * 1024,
+        metrics=None,
+        on_error: Optional[Callable[[BaseException, List[Frame]], None]] = None,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.write = write
+        self.max_size = max_size
+        self.metrics = metrics
+        self.on_error = on_error
+
+        self._queues: List[Deque[Frame]] = [collections.deque() for _ in PRIORITIES]
+        # The number of queued frames and the bytes queued or reserved for
+        # senders that have been given room.
+        self._length = 0
+        self._size = 0
+        # Senders that wait for room: (priority, sequence number, size,
+        # future).
+        self._waiters: List[Tuple[int, int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+        self._writing = False
+        self._writer: Optional[asyncio.Task] = None
+        # The exception writing a frame failed with.
+        self._error: Optional[BaseException] = None
+
+    def __len__(self) -> int:
+        """Return the number of queued frames."""
+        return self._length
+
+    @property
+    def size(self) -> int:
+        """The number of bytes of the queued frames."""
+        return self._size
+
+    def _busy(self) -> bool:
+        """Return whether a frame is being written, queued or waits for
+        room."""
+        return bool(
+            self._writing
+            or self._writer is not None
+            or self._length
+            or self._size
+            or self._waiters
+        )
+
+    def _update_metrics(self):
+        if self.metrics is not None:
+            self.metrics.send_queue_depth = self._length + self._writing
+
+    async def put(self, frame: Frame, priority: int = DEFAULT):
+        """
+        Write `frame` if nothing is queued, else queue it. Wait while the
+        queue is full.
+
+        Exceptions of writing are raised when the frame is written right
+        away. Once writing a frame has failed, queued frames are dropped and
+        the exception is raised for waiting and later senders.
+        """
+        if self._error is not None:
+            raise self._error
+
+        if not self._busy():
+            self._writing = True
+            self._update_metrics()
+            try:
+                await self.write(frame)
+            except Exception as e:
+                self._fail(e)
+                raise
+            finally:
+                self._writing = False
+                self._update_metrics()
+                # Frames may have been queued in the meantime.
+                self._start_writer()
+            return
+
+        size = _frame_size(frame)
+        if self._waiters or (self._size and self._size + size > self.max_size):
+            waiter = asyncio.get_running_loop().create_future()
+            heapq.heappush(
+                self._waiters, (priority, next(self._sequence), size, waiter)
+            )
+            try:
+                # Room is reserved for the frame when the future is done.
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._size -= size
+                self._wake_waiters()
+                raise
+            if self._error is not None:
+                # Writing failed after room was reserved.
+                self._size -= size
+                raise self._error
+        else:
+            self._size += size
+
+        self._queues[priority].append(frame)
+        self._length += 1
+        self._update_metrics()
+        self._start_writer()
+
+    def _wake_waiters(self):
+        """Reserve room for waiting senders, by priority, while it fits."""
+        while self._waiters:
+            _, _, size, waiter = self._waiters[0]
+            if waiter.cancelled():
+                heapq.heappop(self._waiters)
+                continue
+            if self._size and self._size + size > self.max_size:
+                break
+            heapq.heappop(self._waiters)
+            self._size += size
+            waiter.set_result(None)
+
+    def _start_writer(self):
+        if self._length and not self._writing and self._writer is None:
+            self._writer = asyncio.ensure_future(self._write_queued())
+
+    def _pop(self) -> Frame:
+        for queue in self._queues:
+            if queue:
+                frame = queue.popleft()
+                self._length -= 1
+                self._size -= _frame_size(frame)
+                return frame
+        raise IndexError("The queue is empty")
+
+    async def _write_queued(self):
+        self._writing = True
+        try:
+            while self._length:
+                frame = self._pop()
+                # The frame leaves the queue before it's written, so that
+                # senders can queue the next ones in the meantime.
+                self._wake_waiters()
+                await self.write(frame)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # The sender of `frame` has returned already.
+            self._fail(e, [frame])
+        finally:
+            self._writing = False
+            self._writer = None
+            self._update_metrics()
+
+    def _fail(self, error: BaseException, unwritten: Sequence[Frame] = ()):
+        """Stop writing after `error`: drop the queued frames and raise
+        `error` for the senders that wait for room and all later ones. The
+        dropped frames and `unwritten` are passed to `on_error`."""
+        if self._length:
+            LOGGER.warning("Dropping %d queued frames: %s", self._length, error)
+        self._error = error
+        for _, _, _, waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_exception(error)
+        self._waiters.clear()
+        dropped = list(unwritten) + [frame for queue in self._queues for frame in queue]
+        self.clear()
+
+        if self.on_error is not None and dropped:
+            try:
+                self.on_error(error, dropped)
+            except Exception:
+                LOGGER.exception("Error in on_error of the send queue")
+
+    def clear(self):
+        """Drop the queued frames. Senders that wait for room get it."""
+        for queue in self._queues:
+            # Keep the room reserved for senders that haven't queued yet.
+            self._size -= sum(_frame_size(frame) for frame in queue)
+            queue.clear()
+        self._length = 0
+        self._wake_waiters()
+        self._update_metrics()
+
+    def close(self):
+        """Stop the writer task and drop the queued frames. Senders that wait
+        for room raise a `ConnectionError`."""
+        if self._writer is not None:
+            self._writer.cancel()
+            self._writer = None
+        for _, _, _, waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_exception(ConnectionError("The send queue is closed"))
+        self._waiters.clear()
+        self.clear()
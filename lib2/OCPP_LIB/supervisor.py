@@ -0,0 +1,320 @@
+""" Module to run a server in several processes that share one port.
+
+A single event loop uses a single core. A `Supervisor` starts `workers`
+processes that each bind their own listening socket to the same port, with
+`SO_REUSEPORT`, so that the kernel distributes new connections over them.
+Every worker runs its own event loop with its own `ChargePoint` instances:
+
+    >>> async def serve(sock):
+    ...     server = await websockets.serve(on_connect, sock=sock,
+    ...                                     subprotocols=["ocpp2.0.1"])
+    ...     await server.wait_closed()
+    ...
+    >>> Supervisor(serve, workers=4, port=9000, metrics_port=9100).run()
+
+`serve` is called in the worker with the listening socket. With the default
+start method "spawn" it must be importable, i.e. be defined at module level.
+
+The supervisor restarts workers that exit, after a delay that doubles for
+every crash in a row. Every worker reports the metrics of its charge points,
+see `OCPP_LIB.metrics`, including the number of connected charge points,
+every `report_interval` seconds. The supervisor merges them and serves them at
+http://127.0.0.1:`metrics_port`/metrics. Counters of a worker that exited are
+kept, so they don't decrease when a worker is restarted.
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import socket
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from OCPP_LIB.metrics import REGISTRY, Metrics, serve_metrics
+
+LOGGER = logging.getLogger("ocpp")
+
+
+def reuseport_socket(host: str, port: int, backlog: int = 1024) -> socket.socket:
+    """Return a non-blocking socket listening on `host`:`port`, which other
+    processes can bind to as well."""
+    if not hasattr(socket, "SO_REUSEPORT"):
+        raise OSError("SO_REUSEPORT is not supported on this platform")
+
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind((host, port))
+        sock.listen(backlog)
+        sock.setblocking(False)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+async def _report(index: int, reports, interval: float):
+    """Send the metrics of this worker to the supervisor every `interval`
+    seconds."""
+    while True:
+        reports.put((index, os.getpid(), REGISTRY.snapshot()))
+        await asyncio.sleep(interval)
+
+
+async def _serve_worker(target, index, sock, reports, interval):
+    reporter = asyncio.ensure_future(_report(index, reports, interval))
+    try:
+        await target(sock)
+    finally:
+        reporter.cancel()
+
+
+def _run_worker(
+    target: Callable[[socket.socket], Awaitable[Any]],
+    index: int,
+    host: str,
+    port: int,
+    reports,
+    interval: float,
+):
+    sock = reuseport_socket(host, port)
+    try:
+        asyncio.run(_serve_worker(target, index, sock, reports, interval))
+    except KeyboardInterrupt:
+        pass
+
+
+class _Worker:
+    """The state of one worker slot."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.process: Optional[multiprocessing.Process] = None
+        self.started_at = 0.0
+        self.restart_at: Optional[float] = None
+        self.restarts = 0
+        # Crashes in a row, to compute the restart delay.
+        self.crashes = 0
+        # The last report of the running process.
+        self.connections = 0
+        self.metrics: Optional[Metrics] = None
+
+
+class Supervisor:
+    """
+    Runs `target` in `workers` processes, by default one per core, that
+    listen on `host`:`port`.
+
+    A worker that exits is restarted after `restart_delay` seconds, doubled
+    for every time it exited within `max_restart_delay` seconds after it was
+    started, up to `max_restart_delay`.
+    """
+
+    def __init__(
+        self,
+        target: Callable[[socket.socket], Awaitable[Any]],
+        workers: Optional[int] = None,
+        host: str = "0.0.0.0",
+        port: int = 9000,
+        metrics_port: Optional[int] = None,
+        report_interval: float = 1.0,
+        restart_delay: float = 0.5,
+        max_restart_delay: float = 30.0,
+        start_method: str = "spawn",
+    ):
+        self.target = target
+        self.host = host
+        self.port = port
+        self.metrics_port = metrics_port
+        self.report_interval = report_interval
+        self.restart_delay = restart_delay
+        self.max_restart_delay = max_restart_delay
+
+        self._context = multiprocessing.get_context(start_method)
+        self._reports = self._context.Queue()
+        self._workers = [_Worker(i) for i in range(workers or os.cpu_count() or 1)]
+        # The metrics of processes that have exited.
+        self._retired = Metrics()
+        self._stopping: Optional[asyncio.Event] = None
+
+    def _start(self, worker: _Worker):
+        worker.process = self._context.Process(
+            target=_run_worker,
+            args=(
+                self.target,
+                worker.index,
+                self.host,
+                self.port,
+                self._reports,
+                self.report_interval,
+            ),
+            name=f"ocpp-worker-{worker.index}",
+            daemon=True,
+        )
+        worker.process.start()
+        worker.started_at = time.monotonic()
+        worker.restart_at = None
+        LOGGER.info("Started worker %d, pid %d", worker.index, worker.process.pid)
+
+    def _retire(self, worker: _Worker):
+        """Keep the last metrics reported by the process of `worker`."""
+        if worker.metrics is not None:
+            worker.metrics.pending_calls = worker.metrics.send_queue_depth = 0
+            worker.metrics.connections = 0
+            self._retired.merge(worker.metrics)
+        worker.metrics = None
+        worker.connections = 0
+
+    def _read_reports(self):
+        while True:
+            try:
+                index, pid, metrics = self._reports.get_nowait()
+            except queue.Empty:
+                return
+            worker = self._workers[index]
+            # Ignore late reports of a process that has exited.
+            if worker.restart_at is None and worker.process.pid == pid:
+                # Charge points that are closed aren't counted, even if
+                # they haven't been garbage collected yet.
+                worker.connections = metrics.connections
+                worker.metrics = metrics
+
+    def _check_workers(self):
+        now = time.monotonic()
+        for worker in self._workers:
+            if worker.restart_at is not None:
+                if now >= worker.restart_at:
+                    worker.restarts += 1
+                    self._start(worker)
+                continue
+
+            if worker.process.is_alive():
+                continue
+
+            self._retire(worker)
+            uptime = now - worker.started_at
+            worker.crashes = (
+                worker.crashes + 1 if uptime < self.max_restart_delay else 1
+            )
+            delay = min(
+                self.restart_delay * 2 ** (worker.crashes - 1), self.max_restart_delay
+            )
+            LOGGER.warning(
+                "Worker %d, pid %d, exited with code %s, restarting it in %.1fs",
+                worker.index,
+                worker.process.pid,
+                worker.process.exitcode,
+                delay,
+            )
+            worker.restart_at = now + delay
+
+    async def serve(self):
+        """Start the workers and supervise them until `stop()` is called."""
+        loop = asyncio.get_running_loop()
+        self._stopping = asyncio.Event()
+        signals = []
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, self.stop)
+                signals.append(signum)
+            except (NotImplementedError, RuntimeError, ValueError):
+                # Not supported on this platform, or not the main thread.
+                pass
+
+        metrics_server = None
+        if self.metrics_port is not None:
+            metrics_server = await serve_metrics(self, port=self.metrics_port)
+
+        for worker in self._workers:
+            self._start(worker)
+
+        try:
+            while not self._stopping.is_set():
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), 0.1)
+                except asyncio.TimeoutError:
+                    pass
+                self._read_reports()
+                self._check_workers()
+        finally:
+            for signum in signals:
+                loop.remove_signal_handler(signum)
+            if metrics_server is not None:
+                metrics_server.close()
+            await loop.run_in_executor(None, self._terminate)
+
+    def _terminate(self):
+        processes = [w.process for w in self._workers if w.process is not None]
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join(5)
+            if process.is_alive():
+                process.kill()
+                process.join()
+
+    def run(self):
+        """Run `serve()` until the supervisor receives SIGINT or SIGTERM."""
+        asyncio.run(self.serve())
+
+    def stop(self):
+        """Stop the workers and return from `serve()`."""
+        if self._stopping is not None:
+            self._stopping.set()
+
+    @property
+    def connections(self) -> int:
+        """The number of charge points of all workers, as last reported."""
+        return sum(worker.connections for worker in self._workers)
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Return per worker its pid, whether it's alive, how often it has
+        been restarted and its number of connections."""
+        return [
+            {
+                "worker": worker.index,
+                "pid": worker.process.pid if worker.process else None,
+                "alive": bool(worker.process and worker.process.is_alive()),
+                "restarts": worker.restarts,
+                "connections": worker.connections,
+            }
+            for worker in self._workers
+        ]
+
+    def snapshot(self) -> Metrics:
+        """Return the metrics of all workers, summed up."""
+        self._read_reports()
+        snapshot = Metrics()
+        snapshot.merge(self._retired)
+        for worker in self._workers:
+            if worker.metrics is not None:
+                snapshot.merge(worker.metrics)
+        return snapshot
+
+    def to_prometheus(self) -> str:
+        """Return a snapshot in the Prometheus text format, with the number
+        of connections and restarts per worker."""
+        snapshot = self.snapshot()
+        # The snapshot has the number of connections of all workers.
+        lines = [
+            "# HELP ocpp_worker_connections Charge points per worker.",
+            "# TYPE ocpp_worker_connections gauge",
+        ]
+        lines += [
+            f'ocpp_worker_connections{{worker="{w.index}"}} {w.connections}'
+            for w in self._workers
+        ]
+        lines += [
+            "# HELP ocpp_worker_restarts_total Restarts per worker.",
+            "# TYPE ocpp_worker_restarts_total counter",
+        ]
+        lines += [
+            f'ocpp_worker_restarts_total{{worker="{w.index}"}} {w.restarts}'
+            for w in self._workers
+        ]
+        return snapshot.to_prometheus() + "\n".join(lines) + "\n"
@@ -1,6 +1,6 @@
-from dataclasses import dataclass
 from typing import List, Optional
 
+from OCPP_LIB.dataclass_slots import slotted_dataclass
 from OCPP_LIB.ver16.E_num import (
     AuthorizationStatus,
     ChargingProfileKindType,
@@ -18,7 +18,7 @@ from OCPP_LIB.ver16.E_num import (
 )
 
 
-@dataclass
+@slotted_dataclass
 class IdTagInfo:
     """
     Contains status information about an identifier. It is returned in
@@ -32,7 +32,7 @@ class IdTagInfo:
     expiry_date: Optional[str] = None
 
 
-@dataclass
+@slotted_dataclass
 class AuthorizationData:
     """
     Elements that constitute an entry of a Local Authorization List update.
@@ -42,14 +42,14 @@ class AuthorizationData:
     id_tag_info: Optional[IdTagInfo] = None
 
 
-@dataclass
+@slotted_dataclass
 class ChargingSchedulePeriod:
     start_period: int
     limit: float
     number_phases: Optional[int] = None
 
 
-@dataclass
+@slotted_dataclass
 class ChargingSchedule:
     charging_rate_unit: ChargingRateUnitType
     charging_schedule_period: List[ChargingSchedulePeriod]
@@ -58,7 +58,7 @@ class ChargingSchedule:
     min_charging_rate: Optional[float] = None
 
 
-@dataclass
+@slotted_dataclass
 class ChargingProfile:
     """
     A ChargingProfile consists of a ChargingSchedule, describing the
@@ -76,7 +76,7 @@ class ChargingProfile:
     valid_to: Optional[str] = None
 
 
-@dataclass
+@slotted_dataclass
 class KeyValue:
     """
     Contains information about a specific configuration key.
@@ -97,7 +97,7 @@ class KeyValue:
             raise ValueError(msg)
 
 
-@dataclass
+@slotted_dataclass
 class SampledValue:
     """
     Single sampled value in MeterValues. Each value can be accompanied by
@@ -113,7 +113,7 @@ class SampledValue:
     unit: Optional[UnitOfMeasure] = None
 
 
-@dataclass
+@slotted_dataclass
 class MeterValue:
     """
     Collection of one or more sampled values in MeterValues.req.
@@ -127,7 +127,7 @@ class MeterValue:
 # Security Extension
 
 
-@dataclass
+@slotted_dataclass
 class CertificateHashData:
     """
     CertificateHashDataType is used by:
@@ -140,7 +140,7 @@ class CertificateHashData:
     serial_number: str
 
 
-@dataclass
+@slotted_dataclass
 class Firmware:
     """
     Represents a copy of the firmware that can be loaded/updated on the Charge Point.
@@ -154,7 +154,7 @@ class Firmware:
     signature: Optional[str] = None
 
 
-@dataclass
+@slotted_dataclass
 class LogParameters:
     """
     Class for detailed information the retrieval of logging entries.
@@ -1,10 +1,10 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
+from OCPP_LIB.dataclass_slots import slotted_dataclass
 from OCPP_LIB.ver201 import E_num
 
 
-@dataclass
+@slotted_dataclass
 class ACChargingParametersType:
     """
     EV AC charging parameters.
@@ -15,9 +15,10 @@ class ACChargingParametersType:
     ev_min_current: int
     ev_max_current: int
     ev_max_voltage: int
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class AdditionalInfoType:
     """
     Contains a case insensitive identifier to use for the authorization and the
@@ -27,9 +28,10 @@ class AdditionalInfoType:
 
     additional_id_token: str
     type: str
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class APNType:
     """
     Collection of configuration data needed to make a data-connection over a
@@ -44,9 +46,10 @@ class APNType:
     sim_pin: Optional[int] = None
     preferred_network: Optional[str] = None
     use_only_preferred_network: Optional[bool] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class CertificateHashDataType:
     """
     CertificateHashDataType is used by: CertificateHashDataChainType,
@@ -57,9 +60,10 @@ class CertificateHashDataType:
     issuer_name_hash: str
     issuer_key_hash: str
     serial_number: str
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class CertificateHashDataChainType:
     """
     CertificateHashDataChainType is used by: GetInstalledCertificateIdsResponse
@@ -68,17 +72,19 @@ class CertificateHashDataChainType:
     certificate_type: E_num.GetCertificateIdUseType
     certificate_hash_data: CertificateHashDataType
     child_certificate_hash_data: Optional[List[CertificateHashDataType]] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ChargingLimitType:
     """ChargingLimitType is used by: NotifyChargingLimitRequest"""
 
     charging_limit_source: E_num.ChargingLimitSourceType
     is_grid_critical: Optional[bool] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class DCChargingParametersType:
     """
     EV DC charging parameters
@@ -93,9 +99,10 @@ class DCChargingParametersType:
     ev_energy_capacity: Optional[int] = None
     full_soc: Optional[int] = None
     bulk_soc: Optional[int] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ChargingNeedsType:
     """
     ChargingNeedsType is used by: NotifyEVChargingNeedsRequest
@@ -105,9 +112,10 @@ class ChargingNeedsType:
     departure_time: Optional[str] = None
     ac_charging_parameters: Optional[ACChargingParametersType] = None
     dc_charging_parameters: Optional[DCChargingParametersType] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ChargingProfileCriterionType:
     """
     A ChargingProfile consists of ChargingSchedule, describing the amount of
@@ -119,9 +127,10 @@ class ChargingProfileCriterionType:
     stack_level: Optional[int] = None
     charging_profile_id: Optional[List[int]] = None
     charging_limit_source: Optional[List[E_num.ChargingLimitSourceType]] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ChargingSchedulePeriodType:
     """
     Charging schedule period structure defines a time period in a charging
@@ -134,17 +143,19 @@ class ChargingSchedulePeriodType:
     limit: float
     number_phases: Optional[int] = None
     phase_to_use: Optional[int] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class RelativeTimeIntervalType:
     """RelativeTimeIntervalType is used by: SalesTariffEntryType"""
 
     start: int
     duration: Optional[int] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class CostType:
     """
     CostType is used by: ConsumptionCostType
@@ -153,9 +164,10 @@ class CostType:
     cost_kind: E_num.CostKindType
     amount: int
     amount_multiplier: Optional[int] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ConsumptionCostType:
     """
     ConsumptionCostType is used by: SalesTariffEntryType
@@ -163,18 +175,20 @@ class ConsumptionCostType:
 
     start_value: float
     cost: List[CostType]
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SalesTariffEntryType:
     """SalesTariffEntryType is used by: SalesTariffType"""
 
     relative_time_interval: RelativeTimeIntervalType
     consumption_cost: Optional[List[ConsumptionCostType]] = None
     e_price_level: Optional[int] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SalesTariffType:
     """
     This dataType is based on dataTypes from ISO 15118-2.
@@ -185,9 +199,10 @@ class SalesTariffType:
     sales_tariff_entry: List[SalesTariffEntryType]
     sales_tariff_description: Optional[str] = None
     num_e_price_levels: Optional[int] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ChargingScheduleType:
     """
     Charging schedule structure defines a list of charging periods, as used in:
@@ -203,9 +218,10 @@ class ChargingScheduleType:
     duration: Optional[int] = None
     min_charging_rate: Optional[float] = None
     sales_tariff: Optional[SalesTariffType] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ChargingProfileType:
     """
     A ChargingProfile consists of ChargingSchedule, describing the amount of
@@ -223,9 +239,10 @@ class ChargingProfileType:
     valid_to: Optional[str] = None
     transaction_id: Optional[str] = None
     recurrency_kind: Optional[E_num.RecurrencyKindType] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ClearChargingProfileType:
     """
     A ChargingProfile consists of a ChargingSchedule, describing the amount of
@@ -236,9 +253,10 @@ class ClearChargingProfileType:
     evse_id: Optional[int] = None
     charging_profile_purpose: Optional[E_num.ChargingProfilePurposeType] = None
     stack_level: Optional[int] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class StatusInfoType:
     """
     Element providing more information about the status.
@@ -266,9 +284,10 @@ class StatusInfoType:
 
     reason_code: str
     additional_info: Optional[str] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ClearMonitoringResultType:
     """
     ClearMonitoringResultType is used by: ClearVariableMonitoringResponse
@@ -277,9 +296,10 @@ class ClearMonitoringResultType:
     status: E_num.ClearMonitoringStatusType
     id: int
     status_info: Optional[StatusInfoType] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class EVSEType:
     """
     Electric Vehicle Supply Equipment
@@ -289,9 +309,10 @@ class EVSEType:
 
     id: int
     connector_id: Optional[int] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ComponentType:
     """
     A physical or logical component.
@@ -310,9 +331,10 @@ class ComponentType:
     name: str
     instance: Optional[str] = None
     evse: Optional[EVSEType] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class VariableType:
     """
     Reference key to a component-variable.
@@ -330,9 +352,10 @@ class VariableType:
 
     name: str
     instance: Optional[str] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ComponentVariableType:
     """
     Class to report components, variables and variable attributes and
@@ -343,9 +366,10 @@ class ComponentVariableType:
 
     component: ComponentType
     variable: Optional[VariableType] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class CompositeScheduleType:
     """
     CompositeScheduleType is used by: GetCompositeScheduleResponse
@@ -356,9 +380,10 @@ class CompositeScheduleType:
     schedule_start: str
     charging_rate_unit: E_num.ChargingRateUnitType
     charging_schedule_period: List[ChargingSchedulePeriodType]
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class CostType:
     """
     CostType is used by: ConsumptionCostType
@@ -367,9 +392,10 @@ class CostType:
     cost_kind: E_num.CostKindType
     amount: int
     amount_multiplier: Optional[int] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ConsumptionCostType:
     """
     ConsumptionCostType is used by: SalesTariffEntryType
@@ -377,9 +403,10 @@ class ConsumptionCostType:
 
     start_value: float
     cost: List[CostType]
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class EventDataType:
     """
     Class to report an event notification for a component-variable.
@@ -399,9 +426,10 @@ class EventDataType:
     cleared: Optional[bool] = None
     transaction_id: Optional[str] = None
     variable_monitoring_id: Optional[int] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class FirmwareType:
     """
     Represents a copy of the firmware that can be loaded/updated on the
@@ -414,9 +442,10 @@ class FirmwareType:
     install_date_time: Optional[str] = None
     signing_certificate: Optional[str] = None
     signature: Optional[str] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetVariableDataType:
     """
     Class to hold parameters for GetVariables request.
@@ -426,9 +455,10 @@ class GetVariableDataType:
     component: ComponentType
     variable: VariableType
     attribute_type: Optional[E_num.AttributeType] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetVariableResultType:
     """
     Class to hold results of GetVariables request.
@@ -441,9 +471,10 @@ class GetVariableResultType:
     attribute_type: Optional[E_num.AttributeType] = None
     attribute_value: Optional[str] = None
     attribute_status_info: Optional[StatusInfoType] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class IdTokenType:
     """
     Contains a case insensitive identifier to use for the authorization and the
@@ -456,9 +487,10 @@ class IdTokenType:
     id_token: str
     type: E_num.IdTokenType
     additional_info: Optional[List[AdditionalInfoType]] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class MessageContentType:
     """
     Contains message details, for a message to be displayed on a Charging
@@ -470,9 +502,10 @@ class MessageContentType:
     format: E_num.MessageFormatType
     content: str
     language: Optional[str] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class IdTokenInfoType:
     """
     Contains status information about an identifier. It is advised to not stop
@@ -491,9 +524,10 @@ class IdTokenInfoType:
     language_2: Optional[str] = None
     group_id_token: Optional[IdTokenType] = None
     personal_message: Optional[MessageContentType] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class AuthorizationData:
     """
     Contains the identifier to use for authorization.
@@ -502,9 +536,10 @@ class AuthorizationData:
 
     id_token: IdTokenType
     id_token_info: Optional[IdTokenInfoType] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class LogParametersType:
     """
     Generic class for the configuration of logging entries.
@@ -514,9 +549,10 @@ class LogParametersType:
     remote_location: str
     oldest_timestamp: Optional[str] = None
     latest_timestamp: Optional[str] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class MessageInfoType:
     """
     Contains message details, for a message to be displayed on a Charging
@@ -533,9 +569,10 @@ class MessageInfoType:
     end_date_time: Optional[str] = None
     transaction_id: Optional[str] = None
     display: Optional[ComponentType] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SignedMeterValueType:
     """
     Represent a signed version of the meter value.
@@ -546,9 +583,10 @@ class SignedMeterValueType:
     signing_method: str
     encoding_method: str
     public_key: str
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class UnitOfMeasureType:
     """
     Represents a UnitOfMeasure with a multiplier
@@ -557,9 +595,10 @@ class UnitOfMeasureType:
 
     unit: Optional[str] = None
     multiplier: Optional[int] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SampledValueType:
     """
     Single sampled value in MeterValues. Each value can be accompanied by
@@ -577,9 +616,10 @@ class SampledValueType:
     location: Optional[E_num.LocationType] = None
     signed_meter_value: Optional[SignedMeterValueType] = None
     unit_of_measure: Optional[UnitOfMeasureType] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class MeterValueType:
     """
     Collection of one or more sampled values in MeterValuesRequest and
@@ -590,9 +630,10 @@ class MeterValueType:
 
     timestamp: str
     sampled_value: List[SampledValueType]
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ModemType:
     """
     Defines parameters required for initiating and maintaining wireless
@@ -602,9 +643,10 @@ class ModemType:
 
     iccid: Optional[str] = None
     imsi: Optional[str] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class VariableMonitoringType:
     """
     A monitoring setting for a variable.
@@ -617,9 +659,10 @@ class VariableMonitoringType:
     value: float
     type: E_num.MonitorType
     severity: int
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class MonitoringDataType:
     """
     Class to hold parameters of SetVariableMonitoring request.
@@ -629,9 +672,10 @@ class MonitoringDataType:
     component: ComponentType
     variable: VariableType
     variable_monitoring: List[VariableMonitoringType]
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class VPNType:
     """
     VPN Configuration settings
@@ -644,9 +688,10 @@ class VPNType:
     key: str
     type: E_num.VPNType
     group: Optional[str] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class NetworkConnectionProfileType:
     """
     The NetworkConnectionProfile defines the functional and technical
@@ -662,9 +707,10 @@ class NetworkConnectionProfileType:
     ocpp_interface: E_num.OCPPInterfaceType
     vpn: Optional[VPNType] = None
     apn: Optional[APNType] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ChargingStationType:
     """
     The physical system where an Electrical Vehicle (EV) can be charged.
@@ -676,9 +722,10 @@ class ChargingStationType:
     modem: Optional[ModemType] = None
     serial_number: Optional[str] = None
     firmware_version: Optional[str] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class OCSPRequestDataType:
     """
     OCSPRequestDataType is used by: AuthorizeRequest,
@@ -690,9 +737,10 @@ class OCSPRequestDataType:
     issuer_key_hash: str
     serial_number: str
     responder_url: str
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class VariableAttributeType:
     """
     Attribute data of a variable.
@@ -704,9 +752,10 @@ class VariableAttributeType:
     mutability: Optional[E_num.MutabilityType] = None
     persistent: Optional[bool] = None
     constant: Optional[bool] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class VariableCharacteristicsType:
     """
     Fixed read-only parameters of a variable.
@@ -719,9 +768,10 @@ class VariableCharacteristicsType:
     min_limit: Optional[float] = None
     max_limit: Optional[float] = None
     values_list: Optional[str] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ReportDataType:
     """
     Class to report components, variables and variable attributes and
@@ -733,9 +783,10 @@ class ReportDataType:
     variable: VariableType
     variable_attribute: List[VariableAttributeType]
     variable_characteristics: Optional[VariableCharacteristicsType] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SalesTariffType:
     """
     This dataType is based on dataTypes from ISO 15118-2.
@@ -746,9 +797,10 @@ class SalesTariffType:
     sales_tariff_entry: List[SalesTariffEntryType]
     sales_tariff_description: Optional[str] = None
     num_e_price_levels: Optional[int] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SetMonitoringDataType:
     """
     Class to hold parameters of SetVariableMonitoring request.
@@ -762,9 +814,10 @@ class SetMonitoringDataType:
     variable: VariableType
     id: Optional[int] = None
     transaction: Optional[bool] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SetMonitoringResultType:
     """
     Class to hold result of SetVariableMonitoring request.
@@ -778,9 +831,10 @@ class SetMonitoringResultType:
     variable: VariableType
     id: Optional[int] = None
     status_info: Optional[StatusInfoType] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SetVariableDataType:
     """SetVariableDataType is used by: SetVariablesRequest"""
 
@@ -788,9 +842,10 @@ class SetVariableDataType:
     component: ComponentType
     variable: VariableType
     attribute_type: Optional[E_num.AttributeType] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SetVariableResultType:
     """SetVariableResultType is used by: SetVariablesResponse"""
 
@@ -799,9 +854,10 @@ class SetVariableResultType:
     variable: VariableType
     attribute_type: Optional[E_num.AttributeType] = None
     attribute_status_info: Optional[StatusInfoType] = None
+    custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class TransactionType:
     """TransactionType is used by: TransactionEventRequest"""
 
@@ -810,3 +866,4 @@ class TransactionType:
     time_spent_charging: Optional[int] = None
     stopped_reason: Optional[E_num.ReasonType] = None
     remote_start_id: Optional[int] = None
+    custom_data: Optional[Dict[str, Any]] = None
@@ -1,9 +1,10 @@
 import warnings
-from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+from OCPP_LIB.dataclass_slots import slotted_dataclass
 
-@dataclass
+
+@slotted_dataclass
 class Authorize:
     id_token: Dict
     certificate: Optional[str] = None
@@ -11,72 +12,72 @@ class Authorize:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class BootNotification:
     charging_station: Dict
     reason: str
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class CancelReservation:
     reservation_id: int
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class CertificateSigned:
     certificate_chain: str
     certificate_type: Optional[str] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ChangeAvailability:
     operational_status: str
     evse: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ClearCache:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ClearChargingProfile:
     charging_profile_id: Optional[int] = None
     charging_profile_criteria: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ClearDisplayMessage:
     id: int
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ClearVariableMonitoring:
     id: List
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ClearedChargingLimit:
     charging_limit_source: str
     evse_id: Optional[int] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class CostUpdated:
     total_cost: float
     transaction_id: str
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class CustomerInformation:
     request_id: int
     report: bool
@@ -87,7 +88,7 @@ class CustomerInformation:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class DataTransfer:
     vendor_id: str
     message_id: Optional[str] = None
@@ -95,20 +96,20 @@ class DataTransfer:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class DeleteCertificate:
     certificate_hash_data: Dict
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class FirmwareStatusNotification:
     status: str
     request_id: Optional[int] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class Get15118EVCertificate:
     iso15118_schema_version: str
     action: str
@@ -116,20 +117,20 @@ class Get15118EVCertificate:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetBaseReport:
     request_id: int
     report_base: str
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetCertificateStatus:
     ocsp_request_data: Dict
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetChargingProfiles:
     request_id: int
     charging_profile: Dict
@@ -137,7 +138,7 @@ class GetChargingProfiles:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetCompositeSchedule:
     duration: int
     evse_id: int
@@ -145,7 +146,7 @@ class GetCompositeSchedule:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetDisplayMessages:
     request_id: int
     id: Optional[List] = None
@@ -154,18 +155,18 @@ class GetDisplayMessages:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetInstalledCertificateIds:
     certificate_type: Optional[List] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetLocalListVersion:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetLog:
     log: Dict
     log_type: str
@@ -175,7 +176,7 @@ class GetLog:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetMonitoringReport:
     request_id: int
     component_variable: Optional[List] = None
@@ -183,7 +184,7 @@ class GetMonitoringReport:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetReport:
     request_id: int
     component_variable: Optional[List] = None
@@ -191,45 +192,45 @@ class GetReport:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetTransactionStatus:
     transaction_id: Optional[str] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class GetVariables:
     get_variable_data: List
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class Heartbeat:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class InstallCertificate:
     certificate_type: str
     certificate: str
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class LogStatusNotification:
     status: str
     request_id: Optional[int] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class MeterValues:
     evse_id: int
     meter_value: List
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class NotifyChargingLimit:
     charging_limit: Dict
     charging_schedule: Optional[List] = None
@@ -237,7 +238,7 @@ class NotifyChargingLimit:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class NotifyCustomerInformation:
     data: str
     seq_no: int
@@ -247,7 +248,7 @@ class NotifyCustomerInformation:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class NotifyDisplayMessages:
     request_id: int
     message_info: Optional[List] = None
@@ -255,7 +256,7 @@ class NotifyDisplayMessages:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class NotifyEVChargingNeeds:
     charging_needs: Dict
     evse_id: int
@@ -263,7 +264,7 @@ class NotifyEVChargingNeeds:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class NotifyEVChargingSchedule:
     time_base: str
     charging_schedule: Dict
@@ -271,7 +272,7 @@ class NotifyEVChargingSchedule:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class NotifyEvent:
     generated_at: str
     seq_no: int
@@ -280,7 +281,7 @@ class NotifyEvent:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class NotifyMonitoringReport:
     request_id: int
     seq_no: int
@@ -290,7 +291,7 @@ class NotifyMonitoringReport:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class NotifyReport:
     request_id: int
     generated_at: str
@@ -300,7 +301,7 @@ class NotifyReport:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class PublishFirmware:
     location: str
     checksum: str
@@ -310,7 +311,7 @@ class PublishFirmware:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class PublishFirmwareStatusNotification:
     status: str
     location: Optional[List] = None
@@ -318,7 +319,7 @@ class PublishFirmwareStatusNotification:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ReportChargingProfiles:
     request_id: int
     charging_limit_source: str
@@ -328,7 +329,7 @@ class ReportChargingProfiles:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class RequestStartTransaction:
     id_token: Dict
     remote_start_id: int
@@ -338,20 +339,20 @@ class RequestStartTransaction:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class RequestStopTransaction:
     transaction_id: str
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ReservationStatusUpdate:
     reservation_id: int
     reservation_update_status: str
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class ReserveNow:
     id: int
     expiry_date_time: str
@@ -362,14 +363,14 @@ class ReserveNow:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class Reset:
     type: str
     evse_id: Optional[int] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SecurityEventNotification:
     type: str
     timestamp: str
@@ -377,7 +378,7 @@ class SecurityEventNotification:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SendLocalList:
     version_number: int
     update_type: str
@@ -385,58 +386,58 @@ class SendLocalList:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SetChargingProfile:
     evse_id: int
     charging_profile: Dict
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SetDisplayMessage:
     message: Dict
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SetMonitoringBase:
     monitoring_base: str
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SetMonitoringLevel:
     severity: int
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SetNetworkProfile:
     configuration_slot: int
     connection_data: Dict
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SetVariableMonitoring:
     set_monitoring_data: List
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SetVariables:
     set_variable_data: List
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class SignCertificate:
     csr: str
     certificate_type: Optional[str] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class StatusNotification:
     timestamp: str
     connector_status: str
@@ -445,7 +446,7 @@ class StatusNotification:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class TransactionEvent:
     event_type: str
     timestamp: str
@@ -462,27 +463,27 @@ class TransactionEvent:
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class TriggerMessage:
     requested_message: str
     evse: Optional[Dict] = None
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class UnlockConnector:
     evse_id: int
     connector_id: int
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class UnpublishFirmware:
     checksum: str
     custom_data: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@slotted_dataclass
 class UpdateFirmware:
     request_id: int
     firmware: Dict
@@ -492,7 +493,7 @@ class UpdateFirmware:
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class AuthorizePayload(Authorize):
     def __post_init__(self):
         warnings.warn(
@@ -505,7 +506,7 @@ class AuthorizePayload(Authorize):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class BootNotificationPayload(BootNotification):
     def __post_init__(self):
         warnings.warn(
@@ -518,7 +519,7 @@ class BootNotificationPayload(BootNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class CancelReservationPayload(CancelReservation):
     def __post_init__(self):
         warnings.warn(
@@ -531,7 +532,7 @@ class CancelReservationPayload(CancelReservation):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class CertificateSignedPayload(CertificateSigned):
     def __post_init__(self):
         warnings.warn(
@@ -544,7 +545,7 @@ class CertificateSignedPayload(CertificateSigned):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ChangeAvailabilityPayload(ChangeAvailability):
     def __post_init__(self):
         warnings.warn(
@@ -557,7 +558,7 @@ class ChangeAvailabilityPayload(ChangeAvailability):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ClearCachePayload(ClearCache):
     def __post_init__(self):
         warnings.warn(
@@ -570,7 +571,7 @@ class ClearCachePayload(ClearCache):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ClearChargingProfilePayload(ClearChargingProfile):
     def __post_init__(self):
         warnings.warn(
@@ -583,7 +584,7 @@ class ClearChargingProfilePayload(ClearChargingProfile):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ClearDisplayMessagePayload(ClearDisplayMessage):
     def __post_init__(self):
         warnings.warn(
@@ -596,7 +597,7 @@ class ClearDisplayMessagePayload(ClearDisplayMessage):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ClearVariableMonitoringPayload(ClearVariableMonitoring):
     def __post_init__(self):
         warnings.warn(
@@ -609,7 +610,7 @@ class ClearVariableMonitoringPayload(ClearVariableMonitoring):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ClearedChargingLimitPayload(ClearedChargingLimit):
     def __post_init__(self):
         warnings.warn(
@@ -622,7 +623,7 @@ class ClearedChargingLimitPayload(ClearedChargingLimit):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class CostUpdatedPayload(CostUpdated):
     def __post_init__(self):
         warnings.warn(
@@ -635,7 +636,7 @@ class CostUpdatedPayload(CostUpdated):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class CustomerInformationPayload(CustomerInformation):
     def __post_init__(self):
         warnings.warn(
@@ -648,7 +649,7 @@ class CustomerInformationPayload(CustomerInformation):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class DataTransferPayload(DataTransfer):
     def __post_init__(self):
         warnings.warn(
@@ -661,7 +662,7 @@ class DataTransferPayload(DataTransfer):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class DeleteCertificatePayload(DeleteCertificate):
     def __post_init__(self):
         warnings.warn(
@@ -674,7 +675,7 @@ class DeleteCertificatePayload(DeleteCertificate):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class FirmwareStatusNotificationPayload(FirmwareStatusNotification):
     def __post_init__(self):
         warnings.warn(
@@ -687,7 +688,7 @@ class FirmwareStatusNotificationPayload(FirmwareStatusNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class Get15118EVCertificatePayload(Get15118EVCertificate):
     def __post_init__(self):
         warnings.warn(
@@ -700,7 +701,7 @@ class Get15118EVCertificatePayload(Get15118EVCertificate):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetBaseReportPayload(GetBaseReport):
     def __post_init__(self):
         warnings.warn(
@@ -713,7 +714,7 @@ class GetBaseReportPayload(GetBaseReport):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetCertificateStatusPayload(GetCertificateStatus):
     def __post_init__(self):
         warnings.warn(
@@ -726,7 +727,7 @@ class GetCertificateStatusPayload(GetCertificateStatus):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetChargingProfilesPayload(GetChargingProfiles):
     def __post_init__(self):
         warnings.warn(
@@ -739,7 +740,7 @@ class GetChargingProfilesPayload(GetChargingProfiles):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetCompositeSchedulePayload(GetCompositeSchedule):
     def __post_init__(self):
         warnings.warn(
@@ -752,7 +753,7 @@ class GetCompositeSchedulePayload(GetCompositeSchedule):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetDisplayMessagesPayload(GetDisplayMessages):
     def __post_init__(self):
         warnings.warn(
@@ -765,7 +766,7 @@ class GetDisplayMessagesPayload(GetDisplayMessages):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetInstalledCertificateIdsPayload(GetInstalledCertificateIds):
     def __post_init__(self):
         warnings.warn(
@@ -778,7 +779,7 @@ class GetInstalledCertificateIdsPayload(GetInstalledCertificateIds):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetLocalListVersionPayload(GetLocalListVersion):
     def __post_init__(self):
         warnings.warn(
@@ -791,7 +792,7 @@ class GetLocalListVersionPayload(GetLocalListVersion):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetLogPayload(GetLog):
     def __post_init__(self):
         warnings.warn(
@@ -804,7 +805,7 @@ class GetLogPayload(GetLog):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetMonitoringReportPayload(GetMonitoringReport):
     def __post_init__(self):
         warnings.warn(
@@ -817,7 +818,7 @@ class GetMonitoringReportPayload(GetMonitoringReport):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetReportPayload(GetReport):
     def __post_init__(self):
         warnings.warn(
@@ -830,7 +831,7 @@ class GetReportPayload(GetReport):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetTransactionStatusPayload(GetTransactionStatus):
     def __post_init__(self):
         warnings.warn(
@@ -843,7 +844,7 @@ class GetTransactionStatusPayload(GetTransactionStatus):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class GetVariablesPayload(GetVariables):
     def __post_init__(self):
         warnings.warn(
@@ -856,7 +857,7 @@ class GetVariablesPayload(GetVariables):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class HeartbeatPayload(Heartbeat):
     def __post_init__(self):
         warnings.warn(
@@ -869,7 +870,7 @@ class HeartbeatPayload(Heartbeat):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class InstallCertificatePayload(InstallCertificate):
     def __post_init__(self):
         warnings.warn(
@@ -882,7 +883,7 @@ class InstallCertificatePayload(InstallCertificate):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class LogStatusNotificationPayload(LogStatusNotification):
     def __post_init__(self):
         warnings.warn(
@@ -895,7 +896,7 @@ class LogStatusNotificationPayload(LogStatusNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class MeterValuesPayload(MeterValues):
     def __post_init__(self):
         warnings.warn(
@@ -908,7 +909,7 @@ class MeterValuesPayload(MeterValues):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class NotifyChargingLimitPayload(NotifyChargingLimit):
     def __post_init__(self):
         warnings.warn(
@@ -921,7 +922,7 @@ class NotifyChargingLimitPayload(NotifyChargingLimit):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class NotifyCustomerInformationPayload(NotifyCustomerInformation):
     def __post_init__(self):
         warnings.warn(
@@ -934,7 +935,7 @@ class NotifyCustomerInformationPayload(NotifyCustomerInformation):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class NotifyDisplayMessagesPayload(NotifyDisplayMessages):
     def __post_init__(self):
         warnings.warn(
@@ -947,7 +948,7 @@ class NotifyDisplayMessagesPayload(NotifyDisplayMessages):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class NotifyEVChargingNeedsPayload(NotifyEVChargingNeeds):
     def __post_init__(self):
         warnings.warn(
@@ -960,7 +961,7 @@ class NotifyEVChargingNeedsPayload(NotifyEVChargingNeeds):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class NotifyEVChargingSchedulePayload(NotifyEVChargingSchedule):
     def __post_init__(self):
         warnings.warn(
@@ -973,7 +974,7 @@ class NotifyEVChargingSchedulePayload(NotifyEVChargingSchedule):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class NotifyEventPayload(NotifyEvent):
     def __post_init__(self):
         warnings.warn(
@@ -986,7 +987,7 @@ class NotifyEventPayload(NotifyEvent):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class NotifyMonitoringReportPayload(NotifyMonitoringReport):
     def __post_init__(self):
         warnings.warn(
@@ -999,7 +1000,7 @@ class NotifyMonitoringReportPayload(NotifyMonitoringReport):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class NotifyReportPayload(NotifyReport):
     def __post_init__(self):
         warnings.warn(
@@ -1012,7 +1013,7 @@ class NotifyReportPayload(NotifyReport):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class PublishFirmwarePayload(PublishFirmware):
     def __post_init__(self):
         warnings.warn(
@@ -1025,7 +1026,7 @@ class PublishFirmwarePayload(PublishFirmware):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class PublishFirmwareStatusNotificationPayload(PublishFirmwareStatusNotification):
     def __post_init__(self):
         warnings.warn(
@@ -1038,7 +1039,7 @@ class PublishFirmwareStatusNotificationPayload(PublishFirmwareStatusNotification
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ReportChargingProfilesPayload(ReportChargingProfiles):
     def __post_init__(self):
         warnings.warn(
@@ -1051,7 +1052,7 @@ class ReportChargingProfilesPayload(ReportChargingProfiles):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class RequestStartTransactionPayload(RequestStartTransaction):
     def __post_init__(self):
         warnings.warn(
@@ -1064,7 +1065,7 @@ class RequestStartTransactionPayload(RequestStartTransaction):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class RequestStopTransactionPayload(RequestStopTransaction):
     def __post_init__(self):
         warnings.warn(
@@ -1077,7 +1078,7 @@ class RequestStopTransactionPayload(RequestStopTransaction):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ReservationStatusUpdatePayload(ReservationStatusUpdate):
     def __post_init__(self):
         warnings.warn(
@@ -1090,7 +1091,7 @@ class ReservationStatusUpdatePayload(ReservationStatusUpdate):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ReserveNowPayload(ReserveNow):
     def __post_init__(self):
         warnings.warn(
@@ -1103,7 +1104,7 @@ class ReserveNowPayload(ReserveNow):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class ResetPayload(Reset):
     def __post_init__(self):
         warnings.warn(
@@ -1116,7 +1117,7 @@ class ResetPayload(Reset):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SecurityEventNotificationPayload(SecurityEventNotification):
     def __post_init__(self):
         warnings.warn(
@@ -1129,7 +1130,7 @@ class SecurityEventNotificationPayload(SecurityEventNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SendLocalListPayload(SendLocalList):
     def __post_init__(self):
         warnings.warn(
@@ -1142,7 +1143,7 @@ class SendLocalListPayload(SendLocalList):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SetChargingProfilePayload(SetChargingProfile):
     def __post_init__(self):
         warnings.warn(
@@ -1155,7 +1156,7 @@ class SetChargingProfilePayload(SetChargingProfile):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SetDisplayMessagePayload(SetDisplayMessage):
     def __post_init__(self):
         warnings.warn(
@@ -1168,7 +1169,7 @@ class SetDisplayMessagePayload(SetDisplayMessage):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SetMonitoringBasePayload(SetMonitoringBase):
     def __post_init__(self):
         warnings.warn(
@@ -1181,7 +1182,7 @@ class SetMonitoringBasePayload(SetMonitoringBase):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SetMonitoringLevelPayload(SetMonitoringLevel):
     def __post_init__(self):
         warnings.warn(
@@ -1194,7 +1195,7 @@ class SetMonitoringLevelPayload(SetMonitoringLevel):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SetNetworkProfilePayload(SetNetworkProfile):
     def __post_init__(self):
         warnings.warn(
@@ -1207,7 +1208,7 @@ class SetNetworkProfilePayload(SetNetworkProfile):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SetVariableMonitoringPayload(SetVariableMonitoring):
     def __post_init__(self):
         warnings.warn(
@@ -1220,7 +1221,7 @@ class SetVariableMonitoringPayload(SetVariableMonitoring):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SetVariablesPayload(SetVariables):
     def __post_init__(self):
         warnings.warn(
@@ -1233,7 +1234,7 @@ class SetVariablesPayload(SetVariables):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class SignCertificatePayload(SignCertificate):
     def __post_init__(self):
         warnings.warn(
@@ -1246,7 +1247,7 @@ class SignCertificatePayload(SignCertificate):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class StatusNotificationPayload(StatusNotification):
     def __post_init__(self):
         warnings.warn(
@@ -1259,7 +1260,7 @@ class StatusNotificationPayload(StatusNotification):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class TransactionEventPayload(TransactionEvent):
     def __post_init__(self):
         warnings.warn(
@@ -1272,7 +1273,7 @@ class TransactionEventPayload(TransactionEvent):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class TriggerMessagePayload(TriggerMessage):
     def __post_init__(self):
         warnings.warn(
@@ -1285,7 +1286,7 @@ class TriggerMessagePayload(TriggerMessage):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class UnlockConnectorPayload(UnlockConnector):
     def __post_init__(self):
         warnings.warn(
@@ -1298,7 +1299,7 @@ class UnlockConnectorPayload(UnlockConnector):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class UnpublishFirmwarePayload(UnpublishFirmware):
     def __post_init__(self):
         warnings.warn(
@@ -1311,7 +1312,7 @@ class UnpublishFirmwarePayload(UnpublishFirmware):
 
 
 # Dataclass soon to be deprecated use equal class name without the suffix 'Payload'
-@dataclass
+@slotted_dataclass
 class UpdateFirmwarePayload(UpdateFirmware):
     def __post_init__(self):
         warnings.warn(
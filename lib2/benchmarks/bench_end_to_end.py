@@ -0,0 +1,157 @@
+""" Measure the latency and throughput of Calls between charge points in one
+process.
+
+Run it from the root of the repository:
+
+    $ python -m benchmarks.bench_end_to_end
+    $ python -m benchmarks.bench_end_to_end --connections 100 --number 50
+    $ python -m benchmarks.bench_end_to_end --latency 0.005 --jitter 0.002
+
+`--connections` CSMS-side `ver201.ChargePoint`s are connected to as many
+station-side ones by in-memory connections, see `OCPP_LIB.loopback`. For
+every action each station sends `--number` Calls, one after another, while
+all stations run concurrently. The latency from calling `ChargePoint.call()`
+until it returns the CallResult includes validation, serialization and
+routing on both sides. Frames per second counts Calls and CallResults.
+
+`--latency` and `--jitter` delay every frame, to see how the library behaves
+when most of the time is spent waiting on the network.
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.bench_codec import _sampled_values
+from benchmarks.replay import PERCENTILES, percentile
+from OCPP_LIB.loopback import connection_pair
+from OCPP_LIB.ocpp_routing import on
+from OCPP_LIB.ver201 import ChargePoint, ocpp_request, ocpp_response
+
+_TIMESTAMP = "2024-04-05T12:00:00Z"
+
+
+class CentralSystem(ChargePoint):
+    @on("BootNotification")
+    def on_boot_notification(self, **kwargs):
+        return ocpp_response.BootNotification(
+            current_time=_TIMESTAMP, interval=300, status="Accepted"
+        )
+
+    @on("Heartbeat")
+    def on_heartbeat(self, **kwargs):
+        return ocpp_response.Heartbeat(current_time=_TIMESTAMP)
+
+    @on("StatusNotification")
+    def on_status_notification(self, **kwargs):
+        return ocpp_response.StatusNotification()
+
+    @on("TransactionEvent")
+    def on_transaction_event(self, **kwargs):
+        return ocpp_response.TransactionEvent(total_cost=1.5)
+
+    @on("MeterValues")
+    def on_meter_values(self, **kwargs):
+        return ocpp_response.MeterValues()
+
+
+def _meter_value():
+    return [{"timestamp": _TIMESTAMP, "sampledValue": _sampled_values(8)}]
+
+
+def requests():
+    """Return a list of tuples (action, function returning a request)."""
+    return [
+        (
+            "BootNotification",
+            lambda: ocpp_request.BootNotification(
+                charging_station={"model": "SingleSocketCharger", "vendorName": "X"},
+                reason="PowerUp",
+            ),
+        ),
+        ("Heartbeat", lambda: ocpp_request.Heartbeat()),
+        (
+            "StatusNotification",
+            lambda: ocpp_request.StatusNotification(
+                timestamp=_TIMESTAMP,
+                connector_status="Occupied",
+                evse_id=1,
+                connector_id=1,
+            ),
+        ),
+        (
+            "TransactionEvent",
+            lambda: ocpp_request.TransactionEvent(
+                event_type="Updated",
+                timestamp=_TIMESTAMP,
+                trigger_reason="MeterValuePeriodic",
+                seq_no=1,
+                transaction_info={"transactionId": "TX-1"},
+                meter_value=_meter_value(),
+            ),
+        ),
+        (
+            "MeterValues",
+            lambda: ocpp_request.MeterValues(evse_id=1, meter_value=_meter_value()),
+        ),
+    ]
+
+
+async def _run_action(stations, create_request, number):
+    latencies = []
+
+    async def send(station):
+        for _ in range(number):
+            request = create_request()
+            start = time.perf_counter()
+            await station.call(request)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send(station) for station in stations))
+    return time.perf_counter() - start, sorted(latencies)
+
+
+async def run(connections, number, latency, jitter):
+    stations = []
+    tasks = []
+    for i in range(connections):
+        csms_connection, station_connection = connection_pair(latency, jitter, seed=i)
+        csms = CentralSystem(f"CP_{i}", csms_connection)
+        station = ChargePoint(f"CP_{i}", station_connection)
+        stations.append(station)
+        tasks += [
+            asyncio.ensure_future(csms.start()),
+            asyncio.ensure_future(station.start()),
+        ]
+
+    columns = "".join(f"{f'p{q} (ms)':>10}" for q in PERCENTILES)
+    print(f"{'action':<20} {'calls':>7} {'calls/s':>9} {'frames/s':>9}{columns}")
+
+    for action, create_request in requests():
+        elapsed, latencies = await _run_action(stations, create_request, number)
+        columns = "".join(
+            f"{percentile(latencies, q) * 1e3:>10.2f}" for q in PERCENTILES
+        )
+        print(
+            f"{action:<20} {len(latencies):>7} {len(latencies) / elapsed:>9.0f} "
+            f"{2 * len(latencies) / elapsed:>9.0f}{columns}"
+        )
+
+    for station in stations:
+        await station._connection.close()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--connections", type=int, default=10)
+    parser.add_argument("--number", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.connections, args.number, args.latency, args.jitter))
+
+
+if __name__ == "__main__":
+    main()
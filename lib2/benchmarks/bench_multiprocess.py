@@ -0,0 +1,161 @@
+""" Measure how connection capacity and throughput scale with worker processes.
+
+Run it from the root of the repository; it needs the 'websockets' package:
+
+    $ python -m benchmarks.bench_multiprocess
+    $ python -m benchmarks.bench_multiprocess --workers 1 --workers 2 \\
+        --workers 4 --connections 2000 --number 20
+
+For every number of `--workers` a `Supervisor` starts that many processes,
+which share one port with SO_REUSEPORT, see `OCPP_LIB.supervisor`. Each runs
+a WebSocket server with the CSMS of `benchmarks/bench_end_to_end.py`.
+`--clients` processes then open `--connections` WebSocket connections in
+total, and every connection sends `--number` Heartbeats, one after another.
+
+The connect rate shows the connection capacity, the Calls per second the
+message throughput. Both should grow with the number of workers, up to the
+number of cores, as long as the clients aren't the bottleneck: run them with
+as many processes as there are cores, or on another machine.
+"""
+import argparse
+import asyncio
+import os
+import socket
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import websockets
+
+from benchmarks.bench_end_to_end import CentralSystem
+from benchmarks.replay import PERCENTILES, percentile
+from OCPP_LIB.supervisor import Supervisor
+from OCPP_LIB.ver201 import ChargePoint, ocpp_request
+
+
+async def on_connect(websocket, path=None):
+    if path is None:
+        path = websocket.request.path
+    try:
+        await CentralSystem(path.strip("/"), websocket).start()
+    except websockets.ConnectionClosed:
+        pass
+
+
+async def serve(sock):
+    """Serve the CSMS on the listening socket of a worker."""
+    server = await websockets.serve(on_connect, sock=sock, subprotocols=["ocpp2.0.1"])
+    await server.wait_closed()
+
+
+async def _client(port, charge_point_ids, number):
+    """Connect the charge points, then send the Heartbeats. Return the time
+    it took to connect, the time it took to send and the latencies."""
+    start = time.perf_counter()
+    connections = await asyncio.gather(
+        *(
+            websockets.connect(
+                f"ws://127.0.0.1:{port}/{charge_point_id}",
+                subprotocols=["ocpp2.0.1"],
+                open_timeout=60,
+            )
+            for charge_point_id in charge_point_ids
+        )
+    )
+    connect_time = time.perf_counter() - start
+
+    stations = [
+        ChargePoint(charge_point_id, connection)
+        for charge_point_id, connection in zip(charge_point_ids, connections)
+    ]
+    tasks = [asyncio.ensure_future(station.start()) for station in stations]
+    latencies = []
+
+    async def send(station):
+        for _ in range(number):
+            start = time.perf_counter()
+            await station.call(ocpp_request.Heartbeat())
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send(station) for station in stations))
+    send_time = time.perf_counter() - start
+
+    await asyncio.gather(*(connection.close() for connection in connections))
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return connect_time, send_time, latencies
+
+
+def _run_client(port, charge_point_ids, number):
+    return asyncio.run(_client(port, charge_point_ids, number))
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _wait_for_workers(supervisor, timeout=60):
+    deadline = time.monotonic() + timeout
+    while not all(worker.metrics for worker in supervisor._workers):
+        if time.monotonic() > deadline:
+            raise TimeoutError("Workers didn't start")
+        await asyncio.sleep(0.1)
+
+
+async def run(workers, connections, number, clients):
+    port = _free_port()
+    supervisor = Supervisor(
+        serve, workers=workers, host="127.0.0.1", port=port, report_interval=0.2
+    )
+    task = asyncio.ensure_future(supervisor.serve())
+    try:
+        await _wait_for_workers(supervisor)
+
+        ids = [f"CP_{i}" for i in range(connections)]
+        groups = [ids[i::clients] for i in range(clients)]
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=clients) as executor:
+            results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(executor, _run_client, port, group, number)
+                    for group in groups
+                    if group
+                )
+            )
+    finally:
+        supervisor.stop()
+        await task
+
+    connect_time = max(result[0] for result in results)
+    send_time = max(result[1] for result in results)
+    latencies = sorted(value for result in results for value in result[2])
+    columns = "".join(f"{percentile(latencies, q) * 1e3:>10.2f}" for q in PERCENTILES)
+    print(
+        f"{workers:>7} {connections:>11} {connections / connect_time:>13.0f} "
+        f"{len(latencies):>7} {len(latencies) / send_time:>9.0f}{columns}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--workers", type=int, action="append")
+    parser.add_argument("--connections", type=int, default=500)
+    parser.add_argument("--number", type=int, default=10)
+    parser.add_argument("--clients", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    workers = args.workers or sorted({1, max(cores // 2, 1), cores})
+    print(f"{cores} cores, {args.clients} client processes")
+    columns = "".join(f"{f'p{q} (ms)':>10}" for q in PERCENTILES)
+    print(
+        f"{'workers':>7} {'connections':>11} {'connects/s':>13} "
+        f"{'calls':>7} {'calls/s':>9}{columns}"
+    )
+    for count in workers:
+        asyncio.run(run(count, args.connections, args.number, args.clients))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+""" Measure the latency of responses to a slow peer flooded with bulk reports.
+
+Run it from the root of the repository:
+
+    $ python -m benchmarks.bench_send_queue
+    $ python -m benchmarks.bench_send_queue --senders 50 --delay 0.002
+
+A peer that reads one frame per `--delay` seconds is sent frames through a
+`SendQueue`, see `OCPP_LIB.send_queue`. `--senders` coroutines send
+NotifyReport-sized frames of `--size` bytes as fast as they can, and another
+one sends a response every 10 ms, `--responses` times. This is done once with
+the priority classes and once with every frame in the same class, i.e. first
+in, first out.
+
+The latency of a response is the time from sending it until it's written.
+With priorities it should be about the time to write one frame, without them
+it grows with the size of the queue. The peak queue size shows that memory
+stays bounded by `--max-size` however many frames are sent.
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.replay import PERCENTILES, percentile
+from OCPP_LIB.send_queue import BULK, DEFAULT, RESPONSE, SendQueue
+
+
+async def run(use_priorities, senders, size, responses, delay, max_size):
+    # Without priorities every frame is sent in the same class.
+    bulk_priority = BULK if use_priorities else DEFAULT
+    response_priority = RESPONSE if use_priorities else DEFAULT
+    written = {}
+    peak = 0
+
+    async def write(frame):
+        await asyncio.sleep(delay)
+        written[frame] = time.perf_counter()
+
+    queue = SendQueue(write, max_size=max_size)
+
+    async def send_bulk(index):
+        nonlocal peak
+        count = 0
+        while True:
+            await queue.put(f"{index}:{count}:".ljust(size, "x"), bulk_priority)
+            peak = max(peak, queue.size)
+            count += 1
+
+    async def send_responses():
+        latencies = []
+        for i in range(responses):
+            frame = f"response {i}"
+            start = time.perf_counter()
+            await queue.put(frame, response_priority)
+            while frame not in written:
+                await asyncio.sleep(0.001)
+            latencies.append(written[frame] - start)
+            await asyncio.sleep(0.01)
+        return latencies
+
+    tasks = [asyncio.ensure_future(send_bulk(i)) for i in range(senders)]
+    latencies = sorted(await send_responses())
+    queue.close()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    columns = "".join(f"{percentile(latencies, q) * 1e3:>10.1f}" for q in PERCENTILES)
+    name = "priority" if use_priorities else "fifo"
+    print(f"{name:<10}{columns} {peak / 1024:>14.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--senders", type=int, default=20)
+    parser.add_argument("--size", type=int, default=20000)
+    parser.add_argument("--responses", type=int, default=100)
+    parser.add_argument("--delay", type=float, default=0.001)
+    parser.add_argument("--max-size", type=int, default=1024 * 1024)
+    args = parser.parse_args()
+
+    columns = "".join(f"{f'p{q} (ms)':>10}" for q in PERCENTILES)
+    print(f"{'':<10}{columns} {'peak queue (KiB)':>14}")
+    for use_priorities in (True, False):
+        asyncio.run(
+            run(
+                use_priorities,
+                args.senders,
+                args.size,
+                args.responses,
+                args.delay,
+                args.max_size,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+""" Measure startup time, memory and cold-path latency of schema validation.
+
+Run it from the root of the repository:
+
+    $ python -m benchmarks.bench_startup
+
+Every scenario runs in a fresh interpreter. A scenario loads the schemas either
+from the bundles created by `scripts/bundle_schemas.py` or from the individual
+schema files, and either preloads all validators with `preload()` or creates
+them lazily. For every scenario the following is reported:
+
+* the time `preload()` takes;
+* the memory allocated by loading schemas and building validators;
+* the latency of validating the first message of 10 different actions,
+  which is what the first messages after a deploy pay.
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from benchmarks.payloads import OCPP_VERSIONS, generate_payload, iter_schemas
+
+# The first messages a CSMS typically receives after a restart.
+_COLD_ACTIONS = [
+    "BootNotification",
+    "Heartbeat",
+    "StatusNotification",
+    "Authorize",
+    "MeterValues",
+    "TransactionEvent",
+    "StartTransaction",
+    "StopTransaction",
+    "NotifyReport",
+    "DataTransfer",
+]
+
+
+def child(bundle, preload, engine, trace):
+    """Run a single scenario and print the results as JSON.
+
+    Tracing memory allocations slows down Python considerably. Therefore
+    memory is only measured when `trace` is `True`, and timings only when it
+    is `False`.
+    """
+    if trace:
+        tracemalloc.start()
+
+    from OCPP_LIB import ocpp_messages
+    from OCPP_LIB.ocpp_messages import Call, MessageType, validate_payload
+
+    if not bundle:
+        for ocpp_version in OCPP_VERSIONS:
+            ocpp_messages._schema_bundles[ocpp_version] = None
+
+    baseline = tracemalloc.get_traced_memory()[0] if trace else 0
+
+    preload_time = 0.0
+    if preload:
+        start = time.perf_counter()
+        ocpp_messages.preload(versions=OCPP_VERSIONS, engine=engine)
+        preload_time = time.perf_counter() - start
+
+    messages = [
+        (ocpp_version, Call("1", action, generate_payload(schema)))
+        for ocpp_version in OCPP_VERSIONS
+        for action, message_type_id, schema in iter_schemas(ocpp_version)
+        if action in _COLD_ACTIONS and message_type_id == MessageType.Call
+    ]
+
+    latencies = []
+    for ocpp_version, message in messages:
+        start = time.perf_counter()
+        validate_payload(message, ocpp_version, engine)
+        latencies.append(time.perf_counter() - start)
+
+    memory = tracemalloc.get_traced_memory()[0] - baseline if trace else 0
+    print(
+        json.dumps(
+            {
+                "preload_ms": preload_time * 1e3,
+                "memory_kib": memory / 1024,
+                "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                "first_message_ms": sum(latencies) * 1e3,
+                "first_message_max_ms": max(latencies) * 1e3,
+                "messages": len(latencies),
+            }
+        )
+    )
+
+
+def _run_child(bundle, preload, engine, trace):
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.bench_startup",
+            "--child",
+            json.dumps([bundle, preload, engine, trace]),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def run(engines, runs):
+    print(
+        f"{'engine':<11} {'schemas':<8} {'preload':<8} {'preload (ms)':>13} "
+        f"{'memory (KiB)':>13} {'max rss (KiB)':>14} "
+        f"{'cold total (ms)':>16} {'cold max (ms)':>14}"
+    )
+    for engine in engines:
+        for bundle in [False, True]:
+            for preload in [False, True]:
+                results = [
+                    _run_child(bundle, preload, engine, trace=False)
+                    for _ in range(runs)
+                ]
+                # Report the median run.
+                result = sorted(results, key=lambda r: r["first_message_ms"])[
+                    len(results) // 2
+                ]
+                memory = _run_child(bundle, preload, engine, trace=True)
+
+                print(
+                    f"{engine:<11} {'bundle' if bundle else 'files':<8} "
+                    f"{'yes' if preload else 'no':<8} "
+                    f"{result['preload_ms']:>13.2f} {memory['memory_kib']:>13.0f} "
+                    f"{result['max_rss_kib']:>14} "
+                    f"{result['first_message_ms']:>16.2f} "
+                    f"{result['first_message_max_ms']:>14.2f}"
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--engine",
+        choices=["jsonschema", "compiled"],
+        action="append",
+        dest="engines",
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(*json.loads(args.child))
+        return
+
+    run(args.engines or ["jsonschema", "compiled"], args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+""" Compare the validation engines of `validate_payload()` for every action.
+
+Run it from the root of the repository:
+
+    $ python -m benchmarks.bench_validation
+    $ python -m benchmarks.bench_validation --version 2.0.1 --number 5000
+
+For every schema a payload is generated that contains all optional properties.
+The time it takes to validate that payload is measured for both engines.
+"""
+import argparse
+import functools
+import timeit
+
+from benchmarks.payloads import OCPP_VERSIONS, generate_payload, iter_schemas
+from OCPP_LIB.ocpp_messages import Call, CallResult, MessageType, validate_payload
+
+
+def _message(action, message_type_id, payload):
+    if message_type_id == MessageType.Call:
+        return Call(unique_id="1", action=action, payload=payload)
+    return CallResult(unique_id="1", action=action, payload=payload)
+
+
+def run(ocpp_versions, number, repeat):
+    print(
+        f"{'version':<8} {'message':<48} {'jsonschema (us)':>16} "
+        f"{'compiled (us)':>14} {'speedup':>8}"
+    )
+
+    totals = {"jsonschema": 0.0, "compiled": 0.0}
+    for ocpp_version in ocpp_versions:
+        for action, message_type_id, schema in iter_schemas(ocpp_version):
+            message = _message(action, message_type_id, generate_payload(schema))
+            results = {}
+            for engine in totals:
+                validate = functools.partial(
+                    validate_payload, message, ocpp_version, engine
+                )
+                # Warm up the cache of validators, so that loading the schema
+                # isn't measured.
+                validate()
+                timings = timeit.repeat(validate, number=number, repeat=repeat)
+                results[engine] = min(timings) / number * 1e6
+                totals[engine] += results[engine]
+
+            kind = "Call" if message_type_id == MessageType.Call else "CallResult"
+            print(
+                f"{ocpp_version:<8} {action + ' ' + kind:<48} "
+                f"{results['jsonschema']:>16.2f} {results['compiled']:>14.2f} "
+                f"{results['jsonschema'] / results['compiled']:>7.1f}x"
+            )
+
+    print(
+        f"{'total':<57} {totals['jsonschema']:>16.2f} {totals['compiled']:>14.2f} "
+        f"{totals['jsonschema'] / totals['compiled']:>7.1f}x"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--version", choices=OCPP_VERSIONS, action="append", dest="versions"
+    )
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run(args.versions or OCPP_VERSIONS, args.number, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+"""Pack all JSON schemas of an OCPP version into a single bundle file.
+
+    $ ./scripts/bundle_schemas.py OCPP_LIB/ver16/schemas
+    $ ./scripts/bundle_schemas.py OCPP_LIB/ver201/schemas
+
+The bundle is written next to the folder with schemas, as
+`schemas_bundle.json`. It maps the name of every schema, e.g.
+'BootNotificationResponse', to its content. `OCPP_LIB.ocpp_messages` reads the
+bundle instead of the individual schemas when it exists. Run this script again
+after a schema has been changed.
+"""
+import json
+import sys
+from pathlib import Path
+
+
+def create_bundle(path):
+    bundle = {}
+    for schema in sorted(path.glob("*.json")):
+        # The JSON schemas for OCPP 2.0 start with a byte order mark (BOM).
+        with open(schema, "r", encoding="utf-8-sig") as f:
+            bundle[schema.stem] = json.loads(f.read())
+
+    return bundle
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Pass path to folder with schemas")
+        sys.exit(-1)
+
+    p = Path(sys.argv[1])
+    bundle = create_bundle(p)
+
+    with open(p.parent / "schemas_bundle.json", "w", encoding="utf-8") as f:
+        # Compact separators keep the bundle small and fast to parse.
+        f.write(json.dumps(bundle, separators=(",", ":"), ensure_ascii=False))
+
+    print(f"Bundled {len(bundle)} schemas into {p.parent / 'schemas_bundle.json'}")
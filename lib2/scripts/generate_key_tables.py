@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""Generate `OCPP_LIB/key_tables.py` from the JSON schemas and dataclasses.
+
+Run it from the root of the repository:
+
+    $ python -m scripts.generate_key_tables
+
+For every OCPP version the name of every property in the schemas is mapped
+to its snake_case equivalent. That is the name of the corresponding field of
+the dataclasses in `data_type.py`, `ocpp_request.py` and `ocpp_response.py`.
+If no field exists, the name is derived using the rules of
+`OCPP_LIB.charging_station._camel_to_snake_key()`.
+
+Run this script again after a schema or a dataclass has been changed.
+"""
+import dataclasses
+import importlib
+from pathlib import Path
+
+from OCPP_LIB.charging_station import _camel_to_snake_key, _snake_to_camel_key
+from OCPP_LIB.ocpp_messages import _get_schema_bundle, _list_schema_names
+
+OCPP_VERSIONS = {"1.6": "ver16", "2.0.1": "ver201"}
+
+TABLES_PATH = Path(__file__).resolve().parent.parent / "OCPP_LIB" / "key_tables.py"
+
+HEADER = '''\
+""" Tables that map the camelCase keys of OCPP payloads to snake_case.
+
+This file is generated by `scripts/generate_key_tables.py`. Don't edit it by
+hand.
+"""
+
+'''
+
+
+def _property_names(schema, names):
+    if isinstance(schema, dict):
+        names.update(schema.get("properties", {}))
+        for value in schema.values():
+            _property_names(value, names)
+    elif isinstance(schema, list):
+        for value in schema:
+            _property_names(value, names)
+
+    return names
+
+
+def _field_names(package):
+    names = set()
+    for module_name in ["data_type", "ocpp_request", "ocpp_response"]:
+        module = importlib.import_module(f"OCPP_LIB.{package}.{module_name}")
+        for cls in vars(module).values():
+            if dataclasses.is_dataclass(cls):
+                names.update(field.name for field in dataclasses.fields(cls))
+
+    return names
+
+
+def create_table(ocpp_version):
+    bundle = _get_schema_bundle(ocpp_version)
+    names = set()
+    for schema_name in _list_schema_names(ocpp_version):
+        _property_names(bundle[schema_name], names)
+
+    # Some fields don't follow the rules, e.g. `language_1` for 'language1'.
+    fields = {}
+    for field in _field_names(OCPP_VERSIONS[ocpp_version]):
+        fields.setdefault(_snake_to_camel_key(field), []).append(field)
+
+    table = {}
+    for name in sorted(names):
+        snake_case = _camel_to_snake_key(name)
+        candidates = fields.get(name, [])
+        if snake_case not in candidates and len(candidates) == 1:
+            snake_case = candidates[0]
+        table[name] = snake_case
+
+    if len(set(table.values())) != len(table):
+        raise ValueError(f"Keys of OCPP {ocpp_version} can't be converted uniquely")
+
+    return table
+
+
+def render(tables):
+    lines = [HEADER.rstrip("\n"), "", "CAMEL_TO_SNAKE = {"]
+    for ocpp_version, table in tables.items():
+        lines.append(f'    "{ocpp_version}": {{')
+        for camel_case, snake_case in table.items():
+            lines.append(f'        "{camel_case}": "{snake_case}",')
+        lines.append("    },")
+    lines.append("}")
+
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    tables = {version: create_table(version) for version in OCPP_VERSIONS}
+
+    with open(TABLES_PATH, "w", encoding="utf-8") as f:
+        f.write(render(tables))
+
+    print(f"Wrote {sum(len(t) for t in tables.values())} keys to {TABLES_PATH}")
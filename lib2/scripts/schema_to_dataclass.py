@@ -36,7 +36,7 @@ class dataclass:
         self.attrs.append(attr)
 
     def __str__(self):
-        output = f"@dataclass\nclass {self.name}Payload:\n"
+        output = f"@slotted_dataclass\nclass {self.name}Payload:\n"
 
         if len(self.attrs) == 0:
             return output + "    pass\n"
@@ -78,19 +78,29 @@ class attribute:
 calls = []
 call_results = []
 
+# The classes are created with `__slots__`, which reduces the memory footprint
+# of every payload. See `OCPP_LIB/dataclass_slots.py`.
+HEADER = (
+    b"from typing import Any, Dict, List, Optional\n\n"
+    b"from OCPP_LIB.dataclass_slots import slotted_dataclass\n"
+)
 
-def parse_schema(schema):
-    with open(schema, "r") as f:
+
+def parse_schema(path):
+    with open(path, "r") as f:
         schema = json.loads(f.read())
 
-    name = schema["$id"].split(":")[-1]
+    # Not every schema has an '$id', and the format of the ones that exist
+    # differs. The names of the files are like 'BootNotificationRequest.json'
+    # or, for OCPP 1.6, 'BootNotification.json'.
+    name = path.stem
 
-    call = False
+    call = True
     call_result = False
     if name.endswith("Request"):
-        call = True
         name = name[: -len("Request")]
     elif name.endswith("Response"):
+        call = False
         call_result = True
         name = name[: -len("Response")]
 
@@ -144,16 +154,14 @@ if __name__ == "__main__":
         parse_schema(schema)
 
     with open("call.py", "wb+") as f:
-        f.write(b"from typing import Any, Dict, List\n")
-        f.write(b"from dataclasses import dataclass, field, Optional\n")
+        f.write(HEADER)
 
         for call in sorted(calls, key=lambda call: call.name):
             f.write(b"\n\n")
             f.write(str(call).encode("utf-8"))
 
     with open("call_result.py", "wb+") as f:
-        f.write(b"from typing import Any, Dict, List\n")
-        f.write(b"from dataclasses import dataclass, field\n")
+        f.write(HEADER)
 
         for call in sorted(call_results, key=lambda call: call.name):
             f.write(b"\n\n")
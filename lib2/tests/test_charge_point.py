@@ -2,10 +2,12 @@ from dataclasses import asdict
 
 import pytest
 
+from OCPP_LIB import key_tables
 from OCPP_LIB.charging_station import (
     camel_to_snake_case,
     remove_nones,
     serialize_as_dict,
+    serialize_payload,
     snake_to_camel_case,
 )
 from OCPP_LIB.ocpp_messages import Call
@@ -108,6 +110,58 @@ def test_snake_to_camel_case(test_input, expected):
     assert result == expected
 
 
+@pytest.mark.parametrize("ocpp_version", ["1.6", "2.0.1"])
+def test_key_tables_round_trip(ocpp_version):
+    """
+    Test that every property of the schemas is converted to snake_case and
+    back to the same camelCase key.
+    """
+    payload = {key: [{key: 1}] for key in key_tables.CAMEL_TO_SNAKE[ocpp_version]}
+
+    snake_case_payload = camel_to_snake_case(payload, ocpp_version)
+
+    assert snake_to_camel_case(snake_case_payload, ocpp_version) == payload
+
+
+@pytest.mark.parametrize(
+    "test_input,expected,ocpp_version",
+    [
+        ({"ocppCsmsUrl": "foo.com"}, {"ocpp_csms_url": "foo.com"}, "2.0.1"),
+        ({"language1": "nl"}, {"language_1": "nl"}, "2.0.1"),
+        ({"bulkSoC": 80}, {"bulk_soc": 80}, "2.0.1"),
+        ({"chargeBoxSerialNumber": "a"}, {"charge_box_serial_number": "a"}, "1.6"),
+        (
+            {"customData": {"vendorId": "a", "vendorSpecificKey": 1}},
+            {"custom_data": {"vendor_id": "a", "vendor_specific_key": 1}},
+            "2.0.1",
+        ),
+    ],
+)
+def test_camel_to_snake_case_and_back_with_ocpp_version(
+    test_input, expected, ocpp_version
+):
+    assert camel_to_snake_case(test_input, ocpp_version) == expected
+    assert snake_to_camel_case(expected, ocpp_version) == test_input
+
+
+def test_key_tables_are_up_to_date():
+    """
+    Test if `OCPP_LIB/key_tables.py` matches the output of
+    `scripts/generate_key_tables.py`.
+    """
+    from scripts.generate_key_tables import (
+        OCPP_VERSIONS,
+        TABLES_PATH,
+        create_table,
+        render,
+    )
+
+    with open(TABLES_PATH, "r", encoding="utf-8") as f:
+        assert f.read() == render(
+            {ocpp_version: create_table(ocpp_version) for ocpp_version in OCPP_VERSIONS}
+        )
+
+
 def test_remove_nones():
     expected_payload = {"charge_point_model": "foo", "charge_point_vendor": "bar"}
 
@@ -283,13 +337,17 @@ def test_serialize_as_dict():
                         "evse": {
                             "id": 1,
                             "connectorId": None,
+                            "customData": None,
                         },
+                        "customData": None,
                     },
                     "variable": {
                         "name": "Variable",
                         "instance": None,
+                        "customData": None,
                     },
                     "attributeType": None,
+                    "customData": None,
                 }
             ],
             "customData": None,
@@ -312,6 +370,100 @@ def test_serialize_as_dict():
     assert serialize_as_dict(payload) == expected
 
 
+def test_serialize_as_dict_with_list_of_dataclasses():
+    """
+    Test that all dataclasses in a list are serialized, not only the last one.
+    """
+    payload = MeterValues(
+        connector_id=1,
+        meter_value=[
+            MeterValue(timestamp="1", sampled_value=[SampledValue(value="10")]),
+            MeterValue(timestamp="2", sampled_value=[SampledValue(value="20")]),
+        ],
+    )
+
+    serialized = serialize_as_dict(payload)
+
+    assert [value["timestamp"] for value in serialized["meter_value"]] == ["1", "2"]
+
+
+def _meter_values_payload():
+    return MeterValues(
+        connector_id=1,
+        meter_value=[
+            MeterValue(
+                timestamp=f"2017-08-17T07:0{i}:06.186748+00:00",
+                sampled_value=[
+                    SampledValue(value="10", measurand="Power.Active.Import"),
+                    SampledValue(value="20", phase="L1", unit="W"),
+                ],
+            )
+            for i in range(3)
+        ],
+        transaction_id=None,
+    )
+
+
+@pytest.mark.parametrize(
+    "payload,ocpp_version",
+    [
+        (_meter_values_payload(), "1.6"),
+        (BootNotification(charge_point_model="foo", charge_point_vendor="bar"), None),
+        (
+            v201GetVariables(
+                get_variable_data=[
+                    GetVariableDataType(
+                        component=ComponentType(name="A", evse=EVSEType(id=1)),
+                        variable=VariableType(name="B"),
+                    ),
+                    GetVariableDataType(
+                        component=ComponentType(name="C"),
+                        variable=VariableType(name="D", instance="E"),
+                    ),
+                ],
+                custom_data={"vendor_id": "x", "some_value": None},
+            ),
+            "2.0.1",
+        ),
+        (
+            v201SetNetworkProfile(
+                configuration_slot=1,
+                connection_data=NetworkConnectionProfileType(
+                    ocpp_version=OCPPVersionType.ocpp20,
+                    ocpp_transport=OCPPTransportType.json,
+                    ocpp_csms_url="wss://localhost:9000",
+                    message_timeout=60,
+                    security_profile=1,
+                    ocpp_interface=OCPPInterfaceType.wired0,
+                ),
+            ),
+            "2.0.1",
+        ),
+    ],
+)
+def test_serialize_payload(payload, ocpp_version):
+    """
+    Test that serialize_payload() gives the same result as serializing,
+    removing Nones and converting the keys one after another.
+    """
+    expected = remove_nones(
+        snake_to_camel_case(serialize_as_dict(payload), ocpp_version)
+    )
+
+    assert serialize_payload(payload, ocpp_version) == expected
+
+
+def test_serialize_payload_with_list_of_dataclasses():
+    payload = serialize_payload(_meter_values_payload(), "1.6")
+
+    assert len(payload["meterValue"]) == 3
+    assert payload["meterValue"][0]["sampledValue"] == [
+        {"value": "10", "measurand": "Power.Active.Import"},
+        {"value": "20", "phase": "L1", "unit": "W"},
+    ]
+    assert "transactionId" not in payload
+
+
 @pytest.mark.asyncio
 async def test_call_unique_id_added_to_handler_args_correctly(connection):
     """
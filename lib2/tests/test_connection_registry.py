@@ -0,0 +1,102 @@
+import pytest
+
+from OCPP_LIB.connection_registry import BOOTED, CONNECTED, ConnectionRegistry
+from OCPP_LIB.ver201.data_type import ChargingStationType
+
+
+class FakeChargePoint:
+    def __init__(self, id):
+        self.id = id
+
+
+def test_add_get_and_remove():
+    registry = ConnectionRegistry()
+    cp = FakeChargePoint("CP_1")
+    assert registry.add(cp) is None
+
+    assert registry["CP_1"] is cp
+    assert registry.get("CP_2") is None
+    assert "CP_1" in registry
+    assert len(registry) == 1
+    assert list(registry) == ["CP_1"]
+    assert registry.attributes("CP_1")["state"] == CONNECTED
+    assert registry.find(state=CONNECTED) == {"CP_1"}
+
+    assert registry.remove(cp)
+    assert not registry.remove(cp)
+    assert len(registry) == 0
+    assert registry.find(state=CONNECTED) == set()
+    assert registry.counts("state") == {}
+
+
+def test_reconnect_replaces_charge_point():
+    registry = ConnectionRegistry()
+    old, new = FakeChargePoint("CP_1"), FakeChargePoint("CP_1")
+    registry.add(old, vendor="ACME")
+    assert registry.add(new) is old
+    assert registry.find(vendor="ACME") == set()
+
+    # The old connection closes after the new one has been added.
+    assert not registry.remove(old)
+    assert registry["CP_1"] is new
+
+
+def test_find_and_counts():
+    registry = ConnectionRegistry()
+    for i in range(10):
+        registry.add(FakeChargePoint(f"CP_{i}"))
+        registry.update(
+            f"CP_{i}",
+            vendor="ACME" if i % 2 else "Other",
+            firmware_version=f"1.{i % 3}",
+        )
+
+    assert registry.find(vendor="ACME", firmware_version="1.0") == {"CP_3", "CP_9"}
+    assert registry.find(vendor="Nobody") == set()
+    assert len(registry.find()) == 10
+    assert registry.count(vendor="Other") == 5
+    assert registry.counts("firmware_version") == {"1.0": 4, "1.1": 3, "1.2": 3}
+
+    registry.update("CP_3", firmware_version="2.0")
+    assert registry.find(vendor="ACME", firmware_version="1.0") == {"CP_9"}
+    assert not registry.update("CP_99", state=BOOTED)
+
+    with pytest.raises(ValueError):
+        registry.find(connected_at=0)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {
+            "charge_point_vendor": "ACME",
+            "charge_point_model": "Wallbox",
+            "firmware_version": "1.2.3",
+        },
+        {
+            "charging_station": {
+                "vendor_name": "ACME",
+                "model": "Wallbox",
+                "firmware_version": "1.2.3",
+            },
+            "reason": "PowerUp",
+        },
+        {
+            "charging_station": ChargingStationType(
+                vendor_name="ACME", model="Wallbox", firmware_version="1.2.3"
+            ),
+            "reason": "PowerUp",
+        },
+    ],
+)
+def test_boot_notification(kwargs):
+    registry = ConnectionRegistry()
+    registry.add(FakeChargePoint("CP_1"))
+    assert registry.boot_notification("CP_1", **kwargs)
+
+    attributes = registry.attributes("CP_1")
+    assert attributes["vendor"] == "ACME"
+    assert attributes["model"] == "Wallbox"
+    assert attributes["firmware_version"] == "1.2.3"
+    assert registry.find(state=BOOTED, model="Wallbox") == {"CP_1"}
+    assert registry.find(state=CONNECTED) == set()
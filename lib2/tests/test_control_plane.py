@@ -0,0 +1,141 @@
+import asyncio
+import contextlib
+import json
+
+import pytest
+
+from OCPP_LIB.connection_registry import ConnectionRegistry
+from OCPP_LIB.control_plane import ControlPlane
+from OCPP_LIB.fleet import ERROR, NOT_CONNECTED, SUCCESS, TIMEOUT
+from OCPP_LIB.loopback import connection_pair
+from OCPP_LIB.ocpp_routing import on
+from OCPP_LIB.ver201 import ChargePoint, ocpp_request, ocpp_response
+
+
+class CSMS(ChargePoint):
+    async def send_trigger_message(self, requested_message_value):
+        return await self.call(
+            ocpp_request.TriggerMessage(requested_message=requested_message_value)
+        )
+
+    async def send_clear_cache(self):
+        return await self.call(ocpp_request.ClearCache())
+
+
+class Station(ChargePoint):
+    @on("TriggerMessage")
+    async def on_trigger_message(self, requested_message, **kwargs):
+        if requested_message == "Heartbeat" and self.id == "CP_2":
+            await asyncio.sleep(1)
+        return ocpp_response.TriggerMessage(status="Accepted")
+
+    @on("ClearCache")
+    def on_clear_cache(self, **kwargs):
+        return ocpp_response.ClearCache(status="Rejected")
+
+
+@contextlib.asynccontextmanager
+async def connect_fleet():
+    """Connect 4 stations and add the CSMS side of them to a registry."""
+    registry = ConnectionRegistry()
+    tasks = []
+    for i in range(4):
+        csms_connection, station_connection = connection_pair()
+        csms = CSMS(f"CP_{i}", csms_connection)
+        station = Station(f"CP_{i}", station_connection)
+        registry.add(csms, vendor="ACME" if i < 2 else "Other")
+        tasks += [asyncio.ensure_future(cp.start()) for cp in (csms, station)]
+
+    try:
+        yield registry
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_execute():
+    async with connect_fleet() as fleet:
+        stored = []
+
+        async def on_result(charge_point_id, action, response):
+            stored.append((charge_point_id, action, response.status))
+
+        control_plane = ControlPlane(fleet, timeout=0.2, on_result=on_result)
+        results = await control_plane.execute(
+            [
+                {"charge_point_id": "CP_0", "action": "ClearCache"},
+                {
+                    "select": {"vendor": "Other"},
+                    "action": "trigger_message",
+                    "arguments": ["Heartbeat"],
+                },
+                {"charge_point_ids": ["CP_1", "CP_9"], "action": "ClearCache"},
+                {"charge_point_id": "CP_1", "action": "Reset"},
+            ]
+        )
+
+        assert [(r["charge_point_id"], r["status"]) for r in results] == [
+            ("CP_0", SUCCESS),
+            ("CP_2", TIMEOUT),
+            ("CP_3", SUCCESS),
+            ("CP_1", SUCCESS),
+            ("CP_9", NOT_CONNECTED),
+            ("CP_1", ERROR),
+        ]
+        assert results[0]["response"]["status"] == "Rejected"
+        assert results[5]["error"] == "Unknown action 'Reset'"
+        assert sorted(stored) == [
+            ("CP_0", "ClearCache", "Rejected"),
+            ("CP_1", "ClearCache", "Rejected"),
+            ("CP_3", "trigger_message", "Accepted"),
+        ]
+
+
+async def _request(port, method, target, body=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    data = json.dumps(body).encode() if body is not None else b""
+    writer.write(
+        f"{method} {target} HTTP/1.1\r\nContent-Length: {len(data)}\r\n\r\n".encode()
+        + data
+    )
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+@pytest.mark.asyncio
+async def test_serve():
+    async with connect_fleet() as fleet:
+        server = await ControlPlane(fleet).serve(port=0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            command = {
+                "charge_point_id": "CP_3",
+                "action": "TriggerMessage",
+                "arguments": {"requested_message_value": "StatusNotification"},
+            }
+            status, body = await _request(port, "POST", "/commands", command)
+            assert status == 200
+            assert body["results"][0]["response"]["status"] == "Accepted"
+
+            status, body = await _request(port, "POST", "/commands?async=1", [command])
+            assert status == 202
+            job = body["job"]
+            for _ in range(100):
+                status, body = await _request(port, "GET", f"/jobs/{job}")
+                if body["status"] == "done":
+                    break
+                await asyncio.sleep(0.01)
+            assert body["results"][0]["status"] == SUCCESS
+
+            status, body = await _request(port, "GET", "/charge_points?vendor=ACME")
+            assert [cp["id"] for cp in body["charge_points"]] == ["CP_0", "CP_1"]
+
+            assert (await _request(port, "POST", "/commands", [{}]))[0] == 400
+            assert (await _request(port, "GET", "/jobs/99"))[0] == 404
+        finally:
+            server.close()
+            await server.wait_closed()
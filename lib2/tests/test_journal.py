@@ -0,0 +1,146 @@
+import json
+import os
+import time
+
+import pytest
+
+from OCPP_LIB.journal import INBOUND, OUTBOUND, FrameJournal, read_journal
+from OCPP_LIB.ocpp_messages import Call, CallError, CallResult
+from OCPP_LIB.ocpp_routing import on
+from OCPP_LIB.ver201 import ChargePoint, ocpp_response
+
+
+@pytest.fixture
+def directory(tmp_path):
+    return str(tmp_path / "journal")
+
+
+def test_record_and_read(directory):
+    call = Call("1", "Heartbeat", {}).to_json()
+    result = CallResult("1", {"currentTime": "2024-04-05T12:00:00Z"}).to_json()
+    error = CallError("2", "InternalError", "Oops", {}).to_json()
+
+    journal = FrameJournal(directory)
+    journal.record("CP_1", INBOUND, call)
+    journal.record("CP_1", OUTBOUND, result)
+    journal.record("CP_2", INBOUND, error.encode())
+    journal.record("CP_2", INBOUND, "not OCPP")
+    journal.close()
+    assert len(journal) == 4
+
+    records = list(read_journal(directory))
+    assert [
+        (r.charge_point_id, r.direction, r.message_type_id, r.unique_id, r.action)
+        for r in records
+    ] == [
+        ("CP_1", INBOUND, 2, "1", "Heartbeat"),
+        ("CP_1", OUTBOUND, 3, "1", ""),
+        ("CP_2", INBOUND, 4, "2", ""),
+        ("CP_2", INBOUND, 0, "", ""),
+    ]
+    assert [r.frame for r in records] == [call, result, error, "not OCPP"]
+    assert records[0].timestamp <= records[1].timestamp
+    assert records[0].wall_clock > 0
+
+    assert len(list(read_journal(directory, charge_point_id="CP_2"))) == 2
+
+    with pytest.raises(ValueError):
+        journal.record("CP_1", INBOUND, call)
+
+
+def test_segments(directory):
+    frames = [
+        Call(str(i), "DataTransfer", {"vendorId": "x" * (i * 50)}).to_json()
+        for i in range(20)
+    ]
+
+    journal = FrameJournal(directory, segment_size=512, batch_size=256)
+    for frame in frames:
+        journal.record("CP_1", OUTBOUND, frame)
+    journal.close()
+
+    assert len(os.listdir(directory)) > 1
+    assert [r.frame for r in read_journal(directory)] == frames
+
+    # A new journal in the same directory appends segments.
+    journal = FrameJournal(directory, segment_size=512)
+    journal.record("CP_1", OUTBOUND, frames[0])
+    journal.close()
+
+    assert [r.frame for r in read_journal(directory)] == frames + frames[:1]
+
+
+def test_journals_share_a_directory(directory):
+    frames = [Call(str(i), "Heartbeat", {}).to_json() for i in range(200)]
+
+    journals = [FrameJournal(directory, segment_size=512, batch_size=64)]
+    journals.append(FrameJournal(directory, segment_size=512, batch_size=64))
+    for i, frame in enumerate(frames):
+        journals[i % 2].record(f"CP_{i % 2}", OUTBOUND, frame)
+    for journal in journals:
+        journal.close()
+
+    for i in range(2):
+        assert [r.frame for r in read_journal(directory, f"CP_{i}")] == frames[i::2]
+
+
+def test_flush_makes_records_readable(directory):
+    journal = FrameJournal(directory, flush_interval=None)
+    journal.record("CP_1", INBOUND, Call("1", "Heartbeat", {}).to_json())
+    assert list(read_journal(directory)) == []
+
+    journal.flush()
+    assert len(list(read_journal(directory))) == 1
+    journal.close()
+
+
+def test_records_are_flushed_periodically(directory):
+    journal = FrameJournal(directory, flush_interval=0.05)
+    journal.record("CP_1", INBOUND, Call("1", "Heartbeat", {}).to_json())
+
+    deadline = time.monotonic() + 5
+    while not list(read_journal(directory)) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(list(read_journal(directory))) == 1
+    journal.close()
+
+
+@pytest.mark.asyncio
+async def test_charge_point_records_frames(connection, directory):
+    class MyChargePoint(ChargePoint):
+        @on("Heartbeat")
+        def on_heartbeat(self, **kwargs):
+            return ocpp_response.Heartbeat(current_time="2024-04-05T12:00:00Z")
+
+    journal = FrameJournal(directory)
+    cp = MyChargePoint("CP_1", connection, journal=journal)
+    await cp.route_message(Call("42", "Heartbeat", {}).to_json())
+    journal.close()
+
+    inbound, outbound = read_journal(directory)
+    assert (inbound.direction, inbound.action, inbound.unique_id) == (
+        INBOUND,
+        "Heartbeat",
+        "42",
+    )
+    assert (outbound.direction, outbound.unique_id) == (OUTBOUND, "42")
+    assert json.loads(outbound.frame)[2] == {"currentTime": "2024-04-05T12:00:00Z"}
+
+
+@pytest.mark.asyncio
+async def test_journal_errors_dont_break_the_connection(connection, directory):
+    class MyChargePoint(ChargePoint):
+        @on("Heartbeat")
+        def on_heartbeat(self, **kwargs):
+            return ocpp_response.Heartbeat(current_time="2024-04-05T12:00:00Z")
+
+    journal = FrameJournal(directory)
+    # Ids longer than a record can hold can't be recorded.
+    cp = MyChargePoint("CP" * 40000, connection, journal=journal)
+    await cp.route_message(Call("1", "Heartbeat", {}).to_json())
+    assert json.loads(connection.send.call_args[0][0])[1] == "1"
+
+    journal.close()
+    cp = MyChargePoint("CP_1", connection, journal=journal)
+    await cp.route_message(Call("2", "Heartbeat", {}).to_json())
+    assert json.loads(connection.send.call_args[0][0])[1] == "2"
@@ -0,0 +1,106 @@
+import decimal
+import json
+
+import pytest
+
+from OCPP_LIB import json_codec
+from OCPP_LIB.error_handling import FormatViolationError
+from OCPP_LIB.json_codec import (
+    JSONCodec,
+    StdlibJSONCodec,
+    available_codecs,
+    get_codec,
+    set_default_codec,
+)
+from OCPP_LIB.ocpp_messages import Call, CallError, CallResult, unpack
+
+
+@pytest.fixture(params=available_codecs())
+def codec(request):
+    return get_codec(request.param)
+
+
+def test_encode_is_compact(codec):
+    assert codec.encode([2, "1", "Heartbeat", {"a": [1, 2]}]) == (
+        '[2,"1","Heartbeat",{"a":[1,2]}]'
+    )
+
+
+def test_encode_decimal(codec):
+    assert codec.encode([decimal.Decimal(2.000001)]) == "[2.0]"
+
+
+def test_encode_object_with_to_json(codec):
+    class Value:
+        def to_json(self):
+            return "value"
+
+    assert codec.encode({"a": Value()}) == '{"a":"value"}'
+
+
+def test_encode_unsupported_type(codec):
+    with pytest.raises(TypeError):
+        codec.encode({"a": object()})
+
+
+@pytest.mark.parametrize("data", ['[2,"1",{"a":1.5}]', b'[2,"1",{"a":1.5}]'])
+def test_decode(codec, data):
+    assert codec.decode(data) == [2, "1", {"a": 1.5}]
+
+
+def test_decode_invalid_json(codec):
+    with pytest.raises(json.JSONDecodeError):
+        codec.decode("[2,")
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        Call(unique_id="1", action="Heartbeat", payload={}),
+        CallResult(unique_id="1", action="Heartbeat", payload={"currentTime": "a"}),
+        CallError(
+            unique_id="1",
+            error_code="GenericError",
+            error_description="Oops",
+            error_details={"a": None},
+        ),
+    ],
+)
+def test_to_json_and_unpack_with_codec(codec, message):
+    data = message.to_json(codec)
+
+    assert data == message.to_json(StdlibJSONCodec())
+
+    unpacked = unpack(data, codec)
+    assert unpacked.message_type_id == message.message_type_id
+    assert unpacked.unique_id == message.unique_id
+
+
+def test_unpack_with_invalid_json_and_codec(codec):
+    with pytest.raises(FormatViolationError):
+        unpack(b"\x01", codec)
+
+
+def test_get_codec():
+    assert get_codec("json") is get_codec("json")
+    assert isinstance(get_codec(), JSONCodec)
+
+    codec = StdlibJSONCodec()
+    assert get_codec(codec) is codec
+
+    expected = "orjson" if "orjson" in available_codecs() else "json"
+    assert get_codec("auto").name == expected
+
+
+def test_get_codec_with_unknown_codec():
+    with pytest.raises(ValueError):
+        get_codec("magic")
+
+
+def test_set_default_codec(monkeypatch):
+    monkeypatch.setattr(json_codec, "_default_codec", json_codec._default_codec)
+    codec = StdlibJSONCodec()
+
+    set_default_codec(codec)
+
+    assert get_codec() is codec
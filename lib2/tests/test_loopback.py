@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from OCPP_LIB.error_handling import ConnectionClosedError
+from OCPP_LIB.loopback import connection_pair
+from OCPP_LIB.ocpp_routing import on
+from OCPP_LIB.ver201 import ChargePoint, ocpp_request, ocpp_response
+
+
+@pytest.mark.asyncio
+async def test_send_and_recv():
+    a, b = connection_pair()
+    await a.send("1")
+    await a.send("2")
+    await b.send("3")
+
+    assert await b.recv() == "1"
+    assert await b.recv() == "2"
+    assert await a.recv() == "3"
+
+
+@pytest.mark.asyncio
+async def test_close():
+    a, b = connection_pair()
+    await a.send("1")
+    receive = asyncio.ensure_future(a.recv())
+    await b.close()
+
+    # Messages sent before the connection was closed are still received.
+    assert await b.recv() == "1"
+    for end in (a, b):
+        assert end.closed
+        with pytest.raises(ConnectionClosedError):
+            await end.recv()
+        with pytest.raises(ConnectionClosedError):
+            await end.send("2")
+
+    with pytest.raises(ConnectionClosedError):
+        await receive
+
+
+@pytest.mark.asyncio
+async def test_charge_points_over_loopback():
+    class CentralSystem(ChargePoint):
+        @on("Heartbeat")
+        def on_heartbeat(self, **kwargs):
+            return ocpp_response.Heartbeat(current_time="2024-04-05T12:00:00Z")
+
+    csms_connection, station_connection = connection_pair()
+    csms = CentralSystem("CP_1", csms_connection)
+    station = ChargePoint("CP_1", station_connection)
+    tasks = [asyncio.ensure_future(cp.start()) for cp in (csms, station)]
+
+    response = await station.call(ocpp_request.Heartbeat())
+    assert response.current_time == "2024-04-05T12:00:00Z"
+
+    await csms_connection.close()
+    for task in tasks:
+        with pytest.raises(ConnectionClosedError):
+            await task
+
+
+@pytest.mark.asyncio
+async def test_latency_and_jitter_keep_order():
+    a, b = connection_pair(latency=0.02, jitter=0.02, seed=1)
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    for i in range(20):
+        await a.send(str(i))
+    assert b._queue.empty()
+
+    assert [await b.recv() for _ in range(20)] == [str(i) for i in range(20)]
+    assert loop.time() - start >= 0.01
+
+
+@pytest.mark.asyncio
+async def test_loss():
+    a, b = connection_pair(loss=0.5, seed=1)
+    for i in range(100):
+        await a.send(str(i))
+
+    assert a.sent == 100
+    assert 20 < a.dropped < 80
+    assert b._queue.qsize() == 100 - a.dropped
+
+    # The same seed drops the same messages.
+    c, _ = connection_pair(loss=0.5, seed=1)
+    for i in range(100):
+        await c.send(str(i))
+    assert c.dropped == a.dropped
+
+
+@pytest.mark.asyncio
+async def test_close_drops_delayed_messages():
+    a, b = connection_pair(latency=0.01)
+    await a.send("1")
+    await a.close()
+    await asyncio.sleep(0.02)
+
+    with pytest.raises(ConnectionClosedError):
+        await b.recv()
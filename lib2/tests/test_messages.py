@@ -1,9 +1,11 @@
 import decimal
 import json
+import os
 from datetime import datetime
 
 import pytest
 
+from OCPP_LIB import ocpp_messages
 from OCPP_LIB.error_handling import (
     FormatViolationError,
     NotImplementedError,
@@ -17,10 +19,13 @@ from OCPP_LIB.ocpp_messages import (
     Call,
     CallError,
     CallResult,
+    LazyCallError,
+    LazyCallResult,
     MessageType,
     _DecimalEncoder,
     _validators,
     get_validator,
+    preload,
     unpack,
     validate_payload,
 )
@@ -65,6 +70,109 @@ def test_unpack_with_invalid_message_type_id_in_json():
         unpack(json.dumps([5, 1]))
 
 
+@pytest.mark.parametrize(
+    "msg",
+    [
+        '[3,"1234",{"status":"Accepted"}]',
+        b'[3,"1234",{"status":"Accepted"}]',
+        ' [ 3 , "1234" ,\n {"status": "Accepted"}]',
+    ],
+)
+def test_unpack_lazy_call_result(msg):
+    """
+    Test that only the header of a CallResult is decoded and that the payload
+    is decoded on first access.
+    """
+    call_result = unpack(msg, lazy=True)
+
+    assert isinstance(call_result, LazyCallResult)
+    assert isinstance(call_result, CallResult)
+    assert call_result.unique_id == "1234"
+    assert not call_result.is_loaded
+
+    assert call_result.payload == {"status": "Accepted"}
+    assert call_result.is_loaded
+
+
+def test_unpack_lazy_call_error():
+    call_error = unpack(
+        '[4,"1234","GenericError","Oops",{"cause":"unknown"}]', lazy=True
+    )
+
+    assert isinstance(call_error, LazyCallError)
+    assert call_error.unique_id == "1234"
+    assert not call_error.is_loaded
+
+    assert call_error.error_code == "GenericError"
+    assert call_error.error_description == "Oops"
+    assert call_error.error_details == {"cause": "unknown"}
+    assert call_error.is_loaded
+
+
+@pytest.mark.parametrize(
+    "msg",
+    [
+        '[2,"1234","Heartbeat",{}]',
+        '[3,"12\\"34",{}]',
+        '[3,"1234"]',
+        '{"3": "1234"}',
+    ],
+)
+def test_unpack_lazy_falls_back_to_complete_decoding(msg):
+    """
+    Test that messages of which the header can't be read without decoding
+    the complete message are decoded as usual.
+    """
+    try:
+        message = unpack(msg, lazy=True)
+    except ProtocolError:
+        return
+
+    assert not isinstance(message, (LazyCallResult, LazyCallError))
+
+
+def test_unpack_lazy_with_invalid_payload():
+    """
+    Test that the exceptions of `unpack()` are raised when a lazy message
+    with an invalid remainder is accessed.
+    """
+    call_result = unpack('[3,"1234",{"status":', lazy=True)
+
+    with pytest.raises(FormatViolationError):
+        call_result.payload
+
+
+@pytest.mark.parametrize(
+    "msg",
+    [
+        Call("1234", "Heartbeat", {}),
+        CallResult("1234", {}, "Heartbeat"),
+        CallError("1234", "GenericError", "", {}),
+        unpack('[3,"1234",{}]', lazy=True),
+        unpack('[4,"1234","GenericError","",{}]', lazy=True),
+    ],
+)
+def test_messages_are_slotted(msg):
+    """Test that messages don't carry a `__dict__`, but lazy messages can
+    still be decoded and modified."""
+    assert not hasattr(msg, "__dict__")
+
+    with pytest.raises(AttributeError):
+        msg.unknown = 1
+
+    msg.unique_id = "5678"
+    assert json.loads(msg.to_json())[1] == "5678"
+
+
+def test_validate_lazy_call_result():
+    call_result = unpack('[3,"1234",{"currentTime":"2022-01-25T19:18:30Z"}]', lazy=True)
+    call_result.action = "Heartbeat"
+
+    validate_payload(call_result, ocpp_version="2.0.1")
+
+    assert call_result.is_loaded
+
+
 def test_get_validator_with_valid_name():
     """
     Test if correct validator is returned and if validator is added to cache.
@@ -96,6 +204,56 @@ def test_get_validator_with_invalid_name():
         get_validator(MessageType.Call, "non-existing", ocpp_version="1.6")
 
 
+@pytest.mark.parametrize("ocpp_version", ["1.6", "2.0.1"])
+def test_schema_bundle_is_up_to_date(ocpp_version):
+    """
+    Test if the bundle created by `scripts/bundle_schemas.py` contains the
+    same schemas as the schema files.
+    """
+    schemas_dir = os.path.join(ocpp_messages._get_schemas_dir(ocpp_version), "schemas")
+    schemas = {}
+    for name in os.listdir(schemas_dir):
+        with open(os.path.join(schemas_dir, name), "r", encoding="utf-8-sig") as f:
+            schemas[name[: -len(".json")]] = json.loads(f.read())
+
+    assert ocpp_messages._get_schema_bundle(ocpp_version) == schemas
+
+
+def test_get_validator_without_schema_bundle(monkeypatch):
+    """
+    Test if schemas are read from the schema files if no bundle exists.
+    """
+    monkeypatch.setattr(ocpp_messages, "_validators", {})
+    monkeypatch.setattr(ocpp_messages, "_schema_bundles", {"1.6": None})
+
+    validator = get_validator(MessageType.Call, "Reset", ocpp_version="1.6")
+
+    assert validator.schema["title"] == "ResetRequest"
+
+
+@pytest.mark.parametrize("engine", ["jsonschema", "compiled"])
+def test_preload(monkeypatch, engine):
+    """
+    Test if preload() creates validators for all schemas.
+    """
+    monkeypatch.setattr(ocpp_messages, "_validators", {})
+    monkeypatch.setattr(ocpp_messages, "_compiled_validators", {})
+
+    assert preload(versions=["1.6"], engine=engine) == 78
+
+    validators = (
+        ocpp_messages._validators
+        if engine == "jsonschema"
+        else ocpp_messages._compiled_validators
+    )
+    assert len(validators) == 78
+
+
+def test_preload_with_invalid_version():
+    with pytest.raises(ValueError):
+        preload(versions=["1.5"])
+
+
 def test_validate_set_charging_profile_payload():
     """ " Test if payloads with floats are validated correctly.
 
@@ -150,6 +308,56 @@ def test_validate_get_composite_profile_payload():
     validate_payload(message, ocpp_version="1.6")
 
 
+@pytest.mark.parametrize("engine", ["jsonschema", "compiled"])
+@pytest.mark.parametrize("limit", [21.4, 0.3, 16, 1e300, decimal.Decimal("21.4")])
+def test_validate_payload_with_multiple_of_does_not_modify_payload(engine, limit):
+    """
+    Test that floats are checked with the precision they have in JSON and
+    that the payload isn't replaced during validation.
+    """
+    payload = {
+        "connectorId": 1,
+        "csChargingProfiles": {
+            "chargingProfileId": 1,
+            "stackLevel": 0,
+            "chargingProfilePurpose": "TxProfile",
+            "chargingProfileKind": "Relative",
+            "chargingSchedule": {
+                "chargingRateUnit": "A",
+                "chargingSchedulePeriod": [{"startPeriod": 0, "limit": limit}],
+            },
+        },
+    }
+    message = Call(unique_id="1234", action="SetChargingProfile", payload=payload)
+
+    validate_payload(message, ocpp_version="1.6", engine=engine)
+
+    assert message.payload is payload
+    period = payload["csChargingProfiles"]["chargingSchedule"][
+        "chargingSchedulePeriod"
+    ][0]
+    assert period["limit"] is limit
+
+
+@pytest.mark.parametrize("engine", ["jsonschema", "compiled"])
+@pytest.mark.parametrize("limit", [21.45, 0.30000000000000004, 1e-300])
+def test_validate_payload_with_invalid_precision(engine, limit):
+    message = CallResult(
+        unique_id="1234",
+        action="GetCompositeSchedule",
+        payload={
+            "status": "Accepted",
+            "chargingSchedule": {
+                "chargingRateUnit": "A",
+                "chargingSchedulePeriod": [{"startPeriod": 0, "limit": limit}],
+            },
+        },
+    )
+
+    with pytest.raises(FormatViolationError):
+        validate_payload(message, ocpp_version="1.6", engine=engine)
+
+
 @pytest.mark.parametrize("ocpp_version", ["1.6", "2.0.1"])
 def test_validate_payload_with_valid_payload(ocpp_version):
     """
@@ -1,4 +1,10 @@
-from OCPP_LIB.ocpp_routing import after, create_route_map, on
+from OCPP_LIB.ocpp_routing import (
+    accepts_call_unique_id,
+    after,
+    create_route_map,
+    get_routes,
+    on,
+)
 from OCPP_LIB.ver16.E_num import Action
 
 
@@ -39,3 +45,89 @@ def test_create_route_map():
             "_skip_schema_validation": False,
         },
     }
+
+
+def test_routes_are_collected_once_per_class():
+    class Base:
+        @on(Action.Heartbeat)
+        def on_heartbeat(self):
+            pass
+
+        @on(Action.Authorize)
+        def on_authorize(self, id_tag, call_unique_id):
+            pass
+
+    class Child(Base):
+        @on(Action.Heartbeat)
+        def on_heartbeat(self):
+            pass
+
+        # Overriding a handler without decorating it removes the route.
+        def on_authorize(self, id_tag, call_unique_id):
+            pass
+
+    assert get_routes(Base) is get_routes(Base)
+    assert get_routes(Base) == {
+        Action.Heartbeat: {
+            "_on_action": Base.on_heartbeat,
+            "_skip_schema_validation": False,
+        },
+        Action.Authorize: {
+            "_on_action": Base.on_authorize,
+            "_skip_schema_validation": False,
+        },
+    }
+    assert get_routes(Child) == {
+        Action.Heartbeat: {
+            "_on_action": Child.on_heartbeat,
+            "_skip_schema_validation": False,
+        },
+    }
+
+    base = Base()
+    assert accepts_call_unique_id(
+        create_route_map(base)[Action.Authorize]["_on_action"]
+    )
+    assert not accepts_call_unique_id(base.on_heartbeat)
+    assert accepts_call_unique_id(lambda call_unique_id: None)
+
+
+def test_routes_of_unrelated_classes_are_independent():
+    """Handlers of one class must not cause attributes with the same name of
+    another class to be evaluated."""
+
+    class ChargePoint:
+        @on(Action.Heartbeat)
+        def on_heartbeat(self):
+            pass
+
+    class Other:
+        @property
+        def on_heartbeat(self):
+            raise RuntimeError("Getter was called during route map creation")
+
+    assert create_route_map(Other()) == {}
+
+
+def test_create_route_map_with_handlers_of_instance():
+    class ChargePoint:
+        @on(Action.Heartbeat)
+        def on_heartbeat(self):
+            pass
+
+        @staticmethod
+        @on(Action.MeterValues)
+        def on_meter_values():
+            pass
+
+    @on(Action.Heartbeat)
+    def on_heartbeat():
+        pass
+
+    cp = ChargePoint()
+    assert create_route_map(cp)[Action.MeterValues]["_on_action"] == (
+        ChargePoint.on_meter_values
+    )
+
+    cp.on_heartbeat = on_heartbeat
+    assert create_route_map(cp)[Action.Heartbeat]["_on_action"] is on_heartbeat
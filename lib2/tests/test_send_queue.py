@@ -0,0 +1,199 @@
+import asyncio
+
+import pytest
+
+from OCPP_LIB.metrics import Metrics
+from OCPP_LIB.ocpp_messages import MessageType
+from OCPP_LIB.send_queue import (
+    BULK,
+    DEFAULT,
+    RESPONSE,
+    TRANSACTION,
+    SendQueue,
+    priority,
+)
+
+
+class SlowPeer:
+    """Writes frames only while `reading` is set."""
+
+    def __init__(self):
+        self.frames = []
+        self.reading = asyncio.Event()
+
+    async def write(self, frame):
+        await self.reading.wait()
+        self.frames.append(frame)
+
+
+def test_priority():
+    assert priority(MessageType.CallResult) == RESPONSE
+    assert priority(MessageType.CallError, "NotifyReport") == RESPONSE
+    assert priority(MessageType.Call, "TransactionEvent") == TRANSACTION
+    assert priority(MessageType.Call, "Heartbeat") == DEFAULT
+    assert priority(MessageType.Call, "NotifyReport") == BULK
+
+
+@pytest.mark.asyncio
+async def test_frames_are_written_by_priority():
+    peer = SlowPeer()
+    metrics = Metrics()
+    queue = SendQueue(peer.write, metrics=metrics)
+
+    # Nothing is queued, so the first frame is written right away.
+    first = asyncio.ensure_future(queue.put("first", BULK))
+    await asyncio.sleep(0)
+    for frame, frame_priority in [
+        ("bulk", BULK),
+        ("heartbeat", DEFAULT),
+        ("transaction", TRANSACTION),
+        ("response", RESPONSE),
+        ("bulk 2", BULK),
+        ("response 2", RESPONSE),
+    ]:
+        await queue.put(frame, frame_priority)
+    assert len(queue) == 6
+    assert metrics.send_queue_depth == 7
+
+    peer.reading.set()
+    await first
+    while len(queue) or metrics.send_queue_depth:
+        await asyncio.sleep(0)
+
+    assert peer.frames == [
+        "first",
+        "response",
+        "response 2",
+        "transaction",
+        "heartbeat",
+        "bulk",
+        "bulk 2",
+    ]
+    assert queue.size == 0
+
+
+@pytest.mark.asyncio
+async def test_backpressure():
+    peer = SlowPeer()
+    queue = SendQueue(peer.write, max_size=10)
+
+    writing = asyncio.ensure_future(queue.put("0000"))
+    await asyncio.sleep(0)
+    await queue.put("1111", BULK)
+    await queue.put("2222", BULK)
+    assert queue.size == 8
+
+    # The queue is full, senders wait for room, the response first.
+    bulk = asyncio.ensure_future(queue.put("3333", BULK))
+    response = asyncio.ensure_future(queue.put("rrrr", RESPONSE))
+    await asyncio.sleep(0)
+    assert not bulk.done() and not response.done()
+    assert len(queue) == 2
+
+    peer.reading.set()
+    await asyncio.gather(writing, bulk, response)
+    while len(queue):
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    # The response gets room before the bulk frame that waited longer.
+    assert peer.frames == ["0000", "1111", "2222", "rrrr", "3333"]
+
+
+@pytest.mark.asyncio
+async def test_write_error_drops_queued_frames():
+    closed = asyncio.Event()
+
+    async def write(frame):
+        await closed.wait()
+        raise ConnectionError("closed")
+
+    queue = SendQueue(write, max_size=4)
+    first = asyncio.ensure_future(queue.put("0000"))
+    await asyncio.sleep(0)
+    await queue.put("1111")
+    waiting = asyncio.ensure_future(queue.put("2222"))
+    await asyncio.sleep(0)
+
+    closed.set()
+    with pytest.raises(ConnectionError):
+        await first
+    # Senders that wait for room and later ones get the error, and nothing
+    # is written anymore.
+    with pytest.raises(ConnectionError):
+        await waiting
+    with pytest.raises(ConnectionError):
+        await queue.put("3333")
+    assert len(queue) == 0 and queue.size == 0
+    await asyncio.sleep(0)
+    assert queue._writer is None
+
+    # Senders waiting for room when the queue is closed get an error.
+    closed.clear()
+    queue = SendQueue(write, max_size=4)
+    first = asyncio.ensure_future(queue.put("0000"))
+    await asyncio.sleep(0)
+    await queue.put("1111")
+    waiting = asyncio.ensure_future(queue.put("2222"))
+    await asyncio.sleep(0)
+    queue.close()
+    with pytest.raises(ConnectionError):
+        await waiting
+    assert len(queue) == 0 and queue.size == 0
+    first.cancel()
+
+
+@pytest.mark.asyncio
+async def test_write_error_reports_dropped_frames():
+    reading = asyncio.Event()
+    closed = asyncio.Event()
+    dropped = []
+
+    async def write(frame):
+        await reading.wait()
+        if frame != "0000":
+            await closed.wait()
+            raise ConnectionError("closed")
+
+    queue = SendQueue(
+        write, on_error=lambda error, frames: dropped.append((error, frames))
+    )
+    first = asyncio.ensure_future(queue.put("0000"))
+    await asyncio.sleep(0)
+    await queue.put("1111")
+    await queue.put("2222", BULK)
+    await queue.put("3333", RESPONSE)
+    reading.set()
+    await first
+    while len(queue) > 2:
+        await asyncio.sleep(0)
+
+    # "3333" is being written, the others are still queued.
+    closed.set()
+    while queue._writer is not None:
+        await asyncio.sleep(0)
+
+    ((error, frames),) = dropped
+    assert isinstance(error, ConnectionError)
+    assert frames == ["3333", "1111", "2222"]
+
+
+@pytest.mark.asyncio
+async def test_size_is_counted_in_bytes():
+    peer = SlowPeer()
+    queue = SendQueue(peer.write, max_size=8)
+    first = asyncio.ensure_future(queue.put("first"))
+    await asyncio.sleep(0)
+
+    await queue.put("\u20ac\u20ac")
+    await queue.put(b"ab")
+    assert queue.size == 8
+    waiting = asyncio.ensure_future(queue.put("x"))
+    await asyncio.sleep(0)
+    assert not waiting.done()
+
+    peer.reading.set()
+    await asyncio.gather(first, waiting)
+    while len(queue):
+        await asyncio.sleep(0)
+    assert queue.size == 0
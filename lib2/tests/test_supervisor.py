@@ -0,0 +1,119 @@
+import asyncio
+import os
+import signal
+import socket
+
+import pytest
+
+from OCPP_LIB.loopback import connection_pair
+from OCPP_LIB.supervisor import Supervisor, reuseport_socket
+from OCPP_LIB.ver201 import ChargePoint
+
+
+async def serve_pid(sock):
+    """Answer every connection with the pid of the worker."""
+
+    async def handle(reader, writer):
+        writer.write(str(os.getpid()).encode())
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, sock=sock)
+    await server.serve_forever()
+
+
+async def serve_charge_points(sock):
+    """Connect two pairs of charge points and close one of them, but keep
+    all of them referenced."""
+    pairs = [connection_pair(), connection_pair()]
+    charge_points = [ChargePoint("CP", c) for pair in pairs for c in pair]
+    tasks = [asyncio.ensure_future(cp.start()) for cp in charge_points]
+    await asyncio.sleep(0)
+    await pairs[1][0].close()
+    await asyncio.gather(*tasks[2:], return_exceptions=True)
+    await asyncio.Event().wait()
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_reuseport_socket():
+    first = reuseport_socket("127.0.0.1", 0)
+    port = first.getsockname()[1]
+    second = reuseport_socket("127.0.0.1", port)
+    assert second.getsockname()[1] == port
+    first.close()
+    second.close()
+
+
+async def _wait_for(condition, timeout=60):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "timed out"
+        await asyncio.sleep(0.1)
+
+
+@pytest.mark.asyncio
+async def test_supervisor_restarts_workers():
+    port = _free_port()
+    supervisor = Supervisor(
+        serve_pid,
+        workers=2,
+        host="127.0.0.1",
+        port=port,
+        report_interval=0.1,
+        restart_delay=0.1,
+    )
+    task = asyncio.ensure_future(supervisor.serve())
+    try:
+        # Workers report once they're serving.
+        await _wait_for(lambda: all(w.metrics for w in supervisor._workers))
+        pids = {status["pid"] for status in supervisor.status()}
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        assert int(await reader.read()) in pids
+        writer.close()
+
+        crashed = supervisor.status()[0]["pid"]
+        os.kill(crashed, signal.SIGKILL)
+        await _wait_for(
+            lambda: supervisor.status()[0]["restarts"] == 1
+            and supervisor._workers[0].metrics is not None
+        )
+
+        status = supervisor.status()
+        assert status[0]["alive"] and status[0]["pid"] != crashed
+        assert status[1]["restarts"] == 0
+        assert 'ocpp_worker_restarts_total{worker="0"} 1' in (
+            supervisor.to_prometheus()
+        )
+    finally:
+        supervisor.stop()
+        await task
+
+    assert not any(status["alive"] for status in supervisor.status())
+
+
+@pytest.mark.asyncio
+async def test_supervisor_counts_connected_charge_points():
+    supervisor = Supervisor(
+        serve_charge_points,
+        workers=1,
+        host="127.0.0.1",
+        port=_free_port(),
+        report_interval=0.1,
+    )
+    task = asyncio.ensure_future(supervisor.serve())
+    try:
+        await _wait_for(lambda: supervisor.connections == 2)
+        # The closed pair isn't counted in later reports either.
+        await asyncio.sleep(0.3)
+        assert supervisor.connections == 2
+        assert "ocpp_connections 2" in supervisor.to_prometheus()
+    finally:
+        supervisor.stop()
+        await task
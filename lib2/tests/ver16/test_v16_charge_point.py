@@ -5,7 +5,7 @@ from unittest import mock
 import pytest
 
 from OCPP_LIB.error_handling import FormatViolationError, GenericError
-from OCPP_LIB.ocpp_messages import CallError
+from OCPP_LIB.ocpp_messages import CallError, CallResult
 from OCPP_LIB.ocpp_routing import after, create_route_map, on
 from OCPP_LIB.ver16 import ChargePoint, ocpp_request, ocpp_response
 from OCPP_LIB.ver16.E_num import Action
@@ -205,7 +205,11 @@ async def test_raise_call_error(base_central_system):
         error_code="GenericError",
         error_description="test_raise_call_error",
     )
-    await base_central_system.route_message(call_error.to_json())
+
+    async def respond(message):
+        await base_central_system.route_message(call_error.to_json())
+
+    base_central_system._connection.send.side_effect = respond
 
     payload = ocpp_request.ClearCache()
     with pytest.raises(GenericError):
@@ -224,7 +228,11 @@ async def test_suppress_call_error(base_central_system):
         error_code="GenericError",
         error_description="test_raise_call_error",
     )
-    await base_central_system.route_message(call_error.to_json())
+
+    async def respond(message):
+        await base_central_system.route_message(call_error.to_json())
+
+    base_central_system._connection.send.side_effect = respond
 
     payload = ocpp_request.ClearCache()
     await base_central_system.call(payload)
@@ -263,3 +271,165 @@ async def test_call_without_unique_id_should_return_a_random_value(
     ) = mock_base_central_system._get_specific_response.call_args_list[0][0]
     # Check the actual unique id is equals to the one internally generated
     assert actual_unique_id == expected_unique_id
+
+
+@pytest.mark.asyncio
+async def test_route_message_drops_unexpected_response(base_central_system):
+    """
+    Test that a response for which no call() is waiting is dropped without
+    decoding its payload.
+    """
+    # The payload isn't valid JSON. Decoding it would fail.
+    await base_central_system.route_message('[3,"1337",{"currentTime":')
+
+    assert base_central_system._pending_calls == {}
+
+
+@pytest.mark.asyncio
+async def test_call_ignores_late_response(base_central_system):
+    """
+    Test that a response to an earlier Call doesn't end up as response of
+    the next Call.
+    """
+
+    async def respond(message):
+        # A late response to an earlier Call, followed by the actual response.
+        await base_central_system.route_message('[3,"1336",{}]')
+        await base_central_system.route_message(
+            CallResult(unique_id="1337", payload={"status": "Accepted"}).to_json()
+        )
+
+    base_central_system._connection.send.side_effect = respond
+
+    response = await base_central_system.call(ocpp_request.ClearCache())
+
+    assert response == ocpp_response.ClearCache(status="Accepted")
+
+
+def _unique_ids():
+    return iter(range(1, 100)).__next__
+
+
+@pytest.mark.asyncio
+async def test_calls_are_sent_one_at_a_time_by_default(connection):
+    cs = ChargePoint(id=1234, connection=connection)
+    cs._unique_id_generator = _unique_ids()
+
+    first = asyncio.ensure_future(cs.call(ocpp_request.ClearCache()))
+    second = asyncio.ensure_future(cs.call(ocpp_request.ClearCache()))
+    await asyncio.sleep(0)
+
+    # The second Call isn't sent before the first one has been answered.
+    assert connection.send.call_count == 1
+    await cs.route_message('[3,"1",{"status":"Accepted"}]')
+    assert await first == ocpp_response.ClearCache(status="Accepted")
+    await asyncio.sleep(0)
+
+    assert connection.send.call_count == 2
+    await cs.route_message('[3,"2",{"status":"Rejected"}]')
+    assert await second == ocpp_response.ClearCache(status="Rejected")
+
+
+@pytest.mark.asyncio
+async def test_pipelined_calls_are_matched_by_unique_id(connection):
+    cs = ChargePoint(id=1234, connection=connection, max_pending_calls=2)
+    cs._unique_id_generator = _unique_ids()
+
+    first = asyncio.ensure_future(cs.call(ocpp_request.ClearCache()))
+    second = asyncio.ensure_future(cs.call(ocpp_request.ClearCache()))
+    await asyncio.sleep(0)
+
+    assert connection.send.call_count == 2
+    assert set(cs._pending_calls) == {"1", "2"}
+
+    # Responses can arrive in any order.
+    await cs.route_message('[3,"2",{"status":"Rejected"}]')
+    await cs.route_message('[3,"1",{"status":"Accepted"}]')
+
+    assert await first == ocpp_response.ClearCache(status="Accepted")
+    assert await second == ocpp_response.ClearCache(status="Rejected")
+    assert cs._pending_calls == {}
+
+
+@pytest.mark.asyncio
+async def test_call_with_pending_unique_id(connection):
+    cs = ChargePoint(id=1234, connection=connection, max_pending_calls=2)
+
+    pending = asyncio.ensure_future(cs.call(ocpp_request.ClearCache(), unique_id="1"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(ValueError):
+        await cs.call(ocpp_request.ClearCache(), unique_id="1")
+
+    await cs.route_message('[3,"1",{"status":"Accepted"}]')
+    assert await pending == ocpp_response.ClearCache(status="Accepted")
+
+
+def test_max_pending_calls_must_be_positive(connection):
+    with pytest.raises(ValueError):
+        ChargePoint(id=1234, connection=connection, max_pending_calls=0)
+
+
+@pytest.mark.asyncio
+async def test_pending_calls_are_cancelled_when_connection_closes(connection):
+    closed = asyncio.Event()
+
+    async def recv():
+        await closed.wait()
+        raise ConnectionError("Connection closed")
+
+    connection.recv = recv
+    cs = ChargePoint(id=1234, connection=connection, max_pending_calls=2)
+    cs._unique_id_generator = _unique_ids()
+
+    server = asyncio.ensure_future(cs.start())
+    calls = [
+        asyncio.ensure_future(cs.call(ocpp_request.ClearCache())) for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+
+    closed.set()
+    with pytest.raises(ConnectionError):
+        await server
+
+    for call in calls:
+        with pytest.raises(asyncio.CancelledError):
+            await call
+    assert cs._pending_calls == {}
+
+
+@pytest.mark.asyncio
+async def test_queued_calls_fail_when_writing_fails(connection):
+    reading = asyncio.Event()
+    closed = asyncio.Event()
+
+    async def send(frame):
+        await reading.wait()
+        if '"1"' not in frame:
+            await closed.wait()
+            raise ConnectionError("Connection closed")
+
+    connection.send = send
+    cs = ChargePoint(
+        id=1234, connection=connection, response_timeout=30, max_pending_calls=3
+    )
+    cs._unique_id_generator = _unique_ids()
+
+    calls = [
+        asyncio.ensure_future(cs.call(ocpp_request.ClearCache())) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    reading.set()
+    # The first Call has been written, the second is being written and the
+    # third is queued.
+    while len(cs._send_queue) > 1:
+        await asyncio.sleep(0)
+    assert not any(call.done() for call in calls)
+
+    closed.set()
+    await cs.route_message('[3,"1",{"status":"Accepted"}]')
+    assert await calls[0] == ocpp_response.ClearCache(status="Accepted")
+    for call in calls[1:]:
+        with pytest.raises(ConnectionError):
+            await asyncio.wait_for(call, 1)
+    assert cs._pending_calls == {}